@@ -7,9 +7,11 @@ requirements (unique national-ID, phone, email; dynamic single-role
 assignment; hierarchy levels for police ranks).
 """
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser, Permission
 from django.db import models
 
+from core.cache import get_or_build, role_tag
 from core.permissions_constants import AccountsPerms
 
 
@@ -73,6 +75,31 @@ class Role(models.Model):
     def __str__(self):
         return self.name
 
+    def get_permission_names(self) -> frozenset[str]:
+        """
+        Return the role's permissions as ``'app_label.codename'`` strings.
+
+        With a shared cache (``settings.CACHE_SHARED``) the set is kept
+        across requests through ``core.cache`` under ``role_tag(pk)``;
+        ``accounts.signals`` invalidates it whenever the role or its
+        permission set changes.  A per-process cache would keep serving
+        a revoked permission on the other workers, so otherwise it is
+        read from the database (and kept per request in ``_perm_cache``).
+        """
+        def build() -> frozenset[str]:
+            return frozenset(
+                f"{app_label}.{codename}"
+                for app_label, codename in self.permissions.values_list(
+                    "content_type__app_label", "codename",
+                )
+            )
+
+        if not settings.CACHE_SHARED:
+            return build()
+        return get_or_build(
+            f"role-permissions:{self.pk}", build, tags=[role_tag(self.pk)],
+        )
+
 
 class User(AbstractUser):
     """
@@ -161,8 +188,7 @@ class User(AbstractUser):
             return set()
             
         if not hasattr(self, '_perm_cache'):
-            perms = self.role.permissions.select_related('content_type')
-            self._perm_cache = {f"{p.content_type.app_label}.{p.codename}" for p in perms}
+            self._perm_cache = set(self.role.get_permission_names())
             
         return self._perm_cache
 
@@ -0,0 +1,46 @@
+"""
+Invalidates ``core.cache`` entries tagged with a role (``role:{id}``)
+whenever the role row or its permission set changes, and entries
+listing all roles (``roles``) whenever a role is saved or deleted —
+whether through ``RoleManagementService``, ``setup_rbac`` or the admin.
+"""
+
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from core.cache import ROLES_TAG, invalidate_tags, role_tag
+
+_PERMISSION_ACTIONS = {"post_add", "post_remove", "post_clear"}
+
+
+def invalidate_role(sender, instance, raw=False, **kwargs) -> None:
+    """Drop cached data derived from the saved or deleted role."""
+    if not raw:
+        invalidate_tags(ROLES_TAG, role_tag(instance.pk))
+
+
+def invalidate_role_permissions(sender, instance, action, reverse, pk_set, **kwargs) -> None:
+    """Drop cached data for roles whose permission set changed."""
+    if action not in _PERMISSION_ACTIONS:
+        return
+    if not reverse:
+        invalidate_tags(role_tag(instance.pk))
+    elif pk_set:
+        # ``permission.role_set.add(...)``: *pk_set* holds the role ids.
+        invalidate_tags(*(role_tag(pk) for pk in pk_set))
+    else:
+        # ``permission.role_set.clear()``: the affected roles are gone
+        # from the through table already, so drop every role's entry.
+        from .models import Role
+
+        invalidate_tags(*(role_tag(pk) for pk in Role.objects.values_list("pk", flat=True)))
+
+
+def connect_cache_signals() -> None:
+    from .models import Role
+
+    post_save.connect(invalidate_role, sender=Role, dispatch_uid="role-cache:save")
+    post_delete.connect(invalidate_role, sender=Role, dispatch_uid="role-cache:delete")
+    m2m_changed.connect(
+        invalidate_role_permissions, sender=Role.permissions.through,
+        dispatch_uid="role-cache:permissions",
+    )
@@ -153,14 +153,22 @@ MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     # WhiteNoise must be immediately after SecurityMiddleware
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    # Brotli / gzip for API responses (static files come pre-compressed).
+    'core.domain.compression.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    # Read-your-writes pinning for replica reads; needs request.user.
+    'core.domain.replicas.ReplicaPinningMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Responses smaller than this many bytes are not compressed
+# (core.domain.compression.CompressionMiddleware).
+RESPONSE_COMPRESSION_MIN_SIZE = env_get('RESPONSE_COMPRESSION_MIN_SIZE', default=1024, cast=int)
+
 ROOT_URLCONF = 'backend.urls'
 
 TEMPLATES = [
@@ -179,11 +187,56 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'backend.wsgi.application'
+ASGI_APPLICATION = 'backend.asgi.application'
+
+# Server interface started by entrypoint.sh:
+#   wsgi — gunicorn sync workers on backend.wsgi (default)
+#   asgi — gunicorn with uvicorn workers on backend.asgi; each request's
+#          sync code runs on its own thread, so slow I/O-bound requests
+#          no longer hold a whole worker process (requires uvicorn-worker)
+SERVER_MODE = env_get('SERVER_MODE', default='wsgi')
+if SERVER_MODE not in ('wsgi', 'asgi'):
+    raise RuntimeError(f"SERVER_MODE must be 'wsgi' or 'asgi', got {SERVER_MODE!r}.")
+
+# Serve the async variants of the read-only endpoints (dashboard, search,
+# most wanted, notifications, constants, board graph — core/domain/asgi.py).
+# Off under WSGI, where each async view would start an event loop.
+ASYNC_READ_VIEWS = env_get('ASYNC_READ_VIEWS', default=SERVER_MODE == 'asgi', cast=bool)
 
 # ==============================================================================
 # DATABASE — PostgreSQL
 # ==============================================================================
 
+# Connection reuse (measure with `manage.py benchmark_db_connections`):
+#   persistent — each worker keeps its connection for DB_CONN_MAX_AGE
+#                seconds, checked before reuse (default under WSGI)
+#   pool       — a psycopg 3 pool of DB_POOL_MIN_SIZE..DB_POOL_MAX_SIZE
+#                connections per worker process (requires psycopg[pool])
+#   close      — a new connection for every request
+# Behind PgBouncer in transaction mode use `persistent` and set
+# DB_TRANSACTION_POOLER: streamed exports keep their server-side cursor
+# inside a transaction (core/domain/exports.py).
+# Under ASGI requests do not reuse threads, so persistent connections
+# would pile up: the default there is `close`; prefer `pool` when
+# psycopg 3 is installed.
+DB_CONN_MODE = env_get(
+    'DB_CONN_MODE', default='close' if SERVER_MODE == 'asgi' else 'persistent',
+)
+if DB_CONN_MODE not in ('persistent', 'pool', 'close'):
+    raise RuntimeError(
+        f"DB_CONN_MODE must be 'persistent', 'pool' or 'close', got {DB_CONN_MODE!r}."
+    )
+
+# Set behind a transaction-mode pooler, where consecutive statements may
+# reach different server sessions: advisory locks (core/domain/locks.py)
+# are then taken per transaction instead of per session.
+DB_TRANSACTION_POOLER = env_get('DB_TRANSACTION_POOLER', default=False, cast=bool)
+
+# Threads per worker that overlap independent reads of one sync request,
+# e.g. the search categories (core/domain/threads.py).  Each keeps a
+# connection per alias under the DB_CONN_MODE rules.
+DB_READ_THREADS = env_get('DB_READ_THREADS', default=2, cast=int)
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -192,9 +245,118 @@ DATABASES = {
         'PASSWORD': env_get('DB_PASSWORD', required=True),
         'HOST':     env_get('DB_HOST',     default='localhost'),
         'PORT':     env_get('DB_PORT',     default='5432'),
+        'CONN_MAX_AGE': (
+            env_get('DB_CONN_MAX_AGE', default=60, cast=int)
+            if DB_CONN_MODE == 'persistent' else 0
+        ),
+        'CONN_HEALTH_CHECKS': env_get('DB_CONN_HEALTH_CHECKS', default=True, cast=bool),
+        'OPTIONS': {},
+    }
+}
+
+if DB_CONN_MODE == 'pool':
+    # Sized per worker and alias: workers × DB_POOL_MAX_SIZE (× 2 with a
+    # read replica) must stay below the server's max_connections.
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': env_get('DB_POOL_MIN_SIZE', default=1, cast=int),
+        'max_size': env_get('DB_POOL_MAX_SIZE', default=4, cast=int),
+        'timeout':  env_get('DB_POOL_TIMEOUT',  default=10, cast=float),
+    }
+
+# Read replica for read-only service work (core/domain/replicas.py).
+# The alias only exists when DB_REPLICA_HOST points at a streaming
+# replica; without it every read stays on 'default' and workers keep a
+# single connection.  The test suite adds it as a mirror of the default
+# test database (conftest.py).
+DB_REPLICA_HOST = env_get('DB_REPLICA_HOST', default='')
+
+if DB_REPLICA_HOST:
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'OPTIONS': {**DATABASES['default']['OPTIONS']},
+        'HOST': DB_REPLICA_HOST,
+        'PORT': env_get('DB_REPLICA_PORT', default=DATABASES['default']['PORT']),
+    }
+
+DATABASE_ROUTERS = ['core.domain.replicas.ReplicaRouter']
+
+# Seconds a user who wrote keeps reading from the primary, so their own
+# changes are visible before the replica catches up.
+REPLICA_STICKY_SECONDS = env_get('REPLICA_STICKY_SECONDS', default=10, cast=int)
+
+# ==============================================================================
+# CACHE
+# ==============================================================================
+
+# core/cache.py layers tag-based invalidation over the 'default' cache.
+# 'locmem' is per process, so invalidations only reach the worker that
+# made them; run several workers against 'redis', 'memcached' or a 'file'
+# cache on a shared volume.  A dotted backend path is accepted as well.
+_CACHE_BACKENDS = {
+    'locmem':    'django.core.cache.backends.locmem.LocMemCache',
+    'file':      'django.core.cache.backends.filebased.FileBasedCache',
+    'redis':     'django.core.cache.backends.redis.RedisCache',
+    'memcached': 'django.core.cache.backends.memcached.PyMemcacheCache',
+}
+CACHE_BACKEND = env_get('CACHE_BACKEND', default='locmem')
+_CACHE_DEFAULT_LOCATIONS = {
+    'locmem': 'wp-default',
+    'file':   str(BASE_DIR / 'cache'),
+}
+
+CACHES = {
+    'default': {
+        'BACKEND':    _CACHE_BACKENDS.get(CACHE_BACKEND, CACHE_BACKEND),
+        'LOCATION':   env_get('CACHE_LOCATION', default=_CACHE_DEFAULT_LOCATIONS.get(CACHE_BACKEND, '')),
+        'KEY_PREFIX': env_get('CACHE_KEY_PREFIX', default='wp'),
     }
 }
 
+# Whether every worker process reads the same 'default' cache.  Data that
+# must never be served stale on another worker — role permissions — is
+# only cached across requests when it is.  Derived from CACHE_BACKEND:
+# off for the per-process locmem and dummy caches.
+CACHE_SHARED = env_get(
+    'CACHE_SHARED',
+    default=CACHES['default']['BACKEND'] not in (
+        'django.core.cache.backends.locmem.LocMemCache',
+        'django.core.cache.backends.dummy.DummyCache',
+    ),
+    cast=bool,
+)
+
+# Writers are pinned to the primary through the 'default' cache
+# (REPLICA_STICKY_SECONDS); a per-process cache would only pin them on
+# the worker that served the write.
+if DB_REPLICA_HOST and not CACHE_SHARED:
+    raise RuntimeError(
+        "DB_REPLICA_HOST requires a shared CACHE_BACKEND ('redis', "
+        "'memcached' or 'file') so read-your-writes holds across workers."
+    )
+
+# Default lifetime of core/cache.py entries; tag invalidation usually
+# drops them earlier.
+APP_CACHE_TIMEOUT = env_get('APP_CACHE_TIMEOUT', default=5 * 60, cast=int)
+
+# Coalesced rebuilds (core.cache.get_or_build_coalesced): how long an
+# expired aggregate may still be served while one worker rebuilds it, and
+# how long a worker with nothing to serve waits for that rebuild.
+APP_CACHE_STALE_SECONDS     = env_get('APP_CACHE_STALE_SECONDS', default=10 * 60, cast=int)
+APP_CACHE_LOCK_WAIT_SECONDS = env_get('APP_CACHE_LOCK_WAIT_SECONDS', default=10, cast=float)
+
+# Lifetimes of the coalesced aggregates; writes to cases or suspects
+# invalidate them sooner.
+MOST_WANTED_CACHE_SECONDS     = env_get('MOST_WANTED_CACHE_SECONDS', default=5 * 60, cast=int)
+DASHBOARD_STATS_CACHE_SECONDS = env_get('DASHBOARD_STATS_CACHE_SECONDS', default=60, cast=int)
+
+# Lifetime of cached global-search results, per (scope, query, category);
+# short, since type-ahead repeats a query for a few seconds at most.
+SEARCH_CACHE_SECONDS = env_get('SEARCH_CACHE_SECONDS', default=30, cast=int)
+
+# Cache-Control max-age of GET /api/core/constants/; clients revalidate
+# with the response's ETag afterwards.
+SYSTEM_CONSTANTS_MAX_AGE = env_get('SYSTEM_CONSTANTS_MAX_AGE', default=60 * 60, cast=int)
+
 # ==============================================================================
 # AUTH
 # ==============================================================================
@@ -233,6 +395,36 @@ STATIC_ROOT = BASE_DIR / env_get('STATIC_ROOT', default='staticfiles')
 MEDIA_URL   = env_get('MEDIA_URL',   default='/media/')
 MEDIA_ROOT  = BASE_DIR / env_get('MEDIA_ROOT',  default='media')
 
+# Protected media delivery (evidence files, suspect photos) — see
+# core/domain/media.py.  Empty streams the bytes from Django;
+# 'x-accel-redirect' (nginx) or 'x-sendfile' (Apache / lighttpd) hand the
+# transfer to the front-end server once the permission check passed.
+MEDIA_DELIVERY_OFFLOAD      = env_get('MEDIA_DELIVERY_OFFLOAD', default='')
+# nginx 'internal' location aliased to MEDIA_ROOT (x-accel-redirect only).
+MEDIA_ACCEL_REDIRECT_PREFIX = env_get('MEDIA_ACCEL_REDIRECT_PREFIX', default='/protected-media/')
+MEDIA_STREAM_CHUNK_SIZE     = env_get('MEDIA_STREAM_CHUNK_SIZE', default=64 * 1024, cast=int)
+
+# Resumable evidence uploads (init → parts → complete).  Parts are staged
+# here and moved into MEDIA_ROOT on completion — keep both on the same
+# filesystem so the move is a rename rather than a copy.
+EVIDENCE_UPLOAD_STAGING_ROOT = BASE_DIR / env_get('EVIDENCE_UPLOAD_STAGING_ROOT', default='upload_staging')
+EVIDENCE_UPLOAD_CHUNK_SIZE   = env_get('EVIDENCE_UPLOAD_CHUNK_SIZE', default=8 * 1024 * 1024, cast=int)
+EVIDENCE_UPLOAD_MAX_SIZE     = env_get('EVIDENCE_UPLOAD_MAX_SIZE', default=20 * 1024 ** 3, cast=int)
+
+# Claimable review queues (core/domain/queues.py).  A claimed item is
+# hidden from other reviewers until it is decided, released, or the lease
+# below runs out.
+REVIEW_CLAIM_LEASE_SECONDS = env_get('REVIEW_CLAIM_LEASE_SECONDS', default=15 * 60, cast=int)
+REVIEW_CLAIM_MAX_BATCH     = env_get('REVIEW_CLAIM_MAX_BATCH', default=25, cast=int)
+
+# Streaming CSV / NDJSON exports (core/domain/exports.py).  Rows fetched
+# per round trip of the server-side cursor.
+EXPORT_CHUNK_SIZE = env_get('EXPORT_CHUNK_SIZE', default=2000, cast=int)
+
+# Judiciary case reports are cached per case revision (see
+# CaseReportingService); this only bounds how long unused entries linger.
+CASE_REPORT_CACHE_SECONDS = env_get('CASE_REPORT_CACHE_SECONDS', default=24 * 60 * 60, cast=int)
+
 # WhiteNoise static file storage (Django 4.2+ STORAGES dict)
 # Serves compressed, cache-busted static files in production without a CDN.
 STORAGES = {
@@ -299,6 +491,11 @@ REST_FRAMEWORK = {
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    # orjson-backed when installed; identical output to JSONRenderer.
+    'DEFAULT_RENDERER_CLASSES': (
+        'core.domain.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
     ],
@@ -329,3 +526,8 @@ SPECTACULAR_SETTINGS = {
     'DESCRIPTION': 'Backend API for the LA Noire police department management system.',
     'VERSION': '1.0.0',
 }
+
+# Pre-generated schema served at /api/schema/ (manage.py
+# generate_openapi_schema writes it at deploy).  Without the file the
+# schema is generated on first request instead.
+OPENAPI_SCHEMA_FILE = BASE_DIR / env_get('OPENAPI_SCHEMA_FILE', default='openapi.json')
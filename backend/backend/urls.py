@@ -9,7 +9,9 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+from drf_spectacular.views import SpectacularSwaggerView
+
+from core.views import OpenAPISchemaView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -23,7 +25,8 @@ urlpatterns = [
     path('api/', include('suspects.urls')),
 
     # ── Swagger / OpenAPI schema ─────────────────────────────────────
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
+    # The schema is pre-generated at deploy (manage.py generate_openapi_schema).
+    path('api/schema/', OpenAPISchemaView.as_view(), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
 ]
 
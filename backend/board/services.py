@@ -31,6 +31,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from asgiref.sync import sync_to_async
 from django.contrib.contenttypes.models import ContentType
 from django.db import IntegrityError, transaction
 from django.db.models import Count, Prefetch, Q, QuerySet
@@ -317,6 +318,11 @@ class BoardWorkspaceService:
             raise PermissionDenied("You do not have permission to view this board.")
         return board
 
+    @staticmethod
+    async def aget_board_snapshot(board_id: int, actor: Any) -> DetectiveBoard:
+        """Async ``get_board_snapshot``."""
+        return await sync_to_async(BoardWorkspaceService.get_board_snapshot)(board_id, actor)
+
 
 # ═══════════════════════════════════════════════════════════════════
 #  Board Item Service
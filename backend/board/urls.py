@@ -28,10 +28,14 @@ Then in the top-level ``backend/backend/urls.py``, include this file::
     path("api/", include("board.urls")),
 """
 
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 from rest_framework_nested import routers as nested_routers
 
+from core.domain.asgi import async_read_paths
+
 from .views import (
+    AsyncBoardFullStateView,
     BoardConnectionViewSet,
     BoardItemViewSet,
     BoardNoteViewSet,
@@ -99,6 +103,14 @@ notes_router.register(
 
 # ── Combined URL patterns ────────────────────────────────────────────────────
 urlpatterns = [
+    # Ahead of the router's sync action when ASYNC_READ_VIEWS is on.
+    *async_read_paths(
+        path(
+            "boards/<int:pk>/full/",
+            AsyncBoardFullStateView.as_view(),
+            name="detective-board-full-state",
+        ),
+    ),
     *router.urls,
     *items_router.urls,
     *connections_router.urls,
@@ -26,6 +26,8 @@ from drf_spectacular.utils import (
     extend_schema,
 )
 
+from core.domain.asgi import AsyncAPIView
+
 from .models import BoardConnection, BoardItem, BoardNote, DetectiveBoard
 from .serializers import (
     BatchCoordinateUpdateSerializer,
@@ -139,6 +141,20 @@ class DetectiveBoardViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
+class AsyncBoardFullStateView(AsyncAPIView):
+    """
+    Async variant of ``DetectiveBoardViewSet.full_state`` (see
+    ``core.domain.asgi``).
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    async def get(self, request: Request, pk: int) -> Response:
+        board = await BoardWorkspaceService.aget_board_snapshot(pk, request.user)
+        serializer = FullBoardStateSerializer(board, context={"request": request})
+        return Response(serializer.data)
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  BoardItem ViewSet
 # ═══════════════════════════════════════════════════════════════════
@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class CasesConfig(AppConfig):
     name = 'cases'
+
+    def ready(self):
+        from .signals import connect_revision_signals
+
+        connect_revision_signals()
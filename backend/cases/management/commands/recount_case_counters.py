@@ -0,0 +1,40 @@
+"""
+Management command: recount_case_counters
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Rebuilds the denormalised ``Case.*_count`` columns from the complainant,
+witness, evidence, suspect and bounty-tip tables and reports how many
+cases had drifted.
+
+The services keep the counters exact; drift only comes from writes that
+bypass them (Django admin, shell sessions, data fixes).  Run it after
+such maintenance, or nightly from cron as a safety net.
+
+Usage::
+
+    python manage.py recount_case_counters
+    python manage.py recount_case_counters --case 12 --case 40
+"""
+
+from django.core.management.base import BaseCommand
+
+from cases.models import Case
+from cases.services import CaseCounterService
+
+
+class Command(BaseCommand):
+    help = "Recompute the denormalised per-case counters and repair drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--case", type=int, action="append", dest="case_ids", metavar="ID",
+            help="Limit to one case (repeatable). Default: all cases.",
+        )
+
+    def handle(self, *args, **options):
+        queryset = None
+        if options["case_ids"]:
+            queryset = Case.objects.filter(pk__in=options["case_ids"])
+        corrected = CaseCounterService.recount(queryset)
+        style = self.style.WARNING if corrected else self.style.SUCCESS
+        self.stdout.write(style(f"  corrected={corrected}"))
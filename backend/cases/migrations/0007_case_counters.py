@@ -0,0 +1,76 @@
+# Generated by Django 6.0.2 on 2026-10-18 22:20
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Case = apps.get_model('cases', 'Case')
+    sources = {
+        'complainant_count': (apps.get_model('cases', 'CaseComplainant'), {}),
+        'witness_count': (apps.get_model('cases', 'CaseWitness'), {}),
+        'evidence_count': (apps.get_model('evidence', 'Evidence'), {}),
+        'suspect_count': (apps.get_model('suspects', 'Suspect'), {}),
+        'suspects_at_trial_count': (
+            apps.get_model('suspects', 'Suspect'),
+            {'status__in': ['under_trial', 'convicted', 'acquitted', 'released']},
+        ),
+        'open_tip_count': (
+            apps.get_model('suspects', 'BountyTip'),
+            {'status__in': ['pending', 'officer_reviewed']},
+        ),
+    }
+    Case.objects.update(**{
+        field: Coalesce(
+            Subquery(
+                model.objects.filter(case=OuterRef('pk'), **filters)
+                .order_by().values('case').annotate(n=Count('pk')).values('n')
+            ),
+            0,
+        )
+        for field, (model, filters) in sources.items()
+    })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cases', '0006_review_leases'),
+        ('evidence', '0007_review_leases'),
+        ('suspects', '0010_review_leases'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='case',
+            name='complainant_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Complainants'),
+        ),
+        migrations.AddField(
+            model_name='case',
+            name='evidence_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Evidence Items'),
+        ),
+        migrations.AddField(
+            model_name='case',
+            name='open_tip_count',
+            field=models.PositiveIntegerField(default=0, help_text='Tips awaiting officer review or detective verification.', verbose_name='Open Bounty Tips'),
+        ),
+        migrations.AddField(
+            model_name='case',
+            name='suspect_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Suspects'),
+        ),
+        migrations.AddField(
+            model_name='case',
+            name='suspects_at_trial_count',
+            field=models.PositiveIntegerField(default=0, help_text='Suspects that are under trial or past it (convicted, acquitted, released).', verbose_name='Suspects at Trial'),
+        ),
+        migrations.AddField(
+            model_name='case',
+            name='witness_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Witnesses'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
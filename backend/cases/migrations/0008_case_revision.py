@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cases', '0007_case_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='case',
+            name='revision',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Revision'),
+        ),
+    ]
@@ -10,7 +10,7 @@ closure.
 from django.conf import settings
 from django.db import models
 
-from core.models import TimeStampedModel
+from core.models import ClaimableModel, TimeStampedModel
 from core.permissions_constants import CasesPerms
 
 
@@ -76,7 +76,7 @@ class ComplainantStatus(models.TextChoices):
 # Models
 # ────────────────────────────────────────────────────────────────────
 
-class Case(TimeStampedModel):
+class Case(ClaimableModel, TimeStampedModel):
     """
     Central entity of the system — a police case.
 
@@ -181,6 +181,31 @@ class Case(TimeStampedModel):
         verbose_name="Assigned Judge",
     )
 
+    # ── Denormalised counters ───────────────────────────────────────
+    # Kept in step with ``F()`` updates by the services that own the
+    # counted rows (``CaseCounterService.adjust``); rebuilt from scratch
+    # by ``manage.py recount_case_counters``.
+    complainant_count = models.PositiveIntegerField(default=0, verbose_name="Complainants")
+    witness_count = models.PositiveIntegerField(default=0, verbose_name="Witnesses")
+    evidence_count = models.PositiveIntegerField(default=0, verbose_name="Evidence Items")
+    suspect_count = models.PositiveIntegerField(default=0, verbose_name="Suspects")
+    suspects_at_trial_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Suspects at Trial",
+        help_text="Suspects that are under trial or past it (convicted, acquitted, released).",
+    )
+    open_tip_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Open Bounty Tips",
+        help_text="Tips awaiting officer review or detective verification.",
+    )
+
+    # ── Report revision ─────────────────────────────────────────────
+    # Bumped by every save of the case and, through ``cases.signals``,
+    # by writes to the rows the judiciary report is built from.  Cached
+    # reports are keyed by it (``CaseReportingService``).
+    revision = models.PositiveIntegerField(default=0, editable=False, verbose_name="Revision")
+
     class Meta:
         verbose_name = "Case"
         verbose_name_plural = "Cases"
@@ -219,6 +244,16 @@ class Case(TimeStampedModel):
     def __str__(self):
         return f"Case #{self.pk} — {self.title}"
 
+    def save(self, *args, **kwargs):
+        # Increment in the same UPDATE; Django reads the new value back
+        # through RETURNING, so ``self.revision`` stays an int.
+        update_fields = kwargs.get("update_fields")
+        if not self._state.adding and (update_fields is None or update_fields):
+            self.revision = models.F("revision") + 1
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "revision"}
+        super().save(*args, **kwargs)
+
     @property
     def is_open(self) -> bool:
         """Return True if the case is still active (not closed/voided)."""
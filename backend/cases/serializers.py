@@ -23,6 +23,8 @@ from typing import Any
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from core.domain.projection import QueryShape, ValuesListSerializer, choice_labels
+
 from .models import (
     Case,
     CaseComplainant,
@@ -32,6 +34,7 @@ from .models import (
     CaseWitness,
     CrimeLevel,
 )
+from .services import ASSIGNMENT_ROLES, BULK_TRANSITION_MAX_CASES, DOCKET_REPORT_MAX_CASES
 
 User = get_user_model()
 
@@ -110,11 +113,10 @@ class CaseListSerializer(serializers.ModelSerializer):
     Compact representation for the list endpoint.
 
     Excludes heavy nested data (complainants, witnesses, status log)
-    to keep list-page payloads small.  Includes summary counts as
-    annotated read-only fields.
+    to keep list-page payloads small.  Summary counts come from the
+    denormalised counter columns on ``Case``.
     """
 
-    complainant_count = serializers.IntegerField(read_only=True)
     crime_level_display = serializers.CharField(
         source="get_crime_level_display",
         read_only=True,
@@ -140,10 +142,23 @@ class CaseListSerializer(serializers.ModelSerializer):
             "assigned_detective",
             "assigned_detective_name",
             "complainant_count",
+            "lease_expires_at",
             "created_at",
             "updated_at",
         ]
-        read_only_fields = ["id", "created_at", "updated_at"]
+        read_only_fields = [
+            "id", "complainant_count", "lease_expires_at", "created_at", "updated_at",
+        ]
+        query_shape = QueryShape(
+            only=(
+                "id", "title", "crime_level", "status", "creation_type",
+                "incident_date", "location", "assigned_detective",
+                "complainant_count", "lease_expires_at", "created_at", "updated_at",
+                "assigned_detective__first_name",
+                "assigned_detective__last_name",
+            ),
+            select_related=("assigned_detective",),
+        )
 
     def get_assigned_detective_name(self, obj: Case) -> str | None:
         """Return the detective's full name or ``None`` if unassigned."""
@@ -155,6 +170,51 @@ class CaseListSerializer(serializers.ModelSerializer):
         ).strip()
 
 
+class CaseListValuesSerializer(ValuesListSerializer):
+    """
+    ``CaseListSerializer`` output built from ``values_list`` rows.
+
+    Used by the case list endpoint; ``tests/test_values_serializers.py``
+    checks it against ``CaseListSerializer`` field for field.
+    """
+
+    lookups = (
+        "id", "title", "crime_level", "status", "creation_type",
+        "incident_date", "location", "assigned_detective",
+        "assigned_detective__first_name", "assigned_detective__last_name",
+        "complainant_count", "lease_expires_at", "created_at", "updated_at",
+    )
+    crime_level_labels = choice_labels(CrimeLevel.choices)
+    status_labels = choice_labels(CaseStatus.choices)
+
+    def to_representation(self, row: tuple[Any, ...]) -> dict[str, Any]:
+        (
+            pk, title, crime_level, case_status, creation_type,
+            incident_date, location, detective_id, first_name, last_name,
+            complainant_count, lease_expires_at, created_at, updated_at,
+        ) = row
+        render_datetime = self.render_datetime
+        return {
+            "id": pk,
+            "title": title,
+            "crime_level": crime_level,
+            "crime_level_display": self.crime_level_labels.get(crime_level, str(crime_level)),
+            "status": case_status,
+            "status_display": self.status_labels.get(case_status, str(case_status)),
+            "creation_type": creation_type,
+            "incident_date": render_datetime(incident_date),
+            "location": location,
+            "assigned_detective": detective_id,
+            "assigned_detective_name": (
+                None if detective_id is None else f"{first_name} {last_name}".strip()
+            ),
+            "complainant_count": complainant_count,
+            "lease_expires_at": render_datetime(lease_expires_at),
+            "created_at": render_datetime(created_at),
+            "updated_at": render_datetime(updated_at),
+        }
+
+
 class CaseStatusLogSerializer(serializers.ModelSerializer):
     """Read-only serializer for the case audit trail."""
 
@@ -481,6 +541,40 @@ class CaseTransitionSerializer(serializers.Serializer):
     )
 
 
+class CaseBulkTransitionSerializer(serializers.Serializer):
+    """
+    Request body for ``POST /api/cases/bulk-transition/``.
+
+    Same rules as ``CaseTransitionSerializer``, applied to every case in
+    ``case_ids``; see ``CaseWorkflowService.bulk_transition``.
+    """
+
+    case_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        min_length=1,
+        max_length=BULK_TRANSITION_MAX_CASES,
+        help_text=f"Cases to transition (at most {BULK_TRANSITION_MAX_CASES}).",
+    )
+    target_status = serializers.ChoiceField(choices=CaseStatus.choices, help_text="Target workflow status for every case.")
+    message = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        default="",
+        max_length=2000,
+        help_text="Logged on every transition. Required for rejection transitions.",
+    )
+
+
+class CaseBulkTransitionResultSerializer(serializers.Serializer):
+    """One entry of the ``bulk-transition`` response."""
+
+    id = serializers.IntegerField()
+    ok = serializers.BooleanField()
+    from_status = serializers.CharField(allow_null=True)
+    to_status = serializers.CharField(allow_null=True)
+    detail = serializers.CharField(allow_blank=True)
+
+
 class CadetReviewSerializer(serializers.Serializer):
     """
     Request body for ``POST /api/cases/{id}/cadet-review/``.
@@ -547,6 +641,23 @@ class OfficerReviewSerializer(serializers.Serializer):
         return attrs
 
 
+class CaseReviewClaimSerializer(serializers.Serializer):
+    """
+    Request body for ``POST /api/cases/review-queue/claim/``.
+
+    ``queue`` is ``"complaint"`` (cadets) or ``"officer"`` (officers).
+    """
+
+    QUEUE_CHOICES = [("complaint", "Complaint review"), ("officer", "Officer review")]
+
+    queue = serializers.ChoiceField(choices=QUEUE_CHOICES, help_text="Review queue to claim from.")
+    limit = serializers.IntegerField(
+        min_value=1,
+        default=10,
+        help_text="Number of cases to claim (capped by REVIEW_CLAIM_MAX_BATCH).",
+    )
+
+
 class AssignPersonnelSerializer(serializers.Serializer):
     """
     Generic request body for personnel assignment endpoints.
@@ -559,6 +670,44 @@ class AssignPersonnelSerializer(serializers.Serializer):
     user_id = serializers.IntegerField(min_value=1, help_text="PK of the user to assign to this case role (must have the appropriate rank).")
 
 
+class BulkAssignPersonnelSerializer(serializers.Serializer):
+    """
+    Request body for ``POST /api/cases/bulk-assign/``.
+
+    Role checks on the requester and the assignees are performed in
+    ``CaseAssignmentService.bulk_assign``.
+    """
+
+    ROLE_CHOICES = [(role, role.title()) for role in ASSIGNMENT_ROLES]
+
+    case_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        min_length=1,
+        max_length=BULK_TRANSITION_MAX_CASES,
+        help_text=f"Cases to assign (at most {BULK_TRANSITION_MAX_CASES}).",
+    )
+    role = serializers.ChoiceField(choices=ROLE_CHOICES, help_text="Case role to assign.")
+    user_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        min_length=1,
+        help_text="PKs of the users to spread the cases over.",
+    )
+    balance = serializers.BooleanField(
+        default=False,
+        help_text="Give each case to the assignee with the fewest open cases instead of plain round-robin.",
+    )
+
+
+class BulkAssignResultSerializer(serializers.Serializer):
+    """One entry of the ``bulk-assign`` response."""
+
+    id = serializers.IntegerField()
+    ok = serializers.BooleanField()
+    assigned_to = serializers.IntegerField(allow_null=True)
+    status = serializers.CharField(allow_null=True)
+    detail = serializers.CharField(allow_blank=True)
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  5. Sub-Resource Write Serializers
 # ═══════════════════════════════════════════════════════════════════
@@ -747,3 +896,28 @@ class CaseReportSerializer(serializers.Serializer):
     suspects = _ReportSuspectSerializer(many=True, read_only=True)
     status_history = _ReportStatusLogSerializer(many=True, read_only=True)
     calculations = _ReportCalculationsSerializer(read_only=True)
+
+
+class DocketReportSerializer(serializers.Serializer):
+    """
+    Request body for ``POST /api/cases/docket-report/``.
+
+    Omit ``case_ids`` to report on the requester's own ``JUDICIARY``
+    queue; see ``CaseReportingService.iter_docket_reports``.
+    """
+
+    case_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        min_length=1,
+        max_length=DOCKET_REPORT_MAX_CASES,
+        help_text=f"Cases to report on, in output order (at most {DOCKET_REPORT_MAX_CASES}).",
+    )
+
+
+class DocketReportLineSerializer(serializers.Serializer):
+    """One line of the ``docket-report`` NDJSON stream."""
+
+    id = serializers.IntegerField()
+    report = CaseReportSerializer(required=False)
+    detail = serializers.CharField(required=False, help_text="Set instead of ``report`` for unknown cases.")
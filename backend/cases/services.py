@@ -11,9 +11,11 @@ Architecture
 - ``CaseQueryService``        — Filtered queryset construction.
 - ``CaseCreationService``     — Draft creation for complaint & crime-scene paths.
 - ``CaseWorkflowService``     — 16-stage state-machine transitions.
+- ``CaseReviewQueueService``  — Claimable cadet / officer review queues.
 - ``CaseAssignmentService``   — Assign/unassign personnel to a case.
 - ``CaseComplainantService``  — Complainant lifetime management (add / review).
 - ``CaseWitnessService``      — Witness registration (crime-scene path).
+- ``CaseCounterService``      — Denormalised per-case counters.
 - ``CaseCalculationService``  — Reward & tracking-threshold formulas.
 
 Workflow State-Machine Overview
@@ -55,17 +57,47 @@ Permission constants used here (from ``core.permissions_constants.CasesPerms``):
 from __future__ import annotations
 
 import datetime
+import heapq
 import re
+from collections import defaultdict
+from collections.abc import Iterator
 from typing import Any
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
-from django.db.models import Count, Max, Prefetch, Q, QuerySet
+from django.db.models import Case as SQLCase
+from django.db.models import (
+    Count,
+    F,
+    Max,
+    OuterRef,
+    Prefetch,
+    Q,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Greatest
 from django.utils import timezone
 
+from core.cache import CASES_TAG, case_tag, invalidate_tags
 from core.constants import REWARD_MULTIPLIER
 from core.domain.access import apply_permission_scope, require_permission
-from core.domain.exceptions import DomainError, InvalidTransition, NotFound, PermissionDenied
+from core.domain.conditional import content_etag
+from core.domain.exceptions import (
+    Conflict,
+    DomainError,
+    InvalidTransition,
+    NotFound,
+    PermissionDenied,
+)
+from core.domain.locks import advisory_lock
 from core.domain.notifications import NotificationService
+from core.domain.projection import QueryShape, apply_query_shape
+from core.domain.queues import LEASE_FIELDS, claim_cleared, claim_next, ensure_claim, release_claim
+from core.domain.replicas import read_replica
 from core.permissions_constants import CasesPerms
 
 from .models import (
@@ -122,9 +154,70 @@ ALLOWED_TRANSITIONS: dict[tuple[str, str], set[str]] = {
     (CaseStatus.JUDICIARY, CaseStatus.CLOSED): {CasesPerms.CAN_CHANGE_CASE_STATUS},
 }
 
+#: Rejection transitions; these require a non-blank message so the
+#: reason reaches the next actor.
+REJECTION_TRANSITIONS: set[tuple[str, str]] = {
+    (CaseStatus.CADET_REVIEW, CaseStatus.RETURNED_TO_COMPLAINANT),
+    (CaseStatus.OFFICER_REVIEW, CaseStatus.RETURNED_TO_CADET),
+}
+
 #: Maximum number of complaint rejections before automatic voiding.
 MAX_REJECTION_COUNT: int = 3
 
+#: Maximum number of cases accepted by one ``bulk_transition`` call.
+BULK_TRANSITION_MAX_CASES: int = 100
+
+#: Maximum number of explicit case ids accepted by one docket report.
+DOCKET_REPORT_MAX_CASES: int = 500
+
+#: Cases built per round of ``CaseReportingService.iter_docket_reports``.
+DOCKET_REPORT_CHUNK_SIZE: int = 100
+
+#: Personnel roles for ``CaseAssignmentService.bulk_assign``:
+#: role → (case field, requester permission, assignee permission, label).
+ASSIGNMENT_ROLES: dict[str, tuple[str, str, str, str]] = {
+    "detective": (
+        "assigned_detective",
+        CasesPerms.CAN_ASSIGN_DETECTIVE,
+        CasesPerms.CAN_BE_ASSIGNED_DETECTIVE,
+        "Detective",
+    ),
+    "sergeant": (
+        "assigned_sergeant",
+        CasesPerms.CAN_ASSIGN_DETECTIVE,
+        CasesPerms.CAN_BE_ASSIGNED_SERGEANT,
+        "Sergeant",
+    ),
+    "captain": (
+        "assigned_captain",
+        CasesPerms.CAN_ASSIGN_DETECTIVE,
+        CasesPerms.CAN_BE_ASSIGNED_CAPTAIN,
+        "Captain",
+    ),
+    "judge": (
+        "assigned_judge",
+        CasesPerms.CAN_FORWARD_TO_JUDICIARY,
+        CasesPerms.CAN_BE_ASSIGNED_JUDGE,
+        "Judge",
+    ),
+}
+
+#: Statuses that do not count towards an assignee's open-case load.
+INACTIVE_CASE_STATUSES: set[str] = {CaseStatus.CLOSED, CaseStatus.VOIDED}
+
+#: Claimable review queues (``CaseReviewQueueService``):
+#: queue name → (statuses awaiting that reviewer, required permission).
+REVIEW_QUEUES: dict[str, tuple[set[str], str]] = {
+    "complaint": (
+        {CaseStatus.CADET_REVIEW, CaseStatus.RETURNED_TO_CADET},
+        CasesPerms.CAN_REVIEW_COMPLAINT,
+    ),
+    "officer": (
+        {CaseStatus.OFFICER_REVIEW},
+        CasesPerms.CAN_APPROVE_CASE,
+    ),
+}
+
 
 # ═══════════════════════════════════════════════════════════════════
 #  Case Query Service
@@ -192,6 +285,30 @@ CASE_SCOPE_RULES: list[tuple[str, Any]] = [
      lambda qs, u: qs.filter(complainants__user=u)),
 ]
 
+#: ``(header, lookup)`` columns of the streaming case export
+#: (``core.domain.exports``).  Related users are exported by id.
+CASE_EXPORT_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("id", "id"),
+    ("title", "title"),
+    ("status", "status"),
+    ("crime_level", "crime_level"),
+    ("creation_type", "creation_type"),
+    ("incident_date", "incident_date"),
+    ("location", "location"),
+    ("created_by", "created_by_id"),
+    ("approved_by", "approved_by_id"),
+    ("assigned_detective", "assigned_detective_id"),
+    ("assigned_sergeant", "assigned_sergeant_id"),
+    ("assigned_captain", "assigned_captain_id"),
+    ("assigned_judge", "assigned_judge_id"),
+    ("complainant_count", "complainant_count"),
+    ("witness_count", "witness_count"),
+    ("evidence_count", "evidence_count"),
+    ("suspect_count", "suspect_count"),
+    ("created_at", "created_at"),
+    ("updated_at", "updated_at"),
+)
+
 
 class CaseQueryService:
     """
@@ -202,13 +319,7 @@ class CaseQueryService:
     """
 
     # ── Shared select_related fields ────────────────────────────────
-    _LIST_SELECT_RELATED: list[str] = [
-        "created_by",
-        "assigned_detective",
-        "assigned_sergeant",
-        "assigned_captain",
-    ]
-
+    # List querysets are shaped by the caller's serializer ``QueryShape``.
     _DETAIL_SELECT_RELATED: list[str] = [
         "created_by",
         "approved_by",
@@ -244,6 +355,7 @@ class CaseQueryService:
         cls,
         requesting_user: Any,
         filters: dict[str, Any],
+        shape: QueryShape | None = None,
     ) -> QuerySet:
         """
         Build a role-scoped, filtered queryset of ``Case`` objects.
@@ -255,12 +367,17 @@ class CaseQueryService:
             scoping before applying explicit filters.
         filters : dict
             Cleaned query-parameter dict from ``CaseFilterSerializer``.
+        shape : QueryShape, optional
+            Projection declared by the rendering serializer
+            (``CaseListSerializer.Meta.query_shape``).  ``None`` loads
+            plain rows with no joins, which is what sub-query callers
+            such as evidence scoping want.
 
         Returns
         -------
         QuerySet[Case]
-            Filtered, annotated, ``select_related`` queryset ready for
-            serialisation by ``CaseListSerializer``.
+            Filtered, annotated queryset ready for serialisation by
+            ``CaseListSerializer``.
         """
         # 1. Base queryset
         qs = Case.objects.all()
@@ -276,15 +393,10 @@ class CaseQueryService:
         # 3. Explicit filters on top of scoped queryset
         qs = cls._apply_filters(qs, filters)
 
-        # 4. DB optimisations — select_related + annotation
-        qs = (
-            qs
-            .select_related(*cls._LIST_SELECT_RELATED)
-            .annotate(complainant_count=Count("complainants"))
-            .distinct()
-        )
-
-        return qs
+        # 4. DB optimisations — serializer shape.  Summary counts are
+        #    denormalised columns (``CaseCounterService``), so there is
+        #    no GROUP BY here.
+        return apply_query_shape(qs, shape)
 
     @classmethod
     def get_case_detail(
@@ -345,6 +457,50 @@ class CaseQueryService:
             # propagating as an unhandled exception → HTTP 500.
             raise NotFound(f"Case '{case_id}' not found: invalid identifier.")
 
+    @staticmethod
+    def get_case_detail_etag(requesting_user: Any, case_id: int) -> str:
+        """
+        Return the ETag of the case detail representation.
+
+        One scoped query on the case row: every write to the case or
+        to a nested sub-resource bumps ``Case.revision`` (see
+        ``CaseRevisionService``), and the calculation fields only move
+        with the day count.  Visibility rules match
+        ``get_case_detail``, so a hidden case is a 404 here too.
+
+        Parameters
+        ----------
+        requesting_user : User
+            From ``request.user``.
+        case_id : int
+            Primary key of the case.
+
+        Returns
+        -------
+        str
+            Quoted validator for ``If-None-Match``.
+
+        Raises
+        ------
+        core.domain.exceptions.NotFound
+            If the case does not exist or is not visible to the user.
+        """
+        qs = apply_permission_scope(
+            Case.objects.all(),
+            requesting_user,
+            scope_rules=CASE_SCOPE_RULES,
+            default="none",
+        )
+        try:
+            row = qs.values_list("revision", "created_at").get(pk=case_id)
+        except Case.DoesNotExist:
+            raise NotFound(f"Case #{case_id} not found or not accessible.")
+        except (ValueError, TypeError):
+            raise NotFound(f"Case '{case_id}' not found: invalid identifier.")
+        revision, created_at = row
+        days = max((timezone.now().date() - created_at.date()).days, 0)
+        return content_etag("case", case_id, revision, days)
+
 
 # ═══════════════════════════════════════════════════════════════════
 #  Case Creation Service
@@ -397,6 +553,7 @@ class CaseCreationService:
         validated_data["creation_type"] = CaseCreationType.COMPLAINT
         validated_data["status"] = CaseStatus.COMPLAINT_REGISTERED
         validated_data["created_by"] = requesting_user
+        validated_data["complainant_count"] = 1
 
         case = Case.objects.create(**validated_data)
 
@@ -475,6 +632,8 @@ class CaseCreationService:
         validated_data["status"] = initial_status
         validated_data["created_by"] = requesting_user
 
+        validated_data["witness_count"] = len(witnesses_data)
+
         if can_auto_approve:
             validated_data["approved_by"] = requesting_user
 
@@ -630,20 +789,21 @@ class CaseWorkflowService:
             )
 
         # 4. Extra guards
-        # a. Rejection transitions require non-blank message
-        _rejection_transitions = {
-            (CaseStatus.CADET_REVIEW, CaseStatus.RETURNED_TO_COMPLAINANT),
-            (CaseStatus.OFFICER_REVIEW, CaseStatus.RETURNED_TO_CADET),
-        }
-        if key in _rejection_transitions and not message.strip():
+        # a. Another reviewer holds an active queue claim on the case
+        ensure_claim(case, requesting_user)
+
+        # b. Rejection transitions require non-blank message
+        if key in REJECTION_TRANSITIONS and not message.strip():
             raise DomainError(
                 "A rejection message is required for this transition."
             )
 
-        # 5. Perform the transition
+        # 5. Perform the transition; the case leaves its review queue,
+        #    so any claim on it is finished.
         prev_status = case.status
         case.status = target_status
-        case.save(update_fields=["status", "updated_at"])
+        claim_cleared(case)
+        case.save(update_fields=["status", *LEASE_FIELDS, "updated_at"])
 
         # 6. Log the transition
         CaseStatusLog.objects.create(
@@ -659,6 +819,187 @@ class CaseWorkflowService:
 
         return case
 
+    @staticmethod
+    @transaction.atomic
+    def bulk_transition(
+        case_ids: list[int],
+        target_status: str,
+        requesting_user: Any,
+        message: str = "",
+    ) -> list[dict[str, Any]]:
+        """
+        **Move many cases to ``target_status`` in one transaction.**
+
+        The batch counterpart of ``transition_state`` for reviewers working
+        through a claimed queue (e.g. an officer opening a page of vetted
+        complaints).  Each case succeeds or fails on its own; a failure is
+        reported in the result instead of aborting the batch.
+
+        Parameters
+        ----------
+        case_ids : list[int]
+            Cases to transition (duplicates ignored), at most
+            ``BULK_TRANSITION_MAX_CASES``.
+        target_status : str
+            The desired ``CaseStatus`` value for every case.
+        requesting_user : User
+            The user initiating the transitions.
+        message : str
+            Logged on every transition; required for rejection targets.
+
+        Returns
+        -------
+        list[dict]
+            One entry per requested id, in id order:
+            ``{"id", "ok", "from_status", "to_status", "detail"}``.
+            ``to_status`` is ``VOIDED`` for a cadet rejection that reaches
+            ``MAX_REJECTION_COUNT``.
+
+        Raises
+        ------
+        DomainError
+            Empty batch or more than ``BULK_TRANSITION_MAX_CASES`` ids.
+
+        Implementation Contract
+        -----------------------
+        1. Lock all cases with one ``SELECT … FOR UPDATE`` ordered by id,
+           so concurrent batches acquire row locks in the same order.
+        2. Validate ``ALLOWED_TRANSITIONS``, permissions and the rejection
+           message once per distinct ``(from_status, target_status)``.
+        3. Per case: queue claim (``ensure_claim``) and, for crime-scene
+           approval, the approver's rank.
+        4. Apply the side effects of the dedicated review actions:
+           ``approved_by`` on ``OPEN``; ``rejection_count`` (and
+           auto-void) on a cadet rejection.
+        5. One ``UPDATE`` per resulting target, one ``bulk_create`` of
+           ``CaseStatusLog`` rows, one batched notification insert.
+        """
+        ids = sorted(set(case_ids))
+        if not ids:
+            raise DomainError("Provide at least one case id.")
+        if len(ids) > BULK_TRANSITION_MAX_CASES:
+            raise DomainError(
+                f"At most {BULK_TRANSITION_MAX_CASES} cases can be "
+                "transitioned in one request."
+            )
+
+        # 1. Lock in id order; pre-load what validation and routing need.
+        cases = {
+            case.pk: case
+            for case in (
+                Case.objects
+                .select_for_update(of=("self",))
+                .select_related("created_by__role", "assigned_detective", "assigned_judge")
+                .filter(pk__in=ids)
+                .order_by("pk")
+            )
+        }
+
+        # 2. Status-pair checks, evaluated once per distinct current status.
+        pair_errors: dict[str, str | None] = {}
+
+        def _pair_error(from_status: str) -> str | None:
+            if from_status not in pair_errors:
+                key = (from_status, target_status)
+                if key not in ALLOWED_TRANSITIONS:
+                    error = f"Cannot transition from '{from_status}' to '{target_status}'."
+                elif not any(
+                    requesting_user.has_perm(f"cases.{p}")
+                    for p in ALLOWED_TRANSITIONS[key]
+                ):
+                    error = "You do not have permission to perform this transition."
+                elif key in REJECTION_TRANSITIONS and not message.strip():
+                    error = "A rejection message is required for this transition."
+                else:
+                    error = None
+                pair_errors[from_status] = error
+            return pair_errors[from_status]
+
+        results: dict[int, dict[str, Any]] = {}
+        # (to_status, counts_as_rejection) → cases
+        groups: dict[tuple[str, bool], list[Case]] = {}
+        approver_level = getattr(requesting_user, "hierarchy_level", 0)
+
+        for pk in ids:
+            case = cases.get(pk)
+            if case is None:
+                results[pk] = {
+                    "id": pk, "ok": False, "from_status": None,
+                    "to_status": None, "detail": "Case not found.",
+                }
+                continue
+
+            result = {
+                "id": pk, "ok": False, "from_status": case.status,
+                "to_status": None, "detail": "",
+            }
+            results[pk] = result
+
+            # 3. Per-case guards
+            error = _pair_error(case.status)
+            if error is None:
+                try:
+                    ensure_claim(case, requesting_user)
+                except Conflict as exc:
+                    error = exc.message
+            if (
+                error is None
+                and case.status == CaseStatus.PENDING_APPROVAL
+                and approver_level < getattr(case.created_by, "hierarchy_level", 0)
+            ):
+                error = (
+                    "Your rank is insufficient to approve a case created by "
+                    "a higher-ranking officer."
+                )
+            if error is not None:
+                result["detail"] = error
+                continue
+
+            # 4. Cadet rejections count towards auto-voiding.
+            rejection = (case.status, target_status) == (
+                CaseStatus.CADET_REVIEW, CaseStatus.RETURNED_TO_COMPLAINANT,
+            )
+            to_status = target_status
+            if rejection and case.rejection_count + 1 >= MAX_REJECTION_COUNT:
+                to_status = CaseStatus.VOIDED
+            result.update(ok=True, to_status=to_status)
+            groups.setdefault((to_status, rejection), []).append(case)
+
+        # 5. Write the batch.
+        now = timezone.now()
+        logs: list[CaseStatusLog] = []
+        for (to_status, rejection), group in groups.items():
+            changes: dict[str, Any] = {
+                "status": to_status,
+                "leased_to": None,
+                "lease_expires_at": None,
+                "updated_at": now,
+                "revision": F("revision") + 1,
+            }
+            if to_status == CaseStatus.OPEN:
+                changes["approved_by"] = requesting_user
+            if rejection:
+                changes["rejection_count"] = F("rejection_count") + 1
+            Case.objects.filter(pk__in=[c.pk for c in group]).update(**changes)
+            invalidate_tags(CASES_TAG, *(case_tag(c.pk) for c in group))
+
+            for case in group:
+                logs.append(CaseStatusLog(
+                    case=case,
+                    from_status=case.status,
+                    to_status=to_status,
+                    changed_by=requesting_user,
+                    message=message,
+                ))
+                case.status = to_status
+                claim_cleared(case)
+        CaseStatusLog.objects.bulk_create(logs)
+
+        transitioned = [case for group in groups.values() for case in group]
+        CaseWorkflowService._dispatch_bulk_notifications(transitioned, requesting_user)
+
+        return [results[pk] for pk in ids]
+
     @staticmethod
     @transaction.atomic
     def submit_for_review(case: Case, requesting_user: Any) -> Case:
@@ -1032,23 +1373,73 @@ class CaseWorkflowService:
         Do NOT send push/email here — that belongs in a Celery task
         triggered after the transaction commits.
         """
+        primary = None
+        if new_status in (CaseStatus.RETURNED_TO_COMPLAINANT, CaseStatus.VOIDED):
+            primary = case.complainants.filter(
+                is_primary=True,
+            ).select_related("user").first()
+
+        recipients, event_type = CaseWorkflowService._notification_route(
+            case, new_status, primary.user if primary else None,
+        )
+        if recipients:
+            NotificationService.create(
+                actor=actor,
+                recipients=recipients,
+                event_type=event_type,
+                related_object=case,
+            )
+
+    @staticmethod
+    def _dispatch_bulk_notifications(cases: list[Case], actor: Any) -> None:
+        """
+        Batched ``_dispatch_notifications`` for ``bulk_transition``.
+
+        ``case.status`` must already hold the new status.  Primary
+        complainants are fetched with one query and every notification
+        is inserted with one ``bulk_create``.
+        """
+        complainant_statuses = {CaseStatus.RETURNED_TO_COMPLAINANT, CaseStatus.VOIDED}
+        needs_primary = [c.pk for c in cases if c.status in complainant_statuses]
+        primaries: dict[int, Any] = {}
+        if needs_primary:
+            primaries = {
+                cc.case_id: cc.user
+                for cc in CaseComplainant.objects.filter(
+                    case_id__in=needs_primary, is_primary=True,
+                ).select_related("user")
+            }
+
+        batch = []
+        for case in cases:
+            recipients, event_type = CaseWorkflowService._notification_route(
+                case, case.status, primaries.get(case.pk),
+            )
+            if recipients:
+                batch.append((recipients, event_type, case))
+        NotificationService.create_many(actor=actor, batch=batch)
+
+    @staticmethod
+    def _notification_route(
+        case: Case,
+        new_status: str,
+        primary_complainant: Any | None,
+    ) -> tuple[list[Any], str]:
+        """
+        Resolve ``(recipients, event_type)`` for a transition into
+        *new_status* (see the routing table in ``_dispatch_notifications``).
+        """
         recipients = []
         event_type = "case_status_changed"
 
         if new_status == CaseStatus.RETURNED_TO_COMPLAINANT:
-            primary = case.complainants.filter(
-                is_primary=True,
-            ).select_related("user").first()
-            if primary:
-                recipients = [primary.user]
+            if primary_complainant:
+                recipients = [primary_complainant]
             event_type = "complaint_returned"
 
         elif new_status == CaseStatus.VOIDED:
-            primary = case.complainants.filter(
-                is_primary=True,
-            ).select_related("user").first()
-            if primary:
-                recipients = [primary.user]
+            if primary_complainant:
+                recipients = [primary_complainant]
             event_type = "case_rejected"
 
         elif new_status == CaseStatus.OPEN:
@@ -1076,13 +1467,92 @@ class CaseWorkflowService:
                 close_recipients.append(case.assigned_detective)
             recipients = close_recipients
 
-        if recipients:
-            NotificationService.create(
-                actor=actor,
-                recipients=recipients,
-                event_type=event_type,
-                related_object=case,
+        return recipients, event_type
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  Case Review Queue Service
+# ═══════════════════════════════════════════════════════════════════
+
+
+class CaseReviewQueueService:
+    """
+    Hands complaint-review and officer-review cases out to reviewers.
+
+    Instead of every cadet or officer opening the same case from a
+    shared list, each reviewer claims a batch of cases for a lease
+    (``settings.REVIEW_CLAIM_LEASE_SECONDS``).  Claimed cases are hidden
+    from other reviewers' claims, and ``transition_state`` refuses a
+    decision from anyone but the claimant until the lease expires.
+    See ``core.domain.queues``.
+    """
+
+    @staticmethod
+    def _queue_queryset(queue: str, requesting_user: Any) -> QuerySet[Case]:
+        try:
+            statuses, perm = REVIEW_QUEUES[queue]
+        except KeyError:
+            raise DomainError(
+                f"Unknown review queue '{queue}'. "
+                f"Choose one of: {', '.join(REVIEW_QUEUES)}."
+            )
+        if not requesting_user.has_perm(f"cases.{perm}"):
+            raise PermissionDenied(
+                "You do not have permission to work this review queue."
             )
+        return Case.objects.filter(status__in=statuses)
+
+    @staticmethod
+    def claim(
+        queue: str,
+        requesting_user: Any,
+        limit: int,
+        shape: QueryShape | None = None,
+    ) -> list[Case]:
+        """
+        Claim the next *limit* cases of *queue*, oldest first.
+
+        Parameters
+        ----------
+        queue : str
+            ``"complaint"`` (cadets) or ``"officer"`` (officers).
+        requesting_user : User
+            Must hold the queue's permission (see ``REVIEW_QUEUES``).
+        limit : int
+            Batch size, capped at ``settings.REVIEW_CLAIM_MAX_BATCH``.
+        shape : QueryShape | None
+            Projection for the returned rows (list serializer shape).
+
+        Returns
+        -------
+        list[Case]
+            The claimed cases, including ones the user already held.
+
+        Raises
+        ------
+        DomainError
+            Unknown queue or non-positive limit.
+        PermissionDenied
+            The user may not work this queue.
+        """
+        qs = CaseReviewQueueService._queue_queryset(queue, requesting_user)
+        pks = claim_next(qs, requesting_user, limit=limit)
+        return list(
+            apply_query_shape(Case.objects.filter(pk__in=pks), shape)
+            .order_by("created_at", "pk")
+        )
+
+    @staticmethod
+    def release(case_id: int, requesting_user: Any) -> None:
+        """
+        Return a claimed case to its queue without deciding it.
+
+        Raises
+        ------
+        Conflict
+            The user does not hold an active claim on the case.
+        """
+        release_claim(Case.objects.all(), case_id, requesting_user)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -1350,6 +1820,205 @@ class CaseAssignmentService:
 
         return case
 
+    @staticmethod
+    @transaction.atomic
+    def bulk_assign(
+        case_ids: list[int],
+        role: str,
+        assignee_ids: list[int],
+        requesting_user: Any,
+        balance: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Assign one role on many cases to one or more users.
+
+        Built for redistributing a caseload (e.g. a departed detective's
+        cases) in one request.  Cases are spread over the assignees
+        round-robin in id order, or — with ``balance`` — each case goes to
+        the assignee with the fewest open cases in that role at the time.
+
+        Parameters
+        ----------
+        case_ids : list[int]
+            Cases to assign (duplicates ignored), at most
+            ``BULK_TRANSITION_MAX_CASES``.
+        role : str
+            A key of ``ASSIGNMENT_ROLES``.
+        assignee_ids : list[int]
+            Users to assign; every one must hold the role's assignee
+            permission.
+        requesting_user : User
+            Must hold the role's assigning permission.
+        balance : bool
+            Distribute by current open-case load instead of plain
+            round-robin.
+
+        Returns
+        -------
+        list[dict]
+            One entry per requested id, in id order:
+            ``{"id", "ok", "assigned_to", "status", "detail"}``.
+
+        Raises
+        ------
+        DomainError
+            Unknown role, empty/oversized batch, or an assignee without
+            the role.
+        NotFound
+            An assignee id does not exist.
+        PermissionDenied
+            The requester may not assign this role.
+
+        Implementation Contract
+        -----------------------
+        1. Check the requester and every assignee once, not per case.
+        2. Lock the cases in id order.  Detectives can be assigned to
+           ``OPEN`` cases (which move to ``INVESTIGATION``, as with
+           ``assign_detective``) and reassigned on ``INVESTIGATION``
+           cases; other roles on any case that is not closed or voided.
+        3. One ``UPDATE`` sets the assignee (and status) of every case.
+        4. One ``bulk_create`` of ``CaseStatusLog`` rows; one
+           notification per assignee.
+        """
+        from django.contrib.auth import get_user_model
+
+        try:
+            field, assign_perm, assignee_perm, label = ASSIGNMENT_ROLES[role]
+        except KeyError:
+            raise DomainError(
+                f"Unknown role '{role}'. Choose one of: {', '.join(ASSIGNMENT_ROLES)}."
+            )
+
+        if not requesting_user.has_perm(f"cases.{assign_perm}"):
+            raise PermissionDenied(
+                f"You do not have permission to assign a {label.lower()}."
+            )
+
+        ids = sorted(set(case_ids))
+        if not ids:
+            raise DomainError("Provide at least one case id.")
+        if len(ids) > BULK_TRANSITION_MAX_CASES:
+            raise DomainError(
+                f"At most {BULK_TRANSITION_MAX_CASES} cases can be "
+                "assigned in one request."
+            )
+
+        # 1. Resolve and validate the assignees once.
+        assignee_ids = list(dict.fromkeys(assignee_ids))
+        users = get_user_model().objects.in_bulk(assignee_ids)
+        if missing := [uid for uid in assignee_ids if uid not in users]:
+            raise NotFound(f"User(s) not found: {', '.join(map(str, missing))}.")
+        assignees = [users[uid] for uid in assignee_ids]
+        for assignee in assignees:
+            if not assignee.has_perm(f"cases.{assignee_perm}"):
+                raise DomainError(
+                    f"User '{assignee.get_username()}' must hold the '{label}' role."
+                )
+
+        # 2. Lock and filter the cases.
+        cases = {
+            case.pk: case
+            for case in (
+                Case.objects
+                .select_for_update()
+                .filter(pk__in=ids)
+                .order_by("pk")
+                .only("pk", "status", field)
+            )
+        }
+        results: dict[int, dict[str, Any]] = {}
+        eligible: list[Case] = []
+        for pk in ids:
+            case = cases.get(pk)
+            result = {
+                "id": pk, "ok": False, "assigned_to": None,
+                "status": case.status if case else None, "detail": "",
+            }
+            results[pk] = result
+            if case is None:
+                result["detail"] = "Case not found."
+            elif role == "detective" and case.status not in (
+                CaseStatus.OPEN, CaseStatus.INVESTIGATION,
+            ):
+                result["detail"] = "Case must be OPEN or under INVESTIGATION to assign a detective."
+            elif case.status in INACTIVE_CASE_STATUSES:
+                result["detail"] = "Closed or voided cases cannot be reassigned."
+            else:
+                eligible.append(case)
+
+        if not eligible:
+            return [results[pk] for pk in ids]
+
+        # 3. Distribute.
+        if balance:
+            load = dict.fromkeys(assignee_ids, 0)
+            load.update(
+                Case.objects
+                .filter(**{f"{field}__in": assignee_ids})
+                .exclude(status__in=INACTIVE_CASE_STATUSES)
+                .exclude(pk__in=[c.pk for c in eligible])
+                .values_list(field)
+                .annotate(n=Count("pk"))
+            )
+            heap = [(load[uid], position, uid) for position, uid in enumerate(assignee_ids)]
+            heapq.heapify(heap)
+            chosen: dict[int, Any] = {}
+            for case in eligible:
+                count, position, uid = heapq.heappop(heap)
+                chosen[case.pk] = users[uid]
+                heapq.heappush(heap, (count + 1, position, uid))
+        else:
+            chosen = {
+                case.pk: assignees[i % len(assignees)]
+                for i, case in enumerate(eligible)
+            }
+
+        now = timezone.now()
+        changes: dict[str, Any] = {"updated_at": now, "revision": F("revision") + 1}
+        if len(assignees) == 1:
+            changes[field] = assignees[0]
+        else:
+            changes[field] = SQLCase(
+                *(When(pk=pk, then=Value(user.pk)) for pk, user in chosen.items())
+            )
+        if role == "detective":
+            changes["status"] = SQLCase(
+                When(status=CaseStatus.OPEN, then=Value(CaseStatus.INVESTIGATION)),
+                default=F("status"),
+            )
+        Case.objects.filter(pk__in=list(chosen)).update(**changes)
+        invalidate_tags(CASES_TAG, *(case_tag(pk) for pk in chosen))
+
+        # 4. Audit trail and notifications.
+        logs: list[CaseStatusLog] = []
+        per_assignee: dict[int, list[Case]] = {}
+        for case in eligible:
+            assignee = chosen[case.pk]
+            to_status = case.status
+            if role == "detective" and case.status == CaseStatus.OPEN:
+                to_status = CaseStatus.INVESTIGATION
+            logs.append(CaseStatusLog(
+                case=case,
+                from_status=case.status,
+                to_status=to_status,
+                changed_by=requesting_user,
+                message=f"{label} {assignee.get_full_name()} assigned to case.",
+            ))
+            results[case.pk].update(ok=True, assigned_to=assignee.pk, status=to_status)
+            per_assignee.setdefault(assignee.pk, []).append(case)
+        CaseStatusLog.objects.bulk_create(logs)
+
+        for uid, assigned in per_assignee.items():
+            NotificationService.create(
+                actor=requesting_user,
+                recipients=[users[uid]],
+                event_type="cases_assigned",
+                payload={"count": len(assigned)},
+                related_object=assigned[0] if len(assigned) == 1 else None,
+            )
+
+        return [results[pk] for pk in ids]
+
     @staticmethod
     @transaction.atomic
     def unassign_role(
@@ -1474,6 +2143,7 @@ class CaseComplainantService:
             user=user,
             is_primary=is_primary,
         )
+        CaseCounterService.adjust(case.pk, complainant_count=1)
         return complainant
 
     @staticmethod
@@ -1584,9 +2254,129 @@ class CaseWitnessService:
             )
 
         witness = CaseWitness.objects.create(case=case, **validated_data)
+        CaseCounterService.adjust(case.pk, witness_count=1)
         return witness
 
 
+# ═══════════════════════════════════════════════════════════════════
+#  Case Counter Service
+# ═══════════════════════════════════════════════════════════════════
+
+
+class CaseCounterService:
+    """
+    Maintains the denormalised ``Case.*_count`` columns.
+
+    The services that create, delete or re-status counted rows call
+    ``adjust`` inside their own transaction.  The increment is a single
+    ``UPDATE … SET n = n + delta`` (an ``F()`` expression), so concurrent
+    writers never lose an update and a rolled-back transaction rolls the
+    counter back with it.
+
+    ``recount`` rebuilds the columns from the source tables; it backs
+    the ``recount_case_counters`` management command and repairs drift
+    from writes that bypass the services (admin, shell, raw SQL).
+    Decrements never go below zero, so drift cannot break a write path.
+    """
+
+    @staticmethod
+    def adjust(case_id: int | None, **deltas: int) -> None:
+        """
+        Add *deltas* to the named counters of one case.
+
+        Usage::
+
+            CaseCounterService.adjust(evidence.case_id, evidence_count=1)
+        """
+        changes = {
+            # A decrement is clamped at zero: a counter that has drifted
+            # (rows written around the services) must not abort the
+            # caller's transaction on the column's CHECK constraint.
+            field: F(field) + delta if delta > 0 else Greatest(F(field) + delta, 0)
+            for field, delta in deltas.items()
+            if delta
+        }
+        if case_id is not None and changes:
+            Case.objects.filter(pk=case_id).update(**changes)
+
+    @staticmethod
+    def _sources() -> dict[str, tuple[Any, dict[str, Any]]]:
+        """counter field → (counted model, extra filter)."""
+        from evidence.models import Evidence
+        from suspects.models import (
+            OPEN_TIP_STATUSES,
+            SUSPECT_AT_TRIAL_STATUSES,
+            BountyTip,
+            Suspect,
+        )
+
+        return {
+            "complainant_count": (CaseComplainant, {}),
+            "witness_count": (CaseWitness, {}),
+            "evidence_count": (Evidence, {}),
+            "suspect_count": (Suspect, {}),
+            "suspects_at_trial_count": (Suspect, {"status__in": SUSPECT_AT_TRIAL_STATUSES}),
+            "open_tip_count": (BountyTip, {"status__in": OPEN_TIP_STATUSES}),
+        }
+
+    @classmethod
+    def recount(cls, queryset: QuerySet[Case] | None = None) -> int:
+        """
+        Recompute every counter of the cases in *queryset* (default: all).
+
+        Returns
+        -------
+        int
+            Number of cases whose stored counters were wrong and have
+            been corrected.
+        """
+        fresh = {
+            field: Coalesce(
+                Subquery(
+                    model.objects
+                    .filter(case=OuterRef("pk"), **filters)
+                    .order_by()
+                    .values("case")
+                    .annotate(n=Count("pk"))
+                    .values("n")
+                ),
+                0,
+            )
+            for field, (model, filters) in cls._sources().items()
+        }
+        qs = Case.objects.all() if queryset is None else queryset
+        stale = Q()
+        for field in fresh:
+            stale |= ~Q(**{field: F(f"fresh_{field}")})
+        stale_ids = list(
+            qs.annotate(**{f"fresh_{field}": expr for field, expr in fresh.items()})
+            .filter(stale)
+            .values_list("pk", flat=True)
+        )
+        if stale_ids:
+            Case.objects.filter(pk__in=stale_ids).update(**fresh)
+        return len(stale_ids)
+
+
+class CaseRevisionService:
+    """
+    Bumps ``Case.revision`` for writes that do not go through
+    ``Case.save()``, and invalidates the cases' ``core.cache`` tags.
+
+    ``cases.signals`` calls ``bump`` when a complainant, witness,
+    evidence item, suspect, interrogation or trial is saved or deleted;
+    services that move rows between cases call it for the old case.
+    """
+
+    @staticmethod
+    def bump(*case_ids: int | None) -> None:
+        """Increment the revision of each case in *case_ids*."""
+        ids = {pk for pk in case_ids if pk is not None}
+        if ids:
+            Case.objects.filter(pk__in=ids).update(revision=F("revision") + 1)
+            invalidate_tags(CASES_TAG, *(case_tag(pk) for pk in ids))
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  Case Calculation Service
 # ═══════════════════════════════════════════════════════════════════
@@ -1721,12 +2511,24 @@ class CaseReportingService:
 
     Access is restricted to users whose role is Judge, Captain,
     Police Chief, or System Administrator.
+
+    Built reports are cached under ``(case id, Case.revision, date)``.
+    Any write to the case or the rows the report reads bumps the
+    revision, so a stale report is never served; the date component
+    refreshes the day-based fields (days wanted, days since creation)
+    once a day.  Concurrent requests missing the same key build it once,
+    behind an advisory lock.
     """
 
     #: Permission required to pull the full case report.
     _REPORT_PERM = f"cases.{CasesPerms.CAN_VIEW_CASE_REPORT}"
 
+    @staticmethod
+    def _cache_key(case_id: int, revision: int) -> str:
+        return f"case-report:{case_id}:{revision}:{timezone.localdate().isoformat()}"
+
     @classmethod
+    @read_replica()
     def get_case_report(cls, user: Any, case_id: int) -> dict[str, Any]:
         """
         Build and return a comprehensive case report dictionary.
@@ -1760,37 +2562,156 @@ class CaseReportingService:
             ),
         )
 
-        # ── Fetch the case with all related data ────────────────────
-        try:
-            case = (
+        revision = (
+            Case.objects.filter(pk=case_id).values_list("revision", flat=True).first()
+        )
+        if revision is None:
+            raise NotFound(f"Case #{case_id} not found.")
+
+        key = cls._cache_key(case_id, revision)
+        report = cache.get(key)
+        if report is None:
+            # Concurrent misses for one revision wait for a single build.
+            # A previous revision is never served, so there is no stale path.
+            with advisory_lock(key, wait=settings.APP_CACHE_LOCK_WAIT_SECONDS):
+                report = cache.get(key)
+                if report is None:
+                    report = cls._build_case_report(case_id)
+                    cache.set(key, report, settings.CASE_REPORT_CACHE_SECONDS)
+        return report
+
+    @classmethod
+    def iter_docket_reports(
+        cls, user: Any, case_ids: list[int] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Return a lazy iterator of reports for a judge's docket.
+
+        Permission and the case list are resolved eagerly, so a refused
+        request fails before any output is produced.  Reports are then
+        built ``DOCKET_REPORT_CHUNK_SIZE`` cases at a time with a fixed
+        number of queries per chunk, reusing cached reports where the
+        revision still matches.
+
+        Parameters
+        ----------
+        user : User
+            The requesting user.  Must have an allowed role.
+        case_ids : list[int] or None
+            Cases to report on, in output order.  ``None`` reports on the
+            user's own queue: every ``JUDICIARY`` case assigned to them.
+
+        Returns
+        -------
+        Iterator[dict]
+            One ``{"id": …, "report": {…}}`` per case, or
+            ``{"id": …, "detail": "Case #… not found."}`` for unknown ids.
+
+        Raises
+        ------
+        core.domain.exceptions.PermissionDenied
+            If the user lacks the ``CAN_VIEW_CASE_REPORT`` permission.
+        core.domain.exceptions.DomainError
+            If more than ``DOCKET_REPORT_MAX_CASES`` ids are given.
+        """
+        require_permission(
+            user,
+            cls._REPORT_PERM,
+            message=(
+                "Only a Judge, Captain, or Police Chief may access "
+                "the full case report."
+            ),
+        )
+        if case_ids is None:
+            case_ids = list(
                 Case.objects
-                .select_related(
-                    "created_by__role",
-                    "approved_by__role",
-                    "assigned_detective__role",
-                    "assigned_sergeant__role",
-                    "assigned_captain__role",
-                    "assigned_judge__role",
-                )
-                .prefetch_related(
-                    Prefetch(
-                        "complainants",
-                        queryset=CaseComplainant.objects.select_related(
-                            "user__role", "reviewed_by__role",
-                        ),
-                    ),
-                    "witnesses",
-                    Prefetch(
-                        "status_logs",
-                        queryset=CaseStatusLog.objects.select_related(
-                            "changed_by__role",
-                        ).order_by("created_at"),
-                    ),
+                .filter(status=CaseStatus.JUDICIARY, assigned_judge=user)
+                .order_by("pk")
+                .values_list("pk", flat=True)
+            )
+        else:
+            case_ids = list(dict.fromkeys(case_ids))
+            if len(case_ids) > DOCKET_REPORT_MAX_CASES:
+                raise DomainError(
+                    f"At most {DOCKET_REPORT_MAX_CASES} cases can be "
+                    f"reported on at once."
                 )
-                .get(pk=case_id)
+        return cls._iter_reports(case_ids)
+
+    @classmethod
+    def _iter_reports(cls, case_ids: list[int]) -> Iterator[dict[str, Any]]:
+        for start in range(0, len(case_ids), DOCKET_REPORT_CHUNK_SIZE):
+            chunk = case_ids[start:start + DOCKET_REPORT_CHUNK_SIZE]
+            revisions = dict(
+                Case.objects.filter(pk__in=chunk).values_list("pk", "revision")
             )
-        except Case.DoesNotExist:
+            keys = {pk: cls._cache_key(pk, rev) for pk, rev in revisions.items()}
+            cached = cache.get_many(keys.values())
+            reports = {pk: cached[key] for pk, key in keys.items() if key in cached}
+
+            missing = [pk for pk in revisions if pk not in reports]
+            if missing:
+                built = cls._build_case_reports(missing)
+                cache.set_many(
+                    {keys[pk]: report for pk, report in built.items()},
+                    settings.CASE_REPORT_CACHE_SECONDS,
+                )
+                reports.update(built)
+
+            for pk in chunk:
+                if pk in reports:
+                    yield {"id": pk, "report": reports[pk]}
+                else:
+                    yield {"id": pk, "detail": f"Case #{pk} not found."}
+
+    @classmethod
+    def _build_case_report(cls, case_id: int) -> dict[str, Any]:
+        """Assemble the report for ``get_case_report`` from the database."""
+        reports = cls._build_case_reports([case_id])
+        if not reports:
             raise NotFound(f"Case #{case_id} not found.")
+        return next(iter(reports.values()))
+
+    @classmethod
+    def _build_case_reports(cls, case_ids: list[int]) -> dict[int, dict[str, Any]]:
+        """
+        Assemble reports for *case_ids* with a fixed number of queries.
+
+        Cases (with their complainants, witnesses and status logs),
+        evidence, suspects, interrogations and trials are each loaded
+        once for the whole batch.  Unknown ids are absent from the result.
+        """
+        # ── Fetch the cases with all related data ───────────────────
+        cases = (
+            Case.objects
+            .filter(pk__in=case_ids)
+            .select_related(
+                "created_by__role",
+                "approved_by__role",
+                "assigned_detective__role",
+                "assigned_sergeant__role",
+                "assigned_captain__role",
+                "assigned_judge__role",
+            )
+            .prefetch_related(
+                Prefetch(
+                    "complainants",
+                    queryset=CaseComplainant.objects.select_related(
+                        "user__role", "reviewed_by__role",
+                    ),
+                ),
+                "witnesses",
+                Prefetch(
+                    "status_logs",
+                    queryset=CaseStatusLog.objects.select_related(
+                        "changed_by__role",
+                    ).order_by("created_at"),
+                ),
+            )
+        )
+        cases = {case.pk: case for case in cases}
+        if not cases:
+            return {}
 
         # ── Lazy-import cross-app models to avoid circular deps ─────
         from evidence.models import Evidence
@@ -1799,13 +2720,13 @@ class CaseReportingService:
         # ── Evidence summary (metadata only, no raw file blobs) ─────
         evidences_qs = (
             Evidence.objects
-            .filter(case=case)
+            .filter(case_id__in=cases)
             .select_related("registered_by__role")
             .order_by("-created_at")
         )
-        evidence_list = []
+        evidence_by_case: dict[int, list[dict[str, Any]]] = defaultdict(list)
         for ev in evidences_qs:
-            evidence_list.append({
+            evidence_by_case[ev.case_id].append({
                 "id": ev.id,
                 "evidence_type": ev.evidence_type,
                 "title": ev.title,
@@ -1817,7 +2738,7 @@ class CaseReportingService:
         # ── Suspects with interrogation & trial summaries ───────────
         suspects_qs = (
             Suspect.objects
-            .filter(case=case)
+            .filter(case_id__in=cases)
             .select_related(
                 "identified_by__role",
                 "approved_by_sergeant__role",
@@ -1839,7 +2760,7 @@ class CaseReportingService:
             )
             .order_by("-wanted_since")
         )
-        suspects_list = []
+        suspects_by_case: dict[int, list[dict[str, Any]]] = defaultdict(list)
         for s in suspects_qs:
             interrogation_summaries = [
                 {
@@ -1864,7 +2785,7 @@ class CaseReportingService:
                 }
                 for t in s.trials.all()
             ]
-            suspects_list.append({
+            suspects_by_case[s.case_id].append({
                 "id": s.id,
                 "full_name": s.full_name,
                 "national_id": s.national_id,
@@ -1880,6 +2801,18 @@ class CaseReportingService:
                 "trials": trial_summaries,
             })
 
+        return {
+            pk: cls._format_report(case, evidence_by_case[pk], suspects_by_case[pk])
+            for pk, case in cases.items()
+        }
+
+    @staticmethod
+    def _format_report(
+        case: Case,
+        evidence_list: list[dict[str, Any]],
+        suspects_list: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Shape one prefetched case and its summaries into a report."""
         # ── Complainants ────────────────────────────────────────────
         complainants_list = [
             {
@@ -0,0 +1,59 @@
+"""
+Keeps ``Case.revision`` and the ``case:{id}`` / ``cases`` cache tags
+current for writes to a case and the rows a case report is built from.
+
+The case's own saves bump the revision in ``Case.save()``; this module
+invalidates their cache tag and covers the related tables.  Receivers
+are connected by ``CasesConfig.ready()`` with lazy model references, so
+the cases app does not import the suspects or evidence apps at load
+time.
+"""
+
+from django.db.models.signals import post_delete, post_save
+
+from core.cache import CASES_TAG, case_tag, invalidate_tags
+
+#: Models whose rows appear in ``CaseReportingService.get_case_report``.
+#: Evidence subtypes are listed individually: Django sends model signals
+#: for the concrete class only.
+REVISION_SOURCES: tuple[str, ...] = (
+    "cases.CaseComplainant",
+    "cases.CaseWitness",
+    "evidence.Evidence",
+    "evidence.TestimonyEvidence",
+    "evidence.BiologicalEvidence",
+    "evidence.VehicleEvidence",
+    "evidence.IdentityEvidence",
+    "suspects.Suspect",
+    "suspects.Interrogation",
+    "suspects.Trial",
+)
+
+
+def bump_case_revision(sender, instance, raw=False, **kwargs) -> None:
+    """Increment the revision of the case *instance* belongs to."""
+    if raw:
+        return
+    from .services import CaseRevisionService
+
+    CaseRevisionService.bump(instance.case_id)
+
+
+def invalidate_case(sender, instance, raw=False, **kwargs) -> None:
+    """Drop cached data derived from the saved or deleted case."""
+    if not raw:
+        invalidate_tags(CASES_TAG, case_tag(instance.pk))
+
+
+def connect_revision_signals() -> None:
+    for name, signal in (("save", post_save), ("delete", post_delete)):
+        signal.connect(
+            invalidate_case, sender="cases.Case",
+            dispatch_uid=f"case-cache:{name}",
+        )
+    for model in REVISION_SOURCES:
+        for name, signal in (("save", post_save), ("delete", post_delete)):
+            signal.connect(
+                bump_case_revision, sender=model,
+                dispatch_uid=f"case-revision:{name}:{model}",
+            )
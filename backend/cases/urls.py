@@ -7,6 +7,7 @@ Route Hierarchy
 ---------------
   /api/cases/                             → list / create
   /api/cases/{id}/                        → retrieve / partial_update / destroy
+  GET  /api/cases/export/                  → stream filtered cases (CSV / NDJSON)
 
   ── Workflow @actions (resource-level RPC) ──────────────────────
   POST /api/cases/{id}/submit/             → complainant submits draft
@@ -15,6 +16,9 @@ Route Hierarchy
   POST /api/cases/{id}/officer-review/     → officer approve/reject
   POST /api/cases/{id}/approve-crime-scene/→ superior approves crime-scene case
   POST /api/cases/{id}/transition/        → generic centralized transition
+  POST /api/cases/bulk-transition/        → one transition applied to many cases
+  POST /api/cases/review-queue/claim/      → lease next N cases to a reviewer
+  POST /api/cases/{id}/release-claim/      → hand a claimed case back
 
   ── Assignment @actions ─────────────────────────────────────────
   POST   /api/cases/{id}/assign-detective/
@@ -22,6 +26,7 @@ Route Hierarchy
   POST   /api/cases/{id}/assign-sergeant/
   POST   /api/cases/{id}/assign-captain/
   POST   /api/cases/{id}/assign-judge/
+  POST   /api/cases/bulk-assign/          → one role on many cases, round-robin / balanced
 
   ── Sub-resource @actions ───────────────────────────────────────
   GET  /api/cases/{id}/complainants/
@@ -33,6 +38,8 @@ Route Hierarchy
 
   GET  /api/cases/{id}/status-log/
   GET  /api/cases/{id}/calculations/
+  GET  /api/cases/{id}/report/             → full judiciary report
+  POST /api/cases/docket-report/           → batch reports streamed as NDJSON
 """
 
 from rest_framework.routers import DefaultRouter
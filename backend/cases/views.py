@@ -22,6 +22,7 @@ from __future__ import annotations
 import logging
 
 from django.contrib.auth import get_user_model
+from django.http import HttpResponseBase
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import (
     OpenApiParameter,
@@ -34,20 +35,30 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from core.domain.conditional import conditional_response
 from core.domain.exceptions import NotFound, PermissionDenied
+from core.domain.exports import stream_export, stream_json_lines
+from core.domain.projection import get_query_shape
+from core.domain.replicas import read_replica
 from core.permissions_constants import CasesPerms
 
 from .models import Case, CaseComplainant
 from .serializers import (
     AddComplainantSerializer,
     AssignPersonnelSerializer,
+    BulkAssignPersonnelSerializer,
+    BulkAssignResultSerializer,
     CadetReviewSerializer,
+    CaseBulkTransitionResultSerializer,
+    CaseBulkTransitionSerializer,
     CaseCalculationsSerializer,
     CaseComplainantSerializer,
     CaseDetailSerializer,
     CaseFilterSerializer,
     CaseListSerializer,
+    CaseListValuesSerializer,
     CaseReportSerializer,
+    CaseReviewClaimSerializer,
     CaseStatusLogSerializer,
     CaseTransitionSerializer,
     CaseUpdateSerializer,
@@ -56,16 +67,20 @@ from .serializers import (
     ComplainantReviewSerializer,
     ComplaintCaseCreateSerializer,
     CrimeSceneCaseCreateSerializer,
+    DocketReportLineSerializer,
+    DocketReportSerializer,
     OfficerReviewSerializer,
     ResubmitComplaintSerializer,
 )
 from .services import (
+    CASE_EXPORT_COLUMNS,
     CaseAssignmentService,
     CaseCalculationService,
     CaseComplainantService,
     CaseCreationService,
     CaseQueryService,
     CaseReportingService,
+    CaseReviewQueueService,
     CaseWitnessService,
     CaseWorkflowService,
 )
@@ -150,8 +165,49 @@ class CaseViewSet(viewsets.ViewSet):
         filters = filter_serializer.validated_data
 
         qs = CaseQueryService.get_filtered_queryset(request.user, filters)
-        serializer = CaseListSerializer(qs, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        with read_replica():
+            data = CaseListValuesSerializer(qs).data
+        return Response(data, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        summary="Export cases (CSV / NDJSON)",
+        description=(
+            "Stream every case visible to the authenticated user as a CSV or "
+            "NDJSON download.  Accepts the same filters as the case list; rows "
+            "are read through a server-side cursor, so large exports run in "
+            "constant memory."
+        ),
+        parameters=[
+            CaseFilterSerializer,
+            OpenApiParameter(
+                name="export_format", type=str, location=OpenApiParameter.QUERY,
+                enum=["csv", "ndjson"], default="csv",
+                description="csv (with a header row) or ndjson (one JSON object per line).",
+            ),
+        ],
+        responses={
+            200: OpenApiResponse(description="Streamed CSV or NDJSON attachment."),
+            400: OpenApiResponse(description="Invalid filter or export format."),
+        },
+        tags=["Cases"],
+    )
+    @action(detail=False, methods=["get"], url_path="export", url_name="export")
+    def export(self, request: Request) -> HttpResponseBase:
+        """
+        GET /api/cases/export/?export_format=csv|ndjson
+
+        Stream the filtered, role-scoped case list as an attachment.
+        """
+        filter_serializer = CaseFilterSerializer(data=request.query_params)
+        filter_serializer.is_valid(raise_exception=True)
+
+        qs = CaseQueryService.get_filtered_queryset(
+            request.user, filter_serializer.validated_data,
+        )
+        return stream_export(
+            qs, CASE_EXPORT_COLUMNS,
+            request.query_params.get("export_format", "csv"), "cases",
+        )
 
     @extend_schema(
         summary="Create a new case",
@@ -214,24 +270,32 @@ class CaseViewSet(viewsets.ViewSet):
         summary="Retrieve case details",
         description=(
             "Return the full case detail with nested complainants, witnesses, "
-            "status logs, and computed formula fields. Requires authentication."
+            "status logs, and computed formula fields. Requires authentication. "
+            "Send the returned ETag in If-None-Match to get 304 when unchanged."
         ),
         responses={
             200: OpenApiResponse(response=CaseDetailSerializer, description="Full case detail."),
+            304: OpenApiResponse(description="Not modified since the ETag in If-None-Match."),
             404: OpenApiResponse(description="Case not found."),
         },
         tags=["Cases"],
     )
-    def retrieve(self, request: Request, pk: int = None) -> Response:
+    def retrieve(self, request: Request, pk: int = None) -> HttpResponseBase:
         """
         GET /api/cases/{id}/
 
         Return the full case detail with all nested sub-resources and
-        computed formula fields.
+        computed formula fields.  Answers 304 from a single query when
+        ``If-None-Match`` still matches.
         """
-        case = CaseQueryService.get_case_detail(request.user, pk)
-        serializer = CaseDetailSerializer(case, context={"request": request})
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        etag = CaseQueryService.get_case_detail_etag(request.user, pk)
+
+        def build() -> Response:
+            case = CaseQueryService.get_case_detail(request.user, pk)
+            serializer = CaseDetailSerializer(case, context={"request": request})
+            return Response(serializer.data, status=status.HTTP_200_OK)
+
+        return conditional_response(request, etag, build)
 
     @extend_schema(
         summary="Partially update case",
@@ -459,6 +523,56 @@ class CaseViewSet(viewsets.ViewSet):
         out = CaseDetailSerializer(case, context={"request": request})
         return Response(out.data, status=status.HTTP_200_OK)
 
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="review-queue/claim",
+        url_name="review-queue-claim",
+    )
+    @extend_schema(
+        summary="Claim cases from a review queue",
+        description=(
+            "Lease the next N cases awaiting complaint (Cadet) or officer "
+            "review to the caller. Claimed cases are skipped by other "
+            "reviewers until decided, released, or the lease expires. "
+            "Calling again renews the caller's existing claims."
+        ),
+        request=CaseReviewClaimSerializer,
+        responses={
+            200: OpenApiResponse(response=CaseListSerializer(many=True), description="Claimed cases."),
+            403: OpenApiResponse(description="Caller may not work this queue."),
+        },
+        tags=["Cases – Workflow"],
+    )
+    def claim_review(self, request: Request) -> Response:
+        """POST /api/cases/review-queue/claim/ — lease cases to the reviewer."""
+        serializer = CaseReviewClaimSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        cases = CaseReviewQueueService.claim(
+            serializer.validated_data["queue"],
+            request.user,
+            serializer.validated_data["limit"],
+            shape=get_query_shape(CaseListSerializer),
+        )
+        out = CaseListSerializer(cases, many=True, context={"request": request})
+        return Response(out.data, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=["post"], url_path="release-claim")
+    @extend_schema(
+        summary="Release a claimed case",
+        description="Return a claimed case to its review queue without deciding it.",
+        request=None,
+        responses={
+            204: OpenApiResponse(description="Claim released."),
+            409: OpenApiResponse(description="Caller holds no active claim on the case."),
+        },
+        tags=["Cases – Workflow"],
+    )
+    def release_claim(self, request: Request, pk: int = None) -> Response:
+        """POST /api/cases/{id}/release-claim/"""
+        CaseReviewQueueService.release(pk, request.user)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
     @action(detail=True, methods=["post"], url_path="approve-crime-scene")
     @extend_schema(
         summary="Approve crime-scene case",
@@ -539,6 +653,43 @@ class CaseViewSet(viewsets.ViewSet):
         out = CaseDetailSerializer(case, context={"request": request})
         return Response(out.data, status=status.HTTP_200_OK)
 
+    @action(detail=False, methods=["post"], url_path="bulk-transition", url_name="bulk-transition")
+    @extend_schema(
+        summary="Transition many cases at once",
+        description=(
+            "Apply one state transition to a batch of cases in a single "
+            "transaction, e.g. an officer opening a page of claimed complaints. "
+            "Each case succeeds or fails independently; the response lists the "
+            "outcome per case."
+        ),
+        request=CaseBulkTransitionSerializer,
+        responses={
+            200: OpenApiResponse(response=CaseBulkTransitionResultSerializer(many=True), description="Per-case results."),
+            400: OpenApiResponse(description="Empty or oversized batch."),
+        },
+        tags=["Cases – Workflow"],
+    )
+    def bulk_transition(self, request: Request) -> Response:
+        """
+        POST /api/cases/bulk-transition/
+
+        Steps
+        -----
+        1. Validate ``request.data`` with ``CaseBulkTransitionSerializer``.
+        2. Delegate to ``CaseWorkflowService.bulk_transition``.
+        3. Return HTTP 200 with the per-case results.
+        """
+        serializer = CaseBulkTransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = CaseWorkflowService.bulk_transition(
+            serializer.validated_data["case_ids"],
+            serializer.validated_data["target_status"],
+            request.user,
+            serializer.validated_data.get("message", ""),
+        )
+        out = CaseBulkTransitionResultSerializer(results, many=True)
+        return Response(out.data, status=status.HTTP_200_OK)
+
     # ── Assignment @actions ───────────────────────────────────────────
 
     @action(detail=True, methods=["post"], url_path="assign-detective")
@@ -704,6 +855,47 @@ class CaseViewSet(viewsets.ViewSet):
         out = CaseDetailSerializer(case, context={"request": request})
         return Response(out.data, status=status.HTTP_200_OK)
 
+    @action(detail=False, methods=["post"], url_path="bulk-assign", url_name="bulk-assign")
+    @extend_schema(
+        summary="Assign personnel to many cases",
+        description=(
+            "Assign one role (detective, sergeant, captain, judge) on a batch of "
+            "cases to one or more users, round-robin or balanced by each "
+            "assignee's open-case load. Open cases move to INVESTIGATION when a "
+            "detective is assigned. Each assignee receives one notification."
+        ),
+        request=BulkAssignPersonnelSerializer,
+        responses={
+            200: OpenApiResponse(response=BulkAssignResultSerializer(many=True), description="Per-case results."),
+            400: OpenApiResponse(description="Invalid batch or an assignee without the role."),
+            403: OpenApiResponse(description="Permission denied."),
+            404: OpenApiResponse(description="Assignee not found."),
+        },
+        tags=["Cases – Assignment"],
+    )
+    def bulk_assign(self, request: Request) -> Response:
+        """
+        POST /api/cases/bulk-assign/
+
+        Steps
+        -----
+        1. Validate ``request.data`` with ``BulkAssignPersonnelSerializer``.
+        2. Delegate to ``CaseAssignmentService.bulk_assign``.
+        3. Return HTTP 200 with the per-case results.
+        """
+        serializer = BulkAssignPersonnelSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        results = CaseAssignmentService.bulk_assign(
+            data["case_ids"],
+            data["role"],
+            data["user_ids"],
+            request.user,
+            balance=data["balance"],
+        )
+        out = BulkAssignResultSerializer(results, many=True)
+        return Response(out.data, status=status.HTTP_200_OK)
+
     # ── Sub-resource @actions — Complainants ─────────────────────────
 
     @action(
@@ -984,3 +1176,38 @@ class CaseViewSet(viewsets.ViewSet):
             return Response({"detail": str(exc)}, status=status.HTTP_403_FORBIDDEN)
         except NotFound as exc:
             return Response({"detail": str(exc)}, status=status.HTTP_404_NOT_FOUND)
+
+    @extend_schema(
+        summary="Batch case reports for a docket",
+        description=(
+            "Stream full case reports as NDJSON, one ``{id, report}`` object "
+            "per line (``{id, detail}`` for unknown ids).  Omit ``case_ids`` "
+            "to report on every JUDICIARY case assigned to the requester.  "
+            "Reports are built in batches with a fixed number of queries. "
+            "Accessible by Judge, Captain, Police Chief, and System Administrator."
+        ),
+        request=DocketReportSerializer,
+        responses={
+            200: OpenApiResponse(
+                response=DocketReportLineSerializer,
+                description="Streamed NDJSON attachment; one object per line.",
+            ),
+            400: OpenApiResponse(description="Empty or oversized batch."),
+            403: OpenApiResponse(description="Role not allowed."),
+        },
+        tags=["Cases"],
+    )
+    @action(detail=False, methods=["post"], url_path="docket-report", url_name="docket-report")
+    def docket_report(self, request: Request) -> HttpResponseBase:
+        """
+        POST /api/cases/docket-report/
+
+        Stream the reports for ``case_ids`` (or the requester's judiciary
+        queue) as an NDJSON attachment.
+        """
+        serializer = DocketReportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        reports = CaseReportingService.iter_docket_reports(
+            request.user, serializer.validated_data.get("case_ids"),
+        )
+        return stream_json_lines(reports, "docket")
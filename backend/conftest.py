@@ -2,6 +2,11 @@
 Root conftest.py — shared fixtures for the entire test suite.
 
 Provides:
+  - a ``replica`` database alias mirroring the default test database
+    (``core.domain.replicas``), whether or not a replica is configured.
+  - an autouse fixture that empties the cache before every test.
+  - a session fixture that closes the read pool's connections
+    (``core.domain.threads``) before the test database is dropped.
   - ``api_client`` fixture returning a DRF ``APIClient``.
   - ``create_user`` factory fixture for creating test users.
   - ``auth_header`` fixture for authenticated requests (JWT).
@@ -13,6 +18,46 @@ import pytest
 from rest_framework.test import APIClient
 
 
+def pytest_configure(config) -> None:
+    """
+    Route replica reads to a second connection to the test database, so
+    tests can tell the aliases apart without a replica server.
+    """
+    from django.conf import settings
+
+    from core.domain.replicas import REPLICA_DB_ALIAS
+
+    default = settings.DATABASES["default"]
+    settings.DATABASES[REPLICA_DB_ALIAS] = {
+        **default,
+        "OPTIONS": {**default.get("OPTIONS", {})},
+        "TEST": {**default.get("TEST", {}), "MIRROR": "default"},
+    }
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    """
+    Start every test with an empty cache.
+
+    Test transactions are rolled back but cached entries are not, so a
+    value built from one test's rows could otherwise leak into the next.
+    """
+    from django.core.cache import cache
+
+    cache.clear()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _stop_read_threads(django_db_setup, django_db_blocker):
+    """Pool threads keep their connections, which would block the drop."""
+    yield
+    from core.domain import threads
+
+    with django_db_blocker.unblock():
+        threads.shutdown()
+
+
 @pytest.fixture()
 def api_client() -> APIClient:
     """Unauthenticated DRF test client."""
@@ -3,3 +3,9 @@ from django.apps import AppConfig
 
 class CoreConfig(AppConfig):
     name = 'core'
+
+    def ready(self):
+        from .services import SystemConstantsService
+
+        # The choice enumerations are code: build them once per process.
+        SystemConstantsService.get_choice_constants()
@@ -0,0 +1,267 @@
+"""
+core.cache — Cache-aside helpers with tag-based invalidation.
+
+Services cache derived data (dashboards, reports, constants, resolved
+permissions) through this module instead of talking to
+``django.core.cache`` directly, so every entry can be dropped by the
+writes that make it stale.
+
+Tags
+----
+Each entry is stored with the tags of the entities it was built from,
+e.g. ``case_tag(12)`` → ``"case:12"``.  A tag maps to a *version* token
+kept in the cache itself; entries remember the versions current when
+they were built.  ``invalidate_tags("case:12")`` drops the version, so
+every entry tagged with it misses on its next read — no key registry
+and no scans, on any backend.
+
+Coalesced rebuilds
+------------------
+``get_or_build_coalesced`` is for expensive aggregates read under load
+(most wanted, dashboard statistics).  When an entry expires or is
+invalidated, one process takes an advisory lock
+(``core.domain.locks``) and rebuilds it while the others keep serving
+the previous value for up to ``settings.APP_CACHE_STALE_SECONDS``.
+With nothing to serve, the others wait for the rebuild instead of
+running it too.
+
+Builds read from the primary
+----------------------------
+*build* runs under ``read_primary()`` (``core.domain.replicas``).  An
+entry rebuilt after a tag invalidation must include the write that
+invalidated it, which a lagging replica may not have applied yet.
+
+Backends
+--------
+The ``default`` cache configured by ``settings.CACHE_BACKEND``.  The
+``locmem`` default is per process: invalidations reach only the worker
+that made them.  Deployments running several workers should use a
+shared backend (``redis``, ``memcached``, or ``file`` on a shared
+volume).
+
+Usage::
+
+    from core.cache import case_tag, get_or_build, invalidate_tags
+
+    stats = get_or_build(
+        f"case-stats:{case.pk}",
+        lambda: _compute_stats(case),
+        tags=[case_tag(case.pk)],
+    )
+
+    # in a write path
+    invalidate_tags(case_tag(case.pk))
+"""
+
+from __future__ import annotations
+
+import secrets
+import time
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from core.domain.locks import advisory_lock
+from core.domain.replicas import read_primary
+
+T = TypeVar("T")
+
+_ENTRY_PREFIX = "app:"
+_TAG_PREFIX = "app-tag:"
+_MISSING = object()
+
+
+# ── Tag names ───────────────────────────────────────────────────────
+
+
+def case_tag(case_id: int) -> str:
+    """Tag for data derived from one case or the rows attached to it."""
+    return f"case:{case_id}"
+
+
+def suspect_national_tag(national_id: str) -> str:
+    """Tag for data aggregated over every suspect row of one person."""
+    return f"suspect-national:{national_id}"
+
+
+def role_tag(role_id: int) -> str:
+    """Tag for data derived from one role (permissions, hierarchy)."""
+    return f"role:{role_id}"
+
+
+#: Tag for data aggregated over all cases; invalidated with any case tag.
+CASES_TAG = "cases"
+
+#: Tag for data aggregated over all suspects; invalidated on any suspect write.
+SUSPECTS_TAG = "suspects"
+
+#: Tag for data listing all roles; invalidated with any role tag.
+ROLES_TAG = "roles"
+
+
+# ── Tag versions ────────────────────────────────────────────────────
+
+
+def _tag_versions(tags: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the current version of each tag, creating missing ones."""
+    keys = [_TAG_PREFIX + tag for tag in tags]
+    versions = cache.get_many(keys)
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        for key in missing:
+            # ``add`` keeps whichever version a concurrent reader stored first.
+            cache.add(key, secrets.token_hex(8), None)
+        versions.update(cache.get_many(missing))
+    return tuple(versions.get(key, "") for key in keys)
+
+
+def invalidate_tags(*tags: str) -> None:
+    """
+    Invalidate every entry carrying any of *tags*.
+
+    Inside a transaction the versions are dropped immediately and again
+    on commit, so an entry rebuilt from pre-commit data by a concurrent
+    request does not outlive the write.
+    """
+    keys = [_TAG_PREFIX + tag for tag in dict.fromkeys(tags)]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+# ── Entries ─────────────────────────────────────────────────────────
+#
+# Stored as ``(tags, versions, value, fresh_until)``; ``fresh_until`` is
+# a ``time.time()`` deadline for coalesced entries and ``None`` otherwise.
+
+
+def _is_fresh(entry: Any, versions: tuple[str, ...]) -> bool:
+    return (
+        entry is not _MISSING
+        and entry[1] == versions
+        and (entry[3] is None or entry[3] > time.time())
+    )
+
+
+def cache_get(key: str, default: Any = None) -> Any:
+    """Return the entry stored under *key*, or *default* if absent or stale."""
+    entry = cache.get(_ENTRY_PREFIX + key, _MISSING)
+    if entry is _MISSING:
+        return default
+    tags = entry[0]
+    if not _is_fresh(entry, _tag_versions(tags) if tags else ()):
+        return default
+    return entry[2]
+
+
+def cache_set(
+    key: str,
+    value: Any,
+    *,
+    tags: Iterable[str] = (),
+    timeout: int | None = None,
+    versions: tuple[str, ...] | None = None,
+) -> None:
+    """
+    Store *value* under *key*, tagged with *tags*.
+
+    *versions* are the tag versions read before *value* was computed;
+    ``get_or_build`` passes them so a write that lands during the build
+    leaves the new entry already stale.  *timeout* defaults to
+    ``settings.APP_CACHE_TIMEOUT``.
+    """
+    tags = tuple(tags)
+    if versions is None:
+        versions = _tag_versions(tags) if tags else ()
+    if timeout is None:
+        timeout = settings.APP_CACHE_TIMEOUT
+    cache.set(_ENTRY_PREFIX + key, (tags, versions, value, None), timeout)
+
+
+def cache_delete(key: str) -> None:
+    """Remove the entry stored under *key*."""
+    cache.delete(_ENTRY_PREFIX + key)
+
+
+def get_or_build(
+    key: str,
+    build: Callable[[], T],
+    *,
+    tags: Iterable[str] = (),
+    timeout: int | None = None,
+) -> T:
+    """
+    Return the cached value for *key*, calling *build* on a miss.
+
+    Parameters
+    ----------
+    key : str
+        Entry key; namespaced internally, so plain names such as
+        ``"dashboard-stats"`` are fine.
+    build : callable
+        Computes the value.  It must be picklable for non-local backends.
+    tags : iterable of str
+        Tags of the entities the value is derived from.
+    timeout : int or None
+        Seconds to keep the entry; ``settings.APP_CACHE_TIMEOUT`` if None.
+    """
+    tags = tuple(tags)
+    entry = cache.get(_ENTRY_PREFIX + key, _MISSING)
+    versions = _tag_versions(tags) if tags else ()
+    if _is_fresh(entry, versions):
+        return entry[2]
+    with read_primary():
+        value = build()
+    cache_set(key, value, tags=tags, timeout=timeout, versions=versions)
+    return value
+
+
+def get_or_build_coalesced(
+    key: str,
+    build: Callable[[], T],
+    *,
+    tags: Iterable[str] = (),
+    timeout: int | None = None,
+) -> T:
+    """
+    ``get_or_build`` for aggregates many requests rebuild at once.
+
+    Only the process holding the ``cache:{key}`` advisory lock calls
+    *build*.  While it runs, other callers return the expired or
+    invalidated value, which is kept ``settings.APP_CACHE_STALE_SECONDS``
+    past *timeout* for that purpose.  Callers with no value to serve
+    wait up to ``settings.APP_CACHE_LOCK_WAIT_SECONDS`` for the rebuild,
+    then build it themselves.
+    """
+    tags = tuple(tags)
+    if timeout is None:
+        timeout = settings.APP_CACHE_TIMEOUT
+    full_key = _ENTRY_PREFIX + key
+
+    entry = cache.get(full_key, _MISSING)
+    versions = _tag_versions(tags) if tags else ()
+    if _is_fresh(entry, versions):
+        return entry[2]
+
+    wait = 0 if entry is not _MISSING else settings.APP_CACHE_LOCK_WAIT_SECONDS
+    with advisory_lock(f"cache:{key}", wait=wait) as acquired:
+        if not acquired and entry is not _MISSING:
+            return entry[2]
+        # Whoever held the lock may have rebuilt the entry meanwhile.
+        entry = cache.get(full_key, _MISSING)
+        versions = _tag_versions(tags) if tags else ()
+        if _is_fresh(entry, versions):
+            return entry[2]
+        with read_primary():
+            value = build()
+        cache.set(
+            full_key,
+            (tags, versions, value, time.time() + timeout),
+            timeout + settings.APP_CACHE_STALE_SECONDS,
+        )
+        return value
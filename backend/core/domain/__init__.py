@@ -7,6 +7,11 @@ exceptions     Domain-specific exceptions that map cleanly to HTTP responses.
 notifications  Synchronous notification creation helper.
 transactions   Helpers for ``transaction.atomic`` + ``select_for_update``.
 access         Role-scoped queryset selectors (placeholder hooks).
+projection     Serializer-declared ``QueryShape`` for list querysets.
+media          Permission-checked streaming delivery of stored files.
+imaging        Thumbnail / preview variants of uploaded images.
+queues         Claimable review queues (SKIP LOCKED leases).
+threads        Independent reads of a sync request run side by side.
 
 Usage from any app::
 
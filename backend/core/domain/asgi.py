@@ -0,0 +1,139 @@
+"""
+core.domain.asgi — Serving the API from ASGI workers.
+
+``SERVER_MODE=asgi`` (``entrypoint.sh``) runs gunicorn with uvicorn
+workers on ``backend.asgi``.  Django then runs each request's sync code
+on a thread of its own, so a slow report or search no longer holds a
+whole worker process.  This module covers what the sync views cannot:
+
+* ``AsyncAPIView`` — a DRF ``APIView`` with ``async def`` handlers.
+  Authentication, permissions and throttles run via ``sync_to_async``;
+  the handler awaits the service.  The async variants of the read-only
+  endpoints are mounted ahead of their sync twins by
+  ``async_read_paths()`` when ``settings.ASYNC_READ_VIEWS`` is on — by
+  default only in ASGI mode, because under WSGI every async view pays
+  for an event loop of its own.
+* ``gather_in_threads()`` — run independent blocking ORM calls at the
+  same time.  Django's async ORM sends every query through the
+  request's one sync thread, so ``asyncio.gather`` over it still runs
+  them one by one; each call here gets a worker thread and its own
+  connection, closed (or returned to the pool) when the call ends.
+* ``adapt_streaming()`` — ASGI reads a sync ``StreamingHttpResponse``
+  body into memory before sending it.  In ASGI mode the body is advanced
+  chunk by chunk on the request's sync thread instead, so exports and
+  media ranges keep streaming with their transaction / open file.
+
+Usage::
+
+    # urls.py — the sync path stays as the documented fallback
+    urlpatterns = [
+        *async_read_paths(
+            path("search/", views.AsyncGlobalSearchView.as_view(), name="global-search"),
+        ),
+        path("search/", views.GlobalSearchView.as_view(), name="global-search"),
+    ]
+
+    # services.py
+    cases, suspects = await gather_in_threads(self._search_cases, self._search_suspects)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any, TypeVar
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponseBase
+from django.urls import URLPattern
+from rest_framework.views import APIView
+
+T = TypeVar("T")
+
+_EXHAUSTED = object()
+
+
+def async_read_paths(*patterns: URLPattern) -> list[URLPattern]:
+    """Return *patterns* if ``settings.ASYNC_READ_VIEWS`` is on, else none."""
+    return list(patterns) if settings.ASYNC_READ_VIEWS else []
+
+
+class AsyncAPIView(APIView):
+    """
+    ``APIView`` whose handlers are coroutines.
+
+    Each subclass shadows a sync endpoint that carries the OpenAPI
+    description, so the variants are left out of the schema.
+    """
+
+    schema = None
+
+    async def dispatch(self, request: Any, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        """``APIView.dispatch`` with the DRF checks moved off the event loop."""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            # Authenticating a token looks the user up.
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            method = request.method.lower()
+            if method in self.http_method_names:
+                handler = getattr(self, method, self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+            response = handler(request, *args, **kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+def _call_with_own_connections(call: Callable[[], T]) -> T:
+    try:
+        return call()
+    finally:
+        # No request cycle closes what a worker thread opened.
+        connections.close_all()
+
+
+async def gather_in_threads(*calls: Callable[[], T]) -> list[T]:
+    """
+    Run *calls* concurrently, each on a worker thread, and return their
+    results in order.
+
+    Each call sees the caller's context variables (``read_replica()``
+    included) and uses its own database connections, so it must not
+    depend on rows written by the caller's open transaction.
+    """
+    return list(await asyncio.gather(*(
+        sync_to_async(_call_with_own_connections, thread_sensitive=False)(call)
+        for call in calls
+    )))
+
+
+async def _advance_on_sync_thread(iterator: Iterator[Any]) -> AsyncIterator[Any]:
+    advance = sync_to_async(next)
+    while (chunk := await advance(iterator, _EXHAUSTED)) is not _EXHAUSTED:
+        yield chunk
+
+
+def adapt_streaming(response: HttpResponseBase) -> HttpResponseBase:
+    """
+    Keep a sync streaming *response* streaming under ASGI.
+
+    A no-op in WSGI mode, where the server iterates the body itself.
+    The original iterator's ``close()`` still runs when the response is
+    closed.
+    """
+    if settings.SERVER_MODE == "asgi" and response.streaming and not response.is_async:
+        response.streaming_content = _advance_on_sync_thread(iter(response.streaming_content))
+    return response
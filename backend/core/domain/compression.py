@@ -0,0 +1,162 @@
+"""
+core.domain.compression — Response compression negotiated by ``Accept-Encoding``.
+
+Case reports, board states and list pages are large, repetitive JSON.
+``CompressionMiddleware`` compresses text-like responses with Brotli
+when the `Brotli <https://pypi.org/project/Brotli/>`_ package is
+installed and the client accepts ``br``, and with gzip otherwise:
+
+* Bodies smaller than ``settings.RESPONSE_COMPRESSION_MIN_SIZE`` bytes
+  are sent as-is; the framing overhead would outweigh the saving.
+* Streamed responses (CSV / NDJSON exports) are compressed chunk by
+  chunk, so they still run in constant memory.
+* Byte-range responses (``Accept-Ranges``, i.e. media delivery through
+  ``core.domain.media``), bodies that already carry a
+  ``Content-Encoding`` and binary content types are left alone.
+* Strong ETags are weakened (``W/"…"``), as Django's ``GZipMiddleware``
+  does; ``If-None-Match`` comparison is weak, so 304s keep working.
+
+gzip output uses Django's ``compress_string`` / ``compress_sequence``
+with random filename padding as a BREACH mitigation.
+
+Register in ``settings.py`` right after ``WhiteNoiseMiddleware`` (which
+serves its own pre-compressed static files)::
+
+    MIDDLEWARE = [
+        ...
+        'whitenoise.middleware.WhiteNoiseMiddleware',
+        'core.domain.compression.CompressionMiddleware',
+        ...
+    ]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponseBase
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.text import compress_sequence, compress_string
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+ENCODING_BROTLI = "br"
+ENCODING_GZIP = "gzip"
+
+#: Content types worth compressing (prefix match on the media type).
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/vnd.oai.openapi",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+#: Random gzip filename padding (see Django's ``GZipMiddleware``).
+_MAX_RANDOM_BYTES = 100
+
+_DEFAULT_MIN_SIZE = 1024
+
+
+def accepted_encoding(accept_encoding: str) -> str | None:
+    """
+    Pick the encoding to use for an ``Accept-Encoding`` header.
+
+    Brotli wins over gzip when both are accepted and Brotli is
+    installed.  Codings with ``q=0`` are refused; ``*`` accepts both.
+    """
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            accepted[coding.strip().lower()] = quality
+
+    def allowed(coding: str) -> bool:
+        return accepted.get(coding, accepted.get("*", 0.0)) > 0
+
+    if brotli is not None and allowed(ENCODING_BROTLI):
+        return ENCODING_BROTLI
+    if allowed(ENCODING_GZIP):
+        return ENCODING_GZIP
+    return None
+
+
+def _brotli_sequence(sequence: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = brotli.Compressor()
+    for chunk in sequence:
+        data = compressor.process(chunk)
+        if data:
+            yield data
+        # Flush per chunk so streamed rows reach the client promptly.
+        yield compressor.flush()
+    yield compressor.finish()
+
+
+def _is_compressible(response: HttpResponseBase) -> bool:
+    content_type = response.get("Content-Type", "").split(";", 1)[0].strip().lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """Brotli / gzip compression for text-like responses."""
+
+    def process_response(
+        self, request: HttpRequest, response: HttpResponseBase,
+    ) -> HttpResponseBase:
+        if (
+            response.has_header("Content-Encoding")
+            or response.has_header("Accept-Ranges")
+            or not _is_compressible(response)
+        ):
+            return response
+        # Async streams (ASGI) are left uncompressed.
+        if response.streaming and response.is_async:
+            return response
+
+        min_size = getattr(settings, "RESPONSE_COMPRESSION_MIN_SIZE", _DEFAULT_MIN_SIZE)
+        if not response.streaming and len(response.content) < min_size:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = accepted_encoding(request.headers.get("Accept-Encoding", ""))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if encoding == ENCODING_BROTLI:
+                response.streaming_content = _brotli_sequence(response.streaming_content)
+            else:
+                response.streaming_content = compress_sequence(
+                    response.streaming_content, max_random_bytes=_MAX_RANDOM_BYTES,
+                )
+            # The compressed length is not known up front.
+            del response.headers["Content-Length"]
+        else:
+            if encoding == ENCODING_BROTLI:
+                compressed = brotli.compress(response.content)
+            else:
+                compressed = compress_string(response.content, max_random_bytes=_MAX_RANDOM_BYTES)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+        return response
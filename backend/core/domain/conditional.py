@@ -0,0 +1,72 @@
+"""
+core.domain.conditional — Conditional GET for API responses.
+
+Detail endpoints are re-fetched constantly as users navigate, and most
+of those fetches return exactly what the client already has.  Each
+service exposes a cheap ``get_*_etag`` that derives a validator from
+one query (revision counters, ``updated_at`` of the row and its
+children); the view compares it with ``If-None-Match`` *before* running
+the heavy prefetching and serialisation:
+
+* match → ``304 Not Modified`` with no body;
+* otherwise the full response, carrying the ``ETag`` for next time.
+
+No ``Last-Modified`` is sent: computed fields (days wanted, case age)
+and deleted children change a body without touching any
+``updated_at``, so a date is not a safe validator for these payloads.
+
+Usage from a view::
+
+    etag = CaseQueryService.get_case_detail_etag(request.user, pk)
+    return conditional_response(
+        request, etag,
+        lambda: Response(CaseDetailSerializer(
+            CaseQueryService.get_case_detail(request.user, pk),
+        ).data),
+    )
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable
+from typing import Any
+
+from django.http import HttpRequest, HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control
+
+
+def content_etag(*parts: Any) -> str:
+    """Return a strong, quoted ETag for the validator values *parts*."""
+    digest = hashlib.sha256("|".join(map(str, parts)).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def conditional_response(
+    request: HttpRequest,
+    etag: str,
+    build: Callable[[], HttpResponseBase],
+    **cache_control: Any,
+) -> HttpResponseBase:
+    """
+    Answer *request* with ``304`` if it already holds *etag*, else ``build()``.
+
+    Parameters
+    ----------
+    request : HttpRequest
+        The incoming request (DRF ``Request`` objects work too).
+    etag : str
+        Quoted validator of the current representation.
+    build : callable
+        Produces the full response; only called on a mismatch.
+    **cache_control
+        ``Cache-Control`` directives for both outcomes.  Defaults to
+        ``private, no-cache``: clients keep the body but revalidate
+        on every use.
+    """
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = build()
+    response["ETag"] = etag
+    patch_cache_control(response, **(cache_control or {"private": True, "no_cache": True}))
+    return response
@@ -0,0 +1,283 @@
+"""
+core.domain.imaging — Derived image variants (thumbnails, previews).
+
+Suspect photos and image evidence are uploaded as camera originals that
+are routinely several megabytes.  Pages that only need a small picture
+(the Most Wanted grid, dashboard widgets, evidence galleries) should use
+a pre-rendered variant instead:
+
+* ``thumb``   — 240×240 centre-cropped JPEG for grids and avatars.
+* ``preview`` — longest side 1280 px, compressed JPEG for detail views.
+
+Variants are rendered out of band by the ``generate_image_derivatives``
+management command and recorded on the owning row in a JSON map
+(``Suspect.photo_derivatives``, ``EvidenceFile.file_derivatives``) of
+``{variant: storage_name}``.  Derivative names are derived from the
+original's storage name, so rendering is idempotent and rows sharing one
+stored original (content-addressed evidence) share its derivatives.
+
+Serializers expose a variant with ``ImageVariantField``; until it has
+been rendered the field falls back to the original's URL.
+"""
+
+from __future__ import annotations
+
+import logging
+import posixpath
+from collections.abc import Iterator
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Any
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
+from django.db.models import Model, QuerySet
+from django.db.models.fields.files import FieldFile
+from django.utils import timezone
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema_field
+from PIL import Image, ImageOps, UnidentifiedImageError
+from rest_framework import serializers
+
+from .exceptions import DomainError
+
+logger = logging.getLogger(__name__)
+
+#: Key recorded in a derivatives map when the original cannot be decoded,
+#: so the row is not picked up again on every run.
+FAILED_KEY = "error"
+
+_DERIVATIVES_ROOT = "derivatives"
+
+#: Rows fetched per query by ``generate_pending``.
+_BATCH_SIZE = 200
+
+
+@dataclass(frozen=True)
+class ImageVariant:
+    """Rendering recipe for one derived variant."""
+
+    size: tuple[int, int]
+    crop: bool = False
+    quality: int = 82
+
+
+IMAGE_VARIANTS: dict[str, ImageVariant] = {
+    "thumb": ImageVariant(size=(240, 240), crop=True, quality=78),
+    "preview": ImageVariant(size=(1280, 1280), quality=82),
+}
+
+
+def derivatives_attname(field_name: str) -> str:
+    """Return the JSON map attribute paired with image field *field_name*."""
+    return f"{field_name}_derivatives"
+
+
+def derivative_name(original_name: str, variant: str) -> str:
+    """
+    Storage name of *variant* for the original stored at *original_name*.
+
+    ``suspect_photos/2026/01/earle.png`` → ``derivatives/thumb/suspect_photos/2026/01/earle.jpg``
+    """
+    stem, _ = posixpath.splitext(original_name)
+    return f"{_DERIVATIVES_ROOT}/{variant}/{stem}.jpg"
+
+
+def _render(image: Image.Image, spec: ImageVariant) -> bytes:
+    if spec.crop:
+        rendered = ImageOps.fit(image, spec.size, Image.Resampling.LANCZOS)
+    else:
+        rendered = image.copy()
+        rendered.thumbnail(spec.size, Image.Resampling.LANCZOS)
+    buffer = BytesIO()
+    rendered.save(buffer, "JPEG", quality=spec.quality, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def _open_rgb(field_file: FieldFile) -> Image.Image:
+    with field_file.storage.open(field_file.name, "rb") as fh:
+        image = Image.open(fh)
+        image = ImageOps.exif_transpose(image)
+        if image.mode in ("RGBA", "LA", "P"):
+            # JPEG has no alpha channel: flatten onto white.
+            image = image.convert("RGBA")
+            background = Image.new("RGB", image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel("A"))
+            return background
+        return image.convert("RGB")
+
+
+def render_derivatives(field_file: FieldFile) -> dict[str, str]:
+    """
+    Render every variant of *field_file* that is not yet in storage.
+
+    Returns
+    -------
+    dict[str, str]
+        ``{variant: storage_name}`` for all entries of ``IMAGE_VARIANTS``.
+
+    Raises
+    ------
+    core.domain.exceptions.DomainError
+        If the original is missing or is not a decodable image.
+    """
+    storage = field_file.storage
+    names = {variant: derivative_name(field_file.name, variant) for variant in IMAGE_VARIANTS}
+    missing = [variant for variant, name in names.items() if not storage.exists(name)]
+    if not missing:
+        return names
+
+    try:
+        image = _open_rgb(field_file)
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError) as exc:
+        raise DomainError(f"Cannot decode image '{field_file.name}': {exc}") from exc
+
+    for variant in missing:
+        names[variant] = storage.save(names[variant], ContentFile(_render(image, IMAGE_VARIANTS[variant])))
+    return names
+
+
+def delete_derivatives(storage: Storage, original_name: str) -> None:
+    """Remove every rendered variant of *original_name* from *storage*."""
+    for variant in IMAGE_VARIANTS:
+        storage.delete(derivative_name(original_name, variant))
+
+
+def _keyset_rows(qs: QuerySet, limit: int | None) -> Iterator[Any]:
+    """
+    Yield up to *limit* rows of the pk-ordered *qs*, one batch at a time.
+
+    Each batch is a plain ``pk > last`` query rather than a server-side
+    cursor held open across the per-row updates, which a
+    transaction-mode pooler (PgBouncer) does not support.
+    """
+    remaining = limit
+    last_pk = None
+    while remaining is None or remaining > 0:
+        size = _BATCH_SIZE if remaining is None else min(_BATCH_SIZE, remaining)
+        page = qs if last_pk is None else qs.filter(pk__gt=last_pk)
+        batch = list(page[:size])
+        if not batch:
+            return
+        yield from batch
+        last_pk = batch[-1].pk
+        if remaining is not None:
+            remaining -= len(batch)
+
+
+def generate_pending(
+    queryset: QuerySet,
+    field_name: str,
+    *,
+    force: bool = False,
+    limit: int | None = None,
+) -> tuple[int, int]:
+    """
+    Render variants for rows of *queryset* whose map is still empty.
+
+    The map is written with a conditional ``UPDATE`` keyed on the
+    original's name, so a row whose image was replaced while it was
+    being rendered is left pending for the next run.  The same
+    ``UPDATE`` refreshes ``updated_at`` where the model has one, so
+    detail ETags change once variant URLs appear.
+
+    Parameters
+    ----------
+    queryset : QuerySet
+        Rows owning an image field *field_name* and its paired
+        ``<field_name>_derivatives`` JSON map.
+    force : bool
+        Re-render rows that already have a map (e.g. after changing
+        ``IMAGE_VARIANTS``).
+    limit : int | None
+        Process at most this many rows.
+
+    Returns
+    -------
+    tuple[int, int]
+        ``(rendered, failed)`` row counts.
+    """
+    attname = derivatives_attname(field_name)
+    qs = queryset.exclude(**{field_name: ""}).exclude(**{f"{field_name}__isnull": True})
+    if not force:
+        qs = qs.filter(**{attname: {}})
+    qs = qs.only("pk", field_name).order_by("pk")
+
+    touch = any(f.name == "updated_at" for f in queryset.model._meta.concrete_fields)
+    rendered = failed = 0
+    for row in _keyset_rows(qs, limit):
+        field_file = getattr(row, field_name)
+        if force:
+            delete_derivatives(field_file.storage, field_file.name)
+        try:
+            derivatives: dict[str, Any] = render_derivatives(field_file)
+            rendered += 1
+        except DomainError as exc:
+            logger.warning("%s #%s: %s", row._meta.label, row.pk, exc)
+            derivatives = {FAILED_KEY: str(exc)}
+            failed += 1
+        changes: dict[str, Any] = {attname: derivatives}
+        if touch:
+            changes["updated_at"] = timezone.now()
+        type(row)._default_manager.filter(
+            pk=row.pk, **{field_name: field_file.name},
+        ).update(**changes)
+    return rendered, failed
+
+
+def variant_file(field_file: FieldFile, derivatives: dict[str, Any], variant: str) -> FieldFile:
+    """
+    Return the ``FieldFile`` for *variant*, or *field_file* if not rendered.
+
+    Raises
+    ------
+    core.domain.exceptions.DomainError
+        If *variant* is not a known variant name.
+    """
+    if variant not in IMAGE_VARIANTS:
+        raise DomainError(
+            f"Unknown image variant '{variant}'. "
+            f"Choose one of: {', '.join(IMAGE_VARIANTS)}."
+        )
+    name = (derivatives or {}).get(variant)
+    if not name:
+        return field_file
+    return FieldFile(field_file.instance, field_file.field, name)
+
+
+@extend_schema_field(OpenApiTypes.URI)
+class ImageVariantField(serializers.Field):
+    """
+    Read-only URL of a derived image variant.
+
+    Usage::
+
+        photo_thumbnail = ImageVariantField(source="photo", variant="thumb")
+
+    Resolves ``<source>_derivatives[variant]`` on the instance and falls
+    back to the original's URL when the variant has not been rendered.
+    URLs are made absolute when the serializer has a request in context,
+    matching DRF's ``ImageField``.
+    """
+
+    def __init__(self, *, variant: str, **kwargs: Any) -> None:
+        if variant not in IMAGE_VARIANTS:
+            raise ValueError(f"Unknown image variant '{variant}'.")
+        self.variant = variant
+        kwargs["read_only"] = True
+        kwargs.setdefault("allow_null", True)
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance: Model) -> FieldFile | None:
+        field_file = super().get_attribute(instance)
+        if not field_file:
+            return None
+        derivatives = getattr(
+            field_file.instance, derivatives_attname(field_file.field.name), None,
+        )
+        return variant_file(field_file, derivatives, self.variant)
+
+    def to_representation(self, value: FieldFile) -> str:
+        url = value.url
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request is not None else url
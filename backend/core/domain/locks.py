@@ -0,0 +1,136 @@
+"""
+core.domain.locks — Cross-process named locks.
+
+Row locks (``select_for_update``, see ``core.domain.transactions``)
+only protect rows that exist.  Work that is not tied to a row — e.g.
+rebuilding an expired cached aggregate — is serialised with a named
+lock instead:
+
+* On PostgreSQL this is an advisory lock on a 64-bit hash of the name,
+  so it holds across Gunicorn workers and hosts sharing the database.
+  By default it is session-level (``pg_try_advisory_lock``): the body
+  runs outside any transaction and the lock is dropped with the session
+  if the worker's connection closes.  If the unlock itself fails (the
+  body left the transaction aborted), the connection is closed, so the
+  lock never outlives the block on a reused connection.
+* Behind a transaction-mode pooler (``settings.DB_TRANSACTION_POOLER``,
+  e.g. PgBouncer) consecutive statements may run on different server
+  sessions, so a session lock could be taken on one and "released" on
+  another, and stay held on a pooled server connection for good.  There
+  the lock is transaction-level (``pg_try_advisory_xact_lock``) and the
+  body runs inside ``transaction.atomic``; PostgreSQL releases it when
+  that transaction ends, whether the body commits, fails or the client
+  disappears.  Inside an outer transaction it is held until the outer
+  transaction ends.
+* Other databases fall back to ``cache.add`` on the default cache, which
+  is cross-process only with a shared cache backend.
+
+Usage::
+
+    from core.domain.locks import advisory_lock
+
+    with advisory_lock("most-wanted") as acquired:
+        if acquired:
+            rebuild()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections, transaction
+
+#: Seconds between attempts while waiting for a held lock.
+_POLL_INTERVAL = 0.05
+
+#: Lifetime of a cache-based fallback lock, in case its holder dies.
+_FALLBACK_TTL = 60
+
+
+def advisory_lock_id(name: str) -> int:
+    """Return the signed 64-bit PostgreSQL advisory lock key for *name*."""
+    digest = hashlib.blake2b(name.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def _transaction_scoped(connection) -> bool:
+    """Whether locks on *connection* must be transaction-level."""
+    return connection.vendor == "postgresql" and settings.DB_TRANSACTION_POOLER
+
+
+def _try_acquire(connection, name: str, *, xact: bool = False) -> bool:
+    if connection.vendor == "postgresql":
+        function = "pg_try_advisory_xact_lock" if xact else "pg_try_advisory_lock"
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT {function}(%s)", [advisory_lock_id(name)])
+            return cursor.fetchone()[0]
+    return cache.add(f"lock:{name}", 1, _FALLBACK_TTL)
+
+
+def _acquire(connection, name: str, wait: float, *, xact: bool = False) -> bool:
+    deadline = time.monotonic() + wait
+    acquired = _try_acquire(connection, name, xact=xact)
+    while not acquired and time.monotonic() < deadline:
+        time.sleep(_POLL_INTERVAL)
+        acquired = _try_acquire(connection, name, xact=xact)
+    return acquired
+
+
+def _release(connection, name: str) -> None:
+    if connection.vendor == "postgresql":
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [advisory_lock_id(name)])
+        except DatabaseError:
+            # An aborted transaction refuses every statement.  Persistent
+            # and pooled connections outlive the request, so end the
+            # session, which releases its locks.  The DB-API connection
+            # is closed first so a pool discards it instead of reusing it.
+            if connection.connection is not None:
+                connection.connection.close()
+            connection.close()
+    else:
+        cache.delete(f"lock:{name}")
+
+
+@contextmanager
+def advisory_lock(
+    name: str,
+    *,
+    wait: float = 0.0,
+    using: str = DEFAULT_DB_ALIAS,
+) -> Iterator[bool]:
+    """
+    Try to take the lock *name*; yield whether it was acquired.
+
+    Parameters
+    ----------
+    name : str
+        Lock name shared by every process that contends for it.
+    wait : float
+        Seconds to keep retrying while another process holds the lock.
+        ``0`` returns immediately.
+    using : str
+        Database alias whose session holds the lock.
+
+    The body runs either way; callers decide what to do when the lock
+    is held elsewhere (serve a stale value, give up, …).  An acquired
+    lock is released on exit — behind a transaction-mode pooler, when
+    the transaction wrapping the body ends (see the module docstring).
+    """
+    connection = connections[using]
+    if _transaction_scoped(connection):
+        with transaction.atomic(using=using):
+            yield _acquire(connection, name, wait, xact=True)
+        return
+    acquired = _acquire(connection, name, wait)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            _release(connection, name)
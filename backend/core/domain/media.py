@@ -0,0 +1,231 @@
+"""
+core.domain.media — Permission-checked delivery of uploaded media.
+
+Evidence files and suspect photos must not be reachable through the
+public ``MEDIA_URL`` in production.  Each app's service layer resolves
+and authorises the ``FieldFile`` to deliver; this module turns it into
+an HTTP response:
+
+* ``If-None-Match`` → ``304 Not Modified`` using a strong ``ETag``.
+* ``Range: bytes=…`` → ``206 Partial Content`` streamed in chunks, so
+  video/audio evidence can be scrubbed without loading it into memory.
+* ``settings.MEDIA_DELIVERY_OFFLOAD`` — when set to ``"x-accel-redirect"``
+  (nginx) or ``"x-sendfile"`` (Apache / lighttpd) the body is left to
+  the front-end server and the worker returns immediately.
+
+Usage from a view::
+
+    evidence_file = EvidenceFileService.get_file_for_download(...)
+    return serve_field_file(
+        request, evidence_file.file, version=evidence_file.updated_at,
+    )
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mimetypes
+import os
+from collections.abc import Iterator
+from typing import IO, Any
+from urllib.parse import quote
+
+from django.conf import settings
+from django.db.models.fields.files import FieldFile
+from django.http import (
+    FileResponse,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBase,
+    HttpResponseNotModified,
+    StreamingHttpResponse,
+)
+
+from .asgi import adapt_streaming
+from .exceptions import NotFound
+
+OFFLOAD_X_ACCEL = "x-accel-redirect"
+OFFLOAD_X_SENDFILE = "x-sendfile"
+
+_DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class RangeNotSatisfiable(Exception):
+    """Raised by ``parse_range_header`` when no byte of the file is covered."""
+
+
+def file_etag(name: str, size: int, version: Any = "") -> str:
+    """
+    Return a strong ETag for a stored file.
+
+    Built from the storage name, byte size and *version* (typically the
+    owning row's ``updated_at``), so it changes whenever the file is
+    replaced without having to hash the content on every request.
+    """
+    digest = hashlib.sha256(f"{name}:{size}:{version}".encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def parse_range_header(header: str, size: int) -> tuple[int, int] | None:
+    """
+    Parse a single-range ``Range`` header against a file of *size* bytes.
+
+    Returns an inclusive ``(start, end)`` pair, or ``None`` when the
+    header is absent, malformed or asks for multiple ranges — in which
+    case the whole file is served (RFC 9110 §14.2 allows ignoring it).
+
+    Raises
+    ------
+    RangeNotSatisfiable
+        If the range starts beyond the end of the file.
+    """
+    if not header or not header.startswith("bytes="):
+        return None
+    spec = header[len("bytes="):].strip()
+    if "," in spec or "-" not in spec:
+        return None
+
+    first, _, last = spec.partition("-")
+    try:
+        if first == "":
+            # Suffix range: the final N bytes.
+            suffix = int(last)
+            if suffix <= 0:
+                raise RangeNotSatisfiable
+            return max(size - suffix, 0), size - 1
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError:
+        return None
+
+    if start >= size:
+        raise RangeNotSatisfiable
+    if start > end:
+        return None
+    return start, min(end, size - 1)
+
+
+def _iter_range(fh: IO[bytes], start: int, length: int, chunk_size: int) -> Iterator[bytes]:
+    """Yield *length* bytes of *fh* from *start*, closing it when done."""
+    try:
+        fh.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = fh.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        fh.close()
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def serve_field_file(
+    request: HttpRequest,
+    field_file: FieldFile,
+    *,
+    version: Any = "",
+    as_attachment: bool = False,
+) -> HttpResponseBase:
+    """
+    Build a streaming response for an already-authorised ``FieldFile``.
+
+    Parameters
+    ----------
+    request : HttpRequest
+        Incoming request; ``Range``, ``If-Range`` and ``If-None-Match``
+        headers are honoured.
+    field_file : FieldFile
+        The file to deliver (``EvidenceFile.file``, ``Suspect.photo``, …).
+    version : Any
+        Extra ETag input, normally the owning row's ``updated_at``.
+    as_attachment : bool
+        Send ``Content-Disposition: attachment`` instead of ``inline``.
+
+    Raises
+    ------
+    core.domain.exceptions.NotFound
+        If the field is empty or its content is missing from storage.
+    """
+    if not field_file:
+        raise NotFound("No file is attached.")
+
+    name = field_file.name
+    storage = field_file.storage
+    try:
+        size = storage.size(name)
+    except OSError:
+        raise NotFound("The requested file is no longer available.")
+
+    etag = file_etag(name, size, version)
+    content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    filename = os.path.basename(name)
+    disposition = "attachment" if as_attachment else "inline"
+
+    common_headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        # Authorised content: never let shared caches keep it, but let
+        # the browser revalidate cheaply with If-None-Match.
+        "Cache-Control": "private, no-cache",
+    }
+
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        response = HttpResponseNotModified()
+        for header, value in common_headers.items():
+            response[header] = value
+        return response
+
+    offload = getattr(settings, "MEDIA_DELIVERY_OFFLOAD", "")
+    if offload in (OFFLOAD_X_ACCEL, OFFLOAD_X_SENDFILE):
+        # The front-end server streams the body and handles Range itself.
+        response = HttpResponse(content_type=content_type)
+        if offload == OFFLOAD_X_ACCEL:
+            prefix = getattr(settings, "MEDIA_ACCEL_REDIRECT_PREFIX", "/protected-media/")
+            response["X-Accel-Redirect"] = f"{prefix.rstrip('/')}/{quote(name)}"
+        else:
+            response["X-Sendfile"] = storage.path(name)
+        response["Content-Disposition"] = f'{disposition}; filename="{filename}"'
+        for header, value in common_headers.items():
+            response[header] = value
+        return response
+
+    byte_range = None
+    if_range = request.headers.get("If-Range")
+    if not if_range or if_range.strip() == etag:
+        try:
+            byte_range = parse_range_header(request.headers.get("Range", ""), size)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+    if byte_range is None:
+        response = FileResponse(
+            storage.open(name, "rb"),
+            content_type=content_type,
+            as_attachment=as_attachment,
+            filename=filename,
+        )
+    else:
+        start, end = byte_range
+        length = end - start + 1
+        chunk_size = getattr(settings, "MEDIA_STREAM_CHUNK_SIZE", _DEFAULT_CHUNK_SIZE)
+        response = StreamingHttpResponse(
+            _iter_range(storage.open(name, "rb"), start, length, chunk_size),
+            status=206,
+            content_type=content_type,
+        )
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Length"] = str(length)
+        response["Content-Disposition"] = f'{disposition}; filename="{filename}"'
+
+    for header, value in common_headers.items():
+        response[header] = value
+    return adapt_streaming(response)
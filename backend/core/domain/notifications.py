@@ -65,6 +65,7 @@ _EVENT_TEMPLATES: dict[str, tuple[str, str]] = {
     "bounty_tip_rejected":   ("Bounty Tip Rejected",     "A bounty tip you submitted has been rejected."),
     "bail_payment":          ("Bail Payment",             "A bail payment has been processed."),
     "assignment_changed":    ("Assignment Updated",       "You have been assigned to or removed from a case."),
+    "cases_assigned":        ("Cases Assigned",           "You have been assigned to {count} case(s)."),
     "complaint_returned":    ("Complaint Returned",       "Your complaint has been returned for revision."),
     "case_approved":         ("Case Approved",            "A case has been approved."),
     "case_rejected":         ("Case Rejected",            "A case has been rejected."),
@@ -159,3 +160,59 @@ class NotificationService:
             actor,
         )
         return notifications
+
+    @classmethod
+    def create_many(
+        cls,
+        *,
+        actor: User,
+        batch: Iterable[tuple[User | Iterable[User], str, models.Model | None]],
+    ) -> list[Notification]:
+        """
+        Create the notifications for many events with one ``bulk_create``.
+
+        Used by batch operations (e.g. bulk case transitions) that would
+        otherwise call ``create`` once per item.
+
+        Args:
+            actor: The user who performed the actions.
+            batch: ``(recipients, event_type, related_object)`` triples,
+                   interpreted as the matching ``create`` arguments.
+
+        Returns:
+            List of created ``Notification`` instances.
+        """
+        from core.models import Notification  # lazy import — avoids circular deps
+
+        notifications: list[Notification] = []
+        for recipients, event_type, related_object in batch:
+            if isinstance(recipients, models.Model):
+                recipients = [recipients]
+            title, message = _EVENT_TEMPLATES.get(
+                event_type,
+                (event_type.replace("_", " ").title(), f"Event: {event_type}"),
+            )
+            content_type = object_id = None
+            if related_object is not None:
+                # get_for_model is cached per model after the first call.
+                content_type = ContentType.objects.get_for_model(related_object)
+                object_id = related_object.pk
+            notifications.extend(
+                Notification(
+                    recipient=recipient,
+                    title=title,
+                    message=message,
+                    content_type=content_type,
+                    object_id=object_id,
+                )
+                for recipient in recipients
+            )
+
+        if notifications:
+            Notification.objects.bulk_create(notifications)
+            logger.info(
+                "Created %d notification(s) in bulk by actor=%s",
+                len(notifications),
+                actor,
+            )
+        return notifications
@@ -0,0 +1,103 @@
+"""
+core.domain.openapi — Pre-generated OpenAPI schema.
+
+drf-spectacular introspects every ViewSet, serializer and
+``extend_schema`` decorator to build the schema, which costs hundreds of
+milliseconds of CPU.  The schema only changes with the code, so it is
+generated once per deploy by ``manage.py generate_openapi_schema`` into
+``settings.OPENAPI_SCHEMA_FILE`` and served from there.
+
+* ``load_schema`` reads the artifact once per process.  Without one
+  (local development, tests) the schema is generated on first use and
+  memoised instead.
+* ``render_schema`` renders it once per format and returns the body
+  with a strong ``ETag``, so ``/api/schema/`` answers revalidations with
+  ``304 Not Modified``.
+
+Usage::
+
+    body, etag = render_schema("yaml")
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+from drf_spectacular.settings import spectacular_settings
+
+logger = logging.getLogger(__name__)
+
+#: ``renderer.format`` → renderer class used for the served body.
+_RENDERERS = {
+    "json": OpenApiJsonRenderer,
+    "yaml": OpenApiYamlRenderer,
+}
+
+
+def generate_schema() -> dict[str, Any]:
+    """Introspect the URLconf and return the public schema."""
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    return generator.get_schema(request=None, public=True)
+
+
+def write_schema(path: str | os.PathLike) -> int:
+    """
+    Generate the schema and write it to *path* as JSON.
+
+    The file is replaced atomically, so workers starting during a deploy
+    never read a partial artifact.  Returns the number of bytes written.
+    """
+    path = Path(path)
+    body = OpenApiJsonRenderer().render(generate_schema(), renderer_context={})
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(body)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    return len(body)
+
+
+@functools.cache
+def load_schema() -> dict[str, Any]:
+    """Return the schema from the artifact, or generate it if there is none."""
+    path = settings.OPENAPI_SCHEMA_FILE
+    try:
+        with open(path, "rb") as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        logger.info("No OpenAPI schema at %s; generating it in-process.", path)
+        return generate_schema()
+
+
+@functools.cache
+def render_schema(fmt: str) -> tuple[bytes, str]:
+    """
+    Return the schema rendered as *fmt* (``"json"`` or ``"yaml"``).
+
+    Returns
+    -------
+    tuple[bytes, str]
+        ``(body, etag)``; the ETag is a quoted digest of *body*.
+    """
+    body = _RENDERERS[fmt]().render(load_schema(), renderer_context={})
+    digest = hashlib.sha256(body).hexdigest()
+    return body, f'"{digest[:32]}"'
+
+
+def clear_schema_cache() -> None:
+    """Forget the loaded schema, e.g. after rewriting the artifact."""
+    render_schema.cache_clear()
+    load_schema.cache_clear()
@@ -0,0 +1,170 @@
+"""
+core.domain.projection — Serializer-declared queryset shapes.
+
+List endpoints should only load the columns and relations their
+serializer actually renders.  Rather than hard-coding
+``select_related`` / ``prefetch_related`` lists in each service (which
+drift out of sync with the serializer over time), a read serializer
+declares a ``QueryShape`` on its ``Meta`` and the service applies it.
+
+Usage::
+
+    # serializers.py
+    class EvidenceListSerializer(serializers.ModelSerializer):
+        class Meta:
+            model = Evidence
+            fields = [...]
+            query_shape = QueryShape(
+                only=("id", "title", "registered_by__first_name", ...),
+                select_related=("registered_by",),
+            )
+
+    # views.py
+    qs = EvidenceQueryService.get_filtered_queryset(
+        request.user, filters, shape=get_query_shape(EvidenceListSerializer),
+    )
+
+Services accept ``shape=None`` to mean "no projection" so internal
+callers (sub-queries, ``values_list`` scoping) are unaffected.
+
+Values serializers
+------------------
+On large list pages DRF's per-field dispatch and model instantiation
+dominate the response time.  The hot list endpoints therefore render
+through a ``ValuesListSerializer`` twin of their ``ModelSerializer``:
+it reads plain ``values_list`` tuples and builds each dict in a single
+function, producing the same output.  The ``ModelSerializer`` remains
+the documented response schema; parity tests keep the two in step::
+
+    qs = CaseQueryService.get_filtered_queryset(request.user, filters)
+    return Response(CaseListValuesSerializer(qs).data)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from django.db.models import QuerySet
+from django.utils import timezone
+
+
+@dataclass(frozen=True)
+class QueryShape:
+    """
+    Columns and relations a read serializer needs from its queryset.
+
+    Attributes
+    ----------
+    only : tuple[str, ...]
+        Field paths passed to ``QuerySet.only()``.  Related columns use
+        the ``relation__field`` form and the relation itself must also
+        appear in ``select_related``.  Empty means "all columns".
+    select_related : tuple[str, ...]
+        Forward FK / one-to-one relations joined in the same query.
+    prefetch_related : tuple
+        Reverse or M2M relations (names or ``Prefetch`` objects).
+    """
+
+    only: tuple[str, ...] = ()
+    select_related: tuple[str, ...] = ()
+    prefetch_related: tuple[Any, ...] = ()
+
+    def apply(self, qs: QuerySet) -> QuerySet:
+        """Return *qs* restricted to this shape."""
+        if self.select_related:
+            qs = qs.select_related(*self.select_related)
+        if self.prefetch_related:
+            qs = qs.prefetch_related(*self.prefetch_related)
+        if self.only:
+            qs = qs.only(*self.only)
+        return qs
+
+
+def get_query_shape(serializer_class: type) -> QueryShape | None:
+    """Return the ``Meta.query_shape`` declared by *serializer_class*, if any."""
+    meta = getattr(serializer_class, "Meta", None)
+    return getattr(meta, "query_shape", None)
+
+
+def apply_query_shape(qs: QuerySet, shape: QueryShape | None) -> QuerySet:
+    """Apply *shape* to *qs*; a ``None`` shape leaves the queryset untouched."""
+    if shape is None:
+        return qs
+    return shape.apply(qs)
+
+
+# ── Values serializers ──────────────────────────────────────────────
+
+
+def datetime_renderer() -> Callable[[datetime | None], str | None]:
+    """
+    Return a function rendering datetimes like DRF's ``DateTimeField``.
+
+    Values are converted to the current time zone (resolved once, here)
+    and formatted as ISO 8601 with a ``Z`` suffix for UTC — DRF's
+    default ``DATETIME_FORMAT``.
+    """
+    tz = timezone.get_current_timezone()
+
+    def render(value: datetime | None) -> str | None:
+        if value is None:
+            return None
+        text = value.astimezone(tz).isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+    return render
+
+
+def choice_labels(choices: Iterable[tuple[Any, Any]]) -> dict[Any, str]:
+    """Map each choice value to its label, as ``get_FOO_display()`` renders it."""
+    return {value: str(label) for value, label in choices}
+
+
+class ValuesListSerializer:
+    """
+    Read-only list serializer over ``values_list`` rows.
+
+    Subclasses declare the ``lookups`` to select and implement
+    ``to_representation`` for one row tuple (in ``lookups`` order).
+    Per-request state — time zone, current time, request — is set up
+    once in ``prepare`` rather than per row.
+
+    Parameters
+    ----------
+    queryset : QuerySet
+        Already role-scoped and filtered by the owning service.  Any
+        ``only`` / ``select_related`` shape is superseded by ``lookups``.
+    context : dict, optional
+        As for DRF serializers; a ``request`` makes file URLs absolute.
+    """
+
+    lookups: tuple[str, ...] = ()
+
+    def __init__(self, queryset: QuerySet, *, context: dict[str, Any] | None = None) -> None:
+        self.queryset = queryset
+        self.context = context or {}
+
+    @property
+    def data(self) -> list[dict[str, Any]]:
+        self.prepare()
+        to_representation = self.to_representation
+        return [to_representation(row) for row in self.queryset.values_list(*self.lookups)]
+
+    def prepare(self) -> None:
+        """Set up per-request state before the rows are rendered."""
+        self.render_datetime = datetime_renderer()
+
+    def file_url(self, storage: Any, name: str | None) -> str | None:
+        """Render a stored file name like DRF's ``FileField`` (URL or ``None``)."""
+        if not name:
+            return None
+        url = storage.url(name)
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request is not None else url
+
+    def to_representation(self, row: tuple[Any, ...]) -> dict[str, Any]:
+        raise NotImplementedError
+
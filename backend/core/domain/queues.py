@@ -0,0 +1,162 @@
+"""
+core.domain.queues — Claimable review work queues.
+
+Reviewers (cadets, officers, the coroner) used to pick items from shared
+lists, so several of them opened the same row and then serialised on the
+``select_for_update`` inside the review service.  Rows that inherit
+``core.models.ClaimableModel`` can instead be handed out in batches:
+
+* ``claim_next`` locks up to N available rows with
+  ``SELECT … FOR UPDATE SKIP LOCKED`` and stamps them with the reviewer
+  and a lease expiry.  Concurrent claimers skip each other's rows rather
+  than waiting, and because the claim is an ``UPDATE`` of the locked row,
+  PostgreSQL re-checks the lease condition for a claimer that raced a
+  just-committed one.
+* ``ensure_claim`` rejects a review by anyone other than the active
+  claimant; ``claim_cleared`` resets the fields once a decision is saved.
+* An expired lease counts as unclaimed, so abandoned work returns to the
+  queue without a sweeper job.
+
+Usage from a service::
+
+    from core.domain.queues import claim_next
+
+    pks = claim_next(
+        Case.objects.filter(status=CaseStatus.CADET_REVIEW),
+        requesting_user,
+        limit=10,
+    )
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from .exceptions import Conflict, DomainError
+
+#: Fields to add to ``save(update_fields=...)`` after ``claim_cleared``.
+LEASE_FIELDS: tuple[str, str] = ("leased_to", "lease_expires_at")
+
+
+def lease_duration() -> timedelta:
+    """Return the configured claim lease (``REVIEW_CLAIM_LEASE_SECONDS``)."""
+    return timedelta(seconds=getattr(settings, "REVIEW_CLAIM_LEASE_SECONDS", 15 * 60))
+
+
+def _available(user: Any, now: Any) -> Q:
+    """Unclaimed, lease expired, or already held by *user*."""
+    return (
+        Q(leased_to__isnull=True)
+        | Q(lease_expires_at__lt=now)
+        | Q(leased_to=user)
+    )
+
+
+def claim_next(
+    queryset: QuerySet,
+    user: Any,
+    *,
+    limit: int,
+    order_by: tuple[str, ...] = ("created_at", "pk"),
+) -> list[int]:
+    """
+    Lease up to *limit* rows of *queryset* to *user*.
+
+    Rows the user already holds are returned again with a renewed lease,
+    so a reviewer who reloads their queue gets the same items back.
+
+    Parameters
+    ----------
+    queryset : QuerySet
+        The queue: rows of a ``ClaimableModel`` that are awaiting review.
+        It must not use ``distinct()`` or aggregates (PostgreSQL cannot
+        lock those).
+    user : User
+        The reviewer taking the items.
+    limit : int
+        Batch size, capped at ``settings.REVIEW_CLAIM_MAX_BATCH``.
+    order_by : tuple[str, ...]
+        Queue order, oldest first by default.
+
+    Returns
+    -------
+    list[int]
+        Primary keys of the claimed rows in queue order.  Callers re-read
+        them with whatever projection their serializer needs; annotated
+        querysets cannot be locked directly.
+
+    Raises
+    ------
+    core.domain.exceptions.DomainError
+        If *limit* is not positive.
+    """
+    if limit < 1:
+        raise DomainError("The claim batch size must be at least 1.")
+    limit = min(limit, getattr(settings, "REVIEW_CLAIM_MAX_BATCH", 25))
+
+    now = timezone.now()
+    with transaction.atomic():
+        pks = list(
+            queryset
+            .filter(_available(user, now))
+            .order_by(*order_by)
+            .select_for_update(skip_locked=True, of=("self",))
+            .values_list("pk", flat=True)[:limit]
+        )
+        queryset.model._default_manager.filter(pk__in=pks).update(
+            leased_to=user, lease_expires_at=now + lease_duration(),
+        )
+    return pks
+
+
+def release_claim(queryset: QuerySet, pk: int, user: Any) -> None:
+    """
+    Give an item back to the queue before deciding it.
+
+    Raises
+    ------
+    core.domain.exceptions.Conflict
+        If *user* does not hold an active claim on the item.
+    """
+    released = queryset.filter(
+        pk=pk, leased_to=user, lease_expires_at__gte=timezone.now(),
+    ).update(leased_to=None, lease_expires_at=None)
+    if not released:
+        raise Conflict("You do not hold a claim on this item.")
+
+
+def ensure_claim(instance: models.Model, user: Any) -> None:
+    """
+    Refuse a review while another reviewer holds an active claim.
+
+    Unclaimed items can still be reviewed directly, so the queue is an
+    opt-in coordination aid rather than a hard gate.
+
+    Raises
+    ------
+    core.domain.exceptions.Conflict
+        If the item is claimed by someone else and the lease is active.
+    """
+    if (
+        instance.leased_to_id is not None
+        and instance.leased_to_id != user.pk
+        and instance.lease_expires_at is not None
+        and instance.lease_expires_at >= timezone.now()
+    ):
+        raise Conflict(
+            "This item is claimed by another reviewer until "
+            f"{instance.lease_expires_at.isoformat(timespec='minutes')}."
+        )
+
+
+def claim_cleared(instance: models.Model) -> models.Model:
+    """Reset the claim fields in memory; save with ``LEASE_FIELDS``."""
+    instance.leased_to = None
+    instance.lease_expires_at = None
+    return instance
@@ -0,0 +1,66 @@
+"""
+core.domain.renderers — JSON renderer with an optional fast encoder.
+
+``FastJSONRenderer`` is DRF's ``JSONRenderer`` with the encoding step
+handed to `orjson <https://github.com/ijl/orjson>`_ when it is
+installed.  orjson encodes dicts, lists, strings, datetimes, dates and
+UUIDs in C; anything else (``Decimal`` amounts such as
+``BountyTip.reward_amount`` or ``Bail.amount``, lazy translation
+strings, querysets) goes through DRF's own ``JSONEncoder.default``, so
+the output matches ``JSONRenderer`` — including ``Z`` for UTC
+datetimes and the escaped ``U+2028`` / ``U+2029`` line separators.
+
+Without orjson, or when a client asks for indented output
+(``Accept: application/json; indent=4``), rendering falls back to
+``JSONRenderer`` and the stdlib ``json`` module.
+
+Register in ``settings.py``::
+
+    REST_FRAMEWORK = {
+        ...
+        'DEFAULT_RENDERER_CLASSES': (
+            'core.domain.renderers.FastJSONRenderer',
+            'rest_framework.renderers.BrowsableAPIRenderer',
+        ),
+    }
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z) if orjson else 0
+
+
+class FastJSONRenderer(JSONRenderer):
+    """``JSONRenderer`` that encodes with orjson when it is available."""
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: dict[str, Any] | None = None,
+    ) -> bytes:
+        if (
+            orjson is None
+            or data is None
+            or not self.compact
+            or self.ensure_ascii
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=JSONEncoder().default, option=_ORJSON_OPTIONS)
+        except (orjson.JSONEncodeError, TypeError):
+            # e.g. integers beyond 64 bits; the stdlib encoder copes.
+            return super().render(data, accepted_media_type, renderer_context)
+        # Same JSONP-safety escaping as ``JSONRenderer``.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
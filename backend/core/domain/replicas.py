@@ -0,0 +1,227 @@
+"""
+core.domain.replicas — Read-replica routing for read-only service work.
+
+Exports, reports and list pages are pure reads that compete with
+workflow writes holding ``select_for_update`` locks.  Services mark that
+work with ``read_replica()`` and ``ReplicaRouter`` sends its queries to
+the ``replica`` database alias; everything else stays on ``default``:
+
+* Reads go to the replica only inside ``read_replica()``.  Writes,
+  reads inside ``transaction.atomic`` (locking reads included) and
+  reads inside ``read_primary()`` always use ``default``.
+* Cached results are built from ``default`` (``core.cache``): a value
+  read from a lagging replica right after a write would be cached in
+  place of the entry that write invalidated.
+* **Read-your-writes.**  A request that writes — or any unsafe-method
+  request — reads from ``default`` for the rest of the request, and the
+  writing user stays pinned to ``default`` for
+  ``settings.REPLICA_STICKY_SECONDS`` afterwards, so a page reloaded
+  right after a save does not show the row as it was before.  The pin
+  is stored in the ``default`` cache, so settings refuse a replica
+  without a shared cache backend (``settings.CACHE_SHARED``).
+* Without a ``replica`` alias in ``settings.DATABASES`` every read uses
+  ``default`` and no pin is stored.
+* Migrations only run on ``default``.
+
+Querysets evaluated after the marked block has exited, such as lazily
+streamed exports, take their alias eagerly with
+``queryset.using(read_alias())``.
+
+Register in ``settings.py``::
+
+    DATABASE_ROUTERS = ['core.domain.replicas.ReplicaRouter']
+    MIDDLEWARE = [
+        ...
+        'django.contrib.auth.middleware.AuthenticationMiddleware',
+        'core.domain.replicas.ReplicaPinningMiddleware',
+        ...
+    ]
+
+Usage::
+
+    from core.domain.replicas import read_replica
+
+    qs = CaseQueryService.get_filtered_queryset(request.user, filters)
+    with read_replica():
+        data = CaseListValuesSerializer(qs).data
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.http import HttpRequest, HttpResponseBase
+
+#: Database alias of the read replica (``settings.DATABASES``).
+REPLICA_DB_ALIAS = "replica"
+
+#: Methods that may be served from the replica; others pin the request.
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+_DEFAULT_STICKY_SECONDS = 10
+
+
+@dataclass
+class _RequestState:
+    """Routing state of the request being served."""
+
+    request: HttpRequest
+    wrote: bool = False
+    pinned: bool = False
+    sticky: bool | None = None
+    resolving: bool = False
+
+
+_replica_reads: ContextVar[bool] = ContextVar("replica_reads", default=False)
+_request_state: ContextVar[_RequestState | None] = ContextVar("replica_request", default=None)
+
+
+def _sticky_key(user_id: Any) -> str:
+    return f"replica-pin:{user_id}"
+
+
+def _user_is_pinned(state: _RequestState) -> bool:
+    """Whether the request's user wrote within the sticky window."""
+    if state.sticky is not None:
+        return state.sticky
+    if state.resolving:
+        # Resolving ``request.user`` may itself query (session auth).
+        return True
+    state.resolving = True
+    try:
+        user = getattr(state.request, "user", None)
+        if user is None or not user.is_authenticated:
+            # Not authenticated yet: decide again on the next query.
+            return False
+        state.sticky = bool(cache.get(_sticky_key(user.pk)))
+        return state.sticky
+    finally:
+        state.resolving = False
+
+
+def read_alias() -> str:
+    """
+    Return the alias a read-only query should use right now.
+
+    ``REPLICA_DB_ALIAS`` unless no replica is configured, a transaction
+    is open on ``default``, or the request / user is pinned to the
+    primary (see the module docstring).
+    """
+    if REPLICA_DB_ALIAS not in settings.DATABASES:
+        return DEFAULT_DB_ALIAS
+    if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+        return DEFAULT_DB_ALIAS
+    state = _request_state.get()
+    if state is not None and (state.pinned or _user_is_pinned(state)):
+        return DEFAULT_DB_ALIAS
+    return REPLICA_DB_ALIAS
+
+
+@contextmanager
+def read_replica() -> Iterator[None]:
+    """
+    Send the reads of the enclosed block to the replica.
+
+    Works as a context manager and as a decorator (``@read_replica()``).
+    Do not wrap a ``yield``: the flag would leak to the consumer.
+    """
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+@contextmanager
+def read_primary() -> Iterator[None]:
+    """
+    Send the reads of the enclosed block to ``default``, even inside
+    ``read_replica()``.
+
+    For results that outlive the request, such as ``core.cache``
+    entries: a lagging replica would let them capture data older than
+    the write that invalidated their predecessor.
+    """
+    token = _replica_reads.set(False)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+class ReplicaRouter:
+    """Route marked reads to the replica and everything else to ``default``."""
+
+    def db_for_read(self, model: type, **hints: Any) -> str:
+        return read_alias() if _replica_reads.get() else DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model: type, **hints: Any) -> str:
+        state = _request_state.get()
+        if state is not None:
+            state.wrote = state.pinned = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> bool | None:
+        # Both aliases hold the same data.
+        aliases = {DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db: str, app_label: str, **hints: Any) -> bool | None:
+        return False if db == REPLICA_DB_ALIAS else None
+
+
+class ReplicaPinningMiddleware:
+    """
+    Track writes per request and pin writing users to the primary.
+
+    Must come after ``AuthenticationMiddleware``.  Token-authenticated
+    users (JWT) are only known once the view has authenticated them,
+    which is before any service reads run.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponseBase:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        state = _RequestState(request, pinned=request.method not in _SAFE_METHODS)
+        token = _request_state.set(state)
+        try:
+            return self.get_response(request)
+        finally:
+            _request_state.reset(token)
+            self._remember_writer(state)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponseBase:
+        state = _RequestState(request, pinned=request.method not in _SAFE_METHODS)
+        token = _request_state.set(state)
+        try:
+            return await self.get_response(request)
+        finally:
+            _request_state.reset(token)
+            self._remember_writer(state)
+
+    @staticmethod
+    def _remember_writer(state: _RequestState) -> None:
+        if not state.wrote or REPLICA_DB_ALIAS not in settings.DATABASES:
+            return
+        user = getattr(state.request, "user", None)
+        if user is not None and user.is_authenticated:
+            seconds = getattr(settings, "REPLICA_STICKY_SECONDS", _DEFAULT_STICKY_SECONDS)
+            cache.set(_sticky_key(user.pk), True, seconds)
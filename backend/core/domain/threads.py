@@ -0,0 +1,101 @@
+"""
+core.domain.threads — Independent blocking reads side by side, from sync code.
+
+A sync request (the WSGI default) that needs several independent slow
+queries — the global search categories — would otherwise run them one
+after another.  ``run_in_threads()`` overlaps them: the first call runs
+on the caller's thread, the others on a small module-level pool of
+``settings.DB_READ_THREADS`` threads per worker process.
+
+Unlike the throwaway threads of ``core.domain.asgi.gather_in_threads``,
+the pool's threads live as long as the worker, and their connections
+follow the same reuse rules as a request's (``DB_CONN_MODE``): before
+and after every call, each thread drops connections that are broken or
+older than ``CONN_MAX_AGE`` — the checks Django runs around a request —
+so ``persistent`` connections are kept, ``pool`` connections go back
+to the pool and ``close`` connections are closed.  A worker therefore
+holds at most ``DB_READ_THREADS`` extra connections per alias.
+
+Each call sees the caller's context variables (``read_replica()``
+included) but not rows written by the caller's open transaction; run
+the calls in turn there instead.
+
+Usage::
+
+    from core.domain.threads import run_in_threads
+
+    cases, suspects = run_in_threads(self._search_cases, self._search_suspects)
+
+``shutdown()`` closes the threads and their connections, e.g. before a
+test database is dropped.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import TypeVar
+
+from django.conf import settings
+from django.db import close_old_connections, connections
+
+T = TypeVar("T")
+
+
+@functools.cache
+def _executor() -> ThreadPoolExecutor:
+    # Created on first use, i.e. in the worker, never in a forking master.
+    return ThreadPoolExecutor(
+        max_workers=settings.DB_READ_THREADS, thread_name_prefix="db-read",
+    )
+
+
+def _call_with_reused_connections(call: Callable[[], T]) -> T:
+    close_old_connections()
+    try:
+        return call()
+    finally:
+        close_old_connections()
+
+
+def run_in_threads(*calls: Callable[[], T]) -> list[T]:
+    """
+    Run *calls* concurrently and return their results in order.
+
+    The first call runs on the caller's thread and connection.  If a
+    call raises, the others are still waited for before the exception
+    propagates.
+    """
+    if not calls:
+        return []
+    futures = [
+        _executor().submit(
+            contextvars.copy_context().run, _call_with_reused_connections, call,
+        )
+        for call in calls[1:]
+    ]
+    try:
+        first = calls[0]()
+    finally:
+        wait(futures)
+    return [first, *(future.result() for future in futures)]
+
+
+def shutdown() -> None:
+    """Close every pool thread's connections and stop the pool."""
+    if _executor.cache_info().currsize == 0:
+        return
+    executor = _executor()
+    # One task per thread: none returns before all of them have started.
+    barrier = threading.Barrier(settings.DB_READ_THREADS)
+
+    def close() -> None:
+        connections.close_all()
+        barrier.wait()
+
+    wait([executor.submit(close) for _ in range(settings.DB_READ_THREADS)])
+    executor.shutdown()
+    _executor.cache_clear()
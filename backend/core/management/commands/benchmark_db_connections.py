@@ -0,0 +1,103 @@
+"""
+Management command: benchmark_db_connections
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Measures what connection reuse (``settings.DB_CONN_MODE``) saves per
+request.  Each simulated request does what Django does around a real
+one — ``close_if_unusable_or_obsolete()`` when it starts and finishes
+(``close_old_connections``) — plus one ``SELECT 1``.  The loop runs
+twice on private connections built from the alias's settings:
+
+* **fresh** — ``CONN_MAX_AGE = 0`` and no pool: connect, authenticate
+  and fork a backend for every request;
+* **configured** — the alias exactly as configured (persistent
+  connections with health checks, or the psycopg pool).
+
+Run it against the same server, and through the same pooler, as
+production for meaningful numbers.
+
+Usage::
+
+    python manage.py benchmark_db_connections
+    python manage.py benchmark_db_connections --requests 1000 --database replica
+"""
+
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+def _private_connection(alias: str, **overrides):
+    """A new ``DatabaseWrapper`` for *alias* with *overrides* applied."""
+    settings_dict = {**connections[alias].settings_dict, **overrides}
+    return type(connections[alias])(settings_dict, alias)
+
+
+def _time_requests(connection, count: int) -> list[float]:
+    """Per-request wall time, in milliseconds, of *count* simulated requests."""
+    timings = []
+    try:
+        for _ in range(count):
+            start = time.perf_counter()
+            connection.close_if_unusable_or_obsolete()
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            connection.close_if_unusable_or_obsolete()
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        connection.close()
+    return timings
+
+
+class Command(BaseCommand):
+    help = "Compare per-request database overhead with and without connection reuse."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests", type=int, default=200,
+            help="Simulated requests per mode (default 200).",
+        )
+        parser.add_argument(
+            "--database", default="default",
+            help="Database alias to benchmark (default 'default').",
+        )
+
+    def handle(self, *args, **options):
+        alias, count = options["database"], options["requests"]
+        if alias not in connections:
+            raise CommandError(f"Unknown database alias '{alias}'.")
+        if count < 1:
+            raise CommandError("--requests must be at least 1.")
+
+        options_without_pool = {
+            key: value
+            for key, value in connections[alias].settings_dict["OPTIONS"].items()
+            if key != "pool"
+        }
+        fresh = _time_requests(
+            _private_connection(
+                alias, CONN_MAX_AGE=0, CONN_HEALTH_CHECKS=False, OPTIONS=options_without_pool,
+            ),
+            count,
+        )
+        configured = _time_requests(_private_connection(alias), count)
+
+        mode = getattr(settings, "DB_CONN_MODE", "persistent")
+        self._report("fresh connection per request", fresh)
+        self._report(f"configured ({mode})", configured)
+        saved = statistics.median(fresh) - statistics.median(configured)
+        share = saved / statistics.median(fresh) * 100
+        self.stdout.write(self.style.SUCCESS(
+            f"Saved per request: {saved:.2f} ms ({share:.0f}% of the database overhead)."
+        ))
+
+    def _report(self, label: str, timings: list[float]) -> None:
+        p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+        self.stdout.write(
+            f"{label:<32} median {statistics.median(timings):7.2f} ms"
+            f"   p95 {p95:7.2f} ms   ({len(timings)} requests)"
+        )
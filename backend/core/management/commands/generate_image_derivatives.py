@@ -0,0 +1,84 @@
+"""
+Management command: generate_image_derivatives
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Renders the thumbnail / preview variants defined in
+``core.domain.imaging.IMAGE_VARIANTS`` for suspect photos and image
+evidence files that do not have them yet.
+
+Run it from cron after deploys and periodically, or keep it running as
+a worker with ``--watch``.  Rendering is idempotent, so overlapping runs
+only repeat work.
+
+Usage::
+
+    python manage.py generate_image_derivatives
+    python manage.py generate_image_derivatives --source suspects --limit 500
+    python manage.py generate_image_derivatives --force          # re-render all
+    python manage.py generate_image_derivatives --watch 30       # worker mode
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.cache import SUSPECTS_TAG, invalidate_tags
+from core.domain.imaging import generate_pending
+from evidence.models import EvidenceFile, FileType
+from suspects.models import Suspect
+
+# Source name → (queryset factory, image field name, cache tags).  The
+# maps are written with UPDATE, so cached listings that embed variant
+# URLs (most wanted, dashboard) are invalidated here.
+SOURCES = {
+    "suspects": (lambda: Suspect.objects.all(), "photo", (SUSPECTS_TAG,)),
+    "evidence": (lambda: EvidenceFile.objects.filter(file_type=FileType.IMAGE), "file", ()),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Render thumbnail and preview variants for suspect photos and "
+        "image evidence that do not have them yet."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--source", choices=sorted(SOURCES), action="append",
+            help="Limit to one source (repeatable). Default: all.",
+        )
+        parser.add_argument(
+            "--limit", type=int, default=None,
+            help="Maximum rows to process per source and pass.",
+        )
+        parser.add_argument(
+            "--force", action="store_true",
+            help="Re-render rows that already have variants.",
+        )
+        parser.add_argument(
+            "--watch", type=int, default=0, metavar="SECONDS",
+            help="Keep running, polling for new images every SECONDS.",
+        )
+
+    def handle(self, *args, **options):
+        sources = options["source"] or sorted(SOURCES)
+        force = options["force"]
+        while True:
+            for name in sources:
+                queryset_factory, field_name, tags = SOURCES[name]
+                rendered, failed = generate_pending(
+                    queryset_factory(), field_name,
+                    force=force, limit=options["limit"],
+                )
+                if rendered or failed:
+                    invalidate_tags(*tags)
+                if rendered or failed or not options["watch"]:
+                    style = self.style.WARNING if failed else self.style.SUCCESS
+                    self.stdout.write(style(
+                        f"  {name:<9s} rendered={rendered} failed={failed}"
+                    ))
+            if not options["watch"]:
+                return
+            # --force applies to the first pass only.
+            force = False
+            time.sleep(options["watch"])
@@ -0,0 +1,37 @@
+"""
+Management command: generate_openapi_schema
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Writes the OpenAPI schema served at ``/api/schema/`` to
+``settings.OPENAPI_SCHEMA_FILE`` (see ``core.domain.openapi``), so
+workers load it from disk instead of introspecting the API.
+
+Run it at build or deploy time, before the workers start (the container
+entrypoint does).  Regenerate whenever views or serializers change; a
+missing artifact only means the first request per worker builds it.
+
+Usage::
+
+    python manage.py generate_openapi_schema
+    python manage.py generate_openapi_schema --file /tmp/openapi.json
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.domain.openapi import write_schema
+
+
+class Command(BaseCommand):
+    help = "Pre-generate the OpenAPI schema served at /api/schema/."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--file", default=None,
+            help="Output path. Default: settings.OPENAPI_SCHEMA_FILE.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["file"] or settings.OPENAPI_SCHEMA_FILE
+        size = write_schema(path)
+        self.stdout.write(self.style.SUCCESS(f"Wrote OpenAPI schema to {path} ({size} bytes)."))
@@ -31,6 +31,34 @@ class TimeStampedModel(models.Model):
         abstract = True
 
 
+class ClaimableModel(models.Model):
+    """
+    Abstract mixin for rows handed out by a review work queue.
+
+    ``leased_to`` holds the reviewer currently working the row and
+    ``lease_expires_at`` the end of their lease; an expired lease is
+    treated as unclaimed.  See ``core.domain.queues``.
+    """
+
+    leased_to = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name="Leased To",
+    )
+    lease_expires_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        db_index=True,
+        verbose_name="Lease Expires At",
+    )
+
+    class Meta:
+        abstract = True
+
+
 class Notification(TimeStampedModel):
     """
     System notification sent to a user regarding case updates, evidence
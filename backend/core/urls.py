@@ -15,12 +15,16 @@ GET  /api/core/search/                     — Global search across Cases, Suspe
 GET  /api/core/constants/                  — System choice enumerations for frontend dropdowns.
 GET  /api/core/notifications/              — List notifications for the authenticated user.
 POST /api/core/notifications/{id}/read/    — Mark a single notification as read.
+
+With ``settings.ASYNC_READ_VIEWS`` the GET endpoints are served by their
+async variants, mounted ahead of the sync views (``core.domain.asgi``).
 """
 
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 from . import views
+from .domain.asgi import async_read_paths
 
 app_name = "core"
 
@@ -33,6 +37,13 @@ router.register(
 )
 
 urlpatterns = [
+    *async_read_paths(
+        path("dashboard/", views.AsyncDashboardStatsView.as_view(), name="dashboard-stats"),
+        path("search/", views.AsyncGlobalSearchView.as_view(), name="global-search"),
+        path("constants/", views.AsyncSystemConstantsView.as_view(), name="system-constants"),
+        path("notifications/", views.AsyncNotificationListView.as_view(), name="notification-list"),
+    ),
+
     # ── Dashboard ────────────────────────────────────────────────────
     path(
         "dashboard/",
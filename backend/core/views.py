@@ -13,8 +13,11 @@ No model imports, no aggregation logic, no cross-app queries.
 
 from __future__ import annotations
 
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseBase
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -25,6 +28,11 @@ from drf_spectacular.utils import (
     OpenApiResponse,
     extend_schema,
 )
+from drf_spectacular.views import SpectacularAPIView
+
+from .domain.asgi import AsyncAPIView
+from .domain.conditional import conditional_response
+from .domain.openapi import render_schema
 
 from .serializers import (
     DashboardStatsSerializer,
@@ -144,45 +152,47 @@ class GlobalSearchView(APIView):
         Returns:
             A ``Response`` containing categorised search results.
         """
+        data = self._get_service(request).search()
+        serializer = GlobalSearchResponseSerializer(data)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    def _get_service(self, request: Request) -> GlobalSearchService:
+        """
+        Build the search from the query parameters.
+
+        Raises:
+            ValidationError: ``q`` is too short or ``category`` unknown.
+        """
         query = request.query_params.get("q", "").strip()
         if len(query) < GlobalSearchService.MIN_QUERY_LENGTH:
-            return Response(
-                {
-                    "detail": (
-                        f"Search query must be at least "
-                        f"{GlobalSearchService.MIN_QUERY_LENGTH} characters."
-                    ),
-                },
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+            raise ValidationError({
+                "detail": (
+                    f"Search query must be at least "
+                    f"{GlobalSearchService.MIN_QUERY_LENGTH} characters."
+                ),
+            })
 
         category = request.query_params.get("category", None)
         valid_categories = {"cases", "suspects", "evidence"}
         if category is not None and category not in valid_categories:
-            return Response(
-                {
-                    "detail": (
-                        f"Invalid category '{category}'. "
-                        f"Must be one of: {', '.join(sorted(valid_categories))}."
-                    ),
-                },
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+            raise ValidationError({
+                "detail": (
+                    f"Invalid category '{category}'. "
+                    f"Must be one of: {', '.join(sorted(valid_categories))}."
+                ),
+            })
 
         try:
             limit = int(request.query_params.get("limit", GlobalSearchService.DEFAULT_LIMIT))
         except (TypeError, ValueError):
             limit = GlobalSearchService.DEFAULT_LIMIT
 
-        service = GlobalSearchService(
+        return GlobalSearchService(
             query=query,
             user=request.user,
             category=category,
             limit=limit,
         )
-        data = service.search()
-        serializer = GlobalSearchResponseSerializer(data)
-        return Response(serializer.data, status=status.HTTP_200_OK)
 
 
 class SystemConstantsView(APIView):
@@ -194,14 +204,19 @@ class SystemConstantsView(APIView):
     labels without hardcoding values.
 
     **Authentication**: Not required (``AllowAny``).
-    These constants are public configuration data.
+    These constants are public configuration data, so no authenticator
+    runs (a JWT would otherwise cost a user lookup per hit).
 
     **Query Parameters**: None.
 
     **Response** (``200 OK``):
-        Serialised by ``SystemConstantsSerializer``.
+        Serialised by ``SystemConstantsSerializer``, with a strong
+        ``ETag`` and a public ``Cache-Control`` of
+        ``settings.SYSTEM_CONSTANTS_MAX_AGE`` seconds.  A matching
+        ``If-None-Match`` returns ``304 Not Modified``.
     """
 
+    authentication_classes = []
     permission_classes = [AllowAny]
 
     @extend_schema(
@@ -210,7 +225,10 @@ class SystemConstantsView(APIView):
             "Return all system-wide choice enumerations and the role hierarchy "
             "so the frontend can dynamically build dropdowns, filters, and labels."
         ),
-        responses={200: OpenApiResponse(response=SystemConstantsSerializer, description="System constants.")},
+        responses={
+            200: OpenApiResponse(response=SystemConstantsSerializer, description="System constants."),
+            304: OpenApiResponse(description="Not modified (matching If-None-Match)."),
+        },
         tags=["System"],
     )
     def get(self, request: Request) -> Response:
@@ -221,11 +239,15 @@ class SystemConstantsView(APIView):
             request: The incoming DRF request.
 
         Returns:
-            A ``Response`` containing all system constants.
+            A ``Response`` containing all system constants, or an empty
+            ``304`` if the client's copy is current.
         """
-        data = SystemConstantsService.get_constants()
-        serializer = SystemConstantsSerializer(data)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        data, etag = SystemConstantsService.get_constants_with_etag()
+        return conditional_response(
+            request, etag,
+            lambda: Response(SystemConstantsSerializer(data).data, status=status.HTTP_200_OK),
+            public=True, max_age=settings.SYSTEM_CONSTANTS_MAX_AGE,
+        )
 
 
 class NotificationViewSet(viewsets.ViewSet):
@@ -287,3 +309,92 @@ class NotificationViewSet(viewsets.ViewSet):
         notification = service.mark_as_read(notification_id=pk)
         serializer = NotificationSerializer(notification)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class AsyncDashboardStatsView(AsyncAPIView, DashboardStatsView):
+    """Async variant of ``DashboardStatsView`` (see ``core.domain.asgi``)."""
+
+    async def get(self, request: Request) -> Response:
+        data = await DashboardAggregationService(user=request.user).aget_stats()
+        serializer = DashboardStatsSerializer(data)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class AsyncGlobalSearchView(AsyncAPIView, GlobalSearchView):
+    """
+    Async variant of ``GlobalSearchView`` (see ``core.domain.asgi``).
+
+    The case, suspect and evidence searches run concurrently.
+    """
+
+    async def get(self, request: Request) -> Response:
+        data = await self._get_service(request).asearch()
+        serializer = GlobalSearchResponseSerializer(data)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class AsyncSystemConstantsView(AsyncAPIView, SystemConstantsView):
+    """Async variant of ``SystemConstantsView`` (see ``core.domain.asgi``)."""
+
+    async def get(self, request: Request) -> HttpResponseBase:
+        data, etag = await SystemConstantsService.aget_constants_with_etag()
+        return conditional_response(
+            request, etag,
+            lambda: Response(SystemConstantsSerializer(data).data, status=status.HTTP_200_OK),
+            public=True, max_age=settings.SYSTEM_CONSTANTS_MAX_AGE,
+        )
+
+
+class AsyncNotificationListView(AsyncAPIView):
+    """
+    Async variant of ``NotificationViewSet.list`` (see
+    ``core.domain.asgi``).
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    async def get(self, request: Request) -> Response:
+        notifications = await NotificationService(user=request.user).alist_notifications()
+        serializer = NotificationSerializer(notifications, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class OpenAPISchemaView(SpectacularAPIView):
+    """
+    **GET /api/schema/**
+
+    Serve the OpenAPI schema pre-generated by
+    ``manage.py generate_openapi_schema`` (see ``core.domain.openapi``)
+    instead of introspecting the API on every request.
+
+    The format is negotiated as by ``SpectacularAPIView`` (YAML by
+    default, JSON with ``?format=json`` or ``Accept: application/json``).
+    Each format is rendered once per process and sent with a strong
+    ``ETag``; a matching ``If-None-Match`` returns ``304 Not Modified``.
+    """
+
+    def get(self, request: Request, *args, **kwargs) -> HttpResponse:
+        """
+        Handle GET request — serve the rendered schema.
+
+        Args:
+            request: The incoming DRF request.
+
+        Returns:
+            The schema document, or an empty ``304`` if the client's
+            copy is current.
+        """
+        renderer = request.accepted_renderer
+        body, etag = render_schema(renderer.format)
+
+        def build() -> HttpResponse:
+            response = HttpResponse(body, content_type=renderer.media_type)
+            response["Content-Disposition"] = (
+                f'inline; filename="{self._get_filename(request, None)}"'
+            )
+            return response
+
+        # The schema changes with each deploy: let clients keep it but
+        # revalidate every time.
+        return conditional_response(request, etag, build, public=True, no_cache=True)
+
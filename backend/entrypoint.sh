@@ -9,10 +9,12 @@
 #   1. Wait until PostgreSQL is accepting connections
 #   2. Run database migrations
 #   3. Collect static files (WhiteNoise serves them)
-#   4. Seed roles and permissions (setup_rbac — idempotent)
-#   5. Create default superuser if it does not exist (idempotent)
+#   4. Pre-generate the OpenAPI schema served at /api/schema/
+#   5. Seed roles and permissions (setup_rbac — idempotent)
+#   6. Create default superuser if it does not exist (idempotent)
 #      username: admin  |  password: 1234
-#   6. Start Gunicorn
+#   7. Start Gunicorn (SERVER_MODE=wsgi, default) or Gunicorn with
+#      uvicorn workers on backend.asgi (SERVER_MODE=asgi)
 #
 # Environment variables DB_HOST and DB_PORT are injected via env_file in
 # docker-compose, so no defaults need to be hard-coded here.
@@ -36,12 +38,18 @@ python manage.py migrate --noinput
 echo "[entrypoint] Collecting static files ..."
 python manage.py collectstatic --noinput
 
-# ── 4. Seed RBAC roles & permissions ─────────────────────────────────────────
+# ── 4. OpenAPI schema ─────────────────────────────────────────────────────────
+# Written once per start so the workers serve it instead of introspecting
+# every view on each /api/schema/ request.
+echo "[entrypoint] Generating OpenAPI schema ..."
+python manage.py generate_openapi_schema
+
+# ── 5. Seed RBAC roles & permissions ─────────────────────────────────────────
 # The setup_rbac command is idempotent — safe to re-run on every start.
 echo "[entrypoint] Setting up RBAC roles and permissions ..."
 python manage.py setup_rbac
 
-# ── 5. Create default superuser (idempotent) ──────────────────────────────────
+# ── 6. Create default superuser (idempotent) ──────────────────────────────────
 echo "[entrypoint] Creating default superuser if needed ..."
 python manage.py shell << 'PYEOF'
 from accounts.models import User, Role
@@ -63,9 +71,21 @@ else:
     print("[entrypoint] Superuser 'admin' already exists — skipping.")
 PYEOF
 
-# ── 6. Start Gunicorn ─────────────────────────────────────────────────────────
-# WSGI module path: backend.wsgi  (Django project package name = backend)
+# ── 7. Start Gunicorn ─────────────────────────────────────────────────────────
+# Module paths: backend.wsgi / backend.asgi  (Django project package name = backend)
 # working_dir is /app/backend (set in compose), so this resolves correctly.
+if [ "${SERVER_MODE:-wsgi}" = "asgi" ]; then
+    # Uvicorn workers: each request's sync code runs on its own thread and
+    # the async read endpoints share the event loop (core/domain/asgi.py).
+    echo "[entrypoint] Starting Gunicorn (ASGI, uvicorn workers) ..."
+    exec gunicorn backend.asgi:application \
+        --worker-class uvicorn_worker.UvicornWorker \
+        --bind 0.0.0.0:8000 \
+        --workers 2 \
+        --timeout 120 \
+        --log-level "${LOG_LEVEL:-info}"
+fi
+
 echo "[entrypoint] Starting Gunicorn ..."
 exec gunicorn backend.wsgi:application \
     --bind 0.0.0.0:8000 \
@@ -3,8 +3,10 @@ from django.contrib import admin
 from .models import (
     BiologicalEvidence,
     Evidence,
+    EvidenceBlob,
     EvidenceCustodyLog,
     EvidenceFile,
+    EvidenceUploadSession,
     IdentityEvidence,
     TestimonyEvidence,
     VehicleEvidence,
@@ -58,3 +60,17 @@ class EvidenceCustodyLogAdmin(admin.ModelAdmin):
     list_display = ("id", "evidence", "handled_by", "action_type", "timestamp")
     list_filter = ("action_type",)
     search_fields = ("notes",)
+
+
+@admin.register(EvidenceUploadSession)
+class EvidenceUploadSessionAdmin(admin.ModelAdmin):
+    list_display = ("id", "evidence", "uploaded_by", "filename",
+                    "received_bytes", "total_size", "updated_at")
+    list_filter = ("file_type",)
+
+
+@admin.register(EvidenceBlob)
+class EvidenceBlobAdmin(admin.ModelAdmin):
+    list_display = ("sha256", "size", "ref_count", "created_at")
+    search_fields = ("sha256",)
+    readonly_fields = ("sha256", "file", "size", "ref_count")
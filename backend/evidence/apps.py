@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class EvidenceConfig(AppConfig):
     name = 'evidence'
+
+    def ready(self):
+        from .signals import connect_blob_signals
+
+        connect_blob_signals()
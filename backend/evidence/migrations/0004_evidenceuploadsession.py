@@ -0,0 +1,37 @@
+# Generated by Django 6.0.2 on 2026-10-18 21:35
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evidence', '0003_evidencecustodylog'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EvidenceUploadSession',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('filename', models.CharField(max_length=255, verbose_name='Original Filename')),
+                ('file_type', models.CharField(choices=[('image', 'Image'), ('video', 'Video'), ('audio', 'Audio'), ('document', 'Document')], max_length=10, verbose_name='File Type')),
+                ('caption', models.CharField(blank=True, default='', max_length=255, verbose_name='Caption')),
+                ('total_size', models.BigIntegerField(verbose_name='Total Size (bytes)')),
+                ('received_bytes', models.BigIntegerField(default=0, verbose_name='Received Bytes')),
+                ('expected_sha256', models.CharField(blank=True, default='', help_text='Optional; verified against the streamed digest on completion.', max_length=64, verbose_name='Client-declared SHA-256')),
+                ('evidence', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='upload_sessions', to='evidence.evidence', verbose_name='Evidence')),
+                ('uploaded_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='evidence_upload_sessions', to=settings.AUTH_USER_MODEL, verbose_name='Uploaded By')),
+            ],
+            options={
+                'verbose_name': 'Evidence Upload Session',
+                'verbose_name_plural': 'Evidence Upload Sessions',
+            },
+        ),
+    ]
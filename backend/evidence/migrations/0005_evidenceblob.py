@@ -0,0 +1,40 @@
+# Generated by Django 6.0.2 on 2026-10-18 21:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evidence', '0004_evidenceuploadsession'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EvidenceBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+                ('sha256', models.CharField(max_length=64, unique=True, verbose_name='SHA-256')),
+                ('file', models.FileField(max_length=255, upload_to='', verbose_name='Stored Content')),
+                ('size', models.BigIntegerField(verbose_name='Size (bytes)')),
+                ('ref_count', models.PositiveIntegerField(default=0, verbose_name='Reference Count')),
+            ],
+            options={
+                'verbose_name': 'Evidence Blob',
+                'verbose_name_plural': 'Evidence Blobs',
+            },
+        ),
+        migrations.AddField(
+            model_name='evidencefile',
+            name='sha256',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=64, verbose_name='SHA-256'),
+        ),
+        migrations.AddField(
+            model_name='evidencefile',
+            name='blob',
+            field=models.ForeignKey(blank=True, help_text="Shared content; ``file`` points at the blob's stored path. Null for files uploaded before content addressing.", null=True, on_delete=django.db.models.deletion.PROTECT, related_name='references', to='evidence.evidenceblob', verbose_name='Content Blob'),
+        ),
+    ]
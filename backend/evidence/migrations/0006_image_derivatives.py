@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-18 21:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evidence', '0005_evidenceblob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='evidencefile',
+            name='file_derivatives',
+            field=models.JSONField(blank=True, default=dict, help_text='Rendered variants of image files as {variant: storage name}; see core.domain.imaging.', verbose_name='File Derivatives'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-19 02:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evidence', '0007_review_leases'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='evidenceuploadsession',
+            name='expected_sha256',
+            field=models.CharField(blank=True, default='', help_text='Optional; compared on completion with the SHA-256 of the received parts.', max_length=64, verbose_name='Client-declared SHA-256'),
+        ),
+    ]
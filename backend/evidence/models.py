@@ -13,10 +13,12 @@ Evidence types (per project-doc §4.3):
     5. Other Item                  – title + description only (uses base ``Evidence``)
 """
 
+import uuid
+
 from django.conf import settings
 from django.db import models
 
-from core.models import TimeStampedModel
+from core.models import ClaimableModel, TimeStampedModel
 from core.permissions_constants import EvidencePerms
 
 
@@ -125,7 +127,7 @@ class TestimonyEvidence(Evidence):
         super().save(*args, **kwargs)
 
 
-class BiologicalEvidence(Evidence):
+class BiologicalEvidence(ClaimableModel, Evidence):
     """
     Biological / medical evidence requiring forensic examination (§4.3.2).
 
@@ -248,6 +250,42 @@ class IdentityEvidence(Evidence):
 # Media files for any evidence type
 # ────────────────────────────────────────────────────────────────────
 
+class EvidenceBlob(TimeStampedModel):
+    """
+    Content-addressed, reference-counted file content.
+
+    Identical media attached to several evidence items (the same CCTV
+    clip on related cases, for instance) is stored once, under a path
+    derived from its SHA-256.  ``ref_count`` tracks how many
+    ``EvidenceFile`` rows point at the blob; the stored file is removed
+    only when the last reference is released.
+    """
+
+    sha256 = models.CharField(
+        max_length=64,
+        unique=True,
+        verbose_name="SHA-256",
+    )
+    file = models.FileField(
+        max_length=255,
+        verbose_name="Stored Content",
+    )
+    size = models.BigIntegerField(
+        verbose_name="Size (bytes)",
+    )
+    ref_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Reference Count",
+    )
+
+    class Meta:
+        verbose_name = "Evidence Blob"
+        verbose_name_plural = "Evidence Blobs"
+
+    def __str__(self):
+        return f"{self.sha256[:12]}… ({self.ref_count} refs)"
+
+
 class EvidenceFile(TimeStampedModel):
     """
     File attachment (image, video, audio, document) for any ``Evidence`` row.
@@ -277,6 +315,30 @@ class EvidenceFile(TimeStampedModel):
         default="",
         verbose_name="Caption",
     )
+    blob = models.ForeignKey(
+        EvidenceBlob,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="references",
+        verbose_name="Content Blob",
+        help_text="Shared content; ``file`` points at the blob's stored path. "
+                  "Null for files uploaded before content addressing.",
+    )
+    sha256 = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        db_index=True,
+        verbose_name="SHA-256",
+    )
+    file_derivatives = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name="File Derivatives",
+        help_text="Rendered variants of image files as {variant: storage name}; "
+                  "see core.domain.imaging.",
+    )
 
     class Meta:
         verbose_name = "Evidence File"
@@ -286,6 +348,82 @@ class EvidenceFile(TimeStampedModel):
         return f"{self.get_file_type_display()} for Evidence #{self.evidence_id}"
 
 
+class EvidenceUploadSession(TimeStampedModel):
+    """
+    In-progress resumable (chunked) upload of a large ``EvidenceFile``.
+
+    Parts are appended to a staging file on disk in order; the row tracks
+    how many bytes have been received so a client can resume after a
+    dropped connection.  Completing the session moves the staged file
+    into media storage and creates the ``EvidenceFile`` and its custody
+    entry; the session row is then deleted.
+
+    The primary key is a random UUID so upload URLs are not guessable.
+    """
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+    evidence = models.ForeignKey(
+        Evidence,
+        on_delete=models.CASCADE,
+        related_name="upload_sessions",
+        verbose_name="Evidence",
+    )
+    uploaded_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="evidence_upload_sessions",
+        verbose_name="Uploaded By",
+    )
+    filename = models.CharField(
+        max_length=255,
+        verbose_name="Original Filename",
+    )
+    file_type = models.CharField(
+        max_length=10,
+        choices=FileType.choices,
+        verbose_name="File Type",
+    )
+    caption = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        verbose_name="Caption",
+    )
+    total_size = models.BigIntegerField(
+        verbose_name="Total Size (bytes)",
+    )
+    received_bytes = models.BigIntegerField(
+        default=0,
+        verbose_name="Received Bytes",
+    )
+    expected_sha256 = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        verbose_name="Client-declared SHA-256",
+        help_text="Optional; compared on completion with the SHA-256 of the received parts.",
+    )
+
+    class Meta:
+        verbose_name = "Evidence Upload Session"
+        verbose_name_plural = "Evidence Upload Sessions"
+
+    def __str__(self):
+        return (
+            f"Upload {self.id} for Evidence #{self.evidence_id} "
+            f"({self.received_bytes}/{self.total_size} bytes)"
+        )
+
+    @property
+    def is_complete(self) -> bool:
+        """True once every declared byte has been received."""
+        return self.received_bytes >= self.total_size
+
+
 # ────────────────────────────────────────────────────────────────────
 # Chain of custody tracking
 # ────────────────────────────────────────────────────────────────────
@@ -19,15 +19,20 @@ from __future__ import annotations
 
 from typing import Any
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.urls import reverse
 from rest_framework import serializers
 
+from core.domain.projection import QueryShape, ValuesListSerializer, choice_labels
+
 from .models import (
     BiologicalEvidence,
     Evidence,
     EvidenceCustodyLog,
     EvidenceFile,
     EvidenceType,
+    EvidenceUploadSession,
     FileType,
     IdentityEvidence,
     TestimonyEvidence,
@@ -58,6 +63,7 @@ class EvidenceFilterSerializer(serializers.Serializer):
     ``search``          : str     — free-text search against title/description
     ``created_after``   : date    — ISO 8601 date string
     ``created_before``  : date    — ISO 8601 date string
+    ``include_details`` : bool    — polymorphic list mode (type-specific fields)
     """
 
     evidence_type = serializers.ChoiceField(
@@ -81,6 +87,11 @@ class EvidenceFilterSerializer(serializers.Serializer):
     )
     created_after = serializers.DateField(required=False, help_text="ISO 8601 date. Return evidence created on or after this date.")
     created_before = serializers.DateField(required=False, help_text="ISO 8601 date. Return evidence created on or before this date.")
+    include_details = serializers.BooleanField(
+        required=False,
+        default=False,
+        help_text="Include type-specific fields (license plate, forensic result, owner name, …) for each item.",
+    )
 
     def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
         """
@@ -119,12 +130,16 @@ class EvidenceFileReadSerializer(serializers.ModelSerializer):
         source="get_file_type_display",
         read_only=True,
     )
+    download_url = serializers.SerializerMethodField()
+    thumbnail_url = serializers.SerializerMethodField()
 
     class Meta:
         model = EvidenceFile
         fields = [
             "id",
             "file",
+            "download_url",
+            "thumbnail_url",
             "file_type",
             "file_type_display",
             "caption",
@@ -132,6 +147,19 @@ class EvidenceFileReadSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields
 
+    def get_download_url(self, obj: EvidenceFile) -> str:
+        """Return the permission-checked streaming endpoint for this file."""
+        return reverse(
+            "evidence-file-download",
+            kwargs={"pk": obj.evidence_id, "file_id": obj.pk},
+        )
+
+    def get_thumbnail_url(self, obj: EvidenceFile) -> str | None:
+        """Return the thumbnail variant's download URL once it is rendered."""
+        if "thumb" not in obj.file_derivatives:
+            return None
+        return f"{self.get_download_url(obj)}?variant=thumb"
+
 
 class EvidenceListSerializer(serializers.ModelSerializer):
     """
@@ -162,6 +190,15 @@ class EvidenceListSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = fields
+        # ``case`` renders as a bare PK, so no join on ``cases_case``.
+        query_shape = QueryShape(
+            only=(
+                "id", "title", "description", "evidence_type", "case",
+                "registered_by", "created_at", "updated_at",
+                "registered_by__first_name", "registered_by__last_name",
+            ),
+            select_related=("registered_by",),
+        )
 
     def get_registered_by_name(self, obj: Evidence) -> str | None:
         """Return the registrar's full name."""
@@ -170,6 +207,58 @@ class EvidenceListSerializer(serializers.ModelSerializer):
         return None
 
 
+class EvidenceListValuesSerializer(ValuesListSerializer):
+    """
+    ``EvidenceListSerializer`` output built from ``values_list`` rows.
+
+    Used by the evidence list endpoint (without ``include_details``);
+    ``tests/test_values_serializers.py`` checks it against
+    ``EvidenceListSerializer`` field for field.
+    """
+
+    lookups = (
+        "id", "title", "description", "evidence_type", "case", "registered_by",
+        "registered_by__first_name", "registered_by__last_name",
+        "created_at", "updated_at",
+    )
+    evidence_type_labels = choice_labels(EvidenceType.choices)
+
+    def to_representation(self, row: tuple[Any, ...]) -> dict[str, Any]:
+        (
+            pk, title, description, evidence_type, case_id, registrar_id,
+            first_name, last_name, created_at, updated_at,
+        ) = row
+        return {
+            "id": pk,
+            "title": title,
+            "description": description,
+            "evidence_type": evidence_type,
+            "evidence_type_display": self.evidence_type_labels.get(evidence_type, str(evidence_type)),
+            "case": case_id,
+            "registered_by": registrar_id,
+            "registered_by_name": (
+                None if registrar_id is None else f"{first_name} {last_name}".strip()
+            ),
+            "created_at": self.render_datetime(created_at),
+            "updated_at": self.render_datetime(updated_at),
+        }
+
+
+class EvidencePolymorphicListSerializer(EvidenceListSerializer):
+    """
+    List representation plus a ``details`` object of type-specific fields.
+
+    Expects ``type_details`` to have been attached to each instance by
+    ``EvidenceQueryService.attach_type_details``.
+    """
+
+    details = serializers.JSONField(source="type_details", read_only=True)
+
+    class Meta(EvidenceListSerializer.Meta):
+        fields = EvidenceListSerializer.Meta.fields + ["details"]
+        read_only_fields = fields
+
+
 # ── Type-specific read serializers ──────────────────────────────────
 
 
@@ -789,6 +878,16 @@ class IdentityEvidenceUpdateSerializer(serializers.ModelSerializer):
 # ═══════════════════════════════════════════════════════════════════
 
 
+class VerificationClaimSerializer(serializers.Serializer):
+    """Request body for ``POST /api/evidence/verifications/claim/``."""
+
+    limit = serializers.IntegerField(
+        min_value=1,
+        default=10,
+        help_text="Number of pending items to claim (capped by REVIEW_CLAIM_MAX_BATCH).",
+    )
+
+
 class VerifyBiologicalEvidenceSerializer(serializers.Serializer):
     """
     Request body for ``POST /api/evidence/{id}/verify/``.
@@ -921,6 +1020,62 @@ class EvidenceFileUploadSerializer(serializers.ModelSerializer):
         return value
 
 
+class EvidenceUploadInitSerializer(serializers.Serializer):
+    """
+    Validates ``POST /api/evidence/{id}/uploads/`` — opens a resumable
+    upload session for a large file.
+    """
+
+    filename = serializers.CharField(max_length=255)
+    file_type = serializers.ChoiceField(choices=FileType.choices)
+    caption = serializers.CharField(max_length=255, required=False, allow_blank=True, default="")
+    total_size = serializers.IntegerField(min_value=1, help_text="Total file size in bytes.")
+    sha256 = serializers.RegexField(
+        regex=r"^[0-9a-fA-F]{64}$",
+        required=False,
+        help_text="Optional hex SHA-256 of the whole file, verified on completion.",
+    )
+
+
+class EvidenceUploadPartSerializer(serializers.Serializer):
+    """
+    Validates ``PUT /api/evidence/{id}/uploads/{upload_id}/parts/``
+    (multipart/form-data).
+    """
+
+    offset = serializers.IntegerField(
+        min_value=0,
+        help_text="Byte offset of this part; must equal the session's received_bytes.",
+    )
+    chunk = serializers.FileField(allow_empty_file=False)
+
+
+class EvidenceUploadSessionSerializer(serializers.ModelSerializer):
+    """Read-only state of a resumable upload session."""
+
+    chunk_size = serializers.SerializerMethodField()
+
+    class Meta:
+        model = EvidenceUploadSession
+        fields = [
+            "id",
+            "evidence",
+            "filename",
+            "file_type",
+            "caption",
+            "total_size",
+            "received_bytes",
+            "chunk_size",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+    def get_chunk_size(self, obj: EvidenceUploadSession) -> int:
+        """Largest part size the server accepts."""
+        return settings.EVIDENCE_UPLOAD_CHUNK_SIZE
+
+
 class ChainOfCustodyEntrySerializer(serializers.ModelSerializer):
     """
     Read-only serializer for ``EvidenceCustodyLog`` entries.
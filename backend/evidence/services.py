@@ -12,6 +12,8 @@ Architecture
 - ``EvidenceProcessingService`` — Polymorphic evidence creation, update, delete.
 - ``MedicalExaminerService``    — Coroner verification workflow for biological evidence.
 - ``EvidenceFileService``       — File attachment management.
+- ``EvidenceBlobService``       — Content-addressed, deduplicated file storage.
+- ``EvidenceUploadService``     — Resumable (chunked) uploads of large files.
 - ``ChainOfCustodyService``     — Read-only audit trail assembly.
 
 Permission Constants (from ``core.permissions_constants.EvidencePerms``)
@@ -26,24 +28,38 @@ Permission Constants (from ``core.permissions_constants.EvidencePerms``)
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
 from typing import Any
 
+from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import transaction
-from django.db.models import Q, QuerySet
-
-from core.domain.exceptions import DomainError, NotFound, PermissionDenied
+from django.core.files import File
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, OuterRef, Q, QuerySet, Subquery
+
+from cases.services import CaseCounterService, CaseRevisionService
+from core.domain.conditional import content_etag
+from core.domain.exceptions import Conflict, DomainError, NotFound, PermissionDenied
+from core.domain.imaging import delete_derivatives
 from core.domain.notifications import NotificationService
+from core.domain.projection import QueryShape, apply_query_shape
+from core.domain.queues import LEASE_FIELDS, claim_cleared, claim_next, ensure_claim, release_claim
 from core.permissions_constants import EvidencePerms
 
 from .models import (
     BiologicalEvidence,
     CustodyAction,
     Evidence,
+    EvidenceBlob,
     EvidenceCustodyLog,
     EvidenceFile,
     EvidenceType,
+    EvidenceUploadSession,
     IdentityEvidence,
     TestimonyEvidence,
     VehicleEvidence,
@@ -56,6 +72,20 @@ logger = logging.getLogger(__name__)
 # evidence list semantics always align with the user's case permissions.
 # No separate evidence scope config is needed.
 
+#: ``(header, lookup)`` columns of the streaming evidence export
+#: (``core.domain.exports``).  Type-specific child fields are left to
+#: the detail endpoint.
+EVIDENCE_EXPORT_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("id", "id"),
+    ("case", "case_id"),
+    ("evidence_type", "evidence_type"),
+    ("title", "title"),
+    ("description", "description"),
+    ("registered_by", "registered_by_id"),
+    ("created_at", "created_at"),
+    ("updated_at", "updated_at"),
+)
+
 
 # ═══════════════════════════════════════════════════════════════════
 #  Evidence Query Service
@@ -70,13 +100,35 @@ class EvidenceQueryService:
     live here so the view stays thin.
     """
 
+    #: Child model and type-specific columns per ``EvidenceType``, used
+    #: by the polymorphic list mode.  ``OTHER`` has no child table.
+    _TYPE_DETAIL_FIELDS: dict[str, tuple[type, tuple[str, ...]]] = {
+        EvidenceType.TESTIMONY: (TestimonyEvidence, ("statement_text",)),
+        EvidenceType.BIOLOGICAL: (
+            BiologicalEvidence,
+            ("forensic_result", "is_verified", "verified_by"),
+        ),
+        EvidenceType.VEHICLE: (
+            VehicleEvidence,
+            ("vehicle_model", "color", "license_plate", "serial_number"),
+        ),
+        EvidenceType.IDENTITY: (
+            IdentityEvidence,
+            ("owner_full_name", "document_details"),
+        ),
+    }
+
     @staticmethod
     def get_filtered_queryset(
         requesting_user: Any,
         filters: dict[str, Any],
+        shape: QueryShape | None = None,
     ) -> QuerySet[Evidence]:
         """
         Build a permission-scoped, filtered queryset of ``Evidence`` objects.
+
+        ``shape`` is the caller's serializer ``QueryShape``; only the
+        columns and relations it declares are loaded.
         """
         # 1) Require explicit read permission first.
         if not requesting_user.has_perm(f"evidence.{EvidencePerms.VIEW_EVIDENCE}"):
@@ -126,10 +178,8 @@ class EvidenceQueryService:
         if created_before is not None:
             qs = qs.filter(created_at__date__lte=created_before)
 
-        # 4. Optimise with select_related / prefetch_related
-        qs = qs.select_related("registered_by", "case").prefetch_related("files")
-
-        return qs
+        # 4. Load only what the caller's serializer renders
+        return apply_query_shape(qs, shape)
 
     @staticmethod
     def get_evidence_detail(pk: int) -> Evidence:
@@ -182,6 +232,69 @@ class EvidenceQueryService:
         # No child found — it's an "Other" type
         return evidence
 
+    @staticmethod
+    def get_evidence_detail_etag(pk: int) -> str:
+        """
+        Return the ETag of the evidence detail representation in one query.
+
+        Saving a typed child (testimony, biological, …) also saves the
+        parent row, so ``Evidence.updated_at`` covers the type-specific
+        fields; the ``files`` count and latest ``updated_at`` (bumped
+        when derivatives are rendered) cover the nested attachments.
+
+        Raises ``NotFound`` if no evidence with the given PK exists.
+        """
+        files = EvidenceFile.objects.filter(evidence=OuterRef("pk")).order_by().values("evidence")
+        try:
+            row = (
+                Evidence.objects.filter(pk=pk)
+                .annotate(
+                    file_count=Subquery(files.annotate(n=Count("pk")).values("n")),
+                    file_updated=Subquery(files.annotate(m=Max("updated_at")).values("m")),
+                )
+                .values_list("updated_at", "file_count", "file_updated")
+                .get()
+            )
+        except Evidence.DoesNotExist:
+            raise NotFound(f"Evidence with id {pk} not found.")
+        except (ValueError, TypeError):
+            raise NotFound(f"Evidence '{pk}' not found: invalid identifier.")
+        return content_etag("evidence", pk, *row)
+
+    @classmethod
+    def attach_type_details(cls, evidences: list[Evidence]) -> list[Evidence]:
+        """
+        Attach a ``type_details`` dict of type-specific fields to each
+        evidence item in *evidences* (the already-evaluated list page).
+
+        Ids are grouped by ``evidence_type`` and each child table is
+        loaded once with ``in_bulk``, so a page costs at most one query
+        per subtype regardless of its size.  FK columns are rendered as
+        their raw id.  Items with no child row get an empty dict.
+        """
+        ids_by_type: dict[str, list[int]] = {}
+        for evidence in evidences:
+            ids_by_type.setdefault(evidence.evidence_type, []).append(evidence.pk)
+
+        children: dict[int, Any] = {}
+        for evidence_type, ids in ids_by_type.items():
+            spec = cls._TYPE_DETAIL_FIELDS.get(evidence_type)
+            if spec is None:
+                continue
+            model, fields = spec
+            children.update(model.objects.only(*fields).in_bulk(ids))
+
+        for evidence in evidences:
+            child = children.get(evidence.pk)
+            if child is None:
+                evidence.type_details = {}
+                continue
+            _, fields = cls._TYPE_DETAIL_FIELDS[evidence.evidence_type]
+            evidence.type_details = {
+                name: child.serializable_value(name) for name in fields
+            }
+        return evidences
+
 
 # ═══════════════════════════════════════════════════════════════════
 #  Evidence Processing Service
@@ -199,7 +312,8 @@ class EvidenceProcessingService:
     """
 
     #: Maps ``EvidenceType`` values to their corresponding model classes.
-    _MODEL_MAP: dict[str, type[Evidence]] = {
+    #: Also used by ``core.services.RecordImportService``.
+    MODEL_MAP: dict[str, type[Evidence]] = {
         EvidenceType.TESTIMONY: TestimonyEvidence,
         EvidenceType.BIOLOGICAL: BiologicalEvidence,
         EvidenceType.VEHICLE: VehicleEvidence,
@@ -263,7 +377,8 @@ class EvidenceProcessingService:
                     )
 
     #: Maps evidence_type to its type-specific validator
-    _VALIDATORS: dict[str, Any] = {
+    #: (also run by ``core.services.RecordImportService``).
+    VALIDATORS: dict[str, Any] = {
         EvidenceType.VEHICLE: _validate_vehicle.__func__,
         EvidenceType.BIOLOGICAL: _validate_biological.__func__,
         EvidenceType.TESTIMONY: _validate_testimony.__func__,
@@ -290,12 +405,12 @@ class EvidenceProcessingService:
             raise DomainError(f"Invalid evidence type: {evidence_type}")
 
         # 3. Run type-specific validation
-        validator = EvidenceProcessingService._VALIDATORS.get(evidence_type)
+        validator = EvidenceProcessingService.VALIDATORS.get(evidence_type)
         if validator:
             validator(validated_data)
 
         # 4. Resolve model class
-        model_cls = EvidenceProcessingService._MODEL_MAP[evidence_type]
+        model_cls = EvidenceProcessingService.MODEL_MAP[evidence_type]
 
         # 5. Inject registered_by
         validated_data["registered_by"] = requesting_user
@@ -307,6 +422,7 @@ class EvidenceProcessingService:
 
         # 7. Create the evidence instance
         evidence = model_cls.objects.create(**validated_data)
+        CaseCounterService.adjust(evidence.case_id, evidence_count=1)
 
         # 8. Dispatch notification to the case's assigned detective
         case = evidence.case
@@ -403,7 +519,10 @@ class EvidenceProcessingService:
                 pass
 
         evidence_pk = evidence.pk
+        case_id = evidence.case_id
+        # Cascades to the files; ``evidence.signals`` releases their blobs.
         evidence.delete()
+        CaseCounterService.adjust(case_id, evidence_count=-1)
 
         logger.info(
             "Evidence #%d deleted by user %s",
@@ -433,9 +552,14 @@ class EvidenceProcessingService:
         except Case.DoesNotExist:
             raise DomainError(f"Case with id {case_id} does not exist.")
 
-        # 3. Update FK
+        # 3. Update FK and move the evidence between the case counters
+        previous_case_id = evidence.case_id
         evidence.case = target_case
         evidence.save(update_fields=["case_id", "updated_at"])
+        if previous_case_id != target_case.pk:
+            CaseCounterService.adjust(previous_case_id, evidence_count=-1)
+            CaseCounterService.adjust(target_case.pk, evidence_count=1)
+            CaseRevisionService.bump(previous_case_id)
 
         logger.info(
             "Evidence #%d linked to Case #%d by user %s",
@@ -524,6 +648,8 @@ class MedicalExaminerService:
             DomainError:      If the evidence is already verified
                               (irreversibility invariant) or required
                               fields are missing.
+            Conflict:         If another Coroner holds an active review
+                              queue claim on the item.
         """
         # 1. Permission check — only Coroner
         if not examiner_user.has_perm(f"evidence.{EvidencePerms.CAN_VERIFY_EVIDENCE}"):
@@ -547,7 +673,11 @@ class MedicalExaminerService:
                 "Verification is irreversible."
             )
 
-        # 4. Decision processing
+        # 4. Another coroner may hold the item through the review queue
+        ensure_claim(bio_evidence, examiner_user)
+        claim_cleared(bio_evidence)
+
+        # 5. Decision processing
         if decision == "approve":
             if not forensic_result.strip():
                 raise DomainError("Forensic result is required when approving.")
@@ -561,12 +691,13 @@ class MedicalExaminerService:
             bio_evidence.forensic_result = f"REJECTED: {notes}"
             bio_evidence.verified_by = examiner_user
 
-        # 5. Persist verification metadata
+        # 6. Persist verification metadata
         bio_evidence.save(update_fields=[
-            "is_verified", "forensic_result", "verified_by", "updated_at",
+            "is_verified", "forensic_result", "verified_by", *LEASE_FIELDS,
+            "updated_at",
         ])
 
-        # 6. Log custody entry for the verification action
+        # 7. Log custody entry for the verification action
         action_label = "approved" if decision == "approve" else "rejected"
         EvidenceCustodyLog.objects.create(
             evidence=bio_evidence,
@@ -575,7 +706,7 @@ class MedicalExaminerService:
             notes=f"Biological evidence {action_label} by Coroner. {forensic_result or notes}".strip(),
         )
 
-        # 7. Notify the assigned detective
+        # 8. Notify the assigned detective
         case = bio_evidence.case
         if hasattr(case, "assigned_detective") and case.assigned_detective:
             NotificationService.create(
@@ -615,6 +746,44 @@ class MedicalExaminerService:
             .order_by("-created_at")
         )
 
+    @staticmethod
+    def claim_pending_verifications(
+        examiner_user: Any,
+        limit: int,
+        shape: QueryShape | None = None,
+    ) -> list[BiologicalEvidence]:
+        """
+        Lease the next *limit* unverified biological items to a Coroner.
+
+        Oldest first.  Items claimed by another Coroner are skipped until
+        verified, released, or the lease expires (``core.domain.queues``).
+
+        Args:
+            examiner_user: The Coroner taking the items.
+            limit:         Batch size (capped by ``REVIEW_CLAIM_MAX_BATCH``).
+            shape:         Projection for the returned rows.
+
+        Raises:
+            PermissionDenied: If the user lacks ``CAN_VERIFY_EVIDENCE``.
+        """
+        if not examiner_user.has_perm(f"evidence.{EvidencePerms.CAN_VERIFY_EVIDENCE}"):
+            raise PermissionDenied("Only the Coroner can claim pending verifications.")
+
+        pks = claim_next(
+            BiologicalEvidence.objects.filter(is_verified=False, verified_by__isnull=True),
+            examiner_user,
+            limit=limit,
+        )
+        return list(
+            apply_query_shape(BiologicalEvidence.objects.filter(pk__in=pks), shape)
+            .order_by("created_at", "pk")
+        )
+
+    @staticmethod
+    def release_verification_claim(evidence_id: int, examiner_user: Any) -> None:
+        """Hand a claimed biological item back to the verification queue."""
+        release_claim(BiologicalEvidence.objects.all(), evidence_id, examiner_user)
+
 
 # ═══════════════════════════════════════════════════════════════════
 #  Evidence File Service
@@ -659,6 +828,37 @@ class EvidenceFileService:
 
         return evidence.files.order_by("-created_at")
 
+    @staticmethod
+    def get_file_for_download(
+        evidence_id: int,
+        file_id: int,
+        user: Any,
+    ) -> EvidenceFile:
+        """
+        Resolve a file attachment the user is allowed to download.
+
+        The parent evidence must be visible through
+        ``EvidenceQueryService.get_filtered_queryset`` (i.e. its case is
+        in the user's case scope) and the user needs ``VIEW_EVIDENCEFILE``.
+        Out-of-scope evidence is reported as ``NotFound`` so its
+        existence is not leaked.
+
+        Raises:
+            PermissionDenied: If the user lacks view permissions.
+            NotFound:         If the evidence or file is not visible.
+        """
+        if not user.has_perm(f"evidence.{EvidencePerms.VIEW_EVIDENCEFILE}"):
+            raise PermissionDenied("You do not have permission to view evidence files.")
+
+        visible = EvidenceQueryService.get_filtered_queryset(user, filters={})
+        if not visible.filter(pk=evidence_id).exists():
+            raise NotFound(f"Evidence with id {evidence_id} not found.")
+
+        try:
+            return EvidenceFile.objects.get(pk=file_id, evidence_id=evidence_id)
+        except EvidenceFile.DoesNotExist:
+            raise NotFound(f"File with id {file_id} not found on evidence {evidence_id}.")
+
     @staticmethod
     @transaction.atomic
     def upload_file(
@@ -694,18 +894,23 @@ class EvidenceFileService:
         except Evidence.DoesNotExist:
             raise NotFound(f"Evidence with id {evidence_id} not found.")
 
+        data = dict(validated_data)
+        upload = data.pop("file")
+        sha256 = EvidenceBlobService.compute_sha256(upload)
+        blob = EvidenceBlobService.acquire(upload, upload.name, sha256)
         evidence_file = EvidenceFile.objects.create(
-            evidence=evidence, **validated_data
+            evidence=evidence, blob=blob, sha256=sha256, file=blob.file.name, **data
         )
 
-        # Log a chain-of-custody entry for the file upload
+        # Log a chain-of-custody entry for the file upload; the content
+        # hash doubles as the integrity value for later verification.
         file_desc = evidence_file.get_file_type_display()
         caption = evidence_file.caption or "No caption"
         EvidenceCustodyLog.objects.create(
             evidence=evidence,
             handled_by=actor,
             action_type=CustodyAction.CHECKED_IN,
-            notes=f"File uploaded: {file_desc} — {caption}",
+            notes=f"File uploaded: {file_desc} — {caption} (SHA-256 {sha256})",
         )
 
         logger.info(
@@ -727,7 +932,12 @@ class EvidenceFileService:
             raise PermissionDenied("You do not have permission to delete evidence files.")
 
         file_pk = evidence_file.pk
-        evidence_file.file.delete(save=False)
+        if evidence_file.blob_id is None:
+            # Pre-content-addressing upload: the file is not shared.
+            if evidence_file.file_derivatives:
+                delete_derivatives(evidence_file.file.storage, evidence_file.file.name)
+            evidence_file.file.delete(save=False)
+        # ``evidence.signals`` releases the blob.
         evidence_file.delete()
         logger.info(
             "Evidence file #%d deleted by user %s",
@@ -736,6 +946,469 @@ class EvidenceFileService:
         )
 
 
+# ═══════════════════════════════════════════════════════════════════
+#  Content-Addressed Blob Service
+# ═══════════════════════════════════════════════════════════════════
+
+
+class EvidenceBlobService:
+    """
+    Content-addressed, reference-counted storage for evidence media.
+
+    Content is stored once under ``evidence_blobs/aa/bb/<sha256><ext>``
+    and shared by every ``EvidenceFile`` with the same SHA-256.  Callers
+    must run inside a transaction: ``acquire`` and ``release`` lock the
+    ``EvidenceBlob`` row so reference counts stay exact under concurrency,
+    and stored content is only deleted after the releasing transaction
+    commits.
+
+    Releasing the last reference leaves the row behind with
+    ``ref_count=0`` until its content is deleted, so the SHA-256 keeps a
+    row to lock: an ``acquire`` in that window revives the row and the
+    pending deletion skips it.  A file with no row is never adopted,
+    since it may be just about to be deleted.
+    """
+
+    @staticmethod
+    def blob_name(sha256: str, filename: str) -> str:
+        """Storage path for *sha256*, keeping the original extension for MIME sniffing."""
+        suffix = Path(filename).suffix.lower()[:16]
+        return f"evidence_blobs/{sha256[:2]}/{sha256[2:4]}/{sha256}{suffix}"
+
+    @staticmethod
+    def compute_sha256(content: File) -> str:
+        """Stream *content* through SHA-256 and rewind it."""
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+        content.seek(0)
+        return digest.hexdigest()
+
+    @classmethod
+    def acquire(
+        cls,
+        content: File,
+        filename: str,
+        sha256: str | None = None,
+    ) -> EvidenceBlob:
+        """
+        Return the blob for *content*, storing it only if it is new.
+
+        Increments ``ref_count`` by one; the caller is expected to point
+        exactly one new ``EvidenceFile`` at the returned blob.
+        """
+        if sha256 is None:
+            sha256 = cls.compute_sha256(content)
+
+        storage = EvidenceBlob._meta.get_field("file").storage
+        blob = EvidenceBlob.objects.select_for_update().filter(sha256=sha256).first()
+        if blob is not None:
+            if blob.ref_count == 0 and not storage.exists(blob.file.name):
+                # Released, and its content deleted by a collection that
+                # then failed to remove the row.
+                blob.file = storage.save(cls.blob_name(sha256, filename), content)
+                blob.save(update_fields=["file", "updated_at"])
+            EvidenceBlob.objects.filter(pk=blob.pk).update(ref_count=F("ref_count") + 1)
+            blob.ref_count += 1
+            return blob
+
+        # ``save`` picks a free name if an orphaned file holds this one.
+        stored_name = storage.save(cls.blob_name(sha256, filename), content)
+        try:
+            with transaction.atomic():
+                return EvidenceBlob.objects.create(
+                    sha256=sha256,
+                    file=stored_name,
+                    size=storage.size(stored_name),
+                    ref_count=1,
+                )
+        except IntegrityError:
+            # A concurrent upload of the same content won the insert.
+            blob = EvidenceBlob.objects.select_for_update().get(sha256=sha256)
+            if stored_name != blob.file.name:
+                storage.delete(stored_name)
+            EvidenceBlob.objects.filter(pk=blob.pk).update(ref_count=F("ref_count") + 1)
+            blob.ref_count += 1
+            return blob
+
+    @classmethod
+    def release(cls, blob_id: int) -> None:
+        """
+        Drop one reference; delete the blob and its content on the last one.
+
+        Called from ``post_delete`` of the referencing ``EvidenceFile``
+        (``evidence.signals``), so cascaded deletes release their blobs
+        too.  The last release marks
+        the row ``ref_count=0``; ``_collect`` deletes it after commit.
+        """
+        blob = EvidenceBlob.objects.select_for_update().get(pk=blob_id)
+        if blob.ref_count > 1:
+            EvidenceBlob.objects.filter(pk=blob_id).update(ref_count=F("ref_count") - 1)
+            return
+
+        EvidenceBlob.objects.filter(pk=blob_id).update(ref_count=0)
+        transaction.on_commit(lambda: cls._collect(blob_id))
+
+    @staticmethod
+    def _collect(blob_id: int) -> None:
+        """Delete a released blob and its content unless it was acquired again."""
+        with transaction.atomic():
+            blob = (
+                EvidenceBlob.objects.select_for_update()
+                .filter(pk=blob_id, ref_count=0)
+                .first()
+            )
+            if blob is None:
+                return
+            storage, name = blob.file.storage, blob.file.name
+            storage.delete(name)
+            delete_derivatives(storage, name)
+            blob.delete()
+        logger.info("Evidence blob %s released and removed", blob.sha256)
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  Resumable Upload Service
+# ═══════════════════════════════════════════════════════════════════
+
+
+class _StagedFile(File):
+    """
+    A finished staging file handed to the storage backend.
+
+    Exposing ``temporary_file_path`` (like Django's
+    ``TemporaryUploadedFile``) lets ``FileSystemStorage`` move the file
+    into place instead of copying it chunk by chunk.
+    """
+
+    def temporary_file_path(self) -> str:
+        return self.name
+
+
+#: Running SHA-256 per upload session kept by this process:
+#: ``{session_id: (offset, digest)}``, least recently used first.
+_RUNNING_DIGESTS: OrderedDict[str, tuple[int, Any]] = OrderedDict()
+_RUNNING_DIGESTS_MAX = 256
+_RUNNING_DIGESTS_LOCK = threading.Lock()
+
+
+class EvidenceUploadService:
+    """
+    Chunked, resumable upload protocol for large evidence media.
+
+    1. ``start_upload``   — declare filename, type and total size.
+    2. ``append_part``    — send bytes at ``offset == received_bytes``;
+       a dropped part is simply resent from the last acknowledged offset.
+    3. ``complete_upload`` — hand the staged file to media storage and
+       create the ``EvidenceFile`` plus its CHECKED_IN custody entry in
+       one transaction.
+
+    The SHA-256 is computed as parts arrive: each worker process keeps a
+    running digest per session and feeds it every part it writes.  A
+    worker that missed parts received elsewhere first catches up by
+    reading only the staged bytes past its own digest, so however the
+    parts are spread over W workers, no byte is read more than W times
+    and completion only hashes what its worker has not seen.  The digest
+    is recorded in the custody notes; when the client declared one
+    up-front it must match.
+    """
+
+    @staticmethod
+    def _staging_path(session_id: Any) -> Path:
+        return Path(settings.EVIDENCE_UPLOAD_STAGING_ROOT) / f"{session_id}.part"
+
+    @classmethod
+    def _digest_at(cls, session_id: Any, offset: int) -> Any:
+        """
+        Return a SHA-256 of the first *offset* staged bytes.
+
+        Continues this process's running digest when it stops at or
+        before *offset*; otherwise starts over.
+        """
+        with _RUNNING_DIGESTS_LOCK:
+            cached = _RUNNING_DIGESTS.get(str(session_id))
+        start, digest = cached if cached and cached[0] <= offset else (0, None)
+        digest = digest.copy() if digest is not None else hashlib.sha256()
+        if start < offset:
+            with open(cls._staging_path(session_id), "rb") as fh:
+                fh.seek(start)
+                remaining = offset - start
+                while remaining and (block := fh.read(min(remaining, 1024 * 1024))):
+                    digest.update(block)
+                    remaining -= len(block)
+        return digest
+
+    @staticmethod
+    def _remember_digest(session_id: Any, offset: int, digest: Any) -> None:
+        key = str(session_id)
+        with _RUNNING_DIGESTS_LOCK:
+            _RUNNING_DIGESTS[key] = (offset, digest)
+            _RUNNING_DIGESTS.move_to_end(key)
+            while len(_RUNNING_DIGESTS) > _RUNNING_DIGESTS_MAX:
+                _RUNNING_DIGESTS.popitem(last=False)
+
+    @classmethod
+    def _handoff_path(cls, session_id: Any) -> Path | None:
+        """
+        Hard-link the staged file under a second name for storage to move.
+
+        The staged file itself stays in place until the completing
+        transaction commits, so a rolled-back completion can be retried.
+        Returns ``None`` where hard links are unsupported; storage then
+        copies from the staged file instead.
+        """
+        staged = cls._staging_path(session_id)
+        handoff = staged.with_suffix(".handoff")
+        handoff.unlink(missing_ok=True)
+        try:
+            os.link(staged, handoff)
+        except OSError:
+            return None
+        return handoff
+
+    @classmethod
+    def _discard(cls, session_id: Any) -> None:
+        staged = cls._staging_path(session_id)
+        staged.unlink(missing_ok=True)
+        staged.with_suffix(".handoff").unlink(missing_ok=True)
+        with _RUNNING_DIGESTS_LOCK:
+            _RUNNING_DIGESTS.pop(str(session_id), None)
+
+    @staticmethod
+    def _get_owned_session(
+        evidence_id: int,
+        upload_id: Any,
+        actor: Any,
+        *,
+        lock: bool = False,
+    ) -> EvidenceUploadSession:
+        qs = EvidenceUploadSession.objects.filter(
+            pk=upload_id, evidence_id=evidence_id, uploaded_by=actor,
+        )
+        if lock:
+            qs = qs.select_for_update()
+        session = qs.first()
+        if session is None:
+            raise NotFound(f"Upload session {upload_id} not found.")
+        return session
+
+    @staticmethod
+    def start_upload(
+        evidence_id: int,
+        actor: Any,
+        validated_data: dict[str, Any],
+    ) -> EvidenceUploadSession:
+        """
+        Open a resumable upload session for an evidence item.
+
+        Raises:
+            PermissionDenied: If the user lacks add-file permission.
+            NotFound:         If no evidence with the given PK exists.
+            DomainError:      If ``total_size`` exceeds the configured maximum.
+        """
+        if not actor.has_perm(f"evidence.{EvidencePerms.ADD_EVIDENCEFILE}"):
+            raise PermissionDenied("You do not have permission to upload evidence files.")
+        if not Evidence.objects.filter(pk=evidence_id).exists():
+            raise NotFound(f"Evidence with id {evidence_id} not found.")
+
+        total_size = validated_data["total_size"]
+        if total_size > settings.EVIDENCE_UPLOAD_MAX_SIZE:
+            raise DomainError(
+                f"File exceeds the maximum upload size of "
+                f"{settings.EVIDENCE_UPLOAD_MAX_SIZE} bytes."
+            )
+
+        session = EvidenceUploadSession.objects.create(
+            evidence_id=evidence_id,
+            uploaded_by=actor,
+            filename=validated_data["filename"],
+            file_type=validated_data["file_type"],
+            caption=validated_data.get("caption", ""),
+            total_size=total_size,
+            expected_sha256=validated_data.get("sha256", "").lower(),
+        )
+        path = EvidenceUploadService._staging_path(session.pk)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+        logger.info(
+            "Upload session %s opened for Evidence #%s (%d bytes) by %s",
+            session.pk, evidence_id, total_size, actor,
+        )
+        return session
+
+    @classmethod
+    def get_session(
+        cls,
+        evidence_id: int,
+        upload_id: Any,
+        actor: Any,
+    ) -> EvidenceUploadSession:
+        """Return the caller's session so a client can resume from ``received_bytes``."""
+        return cls._get_owned_session(evidence_id, upload_id, actor)
+
+    @classmethod
+    def append_part(
+        cls,
+        evidence_id: int,
+        upload_id: Any,
+        actor: Any,
+        offset: int,
+        chunk: Any,
+    ) -> EvidenceUploadSession:
+        """
+        Append one part at ``offset``.
+
+        The session row is locked for the duration of the write so two
+        parts for the same upload can never interleave.
+
+        Raises:
+            NotFound:    If the session does not exist or is not the caller's.
+            Conflict:    If ``offset`` is not the next expected byte; the
+                         response tells the client where to resume.
+            DomainError: If the part is too large or overruns ``total_size``.
+        """
+        if chunk.size > settings.EVIDENCE_UPLOAD_CHUNK_SIZE:
+            raise DomainError(
+                f"Parts may not exceed {settings.EVIDENCE_UPLOAD_CHUNK_SIZE} bytes."
+            )
+
+        with transaction.atomic():
+            session = cls._get_owned_session(evidence_id, upload_id, actor, lock=True)
+            if offset != session.received_bytes:
+                raise Conflict(
+                    f"Expected a part at offset {session.received_bytes}, got {offset}."
+                )
+            if offset + chunk.size > session.total_size:
+                raise DomainError("Part overruns the declared total size.")
+
+            digest = cls._digest_at(session.pk, offset)
+            written = 0
+            with open(cls._staging_path(session.pk), "r+b") as fh:
+                # Drop any bytes left behind by a part whose commit failed.
+                fh.seek(offset)
+                fh.truncate()
+                for piece in chunk.chunks():
+                    fh.write(piece)
+                    digest.update(piece)
+                    written += len(piece)
+
+            session.received_bytes = offset + written
+            session.save(update_fields=["received_bytes", "updated_at"])
+            session_id, received = session.pk, session.received_bytes
+            transaction.on_commit(
+                lambda: cls._remember_digest(session_id, received, digest)
+            )
+
+        return session
+
+    @classmethod
+    def complete_upload(
+        cls,
+        evidence_id: int,
+        upload_id: Any,
+        actor: Any,
+    ) -> EvidenceFile:
+        """
+        Finalise a fully received upload into an ``EvidenceFile``.
+
+        The staged file is handed to ``EvidenceBlobService`` (moved into
+        place, or dropped when identical content is already stored), then
+        the ``EvidenceFile`` row, the CHECKED_IN ``EvidenceCustodyLog``
+        entry (carrying the SHA-256) and the session deletion commit
+        together.  The staged file is removed only after that commit; if
+        the transaction fails, the session can be completed again.
+
+        Raises:
+            NotFound:    If the session does not exist or is not the caller's.
+            DomainError: If bytes are missing, or the digest does not match
+                         the client-declared SHA-256 (the session is discarded).
+        """
+        session = cls._get_owned_session(evidence_id, upload_id, actor)
+        if not session.is_complete:
+            raise DomainError(
+                f"Upload incomplete: {session.received_bytes} of "
+                f"{session.total_size} bytes received."
+            )
+        # Caught up before the row lock is taken: a complete session
+        # accepts no further parts, so the staged bytes cannot change.
+        sha256 = cls._digest_at(session.pk, session.total_size).hexdigest()
+
+        with transaction.atomic():
+            session = cls._get_owned_session(evidence_id, upload_id, actor, lock=True)
+            if session.expected_sha256 and session.expected_sha256 != sha256:
+                session.delete()
+                mismatch = True
+            else:
+                mismatch = False
+                evidence_file = cls._store(session, actor, sha256)
+
+        if mismatch:
+            cls._discard(upload_id)
+            raise DomainError(
+                "Uploaded content does not match the declared SHA-256; "
+                "the upload was discarded."
+            )
+        return evidence_file
+
+    @classmethod
+    def _store(
+        cls,
+        session: EvidenceUploadSession,
+        actor: Any,
+        sha256: str,
+    ) -> EvidenceFile:
+        session_id = session.pk
+        handoff = cls._handoff_path(session_id)
+        if handoff is None:
+            with open(cls._staging_path(session_id), "rb") as fh:
+                blob = EvidenceBlobService.acquire(File(fh), session.filename, sha256)
+        else:
+            try:
+                with open(handoff, "rb") as fh:
+                    blob = EvidenceBlobService.acquire(
+                        _StagedFile(fh, name=str(handoff)), session.filename, sha256,
+                    )
+            finally:
+                # Moved away by the storage, or left over when the content
+                # was already stored.
+                handoff.unlink(missing_ok=True)
+        evidence_file = EvidenceFile.objects.create(
+            evidence_id=session.evidence_id,
+            blob=blob,
+            sha256=sha256,
+            file=blob.file.name,
+            file_type=session.file_type,
+            caption=session.caption,
+        )
+        caption = evidence_file.caption or "No caption"
+        EvidenceCustodyLog.objects.create(
+            evidence_id=session.evidence_id,
+            handled_by=actor,
+            action_type=CustodyAction.CHECKED_IN,
+            notes=(
+                f"File uploaded: {evidence_file.get_file_type_display()} — "
+                f"{caption} (SHA-256 {sha256})"
+            ),
+        )
+        session.delete()
+
+        transaction.on_commit(lambda: cls._discard(session_id))
+        logger.info(
+            "Upload session %s completed as File #%d on Evidence #%d",
+            session_id, evidence_file.pk, session.evidence_id,
+        )
+        return evidence_file
+
+    @classmethod
+    def abort_upload(cls, evidence_id: int, upload_id: Any, actor: Any) -> None:
+        """Discard an unfinished session and its staged bytes."""
+        with transaction.atomic():
+            session = cls._get_owned_session(evidence_id, upload_id, actor, lock=True)
+            session_id = session.pk
+            session.delete()
+        cls._discard(session_id)
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  Chain of Custody Service
 # ═══════════════════════════════════════════════════════════════════
@@ -835,7 +1508,10 @@ class ChainOfCustodyService:
                 "action": "File Added",
                 "performed_by": evidence.registered_by_id,
                 "performer_name": evidence.registered_by.get_full_name(),
-                "details": f"{f.get_file_type_display()}: {f.caption}" if f.caption else f.get_file_type_display(),
+                "details": (
+                    (f"{f.get_file_type_display()}: {f.caption}" if f.caption else f.get_file_type_display())
+                    + (f" (SHA-256 {f.sha256})" if f.sha256 else "")
+                ),
             })
 
         # 3. Verification event (biological only)
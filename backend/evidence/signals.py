@@ -0,0 +1,26 @@
+"""
+Releases the shared ``EvidenceBlob`` of every deleted ``EvidenceFile``.
+
+A file row is deleted directly (``EvidenceFileService.delete_file``) or
+by the cascade from its evidence item or case; releasing from
+``post_delete`` keeps ``EvidenceBlob.ref_count`` exact either way.  The
+receiver is connected by ``EvidenceConfig.ready()``.
+"""
+
+from django.db.models.signals import post_delete
+
+
+def release_blob(sender, instance, **kwargs) -> None:
+    """Drop the deleted file's reference to its content blob."""
+    if instance.blob_id is None:
+        return
+    from .services import EvidenceBlobService
+
+    EvidenceBlobService.release(instance.blob_id)
+
+
+def connect_blob_signals() -> None:
+    post_delete.connect(
+        release_blob, sender="evidence.EvidenceFile",
+        dispatch_uid="evidence-blob:release",
+    )
@@ -8,15 +8,26 @@ Route Hierarchy
 ---------------
   /api/evidence/                                → list / create (polymorphic)
   /api/evidence/{id}/                           → retrieve / partial_update / destroy
+  GET  /api/evidence/export/                     → stream filtered evidence (CSV / NDJSON)
 
   ── Workflow @actions (resource-level RPC) ──────────────────────
   POST /api/evidence/{id}/verify/               → Coroner verifies biological evidence
+  POST /api/evidence/verifications/claim/       → lease unverified biological items
+  POST /api/evidence/{id}/release-claim/        → hand a claimed item back
   POST /api/evidence/{id}/link-case/            → link evidence to a case
   POST /api/evidence/{id}/unlink-case/          → unlink evidence from a case
 
   ── File management @actions ────────────────────────────────────
   GET  /api/evidence/{id}/files/                → list attached files
   POST /api/evidence/{id}/files/                → upload a new file
+  GET  /api/evidence/{id}/files/{file_id}/download/ → stream file (Range / ETag, ?variant=)
+
+  ── Resumable upload @actions ───────────────────────────────────
+  POST   /api/evidence/{id}/uploads/                         → open session
+  GET    /api/evidence/{id}/uploads/{upload_id}/             → resume point
+  DELETE /api/evidence/{id}/uploads/{upload_id}/             → abort
+  PUT    /api/evidence/{id}/uploads/{upload_id}/parts/       → append a part
+  POST   /api/evidence/{id}/uploads/{upload_id}/complete/    → create EvidenceFile
 
   ── Audit / history @actions ────────────────────────────────────
   GET  /api/evidence/{id}/chain-of-custody/     → read-only custody audit trail
@@ -20,6 +20,7 @@ ViewSets
 
 from __future__ import annotations
 
+from django.http import HttpResponseBase
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
@@ -32,6 +33,13 @@ from drf_spectacular.utils import (
     extend_schema,
 )
 
+from core.domain.conditional import conditional_response
+from core.domain.exports import stream_export
+from core.domain.imaging import IMAGE_VARIANTS, variant_file
+from core.domain.media import serve_field_file
+from core.domain.projection import get_query_shape
+from core.domain.replicas import read_replica
+
 from .models import (
     BiologicalEvidence,
     Evidence,
@@ -46,8 +54,13 @@ from .serializers import (
     EvidenceFileUploadSerializer,
     EvidenceFilterSerializer,
     EvidenceListSerializer,
+    EvidenceListValuesSerializer,
     EvidencePolymorphicCreateSerializer,
+    EvidencePolymorphicListSerializer,
     EvidenceUpdateSerializer,
+    EvidenceUploadInitSerializer,
+    EvidenceUploadPartSerializer,
+    EvidenceUploadSessionSerializer,
     IdentityEvidenceDetailSerializer,
     IdentityEvidenceUpdateSerializer,
     LinkCaseSerializer,
@@ -57,13 +70,16 @@ from .serializers import (
     UnlinkCaseSerializer,
     VehicleEvidenceDetailSerializer,
     VehicleEvidenceUpdateSerializer,
+    VerificationClaimSerializer,
     VerifyBiologicalEvidenceSerializer,
 )
 from .services import (
+    EVIDENCE_EXPORT_COLUMNS,
     ChainOfCustodyService,
     EvidenceFileService,
     EvidenceProcessingService,
     EvidenceQueryService,
+    EvidenceUploadService,
     MedicalExaminerService,
 )
 
@@ -138,6 +154,7 @@ class EvidenceViewSet(viewsets.ViewSet):
             OpenApiParameter(name="collected_after", type=str, required=False, description="ISO date — collected on or after."),
             OpenApiParameter(name="collected_before", type=str, required=False, description="ISO date — collected on or before."),
             OpenApiParameter(name="search", type=str, required=False, description="Free-text search across evidence fields."),
+            OpenApiParameter(name="include_details", type=bool, required=False, description="Add a `details` object with type-specific fields to every item."),
         ],
         responses={200: OpenApiResponse(response=EvidenceListSerializer(many=True), description="Evidence list.")},
         tags=["Evidence"],
@@ -148,11 +165,56 @@ class EvidenceViewSet(viewsets.ViewSet):
         if not filter_serializer.is_valid():
             return Response(filter_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+        filters = filter_serializer.validated_data
+        with read_replica():
+            if filters.get("include_details"):
+                queryset = EvidenceQueryService.get_filtered_queryset(
+                    request.user,
+                    filters,
+                    shape=get_query_shape(EvidenceListSerializer),
+                )
+                page = EvidenceQueryService.attach_type_details(list(queryset))
+                data = EvidencePolymorphicListSerializer(page, many=True).data
+            else:
+                queryset = EvidenceQueryService.get_filtered_queryset(request.user, filters)
+                data = EvidenceListValuesSerializer(queryset).data
+        return Response(data, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        summary="Export evidence (CSV / NDJSON)",
+        description=(
+            "Stream every evidence item visible to the authenticated user as a "
+            "CSV or NDJSON download.  Accepts the same filters as the evidence "
+            "list; type-specific fields are not included."
+        ),
+        parameters=[
+            EvidenceFilterSerializer,
+            OpenApiParameter(
+                name="export_format", type=str, location=OpenApiParameter.QUERY,
+                enum=["csv", "ndjson"], default="csv",
+                description="csv (with a header row) or ndjson (one JSON object per line).",
+            ),
+        ],
+        responses={
+            200: OpenApiResponse(description="Streamed CSV or NDJSON attachment."),
+            400: OpenApiResponse(description="Invalid filter or export format."),
+        },
+        tags=["Evidence"],
+    )
+    @action(detail=False, methods=["get"], url_path="export", url_name="export")
+    def export(self, request: Request) -> HttpResponseBase:
+        """GET /api/evidence/export/ — Stream filtered evidence as CSV or NDJSON."""
+        filter_serializer = EvidenceFilterSerializer(data=request.query_params)
+        if not filter_serializer.is_valid():
+            return Response(filter_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
         queryset = EvidenceQueryService.get_filtered_queryset(
-            request.user, filter_serializer.validated_data
+            request.user, filter_serializer.validated_data,
+        )
+        return stream_export(
+            queryset, EVIDENCE_EXPORT_COLUMNS,
+            request.query_params.get("export_format", "csv"), "evidence",
         )
-        serializer = EvidenceListSerializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
 
     @extend_schema(
         summary="Create evidence (polymorphic)",
@@ -199,16 +261,26 @@ class EvidenceViewSet(viewsets.ViewSet):
 
     @extend_schema(
         summary="Retrieve evidence detail",
-        description="Fetch full detail for a single evidence item, resolved to its polymorphic subtype.",
-        responses={200: OpenApiResponse(response=EvidenceListSerializer, description="Evidence detail (type-specific).")},
+        description=(
+            "Fetch full detail for a single evidence item, resolved to its polymorphic subtype. "
+            "Send the returned ETag in If-None-Match to get 304 when unchanged."
+        ),
+        responses={
+            200: OpenApiResponse(response=EvidenceListSerializer, description="Evidence detail (type-specific)."),
+            304: OpenApiResponse(description="Not modified since the ETag in If-None-Match."),
+        },
         tags=["Evidence"],
     )
-    def retrieve(self, request: Request, pk: int = None) -> Response:
-        """GET /api/evidence/{id}/ — Evidence detail."""
-        evidence = self._get_evidence(pk)
-        detail_serializer_class = self._get_detail_serializer(evidence)
-        serializer = detail_serializer_class(evidence)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+    def retrieve(self, request: Request, pk: int = None) -> HttpResponseBase:
+        """GET /api/evidence/{id}/ — Evidence detail (304 if ``If-None-Match`` matches)."""
+        etag = EvidenceQueryService.get_evidence_detail_etag(pk)
+
+        def build() -> Response:
+            evidence = self._get_evidence(pk)
+            serializer = self._get_detail_serializer(evidence)(evidence)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+
+        return conditional_response(request, etag, build)
 
     @extend_schema(
         summary="Partial update evidence",
@@ -278,6 +350,52 @@ class EvidenceViewSet(viewsets.ViewSet):
         response_serializer = BiologicalEvidenceDetailSerializer(bio_evidence)
         return Response(response_serializer.data, status=status.HTTP_200_OK)
 
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="verifications/claim",
+        url_name="verifications-claim",
+    )
+    @extend_schema(
+        summary="Claim biological evidence for verification",
+        description=(
+            "Lease the next N unverified biological items to the calling "
+            "Coroner. Other Coroners' claims skip them until verified, "
+            "released, or the lease expires."
+        ),
+        request=VerificationClaimSerializer,
+        responses={200: OpenApiResponse(response=EvidenceListSerializer(many=True), description="Claimed items.")},
+        tags=["Evidence"],
+    )
+    def claim_verifications(self, request: Request) -> Response:
+        """POST /api/evidence/verifications/claim/ — lease pending items."""
+        serializer = VerificationClaimSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        items = MedicalExaminerService.claim_pending_verifications(
+            request.user,
+            serializer.validated_data["limit"],
+            shape=get_query_shape(EvidenceListSerializer),
+        )
+        return Response(EvidenceListSerializer(items, many=True).data, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=["post"], url_path="release-claim")
+    @extend_schema(
+        summary="Release a claimed verification",
+        description="Return a claimed biological item to the verification queue.",
+        request=None,
+        responses={
+            204: OpenApiResponse(description="Claim released."),
+            409: OpenApiResponse(description="Caller holds no active claim on the item."),
+        },
+        tags=["Evidence"],
+    )
+    def release_claim(self, request: Request, pk: int = None) -> Response:
+        """POST /api/evidence/{id}/release-claim/"""
+        MedicalExaminerService.release_verification_claim(pk, request.user)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
     @action(detail=True, methods=["post"], url_path="link-case")
     @extend_schema(
         summary="Link evidence to a case",
@@ -361,6 +479,155 @@ class EvidenceViewSet(viewsets.ViewSet):
         response_serializer = EvidenceFileReadSerializer(evidence_file)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path=r"files/(?P<file_id>\d+)/download",
+        url_name="file-download",
+    )
+    @extend_schema(
+        summary="Download an evidence file",
+        description=(
+            "Stream the file content after a scope and permission check. "
+            "Supports `Range` requests (206) for audio/video scrubbing and "
+            "`If-None-Match` revalidation (304). Image files accept "
+            "`?variant=` to fetch a rendered thumbnail or preview."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="variant", type=str, required=False, enum=tuple(IMAGE_VARIANTS),
+                description="Rendered image variant; the original is served until it exists.",
+            ),
+        ],
+        responses={
+            (200, "application/octet-stream"): OpenApiResponse(description="File content."),
+            (206, "application/octet-stream"): OpenApiResponse(description="Requested byte range."),
+            304: OpenApiResponse(description="Not modified."),
+        },
+        tags=["Evidence"],
+    )
+    def download_file(self, request: Request, pk: int = None, file_id: int = None) -> HttpResponseBase:
+        """GET /api/evidence/{id}/files/{file_id}/download/ — stream file content."""
+        evidence_file = EvidenceFileService.get_file_for_download(
+            pk, file_id, request.user
+        )
+        field_file = evidence_file.file
+        variant = request.query_params.get("variant")
+        if variant:
+            field_file = variant_file(field_file, evidence_file.file_derivatives, variant)
+        return serve_field_file(
+            request, field_file, version=evidence_file.updated_at
+        )
+
+    # ── Resumable upload @actions ─────────────────────────────────────
+
+    @action(detail=True, methods=["post"], url_path="uploads")
+    @extend_schema(
+        summary="Start a resumable upload",
+        description=(
+            "Open a chunked upload session for a large file. Send parts to "
+            "`uploads/{upload_id}/parts/`, then call `uploads/{upload_id}/complete/`."
+        ),
+        request=EvidenceUploadInitSerializer,
+        responses={201: OpenApiResponse(response=EvidenceUploadSessionSerializer, description="Session opened.")},
+        tags=["Evidence"],
+    )
+    def start_upload(self, request: Request, pk: int = None) -> Response:
+        """POST /api/evidence/{id}/uploads/ — open an upload session."""
+        serializer = EvidenceUploadInitSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        session = EvidenceUploadService.start_upload(
+            pk, request.user, serializer.validated_data
+        )
+        return Response(
+            EvidenceUploadSessionSerializer(session).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+    @action(
+        detail=True,
+        methods=["get", "delete"],
+        url_path=r"uploads/(?P<upload_id>[0-9a-f-]{36})",
+        url_name="upload-session",
+    )
+    @extend_schema(
+        summary="Inspect or abort a resumable upload",
+        description="GET: current `received_bytes` (resume point). DELETE: discard the session.",
+        responses={
+            200: OpenApiResponse(response=EvidenceUploadSessionSerializer, description="Session state."),
+            204: OpenApiResponse(description="Session discarded."),
+        },
+        tags=["Evidence"],
+    )
+    def upload_session(self, request: Request, pk: int = None, upload_id: str = None) -> Response:
+        """
+        GET    /api/evidence/{id}/uploads/{upload_id}/ — session state.
+        DELETE /api/evidence/{id}/uploads/{upload_id}/ — abort.
+        """
+        if request.method == "DELETE":
+            EvidenceUploadService.abort_upload(pk, upload_id, request.user)
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        session = EvidenceUploadService.get_session(pk, upload_id, request.user)
+        return Response(EvidenceUploadSessionSerializer(session).data, status=status.HTTP_200_OK)
+
+    @action(
+        detail=True,
+        methods=["put"],
+        url_path=r"uploads/(?P<upload_id>[0-9a-f-]{36})/parts",
+        url_name="upload-parts",
+    )
+    @extend_schema(
+        summary="Upload one part",
+        description=(
+            "Append a part (multipart/form-data: `offset`, `chunk`). `offset` "
+            "must equal the session's `received_bytes`; a 409 means resume "
+            "from the server's value."
+        ),
+        request=EvidenceUploadPartSerializer,
+        responses={
+            200: OpenApiResponse(response=EvidenceUploadSessionSerializer, description="Part stored."),
+            409: OpenApiResponse(description="Offset mismatch."),
+        },
+        tags=["Evidence"],
+    )
+    def upload_part(self, request: Request, pk: int = None, upload_id: str = None) -> Response:
+        """PUT /api/evidence/{id}/uploads/{upload_id}/parts/ — append a part."""
+        serializer = EvidenceUploadPartSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        session = EvidenceUploadService.append_part(
+            pk,
+            upload_id,
+            request.user,
+            serializer.validated_data["offset"],
+            serializer.validated_data["chunk"],
+        )
+        return Response(EvidenceUploadSessionSerializer(session).data, status=status.HTTP_200_OK)
+
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path=r"uploads/(?P<upload_id>[0-9a-f-]{36})/complete",
+        url_name="upload-complete",
+    )
+    @extend_schema(
+        summary="Complete a resumable upload",
+        description=(
+            "Check the SHA-256 kept as the parts arrived against the declared "
+            "one, if any, and create the evidence file plus its chain-of-custody "
+            "entry atomically."
+        ),
+        request=None,
+        responses={201: OpenApiResponse(response=EvidenceFileReadSerializer, description="File created.")},
+        tags=["Evidence"],
+    )
+    def complete_upload(self, request: Request, pk: int = None, upload_id: str = None) -> Response:
+        """POST /api/evidence/{id}/uploads/{upload_id}/complete/ — finalise."""
+        evidence_file = EvidenceUploadService.complete_upload(pk, upload_id, request.user)
+        return Response(
+            EvidenceFileReadSerializer(evidence_file).data,
+            status=status.HTTP_201_CREATED,
+        )
+
     # ── Audit / history @actions ──────────────────────────────────────
 
     @action(detail=True, methods=["get"], url_path="chain-of-custody")
@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class SuspectsConfig(AppConfig):
     name = 'suspects'
+
+    def ready(self):
+        from .signals import connect_cache_signals
+
+        connect_cache_signals()
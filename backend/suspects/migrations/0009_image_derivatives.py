@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-18 21:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('suspects', '0008_alter_suspect_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='suspect',
+            name='photo_derivatives',
+            field=models.JSONField(blank=True, default=dict, help_text='Rendered variants of ``photo`` as {variant: storage name}; see core.domain.imaging.', verbose_name='Photo Derivatives'),
+        ),
+    ]
@@ -20,7 +20,7 @@ from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.utils import timezone
 
-from core.models import TimeStampedModel
+from core.models import ClaimableModel, TimeStampedModel
 from core.permissions_constants import SuspectsPerms
 from core.constants import REWARD_MULTIPLIER
 
@@ -59,6 +59,22 @@ class BountyTipStatus(models.TextChoices):
     REJECTED = "rejected", "Rejected"
 
 
+#: Suspects counted in ``Case.suspects_at_trial_count``: at trial or past it.
+#: A case moves to JUDICIARY once every suspect is in this set.
+SUSPECT_AT_TRIAL_STATUSES: frozenset[str] = frozenset({
+    SuspectStatus.UNDER_TRIAL,
+    SuspectStatus.CONVICTED,
+    SuspectStatus.ACQUITTED,
+    SuspectStatus.RELEASED,
+})
+
+#: Tips counted in ``Case.open_tip_count``.
+OPEN_TIP_STATUSES: frozenset[str] = frozenset({
+    BountyTipStatus.PENDING,
+    BountyTipStatus.OFFICER_REVIEWED,
+})
+
+
 # ────────────────────────────────────────────────────────────────────
 # Models
 # ────────────────────────────────────────────────────────────────────
@@ -115,6 +131,13 @@ class Suspect(TimeStampedModel):
         null=True,
         verbose_name="Photo",
     )
+    photo_derivatives = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name="Photo Derivatives",
+        help_text="Rendered variants of ``photo`` as {variant: storage name}; "
+                  "see core.domain.imaging.",
+    )
     address = models.TextField(
         blank=True,
         default="",
@@ -467,7 +490,7 @@ class Trial(TimeStampedModel):
         )
 
 
-class BountyTip(TimeStampedModel):
+class BountyTip(ClaimableModel, TimeStampedModel):
     """
     Information submitted by a normal user about a suspect or case
     (project-doc §4.8).
@@ -23,8 +23,12 @@ from __future__ import annotations
 from typing import Any
 
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 from rest_framework import serializers
 
+from core.domain.imaging import ImageVariantField
+from core.domain.projection import QueryShape, ValuesListSerializer, choice_labels
+
 from .models import (
     Bail,
     BountyTip,
@@ -129,6 +133,7 @@ class SuspectListSerializer(serializers.ModelSerializer):
     case_title = serializers.SerializerMethodField()
     is_most_wanted = serializers.BooleanField(read_only=True)
     days_wanted = serializers.IntegerField(read_only=True)
+    photo_thumbnail = ImageVariantField(source="photo", variant="thumb")
 
     class Meta:
         model = Suspect
@@ -138,6 +143,7 @@ class SuspectListSerializer(serializers.ModelSerializer):
             "national_id",
             "phone_number",
             "photo",
+            "photo_thumbnail",
             "status",
             "status_display",
             "case",
@@ -152,6 +158,17 @@ class SuspectListSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = fields
+        query_shape = QueryShape(
+            only=(
+                "id", "full_name", "national_id", "phone_number", "photo",
+                "photo_derivatives", "status", "case", "wanted_since", "identified_by",
+                "sergeant_approval_status", "created_at", "updated_at",
+                "case__title",
+                "identified_by__first_name", "identified_by__last_name",
+                "identified_by__username",
+            ),
+            select_related=("case", "identified_by"),
+        )
 
     def get_identified_by_name(self, obj: Suspect) -> str | None:
         """
@@ -176,6 +193,67 @@ class SuspectListSerializer(serializers.ModelSerializer):
         return getattr(obj.case, "title", None) if obj.case_id else None
 
 
+class SuspectListValuesSerializer(ValuesListSerializer):
+    """
+    ``SuspectListSerializer`` output built from ``values_list`` rows.
+
+    Used by the suspect list endpoint; ``tests/test_values_serializers.py``
+    checks it against ``SuspectListSerializer`` field for field.
+    ``days_wanted`` is computed against one ``now`` per request.
+    """
+
+    lookups = (
+        "id", "full_name", "national_id", "phone_number", "photo", "photo_derivatives",
+        "status", "case", "case__title", "wanted_since", "identified_by",
+        "identified_by__username", "identified_by__first_name",
+        "identified_by__last_name", "identified_by__role__name",
+        "sergeant_approval_status", "created_at", "updated_at",
+    )
+    status_labels = choice_labels(SuspectStatus.choices)
+
+    def prepare(self) -> None:
+        super().prepare()
+        self.now = timezone.now()
+        self.photo_storage = Suspect._meta.get_field("photo").storage
+
+    def to_representation(self, row: tuple[Any, ...]) -> dict[str, Any]:
+        (
+            pk, full_name, national_id, phone_number, photo, derivatives,
+            suspect_status, case_id, case_title, wanted_since, identifier_id,
+            username, first_name, last_name, role_name,
+            approval_status, created_at, updated_at,
+        ) = row
+        render_datetime = self.render_datetime
+        days_wanted = (self.now - wanted_since).days
+        # ``User.__str__`` is the fallback for a nameless identifier.
+        identifier_name = f"{first_name} {last_name}".strip()
+        if not identifier_name:
+            identifier_name = f"{username} () - {role_name or 'No Role'}"
+        return {
+            "id": pk,
+            "full_name": full_name,
+            "national_id": national_id,
+            "phone_number": phone_number,
+            "photo": self.file_url(self.photo_storage, photo),
+            "photo_thumbnail": self.file_url(
+                self.photo_storage,
+                photo and ((derivatives or {}).get("thumb") or photo),
+            ),
+            "status": suspect_status,
+            "status_display": self.status_labels.get(suspect_status, str(suspect_status)),
+            "case": case_id,
+            "case_title": case_title if case_id else None,
+            "wanted_since": render_datetime(wanted_since),
+            "days_wanted": days_wanted,
+            "is_most_wanted": days_wanted > 30,
+            "identified_by": identifier_id,
+            "identified_by_name": identifier_name,
+            "sergeant_approval_status": approval_status,
+            "created_at": render_datetime(created_at),
+            "updated_at": render_datetime(updated_at),
+        }
+
+
 class InterrogationInlineSerializer(serializers.ModelSerializer):
     """
     Compact inline serializer for interrogations nested inside
@@ -313,6 +391,7 @@ class SuspectDetailSerializer(serializers.ModelSerializer):
     is_most_wanted = serializers.BooleanField(read_only=True)
     most_wanted_score = serializers.IntegerField(read_only=True)
     reward_amount = serializers.IntegerField(read_only=True)
+    photo_preview = ImageVariantField(source="photo", variant="preview")
 
     # Nested relations
     interrogations = InterrogationInlineSerializer(many=True, read_only=True)
@@ -328,6 +407,7 @@ class SuspectDetailSerializer(serializers.ModelSerializer):
             "national_id",
             "phone_number",
             "photo",
+            "photo_preview",
             "address",
             "description",
             "status",
@@ -1083,6 +1163,7 @@ class BountyTipListSerializer(serializers.ModelSerializer):
             "status",
             "status_display",
             "is_claimed",
+            "lease_expires_at",
             "created_at",
         ]
         read_only_fields = fields
@@ -1228,6 +1309,16 @@ class BountyTipReviewSerializer(serializers.Serializer):
         return attrs
 
 
+class BountyTipClaimSerializer(serializers.Serializer):
+    """Request body for ``POST /api/bounty-tips/review-queue/claim/``."""
+
+    limit = serializers.IntegerField(
+        min_value=1,
+        default=10,
+        help_text="Number of pending tips to claim (capped by REVIEW_CLAIM_MAX_BATCH).",
+    )
+
+
 class BountyTipVerifySerializer(serializers.Serializer):
     """
     Request body for ``POST /api/bounty-tips/{id}/verify/``.
@@ -1424,6 +1515,10 @@ class MostWantedSerializer(serializers.ModelSerializer):
     - ``computed_score`` — ranking score (max_days × max_crime_degree).
     - ``computed_reward`` — bounty in Rials.
 
+    ``photo_thumbnail`` / ``photo_preview`` point at the rendered image
+    variants (``core.domain.imaging``) and fall back to ``photo`` until
+    they exist, so the listing grid does not ship camera originals.
+
     Used in ``GET /api/suspects/most-wanted/``.
     """
 
@@ -1436,6 +1531,8 @@ class MostWantedSerializer(serializers.ModelSerializer):
     reward_amount = serializers.SerializerMethodField()
     calculated_reward = serializers.SerializerMethodField()
     case_title = serializers.SerializerMethodField()
+    photo_thumbnail = ImageVariantField(source="photo", variant="thumb")
+    photo_preview = ImageVariantField(source="photo", variant="preview")
 
     class Meta:
         model = Suspect
@@ -1444,6 +1541,8 @@ class MostWantedSerializer(serializers.ModelSerializer):
             "full_name",
             "national_id",
             "photo",
+            "photo_thumbnail",
+            "photo_preview",
             "description",
             "address",
             "status",
@@ -1460,15 +1559,21 @@ class MostWantedSerializer(serializers.ModelSerializer):
 
     def get_days_wanted(self, obj: Suspect) -> int:
         """Return annotated days_wanted or fall back to model property."""
-        return getattr(obj, "computed_days_wanted", obj.days_wanted)
+        if hasattr(obj, "computed_days_wanted"):
+            return obj.computed_days_wanted
+        return obj.days_wanted
 
     def get_most_wanted_score(self, obj: Suspect) -> int:
         """Return annotated score or fall back to model property."""
-        return getattr(obj, "computed_score", obj.most_wanted_score)
+        if hasattr(obj, "computed_score"):
+            return obj.computed_score
+        return obj.most_wanted_score
 
     def get_reward_amount(self, obj: Suspect) -> int:
         """Return annotated reward or fall back to model property."""
-        return getattr(obj, "computed_reward", obj.reward_amount)
+        if hasattr(obj, "computed_reward"):
+            return obj.computed_reward
+        return obj.reward_amount
 
     def get_calculated_reward(self, obj: Suspect) -> int:
         """Alias for reward_amount — ensures the field name matches the spec."""
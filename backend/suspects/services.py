@@ -38,30 +38,48 @@ import secrets
 from datetime import timedelta
 from typing import Any
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.db import transaction
 from django.db.models import (
+    Count,
     ExpressionWrapper,
     F,
     IntegerField,
     Max,
+    Min,
     OuterRef,
     Q,
     QuerySet,
     Subquery,
+    Sum,
     Value,
 )
 from django.db.models.functions import Coalesce, ExtractDay, Now
 from django.utils import timezone
 
 from cases.models import CrimeLevel
+from cases.services import CaseCounterService
+from core.cache import (
+    CASES_TAG,
+    SUSPECTS_TAG,
+    get_or_build_coalesced,
+    invalidate_tags,
+    suspect_national_tag,
+)
 from core.constants import REWARD_MULTIPLIER
 from core.domain.access import apply_permission_scope, require_permission
+from core.domain.conditional import content_etag
 from core.domain.exceptions import DomainError, InvalidTransition, NotFound, PermissionDenied
+from core.domain.imaging import delete_derivatives
 from core.domain.notifications import NotificationService
+from core.domain.projection import QueryShape, apply_query_shape
+from core.domain.queues import LEASE_FIELDS, claim_cleared, claim_next, ensure_claim, release_claim
 from core.permissions_constants import CasesPerms, SuspectsPerms
 from core.services import RewardCalculatorService
 
 from .models import (
+    SUSPECT_AT_TRIAL_STATUSES,
     Bail,
     BountyTip,
     BountyTipStatus,
@@ -77,6 +95,15 @@ from .models import (
 logger = logging.getLogger(__name__)
 
 
+def _track_status_change(suspect: Suspect, old_status: str) -> None:
+    """Keep ``Case.suspects_at_trial_count`` in step with a status change."""
+    delta = (
+        (suspect.status in SUSPECT_AT_TRIAL_STATUSES)
+        - (old_status in SUSPECT_AT_TRIAL_STATUSES)
+    )
+    CaseCounterService.adjust(suspect.case_id, suspects_at_trial_count=delta)
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  Permission-based scope rules for suspects-domain entities
 # ═══════════════════════════════════════════════════════════════════
@@ -101,6 +128,23 @@ SUSPECT_SCOPE_RULES: list[tuple[str, Any]] = [
      ).distinct()),
 ]
 
+#: ``(header, lookup)`` columns of the streaming suspect export
+#: (``core.domain.exports``).
+SUSPECT_EXPORT_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("id", "id"),
+    ("case", "case_id"),
+    ("full_name", "full_name"),
+    ("national_id", "national_id"),
+    ("phone_number", "phone_number"),
+    ("status", "status"),
+    ("wanted_since", "wanted_since"),
+    ("arrested_at", "arrested_at"),
+    ("identified_by", "identified_by_id"),
+    ("sergeant_approval_status", "sergeant_approval_status"),
+    ("created_at", "created_at"),
+    ("updated_at", "updated_at"),
+)
+
 #: Scope rules for Interrogation querysets.
 INTERROGATION_SCOPE_RULES: list[tuple[str, Any]] = [
     (f"suspects.{SuspectsPerms.CAN_SCOPE_ALL_SUSPECTS}",
@@ -186,6 +230,7 @@ class SuspectProfileService:
     def get_filtered_queryset(
         requesting_user: Any,
         filters: dict[str, Any],
+        shape: QueryShape | None = None,
     ) -> QuerySet[Suspect]:
         """
         Build a role-scoped, filtered queryset of ``Suspect`` objects.
@@ -206,11 +251,15 @@ class SuspectProfileService:
             - ``created_after``   : date
             - ``created_before``  : date
             - ``approval_status`` : str   (pending/approved/rejected)
+        shape : QueryShape, optional
+            Projection declared by the rendering serializer
+            (``SuspectListSerializer.Meta.query_shape``).  ``None`` loads
+            plain ``Suspect`` rows without joins or prefetches.
 
         Returns
         -------
         QuerySet[Suspect]
-            Filtered, ``select_related`` queryset ready for serialisation.
+            Filtered queryset shaped for the caller's serializer.
 
         Role Scoping Rules
         ------------------
@@ -239,15 +288,10 @@ class SuspectProfileService:
            f. ``created_after``   → ``created_at__date__gte``.
            g. ``created_before``  → ``created_at__date__lte``.
            h. ``approval_status`` → ``sergeant_approval_status`` exact match.
-        4. ``select_related("case", "identified_by", "approved_by_sergeant", "user")``.
-        5. ``prefetch_related("interrogations", "trials", "bails")``.
-        6. Return queryset ordered by ``-wanted_since``.
-        """
-        qs = Suspect.objects.select_related(
-            "case", "identified_by", "approved_by_sergeant", "user",
-        ).prefetch_related(
-            "interrogations", "trials", "bails",
-        )
+        4. Apply ``shape`` (``only`` / ``select_related`` / ``prefetch_related``).
+        5. Return queryset ordered by ``-wanted_since``.
+        """
+        qs = Suspect.objects.all()
 
         # ── Permission-based scoping ────────────────────────────────
         qs = apply_permission_scope(
@@ -282,7 +326,7 @@ class SuspectProfileService:
         if "approval_status" in filters:
             qs = qs.filter(sergeant_approval_status=filters["approval_status"])
 
-        return qs.order_by("-wanted_since")
+        return apply_query_shape(qs, shape).order_by("-wanted_since")
 
     @staticmethod
     def get_suspect_detail(pk: int) -> Suspect:
@@ -331,6 +375,138 @@ class SuspectProfileService:
         except Suspect.DoesNotExist:
             raise NotFound(f"Suspect with id {pk} not found.")
 
+    @staticmethod
+    def get_suspect_detail_etag(pk: int) -> str:
+        """
+        Return the ETag of the suspect detail representation.
+
+        Computed in a single query, before ``get_suspect_detail`` runs
+        its prefetches.  The validator covers:
+
+        - the suspect row (``updated_at``) and the days it has been wanted;
+        - ``case.revision``, which interrogation and trial writes bump
+          (``cases.signals``);
+        - bail rows (count and latest ``updated_at``) and the tip count;
+        - the ``most_wanted_score`` inputs of every suspect sharing the
+          national ID: their number, their cases' revisions and the
+          longest wanted period among open cases.
+
+        Parameters
+        ----------
+        pk : int
+            Primary key of the suspect.
+
+        Returns
+        -------
+        str
+            Quoted validator for ``If-None-Match``.
+
+        Raises
+        ------
+        core.domain.exceptions.NotFound
+            If no suspect with the given PK exists.
+        """
+        from cases.models import CaseStatus
+
+        bails = Bail.objects.filter(suspect=OuterRef("pk")).order_by().values("suspect")
+        tips = BountyTip.objects.filter(suspect=OuterRef("pk")).order_by().values("suspect")
+        group = (
+            Suspect.objects.filter(national_id=OuterRef("national_id"))
+            .exclude(national_id="")
+            .order_by()
+            .values("national_id")
+        )
+        open_group = group.exclude(case__status__in=[CaseStatus.CLOSED, CaseStatus.VOIDED])
+        try:
+            row = (
+                Suspect.objects.filter(pk=pk)
+                .annotate(
+                    bail_count=Subquery(bails.annotate(n=Count("pk")).values("n")),
+                    bail_updated=Subquery(bails.annotate(m=Max("updated_at")).values("m")),
+                    tip_count=Subquery(tips.annotate(n=Count("pk")).values("n")),
+                    group_count=Subquery(group.annotate(n=Count("pk")).values("n")),
+                    group_revisions=Subquery(
+                        group.annotate(r=Sum("case__revision")).values("r"),
+                    ),
+                    group_wanted_since=Subquery(
+                        open_group.annotate(w=Min("wanted_since")).values("w"),
+                    ),
+                )
+                .values_list(
+                    "updated_at", "wanted_since", "case__revision",
+                    "bail_count", "bail_updated", "tip_count",
+                    "group_count", "group_revisions", "group_wanted_since",
+                )
+                .get()
+            )
+        except Suspect.DoesNotExist:
+            raise NotFound(f"Suspect with id {pk} not found.")
+        except (ValueError, TypeError):
+            raise NotFound(f"Suspect '{pk}' not found: invalid identifier.")
+
+        (
+            updated_at, wanted_since, case_revision,
+            bail_count, bail_updated, tip_count,
+            group_count, group_revisions, group_wanted_since,
+        ) = row
+        now = timezone.now()
+        group_days = (now - group_wanted_since).days if group_wanted_since else None
+        return content_etag(
+            "suspect", pk, updated_at, (now - wanted_since).days, case_revision,
+            bail_count, bail_updated, tip_count, group_count, group_revisions, group_days,
+        )
+
+    @staticmethod
+    def get_photo_for_download(requesting_user: Any, pk: int) -> Suspect:
+        """
+        Resolve a suspect whose photo the user is allowed to download.
+
+        Parameters
+        ----------
+        requesting_user : User
+            From ``request.user``.
+        pk : int
+            Primary key of the suspect.
+
+        Returns
+        -------
+        Suspect
+            Instance with ``photo``, ``photo_derivatives`` and
+            ``updated_at`` loaded.
+
+        Raises
+        ------
+        NotFound
+            If the suspect is not visible or has no photo on record.
+
+        Implementation Contract
+        -----------------------
+        A photo is downloadable when the suspect is inside the user's
+        ``SUSPECT_SCOPE_RULES`` scope, or when the suspect is on the
+        public Most Wanted list (wanted for over 30 days), which every
+        authenticated user may view (project-doc §4.7).
+        """
+        cutoff = timezone.now() - timedelta(days=30)
+        scoped_ids = apply_permission_scope(
+            Suspect.objects.all(),
+            requesting_user,
+            scope_rules=SUSPECT_SCOPE_RULES,
+            default="none",
+        ).values("id")
+        suspect = (
+            Suspect.objects
+            .filter(pk=pk)
+            .filter(
+                Q(pk__in=scoped_ids)
+                | Q(status=SuspectStatus.WANTED, wanted_since__lt=cutoff)
+            )
+            .only("id", "photo", "photo_derivatives", "updated_at")
+            .first()
+        )
+        if suspect is None or not suspect.photo:
+            raise NotFound(f"No photo available for suspect {pk}.")
+        return suspect
+
     @staticmethod
     @transaction.atomic
     def create_suspect(
@@ -390,6 +566,7 @@ class SuspectProfileService:
         validated_data["sergeant_approval_status"] = "pending"
 
         suspect = Suspect.objects.create(**validated_data)
+        CaseCounterService.adjust(suspect.case_id, suspect_count=1)
 
         # Dispatch notification to the Sergeant assigned to the case
         case = suspect.case
@@ -461,9 +638,24 @@ class SuspectProfileService:
                 "You do not have permission to update suspects."
             )
 
+        previous_photo = suspect.photo.name if suspect.photo else ""
+        previous_national_id = suspect.national_id
+
         for key, value in validated_data.items():
             setattr(suspect, key, value)
 
+        update_fields = list(validated_data.keys()) + ["updated_at"]
+        if "photo" in validated_data:
+            # Rendered variants belong to the old image; the derivative
+            # worker picks the suspect up again once the map is empty.
+            suspect.photo_derivatives = {}
+            update_fields.append("photo_derivatives")
+            if previous_photo:
+                storage = suspect.photo.storage
+                transaction.on_commit(
+                    lambda: delete_derivatives(storage, previous_photo)
+                )
+
         # If the suspect was previously rejected by the sergeant,
         # reset approval status to "pending" so the sergeant can
         # re-review after the detective's edits.
@@ -471,13 +663,15 @@ class SuspectProfileService:
             suspect.sergeant_approval_status = "pending"
             suspect.sergeant_rejection_message = ""
 
-        update_fields = list(validated_data.keys()) + ["updated_at"]
         if "sergeant_approval_status" not in update_fields:
             update_fields.extend([
                 "sergeant_approval_status",
                 "sergeant_rejection_message",
             ])
         suspect.save(update_fields=update_fields)
+        if previous_national_id and previous_national_id != suspect.national_id:
+            # The save signal only covers the new national ID.
+            invalidate_tags(suspect_national_tag(previous_national_id))
         return suspect
 
     @staticmethod
@@ -506,11 +700,33 @@ class SuspectProfileService:
         - ``computed_score`` = computed_days_wanted * crime_degree
         - ``computed_reward`` = computed_score * REWARD_MULTIPLIER
 
+        Caching
+        -------
+        The list is cached for ``settings.MOST_WANTED_CACHE_SECONDS`` and
+        invalidated by any case or suspect write.  Only one worker
+        rebuilds it at a time; the others keep serving the previous list
+        meanwhile (``core.cache.get_or_build_coalesced``).
+
         Returns
         -------
         list[Suspect]
             Annotated suspect rows ordered by ``computed_score`` descending.
         """
+        return get_or_build_coalesced(
+            "most-wanted",
+            SuspectProfileService._build_most_wanted_list,
+            tags=[CASES_TAG, SUSPECTS_TAG],
+            timeout=settings.MOST_WANTED_CACHE_SECONDS,
+        )
+
+    @staticmethod
+    async def aget_most_wanted_list() -> list[Suspect]:
+        """Async ``get_most_wanted_list``; see there for the rules and caching."""
+        return await sync_to_async(SuspectProfileService.get_most_wanted_list)()
+
+    @staticmethod
+    def _build_most_wanted_list() -> list[Suspect]:
+        """Run the ranking queries behind ``get_most_wanted_list``."""
         from cases.models import CaseStatus
 
         cutoff = timezone.now() - timedelta(
@@ -1120,6 +1336,7 @@ class ArrestAndWarrantService:
         suspect.status = SuspectStatus.ARRESTED
         suspect.arrested_at = timezone.now()
         suspect.save(update_fields=["status", "arrested_at", "updated_at"])
+        _track_status_change(suspect, old_status)
 
         # ── Audit log ──────────────────────────────────────────────
         notes_parts = [f"Arrest location: {arrest_location}"]
@@ -1277,6 +1494,7 @@ class ArrestAndWarrantService:
         old_status = suspect.status
         suspect.status = new_status
         suspect.save(update_fields=["status", "updated_at"])
+        _track_status_change(suspect, old_status)
 
         # ── Audit log ──────────────────────────────────────────────
         SuspectStatusLog.objects.create(
@@ -1489,6 +1707,7 @@ class InterrogationService:
             old_status = suspect.status
             suspect.status = SuspectStatus.UNDER_INTERROGATION
             suspect.save(update_fields=["status", "updated_at"])
+            _track_status_change(suspect, old_status)
             SuspectStatusLog.objects.create(
                 suspect=suspect,
                 from_status=old_status,
@@ -1582,18 +1801,12 @@ class VerdictService:
         if case.status != CaseStatus.INVESTIGATION:
             return
 
-        all_suspects = Suspect.objects.filter(case=case)
-        if not all_suspects.exists():
-            return
-
-        # Check that every suspect is UNDER_TRIAL (or beyond: CONVICTED, ACQUITTED, RELEASED)
-        terminal_or_trial = {
-            SuspectStatus.UNDER_TRIAL,
-            SuspectStatus.CONVICTED,
-            SuspectStatus.ACQUITTED,
-            SuspectStatus.RELEASED,
-        }
-        if all_suspects.exclude(status__in=terminal_or_trial).exists():
+        # Every suspect must be UNDER_TRIAL or beyond (CONVICTED,
+        # ACQUITTED, RELEASED).  The counters were bumped by the status
+        # change in this transaction, so re-read them rather than trust
+        # the caller's instance.
+        case.refresh_from_db(fields=["suspect_count", "suspects_at_trial_count"])
+        if not case.suspect_count or case.suspects_at_trial_count < case.suspect_count:
             return
 
         # All suspects are at trial or beyond — move case to JUDICIARY
@@ -1685,6 +1898,7 @@ class VerdictService:
             # CRITICAL: Captain's verdict requires Chief approval
             suspect.status = SuspectStatus.PENDING_CHIEF_APPROVAL
             suspect.save(update_fields=["status", "updated_at"])
+            _track_status_change(suspect, old_status)
 
             SuspectStatusLog.objects.create(
                 suspect=suspect,
@@ -1731,6 +1945,7 @@ class VerdictService:
             # Non-CRITICAL: apply verdict directly → UNDER_TRIAL
             suspect.status = SuspectStatus.UNDER_TRIAL
             suspect.save(update_fields=["status", "updated_at"])
+            _track_status_change(suspect, old_status)
 
             SuspectStatusLog.objects.create(
                 suspect=suspect,
@@ -1837,6 +2052,7 @@ class VerdictService:
         if decision == "approve":
             suspect.status = SuspectStatus.UNDER_TRIAL
             suspect.save(update_fields=["status", "updated_at"])
+            _track_status_change(suspect, old_status)
 
             SuspectStatusLog.objects.create(
                 suspect=suspect,
@@ -1890,6 +2106,7 @@ class VerdictService:
 
             suspect.status = SuspectStatus.UNDER_INTERROGATION
             suspect.save(update_fields=["status", "updated_at"])
+            _track_status_change(suspect, old_status)
 
             SuspectStatusLog.objects.create(
                 suspect=suspect,
@@ -2109,6 +2326,7 @@ class TrialService:
         else:
             suspect.status = SuspectStatus.ACQUITTED
         suspect.save(update_fields=["status", "updated_at"])
+        _track_status_change(suspect, old_suspect_status)
 
         SuspectStatusLog.objects.create(
             suspect=suspect,
@@ -2295,6 +2513,7 @@ class BountyTipService:
             status=BountyTipStatus.PENDING,
             **validated_data,
         )
+        CaseCounterService.adjust(tip.case_id, open_tip_count=1)
 
         logger.info(
             "BountyTip #%d submitted by user=%s", tip.pk, requesting_user,
@@ -2325,6 +2544,9 @@ class BountyTipService:
         Validation: Only users with CAN_REVIEW_BOUNTY_TIP permission
         (Officer role or higher admins) can review.
 
+        Tips claimed by another officer through the review queue are
+        refused with ``Conflict`` while the lease is active.
+
         If decision is 'reject', update status to REJECTED and notify
         the citizen.
         If decision is 'accept', update status to OFFICER_REVIEWED and
@@ -2349,12 +2571,15 @@ class BountyTipService:
                 target="officer_reviewed / rejected",
                 reason="Only tips in PENDING status can be reviewed.",
             )
+        ensure_claim(tip, officer_user)
 
         tip.reviewed_by = officer_user
+        claim_cleared(tip)
 
         if decision == "reject":
             tip.status = BountyTipStatus.REJECTED
-            tip.save(update_fields=["status", "reviewed_by", "updated_at"])
+            tip.save(update_fields=["status", "reviewed_by", *LEASE_FIELDS, "updated_at"])
+            CaseCounterService.adjust(tip.case_id, open_tip_count=-1)
 
             # Notify the citizen that their tip was rejected
             NotificationService.create(
@@ -2370,7 +2595,7 @@ class BountyTipService:
         else:
             # decision == "accept" → forward to detective
             tip.status = BountyTipStatus.OFFICER_REVIEWED
-            tip.save(update_fields=["status", "reviewed_by", "updated_at"])
+            tip.save(update_fields=["status", "reviewed_by", *LEASE_FIELDS, "updated_at"])
 
             # Notify the assigned detective (from case or suspect's case)
             detective = None
@@ -2397,6 +2622,35 @@ class BountyTipService:
 
         return tip
 
+    @staticmethod
+    def claim_review_queue(officer_user: Any, limit: int) -> QuerySet[BountyTip]:
+        """
+        Lease the next *limit* PENDING tips to *officer_user*, oldest first.
+
+        Other officers' claims skip these tips until they are reviewed,
+        released, or the lease expires (``core.domain.queues``).
+        """
+        perm = f"suspects.{SuspectsPerms.CAN_REVIEW_BOUNTY_TIP}"
+        if not officer_user.has_perm(perm):
+            raise PermissionDenied(
+                "You do not have permission to review bounty tips.",
+            )
+        pks = claim_next(
+            BountyTip.objects.filter(status=BountyTipStatus.PENDING),
+            officer_user,
+            limit=limit,
+        )
+        return (
+            BountyTip.objects.filter(pk__in=pks)
+            .select_related("informant")
+            .order_by("created_at", "pk")
+        )
+
+    @staticmethod
+    def release_review_claim(tip_id: int, officer_user: Any) -> None:
+        """Hand a claimed tip back to the review queue."""
+        release_claim(BountyTip.objects.all(), tip_id, officer_user)
+
     @staticmethod
     @transaction.atomic
     def detective_verify_tip(
@@ -2445,6 +2699,8 @@ class BountyTipService:
                 )
 
         tip.verified_by = detective_user
+        # Either decision closes the tip.
+        CaseCounterService.adjust(tip.case_id, open_tip_count=-1)
 
         if decision == "reject":
             tip.status = BountyTipStatus.REJECTED
@@ -2815,6 +3071,7 @@ class BailService:
         if suspect.status == SuspectStatus.CONVICTED:
             suspect.status = SuspectStatus.RELEASED
             suspect.save(update_fields=["status"])
+            _track_status_change(suspect, SuspectStatus.CONVICTED)
             logger.info(
                 "Suspect #%d released after bail #%d payment by %s",
                 suspect.pk, bail.pk, requesting_user,
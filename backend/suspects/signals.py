@@ -0,0 +1,31 @@
+"""
+Invalidates ``core.cache`` entries aggregated per person
+(``suspect-national:{national_id}``) or over all suspects (``suspects``)
+whenever a suspect row is saved or deleted.  ``SuspectProfileService.update_suspect`` covers the
+previous national ID when it is edited.
+"""
+
+from django.db.models.signals import post_delete, post_save
+
+from core.cache import SUSPECTS_TAG, invalidate_tags, suspect_national_tag
+
+
+def invalidate_suspect(sender, instance, raw=False, **kwargs) -> None:
+    """Drop cached data aggregated over suspects or the suspect's national ID."""
+    if raw:
+        return
+    if instance.national_id:
+        invalidate_tags(SUSPECTS_TAG, suspect_national_tag(instance.national_id))
+    else:
+        invalidate_tags(SUSPECTS_TAG)
+
+
+def connect_cache_signals() -> None:
+    from .models import Suspect
+
+    post_save.connect(
+        invalidate_suspect, sender=Suspect, dispatch_uid="suspect-cache:save",
+    )
+    post_delete.connect(
+        invalidate_suspect, sender=Suspect, dispatch_uid="suspect-cache:delete",
+    )
@@ -11,6 +11,8 @@ Route Hierarchy
   POST   /api/suspects/                                → create (identify) suspect
   GET    /api/suspects/{id}/                           → retrieve suspect detail
   PATCH  /api/suspects/{id}/                           → update suspect profile
+  GET    /api/suspects/{id}/photo/                     → stream photo (Range / ETag, ?variant=)
+  GET    /api/suspects/export/                         → stream filtered suspects (CSV / NDJSON)
 
   ── Suspect Workflow @actions ───────────────────────────────────
   GET    /api/suspects/most-wanted/                    → Most Wanted listing
@@ -41,6 +43,8 @@ Route Hierarchy
   POST   /api/bounty-tips/                                 → submit bounty tip
   GET    /api/bounty-tips/{id}/                            → retrieve tip detail
   POST   /api/bounty-tips/{id}/review/                     → officer review
+  POST   /api/bounty-tips/review-queue/claim/              → lease pending tips
+  POST   /api/bounty-tips/{id}/release-claim/              → hand a claimed tip back
   POST   /api/bounty-tips/{id}/verify/                     → detective verify
   POST   /api/bounty-tips/lookup-reward/                   → reward lookup
 """
@@ -49,7 +53,10 @@ from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 from rest_framework_nested.routers import NestedDefaultRouter
 
+from core.domain.asgi import async_read_paths
+
 from .views import (
+    AsyncMostWantedView,
     BailViewSet,
     BountyTipViewSet,
     InterrogationViewSet,
@@ -93,6 +100,10 @@ suspects_router.register(
 )
 
 urlpatterns = [
+    # Ahead of the router's sync action when ASYNC_READ_VIEWS is on.
+    *async_read_paths(
+        path("suspects/most-wanted/", AsyncMostWantedView.as_view(), name="suspect-most-wanted"),
+    ),
     path("", include(router.urls)),
     path("", include(suspects_router.urls)),
 ]
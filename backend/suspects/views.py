@@ -24,6 +24,7 @@ ViewSets
 
 from __future__ import annotations
 
+from django.http import HttpResponseBase
 from drf_spectacular.utils import (
     OpenApiParameter,
     OpenApiResponse,
@@ -35,7 +36,13 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from core.domain.exceptions import DomainError, InvalidTransition, NotFound, PermissionDenied
+from core.domain.asgi import AsyncAPIView
+from core.domain.conditional import conditional_response
+from core.domain.exceptions import Conflict, DomainError, InvalidTransition, NotFound, PermissionDenied
+from core.domain.exports import stream_export
+from core.domain.imaging import IMAGE_VARIANTS, variant_file
+from core.domain.media import serve_field_file
+from core.domain.replicas import read_replica
 
 from .models import (
     Bail,
@@ -50,6 +57,7 @@ from .serializers import (
     BailDetailSerializer,
     BailListSerializer,
     BountyRewardLookupSerializer,
+    BountyTipClaimSerializer,
     BountyTipCreateSerializer,
     BountyTipDetailSerializer,
     BountyTipListSerializer,
@@ -66,6 +74,7 @@ from .serializers import (
     SuspectDetailSerializer,
     SuspectFilterSerializer,
     SuspectListSerializer,
+    SuspectListValuesSerializer,
     SuspectStatusTransitionSerializer,
     SuspectUpdateSerializer,
     TrialCreateSerializer,
@@ -73,6 +82,7 @@ from .serializers import (
     TrialListSerializer,
 )
 from .services import (
+    SUSPECT_EXPORT_COLUMNS,
     ArrestAndWarrantService,
     BailService,
     BountyTipService,
@@ -171,7 +181,8 @@ class SuspectViewSet(viewsets.ViewSet):
         3. Get queryset via ``SuspectProfileService.get_filtered_queryset(
                request.user, filter_serializer.validated_data
            )``.
-        4. Serialize with ``SuspectListSerializer(queryset, many=True)``.
+        4. Serialize with ``SuspectListValuesSerializer(queryset)`` (same
+           output as ``SuspectListSerializer``, from ``values_list`` rows).
         5. Return HTTP 200 with serialised data.
 
         Example Response
@@ -206,8 +217,49 @@ class SuspectViewSet(viewsets.ViewSet):
         queryset = SuspectProfileService.get_filtered_queryset(
             request.user, filter_serializer.validated_data,
         )
-        serializer = SuspectListSerializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        with read_replica():
+            data = SuspectListValuesSerializer(queryset).data
+        return Response(data, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        summary="Export suspects (CSV / NDJSON)",
+        description=(
+            "Stream every suspect visible to the authenticated user as a CSV "
+            "or NDJSON download.  Accepts the same filters as the suspect list."
+        ),
+        parameters=[
+            SuspectFilterSerializer,
+            OpenApiParameter(
+                name="export_format", type=str, location=OpenApiParameter.QUERY,
+                enum=["csv", "ndjson"], default="csv",
+                description="csv (with a header row) or ndjson (one JSON object per line).",
+            ),
+        ],
+        responses={
+            200: OpenApiResponse(description="Streamed CSV or NDJSON attachment."),
+            400: OpenApiResponse(description="Invalid filter or export format."),
+        },
+        tags=["Suspects"],
+    )
+    @action(detail=False, methods=["get"], url_path="export", url_name="export")
+    def export(self, request: Request) -> HttpResponseBase:
+        """
+        GET /api/suspects/export/?export_format=csv|ndjson
+
+        Stream the filtered, role-scoped suspect list as an attachment.
+        """
+        filter_serializer = SuspectFilterSerializer(data=request.query_params)
+        if not filter_serializer.is_valid():
+            return Response(
+                filter_serializer.errors, status=status.HTTP_400_BAD_REQUEST,
+            )
+        queryset = SuspectProfileService.get_filtered_queryset(
+            request.user, filter_serializer.validated_data,
+        )
+        return stream_export(
+            queryset, SUSPECT_EXPORT_COLUMNS,
+            request.query_params.get("export_format", "csv"), "suspects",
+        )
 
     @extend_schema(
         summary="Identify a new suspect",
@@ -274,15 +326,17 @@ class SuspectViewSet(viewsets.ViewSet):
         summary="Retrieve suspect details",
         description=(
             "Return full suspect detail with nested interrogations, trials, bails, "
-            "and computed ranking properties. Requires authentication."
+            "and computed ranking properties. Requires authentication. "
+            "Send the returned ETag in If-None-Match to get 304 when unchanged."
         ),
         responses={
             200: OpenApiResponse(response=SuspectDetailSerializer, description="Suspect detail."),
+            304: OpenApiResponse(description="Not modified since the ETag in If-None-Match."),
             404: OpenApiResponse(description="Suspect not found."),
         },
         tags=["Suspects"],
     )
-    def retrieve(self, request: Request, pk: int = None) -> Response:
+    def retrieve(self, request: Request, pk: int = None) -> HttpResponseBase:
         """
         GET /api/suspects/{id}/
 
@@ -291,9 +345,11 @@ class SuspectViewSet(viewsets.ViewSet):
 
         Steps
         -----
-        1. ``suspect = self._get_suspect(pk)``.
-        2. Serialize with ``SuspectDetailSerializer(suspect)``.
-        3. Return HTTP 200.
+        1. ``SuspectProfileService.get_suspect_detail_etag(pk)``; answer
+           304 if it matches ``If-None-Match``.
+        2. ``suspect = self._get_suspect(pk)``.
+        3. Serialize with ``SuspectDetailSerializer(suspect)``.
+        4. Return HTTP 200 with the ``ETag``.
 
         Example Response
         ----------------
@@ -318,9 +374,13 @@ class SuspectViewSet(viewsets.ViewSet):
                 ...
             }
         """
-        suspect = self._get_suspect(pk)
-        serializer = SuspectDetailSerializer(suspect)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        etag = SuspectProfileService.get_suspect_detail_etag(pk)
+
+        def build() -> Response:
+            serializer = SuspectDetailSerializer(self._get_suspect(pk))
+            return Response(serializer.data, status=status.HTTP_200_OK)
+
+        return conditional_response(request, etag, build)
 
     @extend_schema(
         summary="Update suspect profile",
@@ -374,6 +434,41 @@ class SuspectViewSet(viewsets.ViewSet):
         output = SuspectDetailSerializer(updated)
         return Response(output.data, status=status.HTTP_200_OK)
 
+    @action(detail=True, methods=["get"], url_path="photo")
+    @extend_schema(
+        summary="Download suspect photo",
+        description=(
+            "Stream the suspect's photo. Allowed when the suspect is in the "
+            "user's scope or on the public Most Wanted list. Supports "
+            "`Range` and `If-None-Match`. Use `?variant=thumb` or "
+            "`?variant=preview` for a rendered, smaller image."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="variant", type=str, required=False, enum=tuple(IMAGE_VARIANTS),
+                description="Rendered image variant; the original is served until it exists.",
+            ),
+        ],
+        responses={
+            (200, "image/*"): OpenApiResponse(description="Photo content."),
+            304: OpenApiResponse(description="Not modified."),
+            404: OpenApiResponse(description="Suspect not visible or has no photo."),
+        },
+        tags=["Suspects"],
+    )
+    def photo(self, request: Request, pk: int = None) -> HttpResponseBase:
+        """
+        GET /api/suspects/{id}/photo/
+
+        Permission-checked photo delivery (see ``core.domain.media``).
+        """
+        suspect = SuspectProfileService.get_photo_for_download(request.user, pk)
+        photo = suspect.photo
+        variant = request.query_params.get("variant")
+        if variant:
+            photo = variant_file(photo, suspect.photo_derivatives, variant)
+        return serve_field_file(request, photo, version=suspect.updated_at)
+
     # ── Workflow @actions ─────────────────────────────────────────────
 
     @action(detail=False, methods=["get"], url_path="most-wanted")
@@ -802,6 +897,20 @@ class SuspectViewSet(viewsets.ViewSet):
         return Response(output.data, status=status.HTTP_200_OK)
 
 
+class AsyncMostWantedView(AsyncAPIView):
+    """
+    Async variant of ``SuspectViewSet.most_wanted`` (see
+    ``core.domain.asgi``).
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    async def get(self, request: Request) -> Response:
+        suspects = await SuspectProfileService.aget_most_wanted_list()
+        serializer = MostWantedSerializer(suspects, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  Interrogation ViewSet (Nested under Suspects)
 # ═══════════════════════════════════════════════════════════════════
@@ -1277,6 +1386,8 @@ class BountyTipViewSet(viewsets.ViewSet):
         POST   /api/bounty-tips/                    → create (citizen)
         GET    /api/bounty-tips/{id}/               → retrieve
         POST   /api/bounty-tips/{id}/review/        → officer review
+        POST   /api/bounty-tips/review-queue/claim/ → lease pending tips
+        POST   /api/bounty-tips/{id}/release-claim/ → hand a claimed tip back
         POST   /api/bounty-tips/{id}/verify/        → detective verify
         POST   /api/bounty-tips/lookup-reward/      → reward lookup
     """
@@ -1375,6 +1486,7 @@ class BountyTipViewSet(viewsets.ViewSet):
             200: OpenApiResponse(response=BountyTipDetailSerializer, description="Review recorded."),
             400: OpenApiResponse(description="Validation error."),
             403: OpenApiResponse(description="Requires CAN_REVIEW_BOUNTY_TIP."),
+            409: OpenApiResponse(description="Tip already reviewed or claimed by another officer."),
         },
         tags=["Bounty Tips"],
     )
@@ -1404,7 +1516,7 @@ class BountyTipViewSet(viewsets.ViewSet):
             return Response(
                 {"detail": str(exc)}, status=status.HTTP_404_NOT_FOUND,
             )
-        except InvalidTransition as exc:
+        except Conflict as exc:
             return Response(
                 {"detail": str(exc)}, status=status.HTTP_409_CONFLICT,
             )
@@ -1415,6 +1527,72 @@ class BountyTipViewSet(viewsets.ViewSet):
         output = BountyTipDetailSerializer(tip)
         return Response(output.data, status=status.HTTP_200_OK)
 
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="review-queue/claim",
+        url_name="review-queue-claim",
+    )
+    @extend_schema(
+        summary="Claim pending tips for review",
+        description=(
+            "Lease the next N pending tips to the calling officer. Other "
+            "officers' claims skip them until reviewed, released, or the "
+            "lease expires."
+        ),
+        request=BountyTipClaimSerializer,
+        responses={
+            200: OpenApiResponse(response=BountyTipListSerializer(many=True), description="Claimed tips."),
+            403: OpenApiResponse(description="Requires CAN_REVIEW_BOUNTY_TIP."),
+        },
+        tags=["Bounty Tips"],
+    )
+    def claim_review(self, request: Request) -> Response:
+        """
+        POST /api/bounty-tips/review-queue/claim/
+
+        Lease pending tips to the officer.
+        """
+        serializer = BountyTipClaimSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                serializer.errors, status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            tips = BountyTipService.claim_review_queue(
+                officer_user=request.user,
+                limit=serializer.validated_data["limit"],
+            )
+        except PermissionDenied as exc:
+            return Response(
+                {"detail": str(exc)}, status=status.HTTP_403_FORBIDDEN,
+            )
+        output = BountyTipListSerializer(tips, many=True)
+        return Response(output.data, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=["post"], url_path="release-claim")
+    @extend_schema(
+        summary="Release a claimed tip",
+        description="Return a claimed tip to the review queue without reviewing it.",
+        request=None,
+        responses={
+            204: OpenApiResponse(description="Claim released."),
+            409: OpenApiResponse(description="Caller holds no active claim on the tip."),
+        },
+        tags=["Bounty Tips"],
+    )
+    def release_claim(self, request: Request, pk: int = None) -> Response:
+        """
+        POST /api/bounty-tips/{id}/release-claim/
+        """
+        try:
+            BountyTipService.release_review_claim(pk, request.user)
+        except Conflict as exc:
+            return Response(
+                {"detail": str(exc)}, status=status.HTTP_409_CONFLICT,
+            )
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
     @action(detail=True, methods=["post"], url_path="verify")
     @extend_schema(
         summary="Detective verifies bounty tip",
@@ -0,0 +1,171 @@
+"""
+Integration tests — application cache with tag invalidation (``core.cache``).
+
+  * ``get_or_build`` serves repeat reads from the cache until one of the
+    entry's tags is invalidated
+  * a write that lands while a value is being built leaves it stale
+  * case, suspect and role write paths invalidate ``case:{id}``,
+    ``suspect-national:{nid}`` and ``role:{id}``
+  * with a shared cache, role permissions are resolved once and shared
+    across user instances; with a per-process one they are not cached
+"""
+
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.test import TestCase, override_settings
+
+from accounts.models import Role
+from cases.models import Case, CaseCreationType, CaseStatus, CrimeLevel
+from cases.services import CaseWitnessService, CaseWorkflowService
+from core.cache import (
+    cache_get,
+    case_tag,
+    get_or_build,
+    invalidate_tags,
+    role_tag,
+    suspect_national_tag,
+)
+from suspects.services import SuspectProfileService
+
+User = get_user_model()
+
+
+class _Counter:
+    """Build function that returns how many times it has been called."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> int:
+        self.calls += 1
+        return self.calls
+
+
+class TestCacheHelpers(TestCase):
+    """Cache-aside reads and tag versions."""
+
+    def test_get_or_build_until_invalidated(self):
+        build = _Counter()
+        read = lambda: get_or_build("stats", build, tags=["case:1", "role:2"])  # noqa: E731
+
+        self.assertEqual((read(), read()), (1, 1))
+        invalidate_tags("role:2")
+        self.assertEqual((read(), read()), (2, 2))
+        invalidate_tags("case:9")
+        self.assertEqual(read(), 2)
+        self.assertEqual(cache_get("stats"), 2)
+
+    def test_write_during_build_leaves_entry_stale(self):
+        def build() -> str:
+            invalidate_tags("case:1")
+            return "old"
+
+        self.assertEqual(get_or_build("racy", build, tags=["case:1"]), "old")
+        self.assertIsNone(cache_get("racy"))
+        self.assertEqual(get_or_build("racy", lambda: "new", tags=["case:1"]), "new")
+
+
+class TestWritePathInvalidation(TestCase):
+    """Service writes drop the entries tagged with what they changed."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_superuser(
+            username="cache_admin",
+            password="C4che!Tags99",
+            email="cache_admin@lapd.test",
+            phone_number="09130050001",
+            national_id="9500000001",
+        )
+
+    def _case(self, case_status: str = CaseStatus.INVESTIGATION) -> Case:
+        return Case.objects.create(
+            title="Cached case",
+            description="Cache fixture.",
+            crime_level=CrimeLevel.LEVEL_2,
+            creation_type=CaseCreationType.CRIME_SCENE,
+            status=case_status,
+            created_by=self.admin,
+        )
+
+    def _cached(self, tag: str) -> None:
+        get_or_build(f"probe:{tag}", lambda: "value", tags=[tag])
+
+    def assertInvalidated(self, tag: str) -> None:
+        self.assertIsNone(cache_get(f"probe:{tag}"), f"{tag} is still cached")
+
+    def test_case_writes(self):
+        case = self._case()
+
+        self._cached(case_tag(case.pk))
+        case.title = "Renamed"
+        case.save(update_fields=["title", "updated_at"])
+        self.assertInvalidated(case_tag(case.pk))
+
+        self._cached(case_tag(case.pk))
+        CaseWitnessService.add_witness(
+            case,
+            {"full_name": "Harry Fremont", "phone_number": "09120000005", "national_id": "5555555555"},
+            self.admin,
+        )
+        self.assertInvalidated(case_tag(case.pk))
+
+    def test_bulk_transition(self):
+        case = self._case(CaseStatus.OPEN)
+        self._cached(case_tag(case.pk))
+
+        CaseWorkflowService.bulk_transition([case.pk], CaseStatus.INVESTIGATION, self.admin)
+
+        self.assertInvalidated(case_tag(case.pk))
+
+    def test_suspect_writes(self):
+        case = self._case()
+        suspect = SuspectProfileService.create_suspect(
+            {"case": case, "full_name": "Jack Drake", "national_id": "1000000001"}, self.admin,
+        )
+        old_tag = suspect_national_tag("1000000001")
+        new_tag = suspect_national_tag("1000000002")
+        self._cached(old_tag)
+        self._cached(new_tag)
+
+        SuspectProfileService.update_suspect(suspect, {"national_id": "1000000002"}, self.admin)
+
+        self.assertInvalidated(old_tag)
+        self.assertInvalidated(new_tag)
+
+    def _clerk(self) -> User:
+        role = Role.objects.create(name="Cache Clerk", hierarchy_level=1)
+        return User.objects.create_user(
+            username="cache_clerk", password="C4che!Tags99", email="clerk@lapd.test",
+            phone_number="09130050002", national_id="9500000002", role=role,
+        )
+
+    @override_settings(CACHE_SHARED=True)
+    def test_role_permission_changes(self):
+        user = self._clerk()
+        role = user.role
+        perm = Permission.objects.get(codename="view_case")
+
+        self.assertFalse(user.has_perm("cases.view_case"))
+        self._cached(role_tag(role.pk))
+        role.permissions.add(perm)
+        self.assertInvalidated(role_tag(role.pk))
+
+        fresh = User.objects.select_related("role").get(pk=user.pk)
+        self.assertTrue(fresh.has_perm("cases.view_case"))
+        again = User.objects.select_related("role").get(pk=user.pk)
+        with self.assertNumQueries(0):
+            self.assertTrue(again.has_perm("cases.view_case"))
+
+    @override_settings(CACHE_SHARED=False)
+    def test_role_permissions_not_cached_per_process(self):
+        user = self._clerk()
+        user.role.permissions.add(Permission.objects.get(codename="view_case"))
+
+        for _ in range(2):
+            fresh = User.objects.select_related("role").get(pk=user.pk)
+            with self.assertNumQueries(1):
+                self.assertTrue(fresh.has_perm("cases.view_case"))
+                self.assertTrue(fresh.has_perm("cases.view_case"))
@@ -0,0 +1,267 @@
+"""
+Integration tests — async read endpoints and ASGI support
+(``core.domain.asgi``).
+
+The URLconf only mounts the async variants with ``ASYNC_READ_VIEWS``,
+which is off under WSGI (and in tests), so the views are called
+directly — through ``async_to_sync``, as Django itself runs them there.
+
+  * each async variant answers like its sync twin: auth, permissions,
+    ``ETag`` / 304 and errors included
+  * the async search runs its category searches concurrently, on worker
+    threads that read from the replica and close their connections
+  * ``adapt_streaming`` streams sync bodies asynchronously in ASGI mode
+  * ``async_read_paths`` follows ``ASYNC_READ_VIEWS``
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connections, router
+from django.http import StreamingHttpResponse
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.urls import path
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from board.models import BoardNote, DetectiveBoard
+from board.views import AsyncBoardFullStateView
+from cases.models import Case, CaseCreationType, CaseStatus, CrimeLevel
+from core.domain.asgi import adapt_streaming, async_read_paths, gather_in_threads
+from core.domain.replicas import REPLICA_DB_ALIAS, read_replica
+from core.models import Notification
+from core.views import (
+    AsyncDashboardStatsView,
+    AsyncGlobalSearchView,
+    AsyncNotificationListView,
+    AsyncSystemConstantsView,
+    DashboardStatsView,
+    GlobalSearchView,
+)
+from evidence.models import Evidence, EvidenceType
+from suspects.models import Suspect, SuspectStatus
+from suspects.views import AsyncMostWantedView
+
+User = get_user_model()
+
+
+def _call(view_class: type, request, **kwargs):
+    return async_to_sync(view_class.as_view())(request, **kwargs)
+
+
+class TestAsyncReadViews(TestCase):
+    """The async variants of the read-only endpoints."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_superuser(
+            username="async_admin",
+            password="As7nc!Reads99",
+            email="async_admin@lapd.test",
+            phone_number="09130120001",
+            national_id="8800000001",
+        )
+        cls.outsider = User.objects.create_user(
+            username="async_outsider",
+            password="As7nc!Reads99",
+            email="async_outsider@lapd.test",
+            phone_number="09130120002",
+            national_id="8800000002",
+        )
+        cls.case = Case.objects.create(
+            title="Async case",
+            description="ASGI fixture.",
+            crime_level=CrimeLevel.LEVEL_1,
+            creation_type=CaseCreationType.CRIME_SCENE,
+            status=CaseStatus.INVESTIGATION,
+            created_by=cls.admin,
+        )
+        cls.suspect = Suspect.objects.create(
+            case=cls.case, full_name="Cole Phelps", national_id="8800000011",
+            status=SuspectStatus.WANTED, identified_by=cls.admin,
+        )
+        Suspect.objects.filter(pk=cls.suspect.pk).update(
+            wanted_since=timezone.now() - timedelta(days=40),
+        )
+        cls.board = DetectiveBoard.objects.create(case=cls.case, detective=cls.admin)
+        BoardNote.objects.create(
+            board=cls.board, title="Lead", content="Check the docks.", created_by=cls.admin,
+        )
+        Notification.objects.create(
+            recipient=cls.admin, title="Assigned", message="You have a new case.",
+        )
+
+    def setUp(self) -> None:
+        self.factory = APIRequestFactory()
+
+    def _get(self, path: str, user=None, **headers):
+        request = self.factory.get(path, **headers)
+        if user is not None:
+            force_authenticate(request, user=user)
+        return request
+
+    def test_dashboard_matches_sync_view(self):
+        expected = DashboardStatsView.as_view()(self._get("/api/core/dashboard/")).data
+        response = _call(AsyncDashboardStatsView, self._get("/api/core/dashboard/"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, expected)
+
+    def test_constants_revalidate(self):
+        response = _call(AsyncSystemConstantsView, self._get("/api/core/constants/"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("crime_levels", response.data)
+
+        request = self._get("/api/core/constants/", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(
+            _call(AsyncSystemConstantsView, request).status_code,
+            status.HTTP_304_NOT_MODIFIED,
+        )
+
+    def test_notifications_require_authentication(self):
+        response = _call(AsyncNotificationListView, self._get("/api/core/notifications/", self.admin))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([n["title"] for n in response.data], ["Assigned"])
+
+        anonymous = _call(AsyncNotificationListView, self._get("/api/core/notifications/"))
+        self.assertEqual(anonymous.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_most_wanted(self):
+        response = _call(AsyncMostWantedView, self._get("/api/suspects/most-wanted/", self.admin))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([s["id"] for s in response.data], [self.suspect.pk])
+        self.assertEqual(response.data[0]["case_title"], "Async case")
+
+    def test_board_full_state_checks_access(self):
+        path_ = f"/api/boards/{self.board.pk}/full/"
+        response = _call(AsyncBoardFullStateView, self._get(path_, self.admin), pk=self.board.pk)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([n["title"] for n in response.data["notes"]], ["Lead"])
+
+        denied = _call(AsyncBoardFullStateView, self._get(path_, self.outsider), pk=self.board.pk)
+        self.assertEqual(denied.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class TestConcurrentSearch(TransactionTestCase):
+    """
+    ``GlobalSearchService.asearch`` and ``gather_in_threads``.
+
+    Worker threads use connections of their own, which cannot see rows
+    inside a test transaction; hence ``TransactionTestCase``.
+    """
+
+    databases = {"default", REPLICA_DB_ALIAS}
+
+    def setUp(self) -> None:
+        self.admin = User.objects.create_superuser(
+            username="async_search_admin",
+            password="As7nc!Search99",
+            email="async_search_admin@lapd.test",
+            phone_number="09130120011",
+            national_id="8800000021",
+        )
+        case = Case.objects.create(
+            title="Harbor smuggling",
+            description="Concurrent search fixture.",
+            crime_level=CrimeLevel.LEVEL_2,
+            creation_type=CaseCreationType.CRIME_SCENE,
+            status=CaseStatus.INVESTIGATION,
+            created_by=self.admin,
+        )
+        Suspect.objects.create(
+            case=case, full_name="Harbor Pete", national_id="8800000031",
+            identified_by=self.admin,
+        )
+        Evidence.objects.create(
+            case=case, evidence_type=EvidenceType.OTHER,
+            title="Harbor manifest", description="", registered_by=self.admin,
+        )
+        self.factory = APIRequestFactory()
+
+    def _search(self, view_class: type, params: dict):
+        request = self.factory.get("/api/core/search/", params)
+        force_authenticate(request, user=self.admin)
+        if view_class is GlobalSearchView:
+            return view_class.as_view()(request)
+        return _call(view_class, request)
+
+    def test_matches_sync_search(self):
+        for params in ({"q": "Harbor"}, {"q": "Harbor", "category": "evidence"}):
+            with self.subTest(**params):
+                expected = self._search(GlobalSearchView, params)
+                cache.clear()
+                response = self._search(AsyncGlobalSearchView, params)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data, expected.data)
+        self.assertEqual(response.data["total_results"], 1)
+
+        short = self._search(AsyncGlobalSearchView, {"q": "H"})
+        self.assertEqual(short.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_calls_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def meet() -> int:
+            barrier.wait()  # BrokenBarrierError if the calls ran one by one
+            return threading.get_ident()
+
+        self.assertEqual(len(set(async_to_sync(gather_in_threads)(meet, meet, meet))), 3)
+
+    def test_worker_threads_read_the_replica_and_close_connections(self):
+        def read():
+            Case.objects.exists()
+            return router.db_for_read(Case), connections[REPLICA_DB_ALIAS]
+
+        async def marked():
+            with read_replica():
+                return await gather_in_threads(read)
+
+        [(alias, connection)] = async_to_sync(marked)()
+        self.assertEqual(alias, REPLICA_DB_ALIAS)
+        self.assertIsNot(connection, connections[REPLICA_DB_ALIAS])
+        self.assertIsNone(connection.connection)
+
+
+class TestAdaptStreaming(SimpleTestCase):
+    """Streaming bodies under each ``SERVER_MODE``."""
+
+    def _response(self, closed: list[bool]) -> StreamingHttpResponse:
+        def lines():
+            try:
+                yield "a,b\n"
+                yield "1,2\n"
+            finally:
+                closed.append(True)
+
+        return StreamingHttpResponse(lines())
+
+    def test_wsgi_keeps_sync_body(self):
+        response = adapt_streaming(self._response([]))
+        self.assertFalse(response.is_async)
+        self.assertEqual(b"".join(response), b"a,b\n1,2\n")
+
+    @override_settings(SERVER_MODE="asgi")
+    def test_asgi_streams_asynchronously(self):
+        closed: list[bool] = []
+        response = adapt_streaming(self._response(closed))
+        self.assertTrue(response.is_async)
+
+        async def first_chunk() -> bytes:
+            async for chunk in response:
+                return chunk
+
+        self.assertEqual(async_to_sync(first_chunk)(), b"a,b\n")
+        response.close()
+        self.assertEqual(closed, [True])
+
+    def test_async_read_paths_follow_the_setting(self):
+        pattern = path("search/", AsyncGlobalSearchView.as_view())
+        with override_settings(ASYNC_READ_VIEWS=True):
+            self.assertEqual(async_read_paths(pattern), [pattern])
+        with override_settings(ASYNC_READ_VIEWS=False):
+            self.assertEqual(async_read_paths(pattern), [])
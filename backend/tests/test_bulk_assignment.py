@@ -0,0 +1,144 @@
+"""
+Integration tests — bulk personnel assignment (``POST /api/cases/bulk-assign/``).
+
+``CaseAssignmentService.bulk_assign`` spreads one case role over one or
+more assignees:
+
+  * round-robin in id order, or balanced by current open-case load
+  * open cases move to INVESTIGATION when a detective is assigned
+  * one status-log row per case, one notification per assignee
+  * assignees without the role are rejected before anything changes
+"""
+
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from cases.models import Case, CaseCreationType, CaseStatus, CaseStatusLog, CrimeLevel
+from core.models import Notification
+
+User = get_user_model()
+
+
+def _user(username: str, index: int, *, superuser: bool = True) -> User:
+    create = User.objects.create_superuser if superuser else User.objects.create_user
+    return create(
+        username=username,
+        password="Bu1k!Assign99",
+        email=f"{username}@lapd.test",
+        phone_number=f"0913000800{index}",
+        national_id=f"920000000{index}",
+    )
+
+
+class TestBulkAssignment(TestCase):
+    """Caseload redistribution through the bulk-assign endpoint."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.sergeant = _user("bulk_sergeant", 1)
+        cls.busy = _user("bulk_det_busy", 2)
+        cls.idle = _user("bulk_det_idle", 3)
+        cls.citizen = _user("bulk_assign_citizen", 4, superuser=False)
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.sergeant)
+        self.url = reverse("case-bulk-assign")
+
+    def _cases(self, count: int, case_status: str = CaseStatus.OPEN, **extra) -> list[Case]:
+        return [
+            Case.objects.create(
+                title=f"Caseload {i}",
+                description="Bulk assignment fixture.",
+                crime_level=CrimeLevel.LEVEL_2,
+                creation_type=CaseCreationType.CRIME_SCENE,
+                status=case_status,
+                created_by=self.sergeant,
+                **extra,
+            )
+            for i in range(count)
+        ]
+
+    def _post(self, payload: dict) -> list[dict]:
+        response = self.client.post(self.url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return response.json()
+
+    def test_round_robin_assigns_and_opens_investigations(self):
+        cases = self._cases(4)
+        closed = self._cases(1, CaseStatus.CLOSED)[0]
+
+        results = self._post({
+            "case_ids": [closed.pk, *(c.pk for c in cases)],
+            "role": "detective",
+            "user_ids": [self.busy.pk, self.idle.pk],
+        })
+
+        self.assertEqual(
+            [r["assigned_to"] for r in results if r["ok"]],
+            [self.busy.pk, self.idle.pk, self.busy.pk, self.idle.pk],
+        )
+        self.assertFalse(next(r for r in results if r["id"] == closed.pk)["ok"])
+        self.assertEqual(
+            set(Case.objects.filter(pk__in=[c.pk for c in cases]).values_list("status", flat=True)),
+            {CaseStatus.INVESTIGATION},
+        )
+        self.assertEqual(
+            CaseStatusLog.objects.filter(
+                case__in=cases, from_status=CaseStatus.OPEN, to_status=CaseStatus.INVESTIGATION,
+            ).count(),
+            4,
+        )
+        notes = Notification.objects.filter(title="Cases Assigned")
+        self.assertEqual(notes.count(), 2)
+        self.assertEqual(notes.get(recipient=self.busy).message, "You have been assigned to 2 case(s).")
+
+    def test_balance_fills_the_least_loaded_assignee_first(self):
+        self._cases(3, CaseStatus.INVESTIGATION, assigned_detective=self.busy)
+        departed = self._cases(4, CaseStatus.INVESTIGATION, assigned_detective=self.citizen)
+
+        results = self._post({
+            "case_ids": [c.pk for c in departed],
+            "role": "detective",
+            "user_ids": [self.busy.pk, self.idle.pk],
+            "balance": True,
+        })
+
+        self.assertEqual(
+            [r["assigned_to"] for r in results],
+            [self.idle.pk, self.idle.pk, self.idle.pk, self.busy.pk],
+        )
+        self.assertEqual(
+            Case.objects.filter(assigned_detective=self.idle, status=CaseStatus.INVESTIGATION).count(), 3,
+        )
+
+    def test_assignee_without_role_is_rejected_up_front(self):
+        cases = self._cases(2)
+        response = self.client.post(
+            self.url,
+            {"case_ids": [c.pk for c in cases], "role": "judge", "user_ids": [self.idle.pk, self.citizen.pk]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Case.objects.filter(assigned_judge__isnull=False).exists())
+
+    def test_query_count_is_independent_of_batch_size(self):
+        def run(count: int) -> int:
+            cases = self._cases(count)
+            with CaptureQueriesContext(connection) as ctx:
+                self._post({
+                    "case_ids": [c.pk for c in cases],
+                    "role": "sergeant",
+                    "user_ids": [self.busy.pk, self.idle.pk],
+                    "balance": True,
+                })
+            return len(ctx.captured_queries)
+
+        self.assertEqual(run(2), run(8))
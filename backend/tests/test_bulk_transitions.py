@@ -0,0 +1,174 @@
+"""
+Integration tests — bulk case transitions (``POST /api/cases/bulk-transition/``).
+
+``CaseWorkflowService.bulk_transition`` applies one transition to many
+cases in a single transaction:
+
+  * each case succeeds or fails independently, with a per-case result
+  * officer approval sets ``approved_by`` and notifies the creators
+  * cadet rejections count towards auto-voiding, like the single action
+  * another reviewer's active claim blocks only that case
+  * the query count does not grow with the batch size
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from cases.models import (
+    Case,
+    CaseComplainant,
+    CaseCreationType,
+    CaseStatus,
+    CaseStatusLog,
+    CrimeLevel,
+)
+from core.models import Notification
+
+User = get_user_model()
+
+
+def _user(username: str, index: int, *, superuser: bool = True) -> User:
+    create = User.objects.create_superuser if superuser else User.objects.create_user
+    return create(
+        username=username,
+        password="Bu1k!Transit99",
+        email=f"{username}@lapd.test",
+        phone_number=f"0913000700{index}",
+        national_id=f"930000000{index}",
+    )
+
+
+class TestBulkTransitions(TestCase):
+    """Batch approvals and rejections through the bulk endpoint."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.officer = _user("bulk_officer", 1)
+        cls.other_reviewer = _user("bulk_other", 2)
+        cls.citizen = _user("bulk_citizen", 3, superuser=False)
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.officer)
+        self.url = reverse("case-bulk-transition")
+
+    def _cases(self, count: int, case_status: str, **extra) -> list[Case]:
+        cases = []
+        for i in range(count):
+            case = Case.objects.create(
+                title=f"Bulk {case_status} {i}",
+                description="Bulk transition fixture.",
+                crime_level=CrimeLevel.LEVEL_3,
+                creation_type=CaseCreationType.COMPLAINT,
+                status=case_status,
+                created_by=self.citizen,
+                **extra,
+            )
+            CaseComplainant.objects.create(case=case, user=self.citizen, is_primary=True)
+            cases.append(case)
+        return cases
+
+    def _post(self, payload: dict) -> list[dict]:
+        response = self.client.post(self.url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return response.json()
+
+    def test_officer_approves_batch_with_per_case_results(self):
+        approvable = self._cases(3, CaseStatus.OFFICER_REVIEW)
+        wrong_stage = self._cases(1, CaseStatus.CADET_REVIEW)[0]
+        missing = approvable[-1].pk + 1000
+
+        results = self._post({
+            "case_ids": [missing, wrong_stage.pk, *(c.pk for c in approvable)],
+            "target_status": CaseStatus.OPEN,
+            "message": "Vetted.",
+        })
+
+        by_id = {r["id"]: r for r in results}
+        self.assertEqual([r["id"] for r in results], sorted(by_id))
+        self.assertEqual(by_id[missing]["detail"], "Case not found.")
+        self.assertFalse(by_id[wrong_stage.pk]["ok"])
+        for case in approvable:
+            self.assertEqual(by_id[case.pk]["to_status"], CaseStatus.OPEN)
+            case.refresh_from_db()
+            self.assertEqual((case.status, case.approved_by_id), (CaseStatus.OPEN, self.officer.pk))
+
+        logs = CaseStatusLog.objects.filter(case__in=approvable)
+        self.assertEqual(logs.count(), 3)
+        self.assertTrue(all(log.message == "Vetted." for log in logs))
+        self.assertEqual(
+            Notification.objects.filter(recipient=self.citizen, title="Case Approved").count(), 3,
+        )
+        self.assertEqual(
+            Case.objects.get(pk=wrong_stage.pk).status, CaseStatus.CADET_REVIEW,
+        )
+
+    def test_cadet_rejection_counts_towards_voiding(self):
+        fresh, last_chance = self._cases(1, CaseStatus.CADET_REVIEW) + self._cases(
+            1, CaseStatus.CADET_REVIEW, rejection_count=2,
+        )
+        payload = {
+            "case_ids": [fresh.pk, last_chance.pk],
+            "target_status": CaseStatus.RETURNED_TO_COMPLAINANT,
+        }
+
+        refused = self._post(payload)
+        self.assertFalse(any(r["ok"] for r in refused))
+        self.assertIn("message is required", refused[0]["detail"])
+
+        results = self._post({**payload, "message": "Missing witness details."})
+        self.assertEqual(
+            [r["to_status"] for r in results],
+            [CaseStatus.RETURNED_TO_COMPLAINANT, CaseStatus.VOIDED],
+        )
+        fresh.refresh_from_db()
+        last_chance.refresh_from_db()
+        self.assertEqual((fresh.status, fresh.rejection_count), (CaseStatus.RETURNED_TO_COMPLAINANT, 1))
+        self.assertEqual((last_chance.status, last_chance.rejection_count), (CaseStatus.VOIDED, 3))
+        self.assertEqual(Notification.objects.filter(recipient=self.citizen).count(), 2)
+
+    def test_claim_held_by_another_reviewer_blocks_only_that_case(self):
+        free, held = self._cases(2, CaseStatus.OFFICER_REVIEW)
+        Case.objects.filter(pk=held.pk).update(
+            leased_to=self.other_reviewer,
+            lease_expires_at=timezone.now() + timedelta(minutes=10),
+        )
+
+        results = self._post({"case_ids": [free.pk, held.pk], "target_status": CaseStatus.OPEN})
+
+        self.assertEqual([r["ok"] for r in results], [True, False])
+        self.assertIn("claimed by another reviewer", results[1]["detail"])
+
+    def test_permission_is_checked_per_status_pair(self):
+        cases = self._cases(2, CaseStatus.OFFICER_REVIEW)
+        client = APIClient()
+        client.force_authenticate(user=self.citizen)
+
+        response = client.post(
+            self.url,
+            {"case_ids": [c.pk for c in cases], "target_status": CaseStatus.OPEN},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(all("permission" in r["detail"] for r in response.json()))
+        self.assertFalse(Case.objects.filter(status=CaseStatus.OPEN).exists())
+
+    def test_query_count_is_independent_of_batch_size(self):
+        def run(count: int) -> int:
+            cases = self._cases(count, CaseStatus.OFFICER_REVIEW)
+            with CaptureQueriesContext(connection) as ctx:
+                self._post({"case_ids": [c.pk for c in cases], "target_status": CaseStatus.OPEN})
+            return len(ctx.captured_queries)
+
+        self.assertEqual(run(2), run(8))
@@ -0,0 +1,153 @@
+"""
+Integration tests — denormalised per-case counters (``CaseCounterService``).
+
+  * the owning services keep ``Case.*_count`` in step with the rows,
+    including evidence re-linked to another case
+  * the case list reads the counter instead of grouping complainants
+  * ``recount_case_counters`` repairs counters after out-of-band writes
+  * the JUDICIARY auto-transition decides from the counters
+"""
+
+from __future__ import annotations
+
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from cases.models import Case, CaseCreationType, CaseStatus, CrimeLevel
+from cases.services import CaseComplainantService, CaseCreationService
+from evidence.models import EvidenceType
+from evidence.services import EvidenceProcessingService
+from suspects.models import Suspect, SuspectStatus
+from suspects.services import BountyTipService, SuspectProfileService, VerdictService
+
+User = get_user_model()
+
+
+def _user(username: str, index: int, *, superuser: bool = True) -> User:
+    create = User.objects.create_superuser if superuser else User.objects.create_user
+    return create(
+        username=username,
+        password="C0unt!Cases99",
+        email=f"{username}@lapd.test",
+        phone_number=f"0913000900{index}",
+        national_id=f"910000000{index}",
+    )
+
+
+class TestCaseCounters(TestCase):
+    """Counter maintenance, consumers and repair."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = _user("counter_admin", 1)
+        cls.citizen = _user("counter_citizen", 2, superuser=False)
+
+    def _case(self, **extra) -> Case:
+        return Case.objects.create(
+            title="Counter case",
+            description="Counter fixture.",
+            crime_level=CrimeLevel.LEVEL_2,
+            creation_type=CaseCreationType.CRIME_SCENE,
+            status=CaseStatus.INVESTIGATION,
+            created_by=self.admin,
+            **extra,
+        )
+
+    def _counters(self, case: Case) -> dict[str, int]:
+        return Case.objects.values(
+            "complainant_count", "evidence_count", "suspect_count",
+            "suspects_at_trial_count", "open_tip_count",
+        ).get(pk=case.pk)
+
+    def test_services_maintain_counters(self):
+        case = CaseCreationService.create_complaint_case(
+            {"title": "Stolen car", "description": "Gone overnight.", "crime_level": CrimeLevel.LEVEL_3},
+            self.citizen,
+        )
+        CaseComplainantService.add_complainant(case, self.admin, self.admin)
+
+        evidence = EvidenceProcessingService.process_new_evidence(
+            EvidenceType.OTHER,
+            {"case": case, "title": "Tyre marks", "description": "Driveway."},
+            self.admin,
+        )
+        EvidenceProcessingService.process_new_evidence(
+            EvidenceType.OTHER,
+            {"case": case, "title": "Broken glass", "description": "Kerb."},
+            self.admin,
+        )
+        EvidenceProcessingService.delete_evidence(evidence, self.admin)
+
+        suspect = SuspectProfileService.create_suspect(
+            {"case": case, "full_name": "Ray Pike", "national_id": "9110000001"},
+            self.admin,
+        )
+        tip = BountyTipService.submit_tip({"suspect": suspect, "information": "Seen at the docks."}, self.citizen)
+
+        self.assertEqual(self._counters(case), {
+            "complainant_count": 2, "evidence_count": 1, "suspect_count": 1,
+            "suspects_at_trial_count": 0, "open_tip_count": 1,
+        })
+
+        BountyTipService.officer_review_tip(tip.pk, self.admin, "reject", "Unfounded.")
+        self.assertEqual(self._counters(case)["open_tip_count"], 0)
+
+    def test_relinked_evidence_moves_between_counters(self):
+        source, target = self._case(), self._case()
+        evidence = EvidenceProcessingService.process_new_evidence(
+            EvidenceType.OTHER,
+            {"case": source, "title": "Ledger", "description": "Back office."},
+            self.admin,
+        )
+        EvidenceProcessingService.link_evidence_to_case(evidence, target.pk, self.admin)
+        self.assertEqual(self._counters(source)["evidence_count"], 0)
+        self.assertEqual(self._counters(target)["evidence_count"], 1)
+
+    def test_case_list_has_no_group_by(self):
+        case = self._case(complainant_count=3)
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+
+        with CaptureQueriesContext(connection) as ctx:
+            rows = client.get(reverse("case-list")).json()
+
+        self.assertEqual(next(r for r in rows if r["id"] == case.pk)["complainant_count"], 3)
+        self.assertFalse(any("GROUP BY" in q["sql"] for q in ctx.captured_queries))
+
+    def test_recount_repairs_drift(self):
+        case = self._case(evidence_count=7)
+        Suspect.objects.create(
+            case=case, full_name="Out Of Band", national_id="9110000002",
+            status=SuspectStatus.UNDER_TRIAL, identified_by=self.admin,
+        )
+
+        out = StringIO()
+        call_command("recount_case_counters", stdout=out)
+        self.assertIn("corrected=1", out.getvalue())
+        self.assertEqual(self._counters(case), {
+            "complainant_count": 0, "evidence_count": 0, "suspect_count": 1,
+            "suspects_at_trial_count": 1, "open_tip_count": 0,
+        })
+
+        out = StringIO()
+        call_command("recount_case_counters", "--case", str(case.pk), stdout=out)
+        self.assertIn("corrected=0", out.getvalue())
+
+    def test_judiciary_transition_reads_counters(self):
+        waiting = self._case(suspect_count=2, suspects_at_trial_count=1)
+        ready = self._case(suspect_count=2, suspects_at_trial_count=2)
+
+        with self.assertNumQueries(1):
+            VerdictService._maybe_transition_case_to_judiciary(waiting)
+        self.assertEqual(waiting.status, CaseStatus.INVESTIGATION)
+
+        VerdictService._maybe_transition_case_to_judiciary(ready)
+        ready.refresh_from_db()
+        self.assertEqual(ready.status, CaseStatus.JUDICIARY)
@@ -0,0 +1,100 @@
+"""
+Integration tests — revision-keyed cache of the judiciary case report.
+
+  * a repeat report for an unchanged case costs one query
+  * saving the case and writing its suspects, witnesses or evidence bump
+    ``Case.revision``, so the next report is rebuilt
+  * re-linking evidence moves it between the cases' counters and reports
+"""
+
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from cases.models import Case, CaseCreationType, CaseStatus, CrimeLevel
+from cases.services import CaseReportingService, CaseWitnessService
+from evidence.models import EvidenceType
+from evidence.services import EvidenceProcessingService
+from suspects.services import SuspectProfileService
+
+User = get_user_model()
+
+
+class TestCaseReportCache(TestCase):
+    """Cached reports follow every write that changes their content."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.judge = User.objects.create_superuser(
+            username="report_judge",
+            password="Rep0rt!Cache99",
+            email="report_judge@lapd.test",
+            phone_number="09130010001",
+            national_id="9910000001",
+        )
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.case = self._case("Report case")
+
+    def _case(self, title: str) -> Case:
+        return Case.objects.create(
+            title=title,
+            description="Report cache fixture.",
+            crime_level=CrimeLevel.LEVEL_2,
+            creation_type=CaseCreationType.CRIME_SCENE,
+            status=CaseStatus.INVESTIGATION,
+            created_by=self.judge,
+        )
+
+    def _report(self, case: Case | None = None) -> dict:
+        return CaseReportingService.get_case_report(self.judge, (case or self.case).pk)
+
+    def test_repeat_report_costs_one_query(self):
+        first = self._report()
+        with self.assertNumQueries(1):
+            self.assertEqual(self._report(), first)
+
+    def test_case_save_bumps_revision(self):
+        self._report()
+        self.case.status = CaseStatus.JUDICIARY
+        self.case.save(update_fields=["status", "updated_at"])
+
+        self.assertEqual(self.case.revision, 1)
+        self.assertEqual(self._report()["case"]["status"], CaseStatus.JUDICIARY)
+
+    def test_related_writes_invalidate_the_report(self):
+        self._report()
+
+        SuspectProfileService.create_suspect(
+            {"case": self.case, "full_name": "Bugsy Siegel"}, self.judge,
+        )
+        self.assertEqual([s["full_name"] for s in self._report()["suspects"]], ["Bugsy Siegel"])
+
+        CaseWitnessService.add_witness(
+            self.case,
+            {"full_name": "Virginia Hill", "phone_number": "09120000002", "national_id": "2222222222"},
+            self.judge,
+        )
+        self.assertEqual(len(self._report()["witnesses"]), 1)
+
+    def test_relinked_evidence_moves_between_reports(self):
+        other = self._case("Other case")
+        evidence = EvidenceProcessingService.process_new_evidence(
+            EvidenceType.OTHER,
+            {"case": self.case, "title": "Ledger", "description": "Flamingo accounts."},
+            self.judge,
+        )
+        self.assertEqual(len(self._report()["evidence"]), 1)
+        self._report(other)
+
+        EvidenceProcessingService.link_evidence_to_case(evidence, other.pk, self.judge)
+
+        self.assertEqual(self._report()["evidence"], [])
+        self.assertEqual([e["title"] for e in self._report(other)["evidence"]], ["Ledger"])
+        self.assertEqual(
+            dict(Case.objects.filter(pk__in=[self.case.pk, other.pk]).values_list("pk", "evidence_count")),
+            {self.case.pk: 0, other.pk: 1},
+        )
@@ -0,0 +1,179 @@
+"""
+Integration tests — conditional GET on detail endpoints
+(``core.domain.conditional``).
+
+``GET /api/cases/{id}/``, ``/api/suspects/{id}/`` and
+``/api/evidence/{id}/`` carry an ``ETag``:
+
+  * a matching ``If-None-Match`` is answered 304 from one query,
+    without the detail prefetches
+  * writes to the row or its nested sub-resources (witnesses, bails,
+    files, rendered variants, related suspects' cases) change the ETag
+  * the ETag lookup honours case visibility (404, not 304)
+"""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+from io import BytesIO
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from PIL import Image
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from cases.models import Case, CaseCreationType, CaseStatus, CaseWitness, CrimeLevel
+from core.domain.imaging import generate_pending
+from evidence.models import Evidence, EvidenceFile, EvidenceType, FileType
+from suspects.models import Bail, Suspect, SuspectStatus
+
+User = get_user_model()
+
+_MEDIA_ROOT = tempfile.mkdtemp(prefix="wp-conditional-tests-")
+
+
+@override_settings(MEDIA_ROOT=_MEDIA_ROOT)
+class TestConditionalGet(TestCase):
+    """ETag validation of the case, suspect and evidence detail views."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_superuser(
+            username="etag_admin",
+            password="Et4g!Detail99",
+            email="etag_admin@lapd.test",
+            phone_number="09130090001",
+            national_id="9100000001",
+        )
+        cls.outsider = User.objects.create_user(
+            username="etag_outsider",
+            password="Et4g!Detail99",
+            email="etag_outsider@lapd.test",
+            phone_number="09130090002",
+            national_id="9100000002",
+        )
+        cls.case = Case.objects.create(
+            title="Conditional case",
+            description="ETag fixture.",
+            crime_level=CrimeLevel.LEVEL_2,
+            creation_type=CaseCreationType.CRIME_SCENE,
+            status=CaseStatus.INVESTIGATION,
+            created_by=cls.admin,
+        )
+        cls.other_case = Case.objects.create(
+            title="Earlier case",
+            description="ETag fixture.",
+            crime_level=CrimeLevel.LEVEL_3,
+            creation_type=CaseCreationType.CRIME_SCENE,
+            status=CaseStatus.INVESTIGATION,
+            created_by=cls.admin,
+        )
+        cls.suspect = Suspect.objects.create(
+            case=cls.case, full_name="Roy Earle", national_id="9100000011",
+            identified_by=cls.admin, status=SuspectStatus.ARRESTED,
+        )
+        cls.alias = Suspect.objects.create(
+            case=cls.other_case, full_name="Roy Earle", national_id="9100000011",
+            identified_by=cls.admin,
+        )
+        cls.evidence = Evidence.objects.create(
+            case=cls.case, evidence_type=EvidenceType.OTHER,
+            title="Matchbook", description="", registered_by=cls.admin,
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        shutil.rmtree(_MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def _etag(self, url: str) -> str:
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("no-cache", response["Cache-Control"])
+        return response["ETag"]
+
+    def assertNotModified(self, url: str, etag: str) -> None:
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+    def test_unchanged_details_are_not_modified(self):
+        for url in (
+            reverse("case-detail", args=[self.case.pk]),
+            reverse("suspect-detail", args=[self.suspect.pk]),
+            reverse("evidence-detail", args=[self.evidence.pk]),
+        ):
+            with self.subTest(url=url):
+                self.assertNotModified(url, self._etag(url))
+
+    def test_case_etag_follows_nested_writes(self):
+        url = reverse("case-detail", args=[self.case.pk])
+        etag = self._etag(url)
+
+        CaseWitness.objects.create(
+            case=self.case, full_name="Elsa Lichtmann",
+            phone_number="09130090011", national_id="9100000021",
+        )
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(len(response.data["witnesses"]), 1)
+
+    def test_case_etag_honours_visibility(self):
+        etag = self._etag(reverse("case-detail", args=[self.case.pk]))
+        self.client.force_authenticate(user=self.outsider)
+        response = self.client.get(
+            reverse("case-detail", args=[self.case.pk]), HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_suspect_etag_follows_bails_and_aliases(self):
+        url = reverse("suspect-detail", args=[self.suspect.pk])
+        etag = self._etag(url)
+
+        Bail.objects.create(
+            suspect=self.suspect, case=self.case, amount=1000, approved_by=self.admin,
+        )
+        after_bail = self._etag(url)
+        self.assertNotEqual(after_bail, etag)
+
+        # Another case of the same person feeds ``most_wanted_score``.
+        self.other_case.crime_level = CrimeLevel.CRITICAL
+        self.other_case.save()
+        self.assertNotEqual(self._etag(url), after_bail)
+
+    def test_evidence_etag_follows_files(self):
+        url = reverse("evidence-detail", args=[self.evidence.pk])
+        etag = self._etag(url)
+
+        EvidenceFile.objects.create(
+            evidence=self.evidence, file_type=FileType.DOCUMENT,
+            file=SimpleUploadedFile("statement.txt", b"I saw nothing."),
+        )
+
+        self.assertNotEqual(self._etag(url), etag)
+
+    def test_rendered_variants_change_the_etag(self):
+        buffer = BytesIO()
+        Image.new("RGB", (600, 400), (30, 30, 200)).save(buffer, "PNG")
+        self.suspect.photo = SimpleUploadedFile("mugshot.png", buffer.getvalue())
+        self.suspect.save()
+        url = reverse("suspect-detail", args=[self.suspect.pk])
+        etag = self._etag(url)
+
+        generate_pending(Suspect.objects.filter(pk=self.suspect.pk), "photo")
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("preview", response.data["photo_preview"])
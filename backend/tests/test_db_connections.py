@@ -0,0 +1,135 @@
+"""
+Integration tests — database connection reuse.
+
+  * ``DB_CONN_MODE=persistent`` (the default) keeps connections with
+    health checks on both aliases
+  * ``benchmark_db_connections`` reports both modes and the saving
+  * with ``DB_TRANSACTION_POOLER`` coalesced rebuilds and case reports
+    leave no advisory lock on the session, so every rebuild can run
+  * ``generate_pending`` walks rows in keyset batches, honouring
+    ``limit`` across batch boundaries
+"""
+
+from __future__ import annotations
+
+import unittest
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+
+from cases.models import Case, CaseCreationType, CaseStatus, CrimeLevel
+from cases.services import CaseReportingService
+from core.cache import CASES_TAG, get_or_build_coalesced, invalidate_tags
+from core.domain import imaging
+from core.domain.replicas import REPLICA_DB_ALIAS
+
+User = get_user_model()
+
+
+class TestConnectionSettings(SimpleTestCase):
+    """Default connection reuse configuration."""
+
+    @unittest.skipUnless(settings.DB_CONN_MODE == "persistent", "DB_CONN_MODE is overridden")
+    def test_persistent_connections_with_health_checks(self):
+        for alias in ("default", "replica"):
+            with self.subTest(alias=alias):
+                self.assertGreater(settings.DATABASES[alias]["CONN_MAX_AGE"], 0)
+                self.assertTrue(settings.DATABASES[alias]["CONN_HEALTH_CHECKS"])
+                self.assertNotIn("pool", settings.DATABASES[alias]["OPTIONS"])
+
+
+class TestConnectionBenchmark(TestCase):
+    """``manage.py benchmark_db_connections``."""
+
+    def test_reports_both_modes(self):
+        out = StringIO()
+        call_command("benchmark_db_connections", requests=3, stdout=out)
+        output = out.getvalue()
+        self.assertIn("fresh connection per request", output)
+        self.assertIn("configured (persistent)", output)
+        self.assertIn("Saved per request", output)
+
+    def test_rejects_unknown_alias(self):
+        with self.assertRaises(CommandError):
+            call_command("benchmark_db_connections", database="nope", stdout=StringIO())
+
+
+class TestKeysetRows(TestCase):
+    """Batching of ``generate_pending``'s row walk."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        admin = User.objects.create_superuser(
+            username="conn_admin",
+            password="C0nn!Reuse99",
+            email="conn_admin@lapd.test",
+            phone_number="09130110001",
+            national_id="8900000001",
+        )
+        cls.cases = [
+            Case.objects.create(
+                title=f"Batch case {i}",
+                description="Keyset fixture.",
+                crime_level=CrimeLevel.LEVEL_3,
+                creation_type=CaseCreationType.CRIME_SCENE,
+                status=CaseStatus.OPEN,
+                created_by=admin,
+            )
+            for i in range(7)
+        ]
+
+    def test_batches_and_limit(self):
+        queryset = Case.objects.order_by("pk")
+        pks = [case.pk for case in self.cases]
+        with mock.patch.object(imaging, "_BATCH_SIZE", 3):
+            with self.assertNumQueries(4):  # 3 + 3 + 1, then an empty page
+                self.assertEqual([row.pk for row in imaging._keyset_rows(queryset, None)], pks)
+            with self.assertNumQueries(2):  # 3 + 2
+                self.assertEqual([row.pk for row in imaging._keyset_rows(queryset, 5)], pks[:5])
+
+
+@override_settings(DB_TRANSACTION_POOLER=True)
+class TestTransactionPooler(TransactionTestCase):
+    """Single-flight rebuilds behind a transaction-mode pooler."""
+
+    databases = {"default", REPLICA_DB_ALIAS}
+
+    def setUp(self) -> None:
+        self.admin = User.objects.create_superuser(
+            username="pooler_admin",
+            password="P00ler!Mode99",
+            email="pooler_admin@lapd.test",
+            phone_number="09130110011",
+            national_id="8900000011",
+        )
+
+    def assertNoAdvisoryLocks(self) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT count(*) FROM pg_locks WHERE locktype = 'advisory'")
+            self.assertEqual(cursor.fetchone()[0], 0)
+
+    def test_invalidated_entry_is_rebuilt_every_time(self):
+        for version in ("v1", "v2", "v3"):
+            self.assertEqual(
+                get_or_build_coalesced("pooled", lambda: version, tags=[CASES_TAG]), version,
+            )
+            self.assertNoAdvisoryLocks()
+            invalidate_tags(CASES_TAG)
+
+    def test_case_report_releases_its_lock(self):
+        case = Case.objects.create(
+            title="Pooled report",
+            description="Pooler fixture.",
+            crime_level=CrimeLevel.LEVEL_2,
+            creation_type=CaseCreationType.CRIME_SCENE,
+            status=CaseStatus.OPEN,
+            created_by=self.admin,
+        )
+        report = CaseReportingService.get_case_report(self.admin, case.pk)
+        self.assertEqual(report["case"]["id"], case.pk)
+        self.assertNoAdvisoryLocks()
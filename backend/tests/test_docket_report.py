@@ -0,0 +1,137 @@
+"""
+Integration tests — batch docket report (``POST /api/cases/docket-report/``).
+
+  * without ``case_ids`` the judge's own JUDICIARY queue is reported,
+    streamed as NDJSON in case order
+  * the query count does not grow with the number of cases
+  * unknown ids get a ``detail`` line; cached reports are reused
+  * users without the report permission are refused with 403
+"""
+
+from __future__ import annotations
+
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import Role
+from cases.models import Case, CaseCreationType, CaseStatus, CrimeLevel
+from cases.services import CaseReportingService
+from evidence.models import Evidence, EvidenceType
+from suspects.models import Suspect, SuspectStatus
+
+User = get_user_model()
+
+
+def _user(username: str, index: int, *, superuser: bool = True) -> User:
+    create = User.objects.create_superuser if superuser else User.objects.create_user
+    return create(
+        username=username,
+        password="D0cket!Rep99",
+        email=f"{username}@lapd.test",
+        phone_number=f"0913000400{index}",
+        national_id=f"960000000{index}",
+    )
+
+
+class TestDocketReport(TestCase):
+    """Batch reports built with a fixed number of queries and streamed."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        call_command("setup_rbac", verbosity=0)
+        cls.judge = _user("docket_judge", 1)
+        cls.other_judge = _user("docket_other", 2)
+        cls.citizen = _user("docket_citizen", 3, superuser=False)
+        cls.citizen.role = Role.objects.get(name="Base User")
+        cls.citizen.save(update_fields=["role"])
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def _case(
+        self, title: str, judge: User | None = None, case_status: str = CaseStatus.JUDICIARY,
+    ) -> Case:
+        case = Case.objects.create(
+            title=title,
+            description="Docket fixture.",
+            crime_level=CrimeLevel.LEVEL_1,
+            creation_type=CaseCreationType.CRIME_SCENE,
+            status=case_status,
+            created_by=self.judge,
+            assigned_judge=judge or self.judge,
+        )
+        Suspect.objects.create(
+            case=case, full_name=f"Suspect of {title}",
+            status=SuspectStatus.UNDER_TRIAL, identified_by=self.judge,
+        )
+        Evidence.objects.create(
+            case=case, evidence_type=EvidenceType.OTHER, title=f"Exhibit of {title}",
+            description="Docket exhibit.", registered_by=self.judge,
+        )
+        return case
+
+    def _stream(self, user: User, body: dict) -> list[dict]:
+        client = APIClient()
+        client.force_authenticate(user=user)
+        response = client.post(reverse("case-docket-report"), body, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        return [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+
+    def test_judiciary_queue_is_streamed(self):
+        mine = [self._case("Docket A"), self._case("Docket B")]
+        self._case("Someone else's", judge=self.other_judge)
+        self._case("Not yet at court", case_status=CaseStatus.INVESTIGATION)
+
+        lines = self._stream(self.judge, {})
+
+        self.assertEqual([line["id"] for line in lines], [c.pk for c in mine])
+        self.assertEqual(
+            lines[0]["report"],
+            CaseReportingService.get_case_report(self.judge, mine[0].pk),
+        )
+        self.assertEqual(
+            [s["full_name"] for s in lines[1]["report"]["suspects"]],
+            ["Suspect of Docket B"],
+        )
+
+    def test_query_count_is_independent_of_case_count(self):
+        def run(count: int) -> int:
+            cache.clear()
+            ids = [self._case(f"Bulk {count}-{i}").pk for i in range(count)]
+            with CaptureQueriesContext(connection) as ctx:
+                reports = list(CaseReportingService.iter_docket_reports(self.judge, ids))
+            self.assertEqual(len(reports), count)
+            return len(ctx.captured_queries)
+
+        self.assertEqual(run(2), run(8))
+
+    def test_unknown_ids_and_cached_reports(self):
+        case = self._case("Cached")
+        CaseReportingService.get_case_report(self.judge, case.pk)
+
+        with self.assertNumQueries(1):
+            lines = list(CaseReportingService.iter_docket_reports(
+                self.judge, [case.pk, case.pk + 1000],
+            ))
+
+        self.assertEqual(lines[0]["report"]["case"]["title"], "Cached")
+        self.assertEqual(
+            lines[1], {"id": case.pk + 1000, "detail": f"Case #{case.pk + 1000} not found."},
+        )
+
+    def test_requires_report_permission(self):
+        client = APIClient()
+        client.force_authenticate(user=self.citizen)
+        response = client.post(reverse("case-docket-report"), {}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,162 @@
+"""
+Integration tests — content-addressed, deduplicated evidence storage.
+
+``EvidenceBlobService`` (evidence/services.py) stores each distinct
+content once under its SHA-256 and reference-counts it:
+
+  * uploading identical media to two evidence items stores one blob
+  * deleting one reference keeps the content; the last one removes it
+  * re-uploading content whose deletion is still pending keeps it
+  * cascaded deletes (evidence item, case) release their blobs
+  * the SHA-256 is recorded in the custody log and chain-of-custody trail
+"""
+
+from __future__ import annotations
+
+import hashlib
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from cases.models import Case, CaseCreationType, CaseStatus, CrimeLevel
+from evidence.models import (
+    Evidence,
+    EvidenceBlob,
+    EvidenceCustodyLog,
+    EvidenceFile,
+    EvidenceType,
+)
+from evidence.services import EvidenceFileService, EvidenceProcessingService
+
+User = get_user_model()
+
+_MEDIA_ROOT = tempfile.mkdtemp(prefix="wp-dedup-tests-")
+_CLIP = b"\x00\x00\x00\x18ftypmp42" + b"cctv" * 500
+
+
+@override_settings(MEDIA_ROOT=_MEDIA_ROOT)
+class TestEvidenceDedupStorage(TestCase):
+    """Shared blobs for identical evidence media."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_superuser(
+            username="dedup_admin",
+            password="D3dup!Admin99",
+            email="dedup_admin@lapd.test",
+            phone_number="09130006001",
+            national_id="9400000001",
+            first_name="Dedup",
+            last_name="Admin",
+        )
+        case = Case.objects.create(
+            title="Dedup case",
+            description="Content-addressed storage fixture.",
+            crime_level=CrimeLevel.LEVEL_2,
+            creation_type=CaseCreationType.CRIME_SCENE,
+            status=CaseStatus.INVESTIGATION,
+            created_by=cls.admin,
+        )
+        cls.first, cls.second = (
+            Evidence.objects.create(
+                case=case,
+                evidence_type=EvidenceType.OTHER,
+                title=title,
+                registered_by=cls.admin,
+            )
+            for title in ("Clip on case A", "Clip on case B")
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        shutil.rmtree(_MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def _upload(self, evidence: Evidence) -> EvidenceFile:
+        response = self.client.post(
+            reverse("evidence-files", kwargs={"pk": evidence.pk}),
+            {
+                "file": SimpleUploadedFile("clip.mp4", _CLIP, content_type="video/mp4"),
+                "file_type": "video",
+            },
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        return EvidenceFile.objects.get(pk=response.data["id"])
+
+    def test_identical_uploads_share_one_blob(self):
+        a = self._upload(self.first)
+        b = self._upload(self.second)
+
+        blob = EvidenceBlob.objects.get()
+        self.assertEqual(blob.ref_count, 2)
+        self.assertEqual(blob.sha256, hashlib.sha256(_CLIP).hexdigest())
+        self.assertEqual(a.file.name, b.file.name)
+        self.assertTrue(a.file.name.endswith(".mp4"))
+
+        log = EvidenceCustodyLog.objects.filter(evidence=self.second).get()
+        self.assertIn(blob.sha256, log.notes)
+
+        trail = self.client.get(
+            reverse("evidence-chain-of-custody", kwargs={"pk": self.first.pk})
+        ).json()
+        self.assertTrue(any(blob.sha256 in entry["details"] for entry in trail))
+
+    def test_content_removed_only_with_last_reference(self):
+        a = self._upload(self.first)
+        b = self._upload(self.second)
+        name = a.file.name
+
+        with self.captureOnCommitCallbacks(execute=True):
+            EvidenceFileService.delete_file(a, self.admin)
+        self.assertEqual(EvidenceBlob.objects.get().ref_count, 1)
+        self.assertTrue(default_storage.exists(name))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            EvidenceFileService.delete_file(b, self.admin)
+        self.assertFalse(EvidenceBlob.objects.exists())
+        self.assertFalse(default_storage.exists(name))
+
+    def test_reupload_before_pending_delete_keeps_content(self):
+        a = self._upload(self.first)
+        name = a.file.name
+
+        with self.captureOnCommitCallbacks() as pending:
+            EvidenceFileService.delete_file(a, self.admin)
+        self.assertEqual(EvidenceBlob.objects.get().ref_count, 0)
+
+        b = self._upload(self.second)
+        for callback in pending:
+            callback()
+
+        blob = EvidenceBlob.objects.get()
+        self.assertEqual((blob.ref_count, b.file.name), (1, name))
+        self.assertTrue(default_storage.exists(name))
+
+    def test_deleting_evidence_releases_its_blobs(self):
+        self._upload(self.first)
+        self._upload(self.second)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            EvidenceProcessingService.delete_evidence(self.first, self.admin)
+        self.assertEqual(EvidenceBlob.objects.get().ref_count, 1)
+
+    def test_case_delete_cascade_releases_blobs(self):
+        name = self._upload(self.first).file.name
+        self._upload(self.second)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.first.case.delete()
+        self.assertFalse(EvidenceBlob.objects.exists())
+        self.assertFalse(default_storage.exists(name))
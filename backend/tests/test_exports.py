@@ -0,0 +1,121 @@
+"""
+Integration tests — streaming CSV / NDJSON exports (``core.domain.exports``).
+
+  * ``GET /api/cases/export/`` streams a CSV with a header row, applies
+    the case-list filters and the caller's scope
+  * ``GET /api/suspects/export/`` and ``GET /api/evidence/export/`` stream
+    NDJSON, one object per line
+  * an unknown ``export_format`` is refused with 400
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import Role
+from cases.models import Case, CaseComplainant, CaseCreationType, CaseStatus, CrimeLevel
+from evidence.models import Evidence, EvidenceType
+from suspects.models import Suspect, SuspectStatus
+
+User = get_user_model()
+
+
+def _user(username: str, index: int, *, superuser: bool = True) -> User:
+    create = User.objects.create_superuser if superuser else User.objects.create_user
+    return create(
+        username=username,
+        password="Exp0rt!Rows99",
+        email=f"{username}@lapd.test",
+        phone_number=f"0913000300{index}",
+        national_id=f"970000000{index}",
+    )
+
+
+class TestExports(TestCase):
+    """Filtered, scoped exports streamed from the list querysets."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        call_command("setup_rbac", verbosity=0)
+        cls.admin = _user("export_admin", 1)
+        cls.citizen = _user("export_citizen", 2, superuser=False)
+        cls.citizen.role = Role.objects.get(name="Base User")
+        cls.citizen.save(update_fields=["role"])
+        cls.cases = [
+            Case.objects.create(
+                title=f"Export case {i}",
+                description="Export fixture.",
+                crime_level=CrimeLevel.LEVEL_2,
+                creation_type=CaseCreationType.CRIME_SCENE,
+                status=case_status,
+                created_by=cls.admin,
+            )
+            for i, case_status in enumerate(
+                [CaseStatus.OPEN, CaseStatus.INVESTIGATION, CaseStatus.OPEN],
+            )
+        ]
+        CaseComplainant.objects.create(case=cls.cases[2], user=cls.citizen, is_primary=True)
+        cls.suspect = Suspect.objects.create(
+            case=cls.cases[1], full_name="Mae Kovac", national_id="9700000099",
+            status=SuspectStatus.WANTED, identified_by=cls.admin,
+        )
+        cls.evidence = Evidence.objects.create(
+            case=cls.cases[1], evidence_type=EvidenceType.OTHER,
+            title="Matchbook", description="From the Blue Room.", registered_by=cls.admin,
+        )
+
+    def _get(self, user: User, name: str, params: dict) -> str:
+        client = APIClient()
+        client.force_authenticate(user=user)
+        response = client.get(reverse(name), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertIn("attachment;", response["Content-Disposition"])
+        return b"".join(response.streaming_content).decode()
+
+    def test_case_csv_applies_filters(self):
+        body = self._get(self.admin, "case-export", {"status": CaseStatus.OPEN})
+
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(
+            [int(r["id"]) for r in rows], [self.cases[0].pk, self.cases[2].pk],
+        )
+        self.assertEqual(rows[0]["title"], "Export case 0")
+        self.assertEqual(rows[0]["created_by"], str(self.admin.pk))
+        self.assertEqual(rows[0]["assigned_detective"], "")
+
+    def test_case_export_respects_scope(self):
+        body = self._get(self.citizen, "case-export", {})
+
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual([int(r["id"]) for r in rows], [self.cases[2].pk])
+
+    def test_suspect_and_evidence_ndjson(self):
+        suspects = self._get(self.admin, "suspect-export", {"export_format": "ndjson"})
+        evidence = self._get(
+            self.admin, "evidence-export",
+            {"export_format": "ndjson", "case": self.cases[1].pk},
+        )
+
+        [suspect] = [json.loads(line) for line in suspects.splitlines()]
+        self.assertEqual(
+            (suspect["id"], suspect["case"], suspect["status"]),
+            (self.suspect.pk, self.cases[1].pk, SuspectStatus.WANTED),
+        )
+        [item] = [json.loads(line) for line in evidence.splitlines()]
+        self.assertEqual((item["id"], item["title"]), (self.evidence.pk, "Matchbook"))
+
+    def test_unknown_format_is_rejected(self):
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+        response = client.get(reverse("case-export"), {"export_format": "xlsx"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,161 @@
+"""
+Integration tests — thumbnail / preview variants of uploaded images.
+
+``core.domain.imaging`` renders variants out of band via the
+``generate_image_derivatives`` management command:
+
+  * suspect photos get a 240×240 ``thumb`` and a ≤1280 px ``preview``
+  * serializers and the dashboard use the variant, falling back to the
+    original until it is rendered
+  * the photo / evidence download endpoints serve ``?variant=``
+  * undecodable images are marked failed and not retried every run
+  * replacing a suspect photo resets its variants
+"""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+from datetime import timedelta
+from io import BytesIO, StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from cases.models import Case, CaseCreationType, CaseStatus, CrimeLevel
+from core.domain.imaging import FAILED_KEY, derivative_name
+from evidence.models import Evidence, EvidenceFile, EvidenceType, FileType
+from suspects.models import Suspect, SuspectStatus
+from suspects.services import SuspectProfileService
+
+User = get_user_model()
+
+_MEDIA_ROOT = tempfile.mkdtemp(prefix="wp-imaging-tests-")
+
+
+def _png(size: tuple[int, int] = (2000, 1500)) -> SimpleUploadedFile:
+    buffer = BytesIO()
+    Image.new("RGBA", size, (200, 30, 30, 128)).save(buffer, "PNG")
+    return SimpleUploadedFile("mugshot.png", buffer.getvalue(), content_type="image/png")
+
+
+@override_settings(MEDIA_ROOT=_MEDIA_ROOT)
+class TestImageDerivatives(TestCase):
+    """Derivative rendering, exposure and invalidation."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_superuser(
+            username="imaging_admin",
+            password="Im@ging!Admin99",
+            email="imaging_admin@lapd.test",
+            phone_number="09130005001",
+            national_id="9500000001",
+        )
+        cls.case = Case.objects.create(
+            title="Imaging case",
+            description="Derivative fixture.",
+            crime_level=CrimeLevel.LEVEL_1,
+            creation_type=CaseCreationType.CRIME_SCENE,
+            status=CaseStatus.INVESTIGATION,
+            created_by=cls.admin,
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        shutil.rmtree(_MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+        self.suspect = Suspect.objects.create(
+            case=self.case, full_name="Earle Tierney", national_id="9510000001",
+            status=SuspectStatus.WANTED, photo=_png(), identified_by=self.admin,
+        )
+        Suspect.objects.filter(pk=self.suspect.pk).update(
+            wanted_since=timezone.now() - timedelta(days=40),
+        )
+
+    def _generate(self) -> str:
+        out = StringIO()
+        call_command("generate_image_derivatives", stdout=out)
+        self.suspect.refresh_from_db()
+        return out.getvalue()
+
+    def test_command_renders_variants(self):
+        self._generate()
+
+        derivatives = self.suspect.photo_derivatives
+        self.assertEqual(
+            derivatives["thumb"], derivative_name(self.suspect.photo.name, "thumb"),
+        )
+        with default_storage.open(derivatives["thumb"]) as fh:
+            thumb = Image.open(fh)
+            self.assertEqual((thumb.format, thumb.size), ("JPEG", (240, 240)))
+        with default_storage.open(derivatives["preview"]) as fh:
+            self.assertEqual(Image.open(fh).size, (1280, 960))
+
+    def test_serializers_fall_back_until_rendered(self):
+        url = reverse("suspect-most-wanted")
+        before = self.client.get(url).json()[0]
+        self.assertEqual(before["photo_thumbnail"], before["photo"])
+
+        self._generate()
+        after = self.client.get(url).json()[0]
+        self.assertTrue(after["photo_thumbnail"].endswith(self.suspect.photo_derivatives["thumb"]))
+        self.assertTrue(after["photo_preview"].endswith(self.suspect.photo_derivatives["preview"]))
+
+        dashboard = self.client.get(reverse("core:dashboard-stats")).json()
+        self.assertTrue(
+            dashboard["top_wanted_suspects"][0]["photo_url"].endswith(".jpg"),
+        )
+
+    def test_photo_endpoint_serves_variant(self):
+        self._generate()
+        url = reverse("suspect-photo", kwargs={"pk": self.suspect.pk})
+
+        response = self.client.get(url, {"variant": "thumb"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "image/jpeg")
+
+        bad = self.client.get(url, {"variant": "poster"})
+        self.assertEqual(bad.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_undecodable_evidence_image_is_marked_failed(self):
+        evidence = Evidence.objects.create(
+            case=self.case, evidence_type=EvidenceType.OTHER,
+            title="Blurry still", registered_by=self.admin,
+        )
+        broken = EvidenceFile.objects.create(
+            evidence=evidence, file_type=FileType.IMAGE,
+            file=SimpleUploadedFile("still.jpg", b"not really a jpeg"),
+        )
+
+        self.assertIn("failed=1", self._generate())
+        broken.refresh_from_db()
+        self.assertIn(FAILED_KEY, broken.file_derivatives)
+        self.assertIn("failed=0", self._generate())
+
+        files = self.client.get(reverse("evidence-files", kwargs={"pk": evidence.pk})).json()
+        self.assertIsNone(files[0]["thumbnail_url"])
+
+    def test_replacing_photo_resets_variants(self):
+        self._generate()
+        old_thumb = self.suspect.photo_derivatives["thumb"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            SuspectProfileService.update_suspect(
+                self.suspect, {"photo": _png((640, 480))}, self.admin,
+            )
+        self.suspect.refresh_from_db()
+        self.assertEqual(self.suspect.photo_derivatives, {})
+        self.assertFalse(default_storage.exists(old_thumb))
@@ -0,0 +1,171 @@
+"""
+Integration tests — serializer-declared query shapes for list endpoints.
+
+Each list serializer declares a ``Meta.query_shape`` and the owning
+service applies it via ``core.domain.projection``.  These tests pin:
+
+  * the number of SQL queries per list request does not grow with the
+    number of rows (no per-row FK or deferred-column loads),
+  * the payload still contains the related display values, and
+  * the polymorphic evidence list (``include_details``) loads each
+    child table at most once per page.
+"""
+
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from cases.models import Case, CaseCreationType, CaseStatus, CrimeLevel
+from evidence.models import (
+    BiologicalEvidence,
+    Evidence,
+    EvidenceType,
+    IdentityEvidence,
+    TestimonyEvidence,
+    VehicleEvidence,
+)
+from suspects.models import Suspect, SuspectStatus
+
+User = get_user_model()
+
+
+class TestListQueryShapes(TestCase):
+    """Query counts for the case, evidence and suspect list endpoints."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_superuser(
+            username="shape_admin",
+            password="Sh@pe!Admin99",
+            email="shape_admin@lapd.test",
+            phone_number="09130009001",
+            national_id="9100000001",
+            first_name="Shape",
+            last_name="Admin",
+        )
+        cls.detective = User.objects.create_user(
+            username="shape_detective",
+            password="Sh@pe!Det99",
+            email="shape_det@lapd.test",
+            phone_number="09130009002",
+            national_id="9100000002",
+            first_name="Cole",
+            last_name="Phelps",
+        )
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def _seed(self, count: int) -> None:
+        """Create *count* cases, each with one evidence item and one suspect."""
+        start = Case.objects.count()
+        for i in range(start, start + count):
+            case = Case.objects.create(
+                title=f"Shape case {i}",
+                description="Query shape fixture.",
+                crime_level=CrimeLevel.LEVEL_2,
+                creation_type=CaseCreationType.CRIME_SCENE,
+                status=CaseStatus.INVESTIGATION,
+                created_by=self.admin,
+                assigned_detective=self.detective,
+            )
+            Evidence.objects.create(
+                case=case,
+                evidence_type=EvidenceType.OTHER,
+                title=f"Shape evidence {i}",
+                registered_by=self.detective,
+            )
+            Suspect.objects.create(
+                case=case,
+                full_name=f"Shape suspect {i}",
+                national_id=f"91200000{i:02d}",
+                status=SuspectStatus.WANTED,
+                identified_by=self.detective,
+            )
+
+    def _count_queries(self, url: str) -> tuple[int, list]:
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(ctx.captured_queries), response.json()
+
+    def _assert_constant(self, url_name: str) -> list:
+        url = reverse(url_name)
+        self._seed(2)
+        small, _ = self._count_queries(url)
+        self._seed(6)
+        large, data = self._count_queries(url)
+        self.assertEqual(small, large)
+        self.assertEqual(len(data), 8)
+        return data
+
+    def test_case_list_queries_do_not_scale_with_rows(self):
+        data = self._assert_constant("case-list")
+        self.assertEqual(data[0]["assigned_detective_name"], "Cole Phelps")
+        self.assertIn("complainant_count", data[0])
+
+    def test_evidence_list_queries_do_not_scale_with_rows(self):
+        data = self._assert_constant("evidence-list")
+        self.assertEqual(data[0]["registered_by_name"], "Cole Phelps")
+        self.assertIsInstance(data[0]["case"], int)
+
+    def test_suspect_list_queries_do_not_scale_with_rows(self):
+        data = self._assert_constant("suspect-list")
+        self.assertEqual(data[0]["identified_by_name"], "Cole Phelps")
+        self.assertTrue(data[0]["case_title"].startswith("Shape case"))
+
+    def test_polymorphic_evidence_list_loads_each_subtype_once(self):
+        case = Case.objects.create(
+            title="Polymorphic case",
+            description="Query shape fixture.",
+            crime_level=CrimeLevel.LEVEL_2,
+            creation_type=CaseCreationType.CRIME_SCENE,
+            status=CaseStatus.INVESTIGATION,
+            created_by=self.admin,
+        )
+        common = {"case": case, "registered_by": self.detective}
+        for i in range(3):
+            TestimonyEvidence.objects.create(
+                evidence_type=EvidenceType.TESTIMONY, title=f"T{i}",
+                statement_text=f"Statement {i}", **common,
+            )
+            BiologicalEvidence.objects.create(
+                evidence_type=EvidenceType.BIOLOGICAL, title=f"B{i}",
+                forensic_result="Type O", **common,
+            )
+            VehicleEvidence.objects.create(
+                evidence_type=EvidenceType.VEHICLE, title=f"V{i}",
+                vehicle_model="Sedan", color="Black",
+                license_plate=f"PLATE-{i}", **common,
+            )
+            IdentityEvidence.objects.create(
+                evidence_type=EvidenceType.IDENTITY, title=f"I{i}",
+                owner_full_name=f"Owner {i}",
+                document_details={"issuer": "LAPD"}, **common,
+            )
+            Evidence.objects.create(
+                evidence_type=EvidenceType.OTHER, title=f"O{i}", **common,
+            )
+
+        url = reverse("evidence-list") + "?include_details=true"
+        queries, data = self._count_queries(url)
+        self.assertLessEqual(queries, 5)
+        self.assertEqual(len(data), 15)
+
+        by_title = {item["title"]: item["details"] for item in data}
+        self.assertEqual(by_title["T0"], {"statement_text": "Statement 0"})
+        self.assertEqual(by_title["B1"]["forensic_result"], "Type O")
+        self.assertIsNone(by_title["B1"]["verified_by"])
+        self.assertEqual(by_title["V2"]["license_plate"], "PLATE-2")
+        self.assertEqual(by_title["I0"]["document_details"], {"issuer": "LAPD"})
+        self.assertEqual(by_title["O0"], {})
+
+        plain = self.client.get(reverse("evidence-list")).json()
+        self.assertNotIn("details", plain[0])
@@ -0,0 +1,175 @@
+"""
+Integration tests — permission-checked media delivery.
+
+Covers ``GET /api/evidence/{id}/files/{file_id}/download/`` and
+``GET /api/suspects/{id}/photo/`` (core/domain/media.py):
+
+  * full download, single byte range (206), unsatisfiable range (416)
+  * ``If-None-Match`` revalidation (304)
+  * ``X-Accel-Redirect`` offload mode
+  * permission and scope checks (403 / 404)
+  * most-wanted suspect photos are visible to any authenticated user
+"""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from cases.models import Case, CaseCreationType, CaseStatus, CrimeLevel
+from evidence.models import Evidence, EvidenceFile, EvidenceType, FileType
+from suspects.models import Suspect, SuspectStatus
+
+User = get_user_model()
+
+_MEDIA_ROOT = tempfile.mkdtemp(prefix="wp-media-tests-")
+_PAYLOAD = bytes(range(256)) * 40  # 10 240 bytes
+
+
+@override_settings(MEDIA_ROOT=_MEDIA_ROOT)
+class TestMediaDelivery(TestCase):
+    """Streaming, range and conditional delivery of protected media."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_superuser(
+            username="media_admin",
+            password="M3dia!Admin99",
+            email="media_admin@lapd.test",
+            phone_number="09130008001",
+            national_id="9200000001",
+            first_name="Media",
+            last_name="Admin",
+        )
+        cls.outsider = User.objects.create_user(
+            username="media_outsider",
+            password="M3dia!Out99",
+            email="media_out@lapd.test",
+            phone_number="09130008002",
+            national_id="9200000002",
+        )
+        cls.case = Case.objects.create(
+            title="Media case",
+            description="Media delivery fixture.",
+            crime_level=CrimeLevel.LEVEL_1,
+            creation_type=CaseCreationType.CRIME_SCENE,
+            status=CaseStatus.INVESTIGATION,
+            created_by=cls.admin,
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        shutil.rmtree(_MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+        evidence = Evidence.objects.create(
+            case=self.case,
+            evidence_type=EvidenceType.OTHER,
+            title="CCTV clip",
+            registered_by=self.admin,
+        )
+        self.evidence_file = EvidenceFile.objects.create(
+            evidence=evidence,
+            file=SimpleUploadedFile("clip.mp4", _PAYLOAD, content_type="video/mp4"),
+            file_type=FileType.VIDEO,
+        )
+        self.url = reverse(
+            "evidence-file-download",
+            kwargs={"pk": evidence.pk, "file_id": self.evidence_file.pk},
+        )
+
+    @staticmethod
+    def _body(response) -> bytes:
+        return b"".join(response.streaming_content)
+
+    def test_full_download_streams_content_with_etag(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._body(response), _PAYLOAD)
+        self.assertEqual(response["Content-Type"], "video/mp4")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertTrue(response["ETag"].startswith('"'))
+
+    def test_range_request_returns_partial_content(self):
+        response = self.client.get(self.url, HTTP_RANGE="bytes=100-199")
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(response["Content-Range"], f"bytes 100-199/{len(_PAYLOAD)}")
+        self.assertEqual(self._body(response), _PAYLOAD[100:200])
+
+        suffix = self.client.get(self.url, HTTP_RANGE="bytes=-16")
+        self.assertEqual(self._body(suffix), _PAYLOAD[-16:])
+
+    def test_unsatisfiable_range_returns_416(self):
+        response = self.client.get(self.url, HTTP_RANGE=f"bytes={len(_PAYLOAD)}-")
+        self.assertEqual(response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+        self.assertEqual(response["Content-Range"], f"bytes */{len(_PAYLOAD)}")
+
+    def test_if_none_match_returns_304(self):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_stale_if_range_ignores_range(self):
+        response = self.client.get(
+            self.url, HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE='"stale"',
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(
+        MEDIA_DELIVERY_OFFLOAD="x-accel-redirect",
+        MEDIA_ACCEL_REDIRECT_PREFIX="/protected-media/",
+    )
+    def test_x_accel_redirect_offload(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response["X-Accel-Redirect"],
+            f"/protected-media/{self.evidence_file.file.name}",
+        )
+        self.assertEqual(response.content, b"")
+
+    def test_user_without_permission_is_denied(self):
+        self.client.force_authenticate(user=self.outsider)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_file_list_exposes_download_url(self):
+        url = reverse("evidence-files", kwargs={"pk": self.evidence_file.evidence_id})
+        data = self.client.get(url).json()
+        self.assertEqual(data[0]["download_url"], self.url)
+
+    def test_suspect_photo_scope_and_most_wanted(self):
+        photo = SimpleUploadedFile("face.jpg", b"\xff\xd8jpeg-bytes", content_type="image/jpeg")
+        recent = Suspect.objects.create(
+            case=self.case, full_name="Recent", national_id="9210000001",
+            status=SuspectStatus.WANTED, photo=photo, identified_by=self.admin,
+        )
+        wanted = Suspect.objects.create(
+            case=self.case, full_name="Long wanted", national_id="9210000002",
+            status=SuspectStatus.WANTED, photo=photo, identified_by=self.admin,
+        )
+        Suspect.objects.filter(pk=wanted.pk).update(
+            wanted_since=timezone.now() - timedelta(days=45),
+        )
+
+        response = self.client.get(reverse("suspect-photo", kwargs={"pk": recent.pk}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "image/jpeg")
+
+        self.client.force_authenticate(user=self.outsider)
+        hidden = self.client.get(reverse("suspect-photo", kwargs={"pk": recent.pk}))
+        self.assertEqual(hidden.status_code, status.HTTP_404_NOT_FOUND)
+        public = self.client.get(reverse("suspect-photo", kwargs={"pk": wanted.pk}))
+        self.assertEqual(public.status_code, status.HTTP_200_OK)
@@ -0,0 +1,84 @@
+"""
+Integration tests — pre-generated OpenAPI schema (``GET /api/schema/``).
+
+  * ``generate_openapi_schema`` writes the artifact the view then serves
+    without introspecting the API
+  * without an artifact the schema is generated once and memoised
+  * the format is negotiated (YAML by default, JSON on request) and each
+    format has its own strong ETag; ``If-None-Match`` returns ``304``
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.domain import openapi
+from core.domain.openapi import clear_schema_cache
+
+
+class TestOpenAPISchema(TestCase):
+    """The schema is generated ahead of time and served with an ETag."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "openapi.json"
+
+        settings_override = override_settings(OPENAPI_SCHEMA_FILE=self.path)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        clear_schema_cache()
+        self.addCleanup(clear_schema_cache)
+        self.client = APIClient()
+        self.url = reverse("schema")
+
+    def test_command_writes_the_served_artifact(self):
+        out = StringIO()
+        call_command("generate_openapi_schema", stdout=out)
+        self.assertIn(str(self.path), out.getvalue())
+        artifact = json.loads(self.path.read_bytes())
+        self.assertIn("/api/core/constants/", artifact["paths"])
+
+        with patch.object(openapi, "generate_schema", side_effect=AssertionError):
+            response = self.client.get(self.url, {"format": "json"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/vnd.oai.openapi+json")
+        self.assertEqual(json.loads(response.content), artifact)
+
+    def test_missing_artifact_is_generated_once(self):
+        with patch.object(openapi, "generate_schema", wraps=openapi.generate_schema) as generate:
+            self.client.get(self.url)
+            self.client.get(self.url, {"format": "json"})
+            self.client.get(self.url)
+
+        self.assertEqual(generate.call_count, 1)
+
+    def test_etag_per_format(self):
+        yaml_response = self.client.get(self.url)
+        json_response = self.client.get(self.url, HTTP_ACCEPT="application/json")
+
+        self.assertEqual(yaml_response["Content-Type"], "application/vnd.oai.openapi")
+        self.assertEqual(json_response["Content-Type"], "application/json")
+        self.assertNotEqual(yaml_response["ETag"], json_response["ETag"])
+        self.assertIn("no-cache", yaml_response["Cache-Control"])
+
+        cached = self.client.get(self.url, HTTP_IF_NONE_MATCH=yaml_response["ETag"])
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(cached.content, b"")
+
+        stale = self.client.get(
+            self.url, HTTP_ACCEPT="application/json", HTTP_IF_NONE_MATCH=yaml_response["ETag"],
+        )
+        self.assertEqual(stale.status_code, status.HTTP_200_OK)
@@ -0,0 +1,142 @@
+"""
+Integration tests — read-replica routing (``core.domain.replicas``).
+
+The ``replica`` alias is a test mirror of ``default`` added by
+``conftest.py``: a second connection to the same test database, so
+queries can be attributed to either alias.  ``TransactionTestCase`` is
+used because the replica connection cannot see rows inside another
+connection's transaction.
+
+  * reads inside ``read_replica()`` use the replica; other reads,
+    writes and reads inside ``transaction.atomic`` use the primary
+  * list endpoints read from the replica; cached results (search,
+    dashboard) are built from the primary
+  * a user who wrote reads from the primary until the pin expires
+  * migrations never target the replica
+  * without a replica alias everything stays on the primary, unpinned
+"""
+
+from __future__ import annotations
+
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connections, router, transaction
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from cases.models import Case, CaseCreationType, CaseStatus, CrimeLevel
+from core.cache import CASES_TAG, get_or_build
+from core.domain.replicas import REPLICA_DB_ALIAS, _sticky_key, read_replica
+
+User = get_user_model()
+
+
+class TestReplicaRouting(TransactionTestCase):
+    """Routing decisions of ``ReplicaRouter``."""
+
+    databases = {"default", REPLICA_DB_ALIAS}
+
+    def setUp(self) -> None:
+        self.admin = User.objects.create_superuser(
+            username="replica_admin",
+            password="R3plica!Reads99",
+            email="replica_admin@lapd.test",
+            phone_number="09130100001",
+            national_id="9000000001",
+        )
+        self.case = Case.objects.create(
+            title="Replicated case",
+            description="Replica fixture.",
+            crime_level=CrimeLevel.LEVEL_2,
+            creation_type=CaseCreationType.CRIME_SCENE,
+            status=CaseStatus.INVESTIGATION,
+            created_by=self.admin,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def assertReadsFrom(self, alias: str, func) -> None:
+        other = "default" if alias == REPLICA_DB_ALIAS else REPLICA_DB_ALIAS
+        with CaptureQueriesContext(connections[alias]) as used, \
+                CaptureQueriesContext(connections[other]) as unused:
+            func()
+        self.assertGreater(len(used), 0)
+        self.assertEqual(len(unused), 0, [q["sql"] for q in unused])
+
+    def test_only_marked_reads_use_the_replica(self):
+        def marked() -> None:
+            with read_replica():
+                self.assertEqual(Case.objects.get(pk=self.case.pk).title, "Replicated case")
+
+        self.assertReadsFrom(REPLICA_DB_ALIAS, marked)
+        self.assertReadsFrom("default", lambda: Case.objects.count())
+
+    def test_writes_and_transactions_use_the_primary(self):
+        def write() -> None:
+            with read_replica():
+                Case.objects.filter(pk=self.case.pk).update(location="Hollywood")
+
+        def locked_read() -> None:
+            with transaction.atomic(), read_replica():
+                Case.objects.select_for_update().get(pk=self.case.pk)
+                Case.objects.count()
+
+        self.assertReadsFrom("default", write)
+        self.assertReadsFrom("default", locked_read)
+
+    def test_endpoints_read_from_the_replica(self):
+        with CaptureQueriesContext(connections[REPLICA_DB_ALIAS]) as replica:
+            listing = self.client.get(reverse("case-list"))
+
+        self.assertEqual(listing.status_code, status.HTTP_200_OK)
+        self.assertEqual(listing.data[0]["id"], self.case.pk)
+        self.assertGreater(len(replica), 0)
+
+    def test_cached_results_are_built_from_the_primary(self):
+        def build() -> None:
+            with read_replica():
+                get_or_build("replica-probe", lambda: Case.objects.count(), tags=[CASES_TAG])
+
+        self.assertReadsFrom("default", build)
+        self.assertReadsFrom("default", lambda: self.client.get(reverse("core:dashboard-stats")))
+
+    def test_writer_reads_own_writes_from_the_primary(self):
+        response = self.client.patch(
+            reverse("case-detail", args=[self.case.pk]), {"title": "Renamed"}, format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with CaptureQueriesContext(connections[REPLICA_DB_ALIAS]) as replica:
+            listing = self.client.get(reverse("case-list"))
+        self.assertEqual(listing.data[0]["title"], "Renamed")
+        self.assertEqual(len(replica), 0)
+
+        cache.clear()  # the pin expires
+        with CaptureQueriesContext(connections[REPLICA_DB_ALIAS]) as replica:
+            self.client.get(reverse("case-list"))
+        self.assertGreater(len(replica), 0)
+
+    def test_migrations_skip_the_replica(self):
+        self.assertFalse(router.allow_migrate(REPLICA_DB_ALIAS, "cases"))
+        self.assertTrue(router.allow_migrate("default", "cases"))
+
+    def test_without_replica_alias_reads_stay_on_primary(self):
+        with mock.patch.dict(settings.DATABASES):
+            del settings.DATABASES[REPLICA_DB_ALIAS]
+
+            def marked() -> None:
+                with read_replica():
+                    Case.objects.count()
+
+            self.assertReadsFrom("default", marked)
+            response = self.client.patch(
+                reverse("case-detail", args=[self.case.pk]), {"title": "Renamed"}, format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(cache.get(_sticky_key(self.admin.pk)))
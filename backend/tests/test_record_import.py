@@ -0,0 +1,205 @@
+"""
+Integration tests — bulk import of historical records (``import_records``).
+
+  * nested NDJSON case records create complainants, witnesses, suspects,
+    evidence subtypes, their logs and the case counters
+  * invalid rows are reported with their line and skipped; the rest of
+    the batch is written
+  * standalone CSV suspect records attach to existing cases
+  * imports send no notifications and the query count does not grow
+    with the number of rows
+  * historical ``created_at`` / ``wanted_since`` values are kept
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+from datetime import datetime, timezone as dt_timezone
+from tempfile import NamedTemporaryFile
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from cases.models import Case, CaseCreationType, CaseStatus, CaseStatusLog, CrimeLevel
+from core.models import Notification
+from core.services import RecordImportService
+from evidence.models import (
+    BiologicalEvidence,
+    EvidenceCustodyLog,
+    IdentityEvidence,
+    VehicleEvidence,
+)
+from suspects.models import Suspect, SuspectStatus, SuspectStatusLog
+
+User = get_user_model()
+
+
+def _user(username: str, index: int) -> User:
+    return User.objects.create_superuser(
+        username=username,
+        password="Imp0rt!Legacy99",
+        email=f"{username}@lapd.test",
+        phone_number=f"0913000200{index}",
+        national_id=f"980000000{index}",
+    )
+
+
+def _case_record(title: str, **extra) -> dict:
+    return {
+        "title": title,
+        "description": "Legacy record.",
+        "crime_level": CrimeLevel.LEVEL_2,
+        "creation_type": CaseCreationType.CRIME_SCENE,
+        "status": CaseStatus.CLOSED,
+        **extra,
+    }
+
+
+def _ndjson(*records: dict) -> io.StringIO:
+    return io.StringIO("".join(json.dumps(r) + "\n" for r in records))
+
+
+class TestRecordImport(TestCase):
+    """Batch validation and bulk writes of the legacy importer."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = _user("import_admin", 1)
+        cls.detective = _user("import_detective", 2)
+
+    def _import(self, stream, kind: str = "cases", fmt: str = "ndjson", **kwargs):
+        return RecordImportService.import_stream(
+            stream, fmt=fmt, kind=kind, actor=self.admin, **kwargs,
+        )
+
+    def test_nested_case_record(self):
+        report = self._import(_ndjson(_case_record(
+            "Black Dahlia",
+            assigned_detective="import_detective",
+            complainants=["import_detective", "import_admin"],
+            witnesses=[{"full_name": "Ann Toth", "phone_number": "09120000001", "national_id": "1111111111"}],
+            suspects=[
+                {"full_name": "Leslie Dillon", "status": SuspectStatus.ACQUITTED},
+                {"full_name": "George Hodel"},
+            ],
+            evidence=[
+                {"evidence_type": "vehicle", "title": "Sedan", "vehicle_model": "Packard", "color": "Black", "license_plate": "7B-1947"},
+                {"evidence_type": "biological", "title": "Hair", "forensic_result": "Match", "is_verified": True},
+                {"evidence_type": "identity", "title": "Licence", "owner_full_name": "Elizabeth Short", "document_details": {"state": "CA"}},
+                {"evidence_type": "other", "title": "Handbag"},
+            ],
+        )))
+
+        self.assertEqual((report.imported, report.failed), (1, 0))
+        case = Case.objects.get(title="Black Dahlia")
+        self.assertEqual(
+            (case.status, case.created_by, case.assigned_detective),
+            (CaseStatus.CLOSED, self.admin, self.detective),
+        )
+        self.assertEqual(
+            (case.complainant_count, case.witness_count, case.suspect_count,
+             case.suspects_at_trial_count, case.evidence_count),
+            (2, 1, 2, 1, 4),
+        )
+        self.assertEqual(case.complainants.get(is_primary=True).user, self.detective)
+        self.assertEqual(VehicleEvidence.objects.get(case=case).license_plate, "7B-1947")
+        self.assertTrue(BiologicalEvidence.objects.get(case=case).is_verified)
+        self.assertEqual(IdentityEvidence.objects.get(case=case).document_details, {"state": "CA"})
+        self.assertEqual(CaseStatusLog.objects.get(case=case).to_status, CaseStatus.CLOSED)
+        self.assertEqual(SuspectStatusLog.objects.filter(suspect__case=case).count(), 2)
+        self.assertEqual(EvidenceCustodyLog.objects.filter(evidence__case=case).count(), 4)
+        self.assertFalse(Notification.objects.exists())
+
+    def test_invalid_rows_are_reported_and_skipped(self):
+        stream = io.StringIO(
+            json.dumps(_case_record("Good")) + "\n"
+            + "{not json\n"
+            + json.dumps(_case_record("Bad", crime_level=9, created_by="nobody")) + "\n"
+            + json.dumps(_case_record("Bad plate", evidence=[
+                {"evidence_type": "vehicle", "title": "Car", "vehicle_model": "Ford", "color": "Red"},
+            ])) + "\n"
+        )
+        report = self._import(stream)
+
+        self.assertEqual((report.imported, report.failed), (1, 3))
+        self.assertEqual([line for line, _ in report.errors][:1], [2])
+        messages = " ".join(message for _, message in report.errors)
+        self.assertIn("crime_level", messages)
+        self.assertIn("Unknown user 'nobody'", messages)
+        self.assertIn("license plate or a serial number", messages)
+        self.assertEqual(list(Case.objects.values_list("title", flat=True)), ["Good"])
+
+    def test_standalone_csv_suspects(self):
+        case = Case.objects.create(
+            title="Existing", description="Existing case.", crime_level=CrimeLevel.LEVEL_1,
+            creation_type=CaseCreationType.CRIME_SCENE, status=CaseStatus.INVESTIGATION,
+            created_by=self.admin,
+        )
+        csv_text = (
+            "case,full_name,national_id,status\n"
+            f"{case.pk},Mickey Cohen,1234567890,under_trial\n"
+            f"{case.pk + 1000},Jack Dragna,1234567891,wanted\n"
+        )
+        report = self._import(io.StringIO(csv_text), kind="suspects", fmt="csv")
+
+        self.assertEqual((report.imported, report.failed), (1, 1))
+        self.assertIn("does not exist", report.errors[0][1])
+        suspect = Suspect.objects.get(case=case)
+        self.assertEqual((suspect.status, suspect.identified_by), (SuspectStatus.UNDER_TRIAL, self.admin))
+        case.refresh_from_db()
+        self.assertEqual((case.suspect_count, case.suspects_at_trial_count), (1, 1))
+
+    def test_query_count_is_independent_of_row_count(self):
+        def run(count: int) -> int:
+            records = [
+                _case_record(f"Bulk {count}-{i}", suspects=[{"full_name": "Anon"}])
+                for i in range(count)
+            ]
+            with CaptureQueriesContext(connection) as ctx:
+                self._import(_ndjson(*records), batch_size=100)
+            return len(ctx.captured_queries)
+
+        self.assertEqual(run(2), run(20))
+
+    def test_historical_timestamps_are_kept(self):
+        opened = datetime(2019, 3, 1, tzinfo=dt_timezone.utc)
+        wanted = datetime(2019, 4, 1, tzinfo=dt_timezone.utc)
+        report = self._import(_ndjson(
+            _case_record(
+                "Cold case", created_at=opened.isoformat(),
+                suspects=[
+                    {"full_name": "Long Gone", "status": SuspectStatus.WANTED, "wanted_since": wanted.isoformat()},
+                    {"full_name": "Since Opening", "created_at": opened.isoformat()},
+                ],
+                evidence=[{"evidence_type": "other", "title": "Letter", "created_at": opened.isoformat()}],
+            ),
+            _case_record("Future", created_at="2999-01-01T00:00:00Z"),
+        ))
+
+        self.assertEqual((report.imported, report.failed), (1, 1))
+        self.assertIn("created_at: Cannot be in the future.", report.errors[0][1])
+        case = Case.objects.get(title="Cold case")
+        self.assertEqual(case.created_at, opened)
+        self.assertEqual(case.evidences.get().created_at, opened)
+        self.assertEqual(
+            dict(Suspect.objects.filter(case=case).values_list("full_name", "wanted_since")),
+            {"Long Gone": wanted, "Since Opening": opened},
+        )
+        self.assertGreater(Suspect.objects.get(full_name="Long Gone").days_wanted, 30)
+
+    def test_command_dry_run_writes_nothing(self):
+        with NamedTemporaryFile("w", suffix=".ndjson", delete=False) as fh:
+            fh.write(json.dumps(_case_record("Dry")) + "\n")
+        self.addCleanup(os.unlink, fh.name)
+        out = io.StringIO()
+        call_command(
+            "import_records", fh.name, "--kind", "cases", "--actor", "import_admin",
+            "--dry-run", stdout=out,
+        )
+        self.assertIn("imported=1 failed=0", out.getvalue())
+        self.assertFalse(Case.objects.exists())
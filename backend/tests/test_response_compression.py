@@ -0,0 +1,131 @@
+"""
+Integration tests — JSON rendering and response compression
+(``core.domain.renderers`` / ``core.domain.compression``).
+
+  * ``FastJSONRenderer`` matches ``JSONRenderer`` for datetimes,
+    Decimals, lazy strings and line separators (with or without orjson)
+  * large JSON responses are gzip-compressed when accepted; small ones,
+    and clients that do not accept gzip, get identity bodies
+  * ``Accept-Encoding`` q-values are honoured
+  * ETags are weakened and still answer ``If-None-Match`` with 304
+  * streamed NDJSON exports are compressed chunk by chunk
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import unittest
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from cases.models import Case, CaseCreationType, CaseStatus, CrimeLevel
+from core.domain import compression, renderers
+from core.domain.compression import accepted_encoding
+from core.domain.renderers import FastJSONRenderer
+
+User = get_user_model()
+
+_SAMPLE = {
+    "reward_amount": Decimal("200000000.00"),
+    "amount": Decimal("1.5"),
+    "created_at": datetime(2026, 3, 1, 22, 30, 15, 123456, tzinfo=dt_timezone.utc),
+    "label": gettext_lazy("Open"),
+    "text": "line\u2028separator",
+    "nested": [{"id": 1, "ok": True, "none": None}],
+}
+
+
+class TestFastJSONRenderer(SimpleTestCase):
+    """Output is interchangeable with DRF's ``JSONRenderer``."""
+
+    def test_matches_json_renderer(self):
+        self.assertEqual(FastJSONRenderer().render(_SAMPLE), JSONRenderer().render(_SAMPLE))
+
+    @unittest.skipUnless(renderers.orjson, "orjson is not installed")
+    def test_orjson_matches_json_renderer(self):
+        self.test_matches_json_renderer()
+
+    def test_indent_is_honoured(self):
+        body = FastJSONRenderer().render({"a": 1}, "application/json; indent=2")
+        self.assertEqual(body, b'{\n  "a": 1\n}')
+
+
+class TestAcceptedEncoding(SimpleTestCase):
+    """``Accept-Encoding`` negotiation."""
+
+    def test_negotiation(self):
+        self.assertEqual(accepted_encoding("gzip, deflate"), "gzip")
+        self.assertEqual(accepted_encoding("*"), "gzip" if compression.brotli is None else "br")
+        self.assertIsNone(accepted_encoding("gzip;q=0, identity"))
+        self.assertIsNone(accepted_encoding(""))
+
+
+class TestResponseCompression(TestCase):
+    """Compression of API responses."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_superuser(
+            username="gzip_admin",
+            password="Gz1p!Bodies99",
+            email="gzip_admin@lapd.test",
+            phone_number="09130080001",
+            national_id="9200000001",
+        )
+        for i in range(40):
+            Case.objects.create(
+                title=f"Compressed case {i}",
+                description="Compression fixture.",
+                crime_level=CrimeLevel.LEVEL_2,
+                creation_type=CaseCreationType.CRIME_SCENE,
+                status=CaseStatus.OPEN,
+                created_by=cls.admin,
+            )
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def test_large_json_is_gzipped(self):
+        plain = self.client.get(reverse("case-list"))
+        self.assertNotIn("Content-Encoding", plain)
+        self.assertIn("Accept-Encoding", plain["Vary"])
+
+        response = self.client.get(reverse("case-list"), HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(int(response["Content-Length"]), len(response.content))
+        self.assertLess(len(response.content), len(plain.content))
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+
+    def test_small_bodies_are_not_compressed(self):
+        with override_settings(RESPONSE_COMPRESSION_MIN_SIZE=10**7):
+            response = self.client.get(reverse("case-list"), HTTP_ACCEPT_ENCODING="gzip")
+        self.assertNotIn("Content-Encoding", response)
+
+    def test_etag_survives_compression(self):
+        url = reverse("core:system-constants")
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertTrue(response["ETag"].startswith('W/"'))
+
+        cached = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(cached.status_code, 304)
+
+    def test_streamed_export_is_gzipped(self):
+        response = self.client.get(
+            reverse("case-export"), {"export_format": "ndjson"}, HTTP_ACCEPT_ENCODING="gzip",
+        )
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        lines = gzip.decompress(b"".join(response.streaming_content)).splitlines()
+        self.assertEqual(len(lines), 40)
+        self.assertEqual(json.loads(lines[0])["title"], "Compressed case 0")
@@ -0,0 +1,239 @@
+"""
+Integration tests — resumable (chunked) evidence uploads.
+
+Flow: ``POST uploads/`` → ``PUT uploads/{id}/parts/`` × N →
+``POST uploads/{id}/complete/`` (evidence/services.py
+``EvidenceUploadService``).
+
+  * parts appended in order produce a byte-identical EvidenceFile
+  * a CHECKED_IN custody entry carrying the SHA-256 is written
+  * the SHA-256 is kept as parts arrive; a process that missed parts
+    catches up from its own digest
+  * out-of-order offsets return 409 with the resume point
+  * completing early, or with a mismatched declared SHA-256, is rejected
+  * a completion whose transaction fails leaves the session retryable
+  * sessions are private to the uploader
+"""
+
+from __future__ import annotations
+
+import hashlib
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from cases.models import Case, CaseCreationType, CaseStatus, CrimeLevel
+from evidence.models import (
+    CustodyAction,
+    Evidence,
+    EvidenceCustodyLog,
+    EvidenceFile,
+    EvidenceType,
+    EvidenceUploadSession,
+)
+from evidence.services import _RUNNING_DIGESTS, EvidenceUploadService
+
+User = get_user_model()
+
+_TMP = Path(tempfile.mkdtemp(prefix="wp-upload-tests-"))
+_PAYLOAD = b"surveillance-frame-" * 1000  # 19 000 bytes
+
+
+@override_settings(
+    MEDIA_ROOT=str(_TMP / "media"),
+    EVIDENCE_UPLOAD_STAGING_ROOT=_TMP / "staging",
+    EVIDENCE_UPLOAD_CHUNK_SIZE=8000,
+)
+class TestResumableUploads(TestCase):
+    """Chunked upload protocol for large evidence media."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_superuser(
+            username="upload_admin",
+            password="Upl0ad!Admin99",
+            email="upload_admin@lapd.test",
+            phone_number="09130007001",
+            national_id="9300000001",
+        )
+        cls.other_admin = User.objects.create_superuser(
+            username="upload_admin2",
+            password="Upl0ad!Admin99",
+            email="upload_admin2@lapd.test",
+            phone_number="09130007002",
+            national_id="9300000002",
+        )
+        case = Case.objects.create(
+            title="Upload case",
+            description="Resumable upload fixture.",
+            crime_level=CrimeLevel.LEVEL_1,
+            creation_type=CaseCreationType.CRIME_SCENE,
+            status=CaseStatus.INVESTIGATION,
+            created_by=cls.admin,
+        )
+        cls.evidence = Evidence.objects.create(
+            case=case,
+            evidence_type=EvidenceType.OTHER,
+            title="Parking-lot CCTV",
+            registered_by=cls.admin,
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        shutil.rmtree(_TMP, ignore_errors=True)
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def _start(self, **extra) -> str:
+        payload = {
+            "filename": "cctv.mp4",
+            "file_type": "video",
+            "caption": "Lot B",
+            "total_size": len(_PAYLOAD),
+            **extra,
+        }
+        response = self.client.post(
+            reverse("evidence-start-upload", kwargs={"pk": self.evidence.pk}),
+            payload,
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        return response.data["id"]
+
+    def _put(self, upload_id: str, offset: int, data: bytes):
+        url = reverse(
+            "evidence-upload-parts",
+            kwargs={"pk": self.evidence.pk, "upload_id": upload_id},
+        )
+        return self.client.put(
+            url,
+            {"offset": offset, "chunk": SimpleUploadedFile("part", data)},
+            format="multipart",
+        )
+
+    def _complete(self, upload_id: str):
+        url = reverse(
+            "evidence-upload-complete",
+            kwargs={"pk": self.evidence.pk, "upload_id": upload_id},
+        )
+        return self.client.post(url)
+
+    def _upload_all(self, upload_id: str) -> None:
+        for offset in range(0, len(_PAYLOAD), 8000):
+            response = self._put(upload_id, offset, _PAYLOAD[offset:offset + 8000])
+            self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+    def test_chunked_upload_creates_file_and_custody_entry(self):
+        upload_id = self._start()
+        self._upload_all(upload_id)
+
+        response = self._complete(upload_id)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+        evidence_file = EvidenceFile.objects.get(pk=response.data["id"])
+        with evidence_file.file.open("rb") as fh:
+            self.assertEqual(fh.read(), _PAYLOAD)
+        self.assertFalse(EvidenceUploadSession.objects.filter(pk=upload_id).exists())
+
+        log = EvidenceCustodyLog.objects.get(evidence=self.evidence)
+        self.assertEqual(log.action_type, CustodyAction.CHECKED_IN)
+        self.assertIn(hashlib.sha256(_PAYLOAD).hexdigest(), log.notes)
+
+    def test_matching_declared_sha256_is_accepted(self):
+        upload_id = self._start(sha256=hashlib.sha256(_PAYLOAD).hexdigest())
+        self._upload_all(upload_id)
+
+        response = self._complete(upload_id)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+    def test_digest_is_kept_as_parts_arrive(self):
+        sha256 = hashlib.sha256(_PAYLOAD).hexdigest()
+        upload_id = self._start(sha256=sha256)
+        with self.captureOnCommitCallbacks(execute=True):
+            self._put(upload_id, 0, _PAYLOAD[:8000])
+        # Another worker takes the second part: this process never sees it.
+        self._put(upload_id, 8000, _PAYLOAD[8000:16000])
+        self.assertEqual(_RUNNING_DIGESTS[upload_id][0], 8000)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._put(upload_id, 16000, _PAYLOAD[16000:])
+        offset, digest = _RUNNING_DIGESTS[upload_id]
+        self.assertEqual((offset, digest.hexdigest()), (len(_PAYLOAD), sha256))
+
+        response = self._complete(upload_id)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+    def test_failed_completion_can_be_retried(self):
+        upload_id = self._start()
+        self._upload_all(upload_id)
+
+        with mock.patch.object(
+            EvidenceCustodyLog.objects, "create", side_effect=DatabaseError("insert failed"),
+        ), self.assertRaises(DatabaseError):
+            EvidenceUploadService.complete_upload(self.evidence.pk, upload_id, self.admin)
+        self.assertTrue(EvidenceUploadSession.objects.filter(pk=upload_id).exists())
+        self.assertTrue(EvidenceUploadService._staging_path(upload_id).exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self._complete(upload_id)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        with EvidenceFile.objects.get(pk=response.data["id"]).file.open("rb") as fh:
+            self.assertEqual(fh.read(), _PAYLOAD)
+        self.assertFalse(EvidenceUploadService._staging_path(upload_id).exists())
+
+    def test_completes_without_hard_links(self):
+        upload_id = self._start()
+        self._upload_all(upload_id)
+
+        with mock.patch("evidence.services.os.link", side_effect=OSError("unsupported")), \
+                self.captureOnCommitCallbacks(execute=True):
+            response = self._complete(upload_id)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        with EvidenceFile.objects.get(pk=response.data["id"]).file.open("rb") as fh:
+            self.assertEqual(fh.read(), _PAYLOAD)
+        self.assertFalse(EvidenceUploadService._staging_path(upload_id).exists())
+
+    def test_wrong_offset_returns_conflict_with_resume_point(self):
+        upload_id = self._start()
+        self._put(upload_id, 0, _PAYLOAD[:8000])
+
+        response = self._put(upload_id, 0, _PAYLOAD[:8000])
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+        state = self.client.get(
+            reverse("evidence-upload-session", kwargs={"pk": self.evidence.pk, "upload_id": upload_id})
+        )
+        self.assertEqual(state.data["received_bytes"], 8000)
+
+    def test_complete_before_all_bytes_is_rejected(self):
+        upload_id = self._start()
+        self._put(upload_id, 0, _PAYLOAD[:8000])
+        response = self._complete(upload_id)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(EvidenceFile.objects.exists())
+
+    def test_declared_sha256_mismatch_discards_upload(self):
+        upload_id = self._start(sha256="0" * 64)
+        self._upload_all(upload_id)
+        response = self._complete(upload_id)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(EvidenceFile.objects.exists())
+        self.assertFalse(EvidenceUploadSession.objects.filter(pk=upload_id).exists())
+
+    def test_session_is_private_to_uploader(self):
+        upload_id = self._start()
+        self.client.force_authenticate(user=self.other_admin)
+        response = self._put(upload_id, 0, _PAYLOAD[:8000])
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
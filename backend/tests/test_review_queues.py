@@ -0,0 +1,199 @@
+"""
+Integration tests — claimable review queues (``core.domain.queues``).
+
+  * concurrent reviewers receive disjoint batches, oldest first
+  * re-claiming returns the caller's own items with a renewed lease
+  * a decision by anyone but the claimant is refused (409) until the
+    lease expires; deciding clears the lease
+  * released and expired items return to the queue
+  * rows locked by another transaction are skipped, not waited on
+  * bounty-tip and biological-verification queues behave the same way
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from cases.models import Case, CaseCreationType, CaseStatus, CrimeLevel
+from core.domain.queues import claim_next
+from evidence.models import BiologicalEvidence, EvidenceType
+from suspects.models import BountyTip, BountyTipStatus
+
+User = get_user_model()
+
+
+def _superuser(username: str, index: int) -> User:
+    return User.objects.create_superuser(
+        username=username,
+        password="Qu3ue!Review99",
+        email=f"{username}@lapd.test",
+        phone_number=f"0913000400{index}",
+        national_id=f"960000000{index}",
+    )
+
+
+def _complaint(creator: User, title: str) -> Case:
+    return Case.objects.create(
+        title=title,
+        description="Review queue fixture.",
+        crime_level=CrimeLevel.LEVEL_3,
+        creation_type=CaseCreationType.COMPLAINT,
+        status=CaseStatus.CADET_REVIEW,
+        created_by=creator,
+    )
+
+
+class TestReviewQueues(TestCase):
+    """Claim / release / decide through the case, tip and coroner queues."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.cadet_a = _superuser("queue_cadet_a", 1)
+        cls.cadet_b = _superuser("queue_cadet_b", 2)
+        cls.citizen = User.objects.create_user(
+            username="queue_citizen",
+            password="Qu3ue!Citizen99",
+            email="queue_citizen@lapd.test",
+            phone_number="09130004009",
+            national_id="9600000009",
+        )
+        cls.cases = [_complaint(cls.cadet_a, f"Complaint {i}") for i in range(5)]
+
+    def setUp(self) -> None:
+        self.client_a = APIClient()
+        self.client_a.force_authenticate(user=self.cadet_a)
+        self.client_b = APIClient()
+        self.client_b.force_authenticate(user=self.cadet_b)
+        self.claim_url = reverse("case-review-queue-claim")
+
+    def _claim(self, client: APIClient, limit: int, queue: str = "complaint") -> list[int]:
+        response = client.post(self.claim_url, {"queue": queue, "limit": limit}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return [item["id"] for item in response.json()]
+
+    def test_reviewers_receive_disjoint_batches(self):
+        first = self._claim(self.client_a, 3)
+        second = self._claim(self.client_b, 3)
+
+        self.assertEqual(first, [c.pk for c in self.cases[:3]])
+        self.assertEqual(second, [c.pk for c in self.cases[3:]])
+        self.assertEqual(self._claim(self.client_a, 3), first)
+
+    def test_decision_is_reserved_for_the_claimant(self):
+        case_id = self._claim(self.client_a, 1)[0]
+        url = reverse("case-cadet-review", kwargs={"pk": case_id})
+
+        refused = self.client_b.post(url, {"decision": "approve"}, format="json")
+        self.assertEqual(refused.status_code, status.HTTP_409_CONFLICT)
+
+        accepted = self.client_a.post(url, {"decision": "approve"}, format="json")
+        self.assertEqual(accepted.status_code, status.HTTP_200_OK, accepted.data)
+        case = Case.objects.get(pk=case_id)
+        self.assertEqual(case.status, CaseStatus.OFFICER_REVIEW)
+        self.assertIsNone(case.leased_to_id)
+
+    def test_released_and_expired_items_return_to_queue(self):
+        held = self._claim(self.client_a, 2)
+
+        response = self.client_a.post(reverse("case-release-claim", kwargs={"pk": held[0]}))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        Case.objects.filter(pk=held[1]).update(
+            lease_expires_at=timezone.now() - timedelta(seconds=1),
+        )
+
+        self.assertEqual(self._claim(self.client_b, 2), held)
+
+        not_mine = self.client_a.post(reverse("case-release-claim", kwargs={"pk": held[0]}))
+        self.assertEqual(not_mine.status_code, status.HTTP_409_CONFLICT)
+
+    def test_queue_requires_reviewer_permission(self):
+        client = APIClient()
+        client.force_authenticate(user=self.citizen)
+        response = client.post(self.claim_url, {"queue": "officer"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_bounty_tip_queue(self):
+        tips = [
+            BountyTip.objects.create(
+                case=self.cases[0], informant=self.citizen, information=f"Tip {i}",
+            )
+            for i in range(2)
+        ]
+        url = reverse("bounty-tip-review-queue-claim")
+        claimed = self.client_a.post(url, {"limit": 1}, format="json").json()
+        self.assertEqual([t["id"] for t in claimed], [tips[0].pk])
+        self.assertIsNotNone(claimed[0]["lease_expires_at"])
+
+        review_url = reverse("bounty-tip-review", kwargs={"pk": tips[0].pk})
+        reject = {"decision": "reject", "review_notes": "Unfounded."}
+        refused = self.client_b.post(review_url, reject, format="json")
+        self.assertEqual(refused.status_code, status.HTTP_409_CONFLICT)
+
+        claimed_b = self.client_b.post(url, {"limit": 5}, format="json").json()
+        self.assertEqual([t["id"] for t in claimed_b], [tips[1].pk])
+
+        done = self.client_a.post(review_url, reject, format="json")
+        self.assertEqual(done.status_code, status.HTTP_200_OK, done.data)
+        self.assertEqual(BountyTip.objects.get(pk=tips[0].pk).status, BountyTipStatus.REJECTED)
+
+    def test_biological_verification_queue(self):
+        items = [
+            BiologicalEvidence.objects.create(
+                case=self.cases[0], evidence_type=EvidenceType.BIOLOGICAL,
+                title=f"Sample {i}", registered_by=self.cadet_a,
+            )
+            for i in range(3)
+        ]
+        url = reverse("evidence-verifications-claim")
+        first = [e["id"] for e in self.client_a.post(url, {"limit": 2}, format="json").json()]
+        second = [e["id"] for e in self.client_b.post(url, {"limit": 2}, format="json").json()]
+        self.assertEqual(first, [items[0].pk, items[1].pk])
+        self.assertEqual(second, [items[2].pk])
+
+        verify_url = reverse("evidence-verify", kwargs={"pk": items[0].pk})
+        refused = self.client_b.post(
+            verify_url, {"decision": "approve", "forensic_result": "Match"}, format="json",
+        )
+        self.assertEqual(refused.status_code, status.HTTP_409_CONFLICT)
+
+
+class TestClaimSkipsLockedRows(TransactionTestCase):
+    """A row locked by another transaction is skipped rather than awaited."""
+
+    def test_locked_row_is_skipped(self):
+        creator = _superuser("queue_lock_owner", 3)
+        locked, free = (_complaint(creator, "Locked"), _complaint(creator, "Free"))
+
+        holding = threading.Event()
+        finish = threading.Event()
+
+        def hold_lock() -> None:
+            try:
+                with transaction.atomic():
+                    Case.objects.select_for_update().get(pk=locked.pk)
+                    holding.set()
+                    finish.wait(timeout=10)
+            finally:
+                connection.close()
+
+        worker = threading.Thread(target=hold_lock)
+        worker.start()
+        try:
+            self.assertTrue(holding.wait(timeout=10))
+            pks = claim_next(
+                Case.objects.filter(status=CaseStatus.CADET_REVIEW), creator, limit=2,
+            )
+        finally:
+            finish.set()
+            worker.join()
+
+        self.assertEqual(pks, [free.pk])
@@ -0,0 +1,155 @@
+"""
+Integration tests — global search latency (``GlobalSearchService``).
+
+  * each category's results are cached per scope, query and limit, and
+    dropped when a case or suspect changes
+  * users with different case scopes never share cached results
+  * outside a transaction the uncached categories run concurrently, on
+    pool threads that keep their connections; inside one they run on
+    the caller's thread
+"""
+
+from __future__ import annotations
+
+import threading
+import unittest
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connections, transaction
+from django.test import TestCase, TransactionTestCase
+
+from accounts.models import Role
+from cases.models import Case, CaseCreationType, CaseStatus, CrimeLevel
+from core.domain.replicas import REPLICA_DB_ALIAS
+from core.services import GlobalSearchService
+from suspects.models import Suspect
+
+User = get_user_model()
+
+
+def _case(title: str, creator, **fields) -> Case:
+    return Case.objects.create(
+        title=title,
+        description="Search cache fixture.",
+        crime_level=CrimeLevel.LEVEL_2,
+        creation_type=CaseCreationType.CRIME_SCENE,
+        status=CaseStatus.INVESTIGATION,
+        created_by=creator,
+        **fields,
+    )
+
+
+class TestSearchCache(TestCase):
+    """Per-category result caching."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        call_command("setup_rbac", verbosity=0)
+        cls.admin = User.objects.create_superuser(
+            username="search_cache_admin",
+            password="Se4rch!Cache99",
+            email="search_cache_admin@lapd.test",
+            phone_number="09130130001",
+            national_id="8700000001",
+        )
+        cls.detective = User.objects.create_user(
+            username="search_cache_detective",
+            password="Se4rch!Cache99",
+            email="search_cache_detective@lapd.test",
+            phone_number="09130130002",
+            national_id="8700000002",
+            role=Role.objects.get(name="Detective"),
+        )
+        cls.assigned = _case("Harbor arson", cls.admin, assigned_detective=cls.detective)
+        cls.other = _case("Harbor fraud", cls.admin)
+        Suspect.objects.create(
+            case=cls.other, full_name="Harbor Hank", national_id="8700000011",
+            identified_by=cls.admin,
+        )
+
+    def _titles(self, user, query: str = "Harbor") -> list[str]:
+        return sorted(c["title"] for c in GlobalSearchService(query, user).search()["cases"])
+
+    def test_repeat_search_is_served_from_cache(self):
+        first = GlobalSearchService("Harbor", self.admin).search()
+        with self.assertNumQueries(0):
+            self.assertEqual(GlobalSearchService("Harbor", self.admin).search(), first)
+        self.assertEqual(first["total_results"], 3)
+
+    def test_cached_categories_are_not_searched_again(self):
+        GlobalSearchService("Harbor", self.admin, category="cases").search()
+        with mock.patch.object(GlobalSearchService, "_search_cases") as search_cases:
+            result = GlobalSearchService("Harbor", self.admin).search()
+        search_cases.assert_not_called()
+        self.assertEqual(len(result["suspects"]), 1)
+
+    def test_case_write_invalidates(self):
+        self.assertEqual(self._titles(self.admin), ["Harbor arson", "Harbor fraud"])
+        _case("Harbor theft", self.admin)
+        self.assertEqual(
+            self._titles(self.admin), ["Harbor arson", "Harbor fraud", "Harbor theft"],
+        )
+
+    def test_scopes_do_not_share_results(self):
+        self.assertEqual(self._titles(self.admin), ["Harbor arson", "Harbor fraud"])
+        self.assertEqual(self._titles(self.detective), ["Harbor arson"])
+        self.assertEqual(
+            GlobalSearchService("Harbor", self.detective).search()["suspects"], [],
+        )
+
+
+def _meeting(barrier: threading.Barrier, threads: set[int]):
+    def search(self) -> list:
+        threads.add(threading.get_ident())
+        barrier.wait()  # BrokenBarrierError if the searches ran one by one
+        return []
+    return search
+
+
+class TestConcurrentCategories(TransactionTestCase):
+    """The sync ``search()`` overlaps the uncached categories."""
+
+    databases = {"default", REPLICA_DB_ALIAS}
+
+    def setUp(self) -> None:
+        self.admin = User.objects.create_superuser(
+            username="search_fanout_admin",
+            password="Se4rch!Fanout99",
+            email="search_fanout_admin@lapd.test",
+            phone_number="09130130011",
+            national_id="8700000021",
+        )
+
+    def _patched(self, parties: int, threads: set[int]):
+        search = _meeting(threading.Barrier(parties, timeout=5), threads)
+        return mock.patch.multiple(
+            GlobalSearchService,
+            _search_cases=search, _search_suspects=search, _search_evidence=search,
+        )
+
+    def test_categories_run_concurrently(self):
+        threads: set[int] = set()
+        with self._patched(3, threads):
+            result = GlobalSearchService("Harbor", self.admin).search()
+        self.assertEqual(result["total_results"], 0)
+        self.assertEqual(len(threads), 3)
+        self.assertIn(threading.get_ident(), threads)
+
+    @unittest.skipUnless(settings.DB_CONN_MODE == "persistent", "DB_CONN_MODE is overridden")
+    def test_pool_threads_keep_their_connections(self):
+        _case("Harbor arson", self.admin)
+        with mock.patch.object(
+            connections["default"].__class__, "close", autospec=True,
+        ) as close:
+            result = GlobalSearchService("Harbor", self.admin).search()
+        self.assertEqual([row["title"] for row in result["cases"]], ["Harbor arson"])
+        close.assert_not_called()
+
+    def test_categories_run_in_turn_inside_a_transaction(self):
+        threads: set[int] = set()
+        with self._patched(1, threads), transaction.atomic():
+            GlobalSearchService("Harbor", self.admin).search()
+        self.assertEqual(threads, {threading.get_ident()})
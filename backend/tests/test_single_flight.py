@@ -0,0 +1,190 @@
+"""
+Integration tests — coalesced rebuilds of cached aggregates
+(``core.cache.get_or_build_coalesced`` / ``core.domain.locks``).
+
+  * an advisory lock held by one database session excludes the others
+  * an expired entry is served as-is while another session rebuilds it,
+    and rebuilt by the session that gets the lock
+  * with nothing cached, a caller waits for the rebuilding session and
+    uses its value instead of building too
+  * the most-wanted list is served from the cache until a suspect changes
+  * a lock whose unlock fails is released by closing the session
+  * behind a transaction-mode pooler the lock is transaction-level: the
+    body runs in a transaction and its end releases the lock
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError, connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from cases.models import Case, CaseCreationType, CaseStatus, CrimeLevel
+from core.cache import cache_set, get_or_build_coalesced
+from core.domain.locks import advisory_lock, advisory_lock_id
+from suspects.models import Suspect, SuspectStatus
+from suspects.services import SuspectProfileService
+
+User = get_user_model()
+
+
+def _fail() -> None:
+    raise AssertionError("build() must not run")
+
+
+class TestSingleFlight(TestCase):
+    """Only the lock holder rebuilds; everyone else serves or waits."""
+
+    def setUp(self) -> None:
+        self.other = connection.copy()
+        self.other.inc_thread_sharing()
+        self.addCleanup(self.other.close)
+
+    def _hold(self, name: str) -> None:
+        with self.other.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_lock(%s)", [advisory_lock_id(name)])
+
+    def _release(self, name: str) -> None:
+        with self.other.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_unlock(%s)", [advisory_lock_id(name)])
+
+    def test_lock_excludes_other_sessions(self):
+        self._hold("report-job")
+        with advisory_lock("report-job") as acquired:
+            self.assertFalse(acquired)
+        self._release("report-job")
+        with advisory_lock("report-job") as acquired:
+            self.assertTrue(acquired)
+
+    def test_expired_entry_is_served_while_locked(self):
+        # timeout=0: the entry is stale as soon as it is written.
+        get_or_build_coalesced("agg", lambda: "v1", timeout=0)
+
+        self._hold("cache:agg")
+        self.assertEqual(get_or_build_coalesced("agg", _fail, timeout=0), "v1")
+        self._release("cache:agg")
+
+        self.assertEqual(get_or_build_coalesced("agg", lambda: "v2", timeout=60), "v2")
+        self.assertEqual(get_or_build_coalesced("agg", _fail, timeout=60), "v2")
+
+    def test_missing_entry_waits_for_the_rebuild(self):
+        self._hold("cache:fresh")
+
+        def rebuild_elsewhere() -> None:
+            cache_set("fresh", "built elsewhere")
+            self._release("cache:fresh")
+
+        # The other session "finishes" its rebuild shortly after we start
+        # waiting; we must pick its value up instead of building.
+        timer = threading.Timer(0.2, rebuild_elsewhere)
+        timer.start()
+        self.addCleanup(timer.join)
+        with self.settings(APP_CACHE_LOCK_WAIT_SECONDS=5):
+            self.assertEqual(get_or_build_coalesced("fresh", _fail), "built elsewhere")
+
+
+class TestMostWantedCache(TestCase):
+    """The public list is cached and follows suspect writes."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_superuser(
+            username="flight_admin",
+            password="S1ngle!Flight99",
+            email="flight_admin@lapd.test",
+            phone_number="09130060001",
+            national_id="9400000001",
+        )
+        cls.case = Case.objects.create(
+            title="Flight case",
+            description="Most wanted fixture.",
+            crime_level=CrimeLevel.LEVEL_2,
+            creation_type=CaseCreationType.CRIME_SCENE,
+            status=CaseStatus.INVESTIGATION,
+            created_by=cls.admin,
+        )
+
+    def _wanted(self, name: str, national_id: str) -> Suspect:
+        suspect = Suspect.objects.create(
+            case=self.case, full_name=name, national_id=national_id,
+            status=SuspectStatus.WANTED, identified_by=self.admin,
+        )
+        suspect.wanted_since = timezone.now() - timedelta(days=45)
+        suspect.save(update_fields=["wanted_since"])
+        return suspect
+
+    def test_list_is_cached_until_a_suspect_changes(self):
+        self._wanted("Johnny Stompanato", "9400000011")
+        first = SuspectProfileService.get_most_wanted_list()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                [s.pk for s in SuspectProfileService.get_most_wanted_list()],
+                [s.pk for s in first],
+            )
+
+        self._wanted("Bugs Moran", "9400000012")
+        self.assertEqual(len(SuspectProfileService.get_most_wanted_list()), 2)
+
+
+class TestFailedUnlock(TransactionTestCase):
+    """An unlock refused by an aborted transaction must not leak the lock."""
+
+    def test_session_is_closed(self):
+        with self.assertRaises(DatabaseError), transaction.atomic():
+            with advisory_lock("stuck-job") as acquired:
+                self.assertTrue(acquired)
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1 / 0")
+
+        self.assertIsNone(connection.connection)
+        other = connection.copy()
+        self.addCleanup(other.close)
+        with other.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", [advisory_lock_id("stuck-job")])
+            self.assertTrue(cursor.fetchone()[0])
+
+
+@override_settings(DB_TRANSACTION_POOLER=True)
+class TestTransactionScopedLock(TransactionTestCase):
+    """Behind a transaction-mode pooler no lock survives its transaction."""
+
+    def setUp(self) -> None:
+        self.other = connection.copy()
+        self.addCleanup(self.other.close)
+
+    def _other_acquires(self, name: str) -> bool:
+        with self.other.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_xact_lock(%s)", [advisory_lock_id(name)])
+            return cursor.fetchone()[0]
+
+    def _session_locks(self) -> int:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT count(*) FROM pg_locks"
+                " WHERE locktype = 'advisory' AND pid = pg_backend_pid()"
+            )
+            return cursor.fetchone()[0]
+
+    def test_lock_is_held_for_the_transaction(self):
+        with advisory_lock("pooled-job") as acquired:
+            self.assertTrue(acquired)
+            self.assertTrue(connection.in_atomic_block)
+            self.assertFalse(self._other_acquires("pooled-job"))
+        self.assertEqual(self._session_locks(), 0)
+        self.assertTrue(self._other_acquires("pooled-job"))
+
+    def test_failed_body_releases_the_lock(self):
+        with self.assertRaises(DatabaseError):
+            with advisory_lock("pooled-job") as acquired:
+                self.assertTrue(acquired)
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1 / 0")
+
+        self.assertIsNotNone(connection.connection)
+        self.assertEqual(self._session_locks(), 0)
+        self.assertTrue(self._other_acquires("pooled-job"))
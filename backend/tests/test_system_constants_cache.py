@@ -0,0 +1,72 @@
+"""
+Integration tests — cached system constants (``GET /api/core/constants/``).
+
+  * the response carries a strong ETag and a public ``Cache-Control``
+  * a matching ``If-None-Match`` returns ``304`` with no body
+  * repeat hits cost no database queries
+  * creating, renaming or deleting a role changes the ETag
+"""
+
+from __future__ import annotations
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from accounts.models import Role
+
+
+class TestSystemConstantsCache(TestCase):
+    """The constants endpoint is served from the cache and revalidated by ETag."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.role = Role.objects.create(name="Constants Clerk", hierarchy_level=3)
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.url = reverse("core:system-constants")
+
+    def test_etag_and_cache_control(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+        self.assertTrue(etag.startswith('"') and etag.endswith('"'))
+        self.assertIn("public", response["Cache-Control"])
+        self.assertIn("max-age=3600", response["Cache-Control"])
+
+        cached = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(cached.content, b"")
+        self.assertEqual(cached["ETag"], etag)
+
+    def test_steady_state_costs_no_queries(self):
+        first = self.client.get(self.url, HTTP_AUTHORIZATION="Bearer not-checked")
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+
+        with self.assertNumQueries(0):
+            again = self.client.get(self.url)
+            self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(again.json(), first.json())
+
+    def test_role_writes_change_the_etag(self):
+        etags = [self.client.get(self.url)["ETag"]]
+
+        self.role.name = "Senior Constants Clerk"
+        self.role.save()
+        etags.append(self.client.get(self.url)["ETag"])
+
+        Role.objects.create(name="Constants Intern", hierarchy_level=1)
+        etags.append(self.client.get(self.url)["ETag"])
+
+        self.role.delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etags[-1])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etags.append(response["ETag"])
+
+        self.assertEqual(len(set(etags)), 4)
+        names = [r["name"] for r in response.json()["role_hierarchy"]]
+        self.assertNotIn("Senior Constants Clerk", names)
+        self.assertIn("Constants Intern", names)
@@ -0,0 +1,172 @@
+"""
+Parity tests — ``values_list`` list serializers (``core.domain.projection``).
+
+The case, evidence and suspect list endpoints render through
+``*ListValuesSerializer`` classes.  Their output must be byte-identical
+to the ``ModelSerializer`` they stand in for, which stays the documented
+schema:
+
+  * nullable relations, blank names and unassigned FKs
+  * datetimes in UTC and in a non-UTC current time zone
+  * suspect photos with and without rendered thumbnails, relative and
+    absolute (request in context)
+  * the list endpoints return the same bytes and use a single query
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APIRequestFactory
+
+from accounts.models import Role
+from cases.models import Case, CaseCreationType, CaseStatus, CrimeLevel
+from cases.serializers import CaseListSerializer, CaseListValuesSerializer
+from cases.services import CaseQueryService
+from core.domain.projection import get_query_shape
+from evidence.models import Evidence, EvidenceType
+from evidence.serializers import EvidenceListSerializer, EvidenceListValuesSerializer
+from evidence.services import EvidenceQueryService
+from suspects.models import Suspect, SuspectStatus
+from suspects.serializers import SuspectListSerializer, SuspectListValuesSerializer
+from suspects.services import SuspectProfileService
+
+User = get_user_model()
+
+_render = JSONRenderer().render
+
+
+class TestValuesSerializerParity(TestCase):
+    """Each values serializer matches its ModelSerializer byte for byte."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_superuser(
+            username="parity_admin",
+            password="P4rity!Rows99",
+            email="parity_admin@lapd.test",
+            phone_number="09130070001",
+            national_id="9300000001",
+            first_name="Cole",
+            last_name="Phelps",
+        )
+        cls.nameless = User.objects.create_user(
+            username="parity_nameless",
+            password="P4rity!Rows99",
+            email="parity_nameless@lapd.test",
+            phone_number="09130070002",
+            national_id="9300000002",
+        )
+        cls.clerk = User.objects.create_user(
+            username="parity_clerk",
+            password="P4rity!Rows99",
+            email="parity_clerk@lapd.test",
+            phone_number="09130070003",
+            national_id="9300000003",
+            role=Role.objects.create(name="Parity Clerk", hierarchy_level=2),
+        )
+
+        cls.assigned = Case.objects.create(
+            title="Assigned",
+            description="Parity fixture.",
+            crime_level=CrimeLevel.LEVEL_1,
+            creation_type=CaseCreationType.CRIME_SCENE,
+            status=CaseStatus.INVESTIGATION,
+            created_by=cls.admin,
+            assigned_detective=cls.admin,
+            incident_date=datetime(2026, 3, 1, 22, 30, 15, 123456, tzinfo=dt_timezone.utc),
+            location="Hollywood",
+        )
+        Case.objects.create(
+            title="Unassigned",
+            description="Parity fixture.",
+            crime_level=CrimeLevel.CRITICAL,
+            creation_type=CaseCreationType.COMPLAINT,
+            status=CaseStatus.OPEN,
+            created_by=cls.admin,
+        )
+        Case.objects.create(
+            title="Nameless detective",
+            description="Parity fixture.",
+            crime_level=CrimeLevel.LEVEL_3,
+            creation_type=CaseCreationType.CRIME_SCENE,
+            status=CaseStatus.INVESTIGATION,
+            created_by=cls.admin,
+            assigned_detective=cls.nameless,
+        )
+
+        for registrar, evidence_type in (
+            (cls.admin, EvidenceType.TESTIMONY),
+            (cls.nameless, EvidenceType.OTHER),
+        ):
+            Evidence.objects.create(
+                case=cls.assigned, evidence_type=evidence_type,
+                title=f"Exhibit {evidence_type}", description="", registered_by=registrar,
+            )
+
+        photographed = Suspect.objects.create(
+            case=cls.assigned, full_name="Roy Earle", national_id="9300000011",
+            identified_by=cls.admin, photo="suspect_photos/2026/01/earle.png",
+            photo_derivatives={"thumb": "derivatives/thumb/suspect_photos/2026/01/earle.jpg"},
+        )
+        photographed.wanted_since = timezone.now() - timedelta(days=45)
+        photographed.save(update_fields=["wanted_since"])
+        Suspect.objects.create(
+            case=cls.assigned, full_name="Leland Monroe", identified_by=cls.nameless,
+            photo="suspect_photos/2026/01/monroe.png", status=SuspectStatus.ARRESTED,
+        )
+        Suspect.objects.create(
+            case=cls.assigned, full_name="Ira Hogeboom", identified_by=cls.clerk,
+        )
+
+    def assertParity(self, model_serializer, values_serializer, queryset, **context) -> None:
+        shaped = get_query_shape(model_serializer).apply(queryset)
+        expected = _render(model_serializer(shaped, many=True, context=context).data)
+        self.assertEqual(_render(values_serializer(queryset, context=context).data), expected)
+
+    def test_cases(self):
+        self.assertParity(CaseListSerializer, CaseListValuesSerializer, Case.objects.order_by("pk"))
+
+    def test_evidence(self):
+        self.assertParity(
+            EvidenceListSerializer, EvidenceListValuesSerializer, Evidence.objects.order_by("pk"),
+        )
+
+    def test_suspects(self):
+        queryset = Suspect.objects.order_by("pk")
+        self.assertParity(SuspectListSerializer, SuspectListValuesSerializer, queryset)
+
+        request = APIRequestFactory().get("/api/suspects/")
+        self.assertParity(
+            SuspectListSerializer, SuspectListValuesSerializer, queryset, request=request,
+        )
+
+    def test_non_utc_time_zone(self):
+        with timezone.override("America/Los_Angeles"):
+            self.assertParity(
+                CaseListSerializer, CaseListValuesSerializer, Case.objects.order_by("pk"),
+            )
+
+    def test_list_endpoints(self):
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+
+        for name, model_serializer, service in (
+            ("case-list", CaseListSerializer, CaseQueryService),
+            ("evidence-list", EvidenceListSerializer, EvidenceQueryService),
+            ("suspect-list", SuspectListSerializer, SuspectProfileService),
+        ):
+            with self.subTest(endpoint=name):
+                shaped = service.get_filtered_queryset(
+                    self.admin, {}, shape=get_query_shape(model_serializer),
+                )
+                expected = _render(model_serializer(shaped, many=True).data)
+                with self.assertNumQueries(1):
+                    response = client.get(reverse(name))
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.content, expected)